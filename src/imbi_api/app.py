@@ -1,4 +1,5 @@
 import logging
+from collections import abc
 
 import fastapi
 from fastapi import responses
@@ -8,28 +9,32 @@ from imbi_common.plugins.errors import PluginCredentialsMissing
 from uvicorn.middleware import proxy_headers
 
 from imbi_api import endpoints, lifespans, openapi, settings, version
-from imbi_api.middleware import rate_limit
+from imbi_api.auth import invalidation
+from imbi_api.middleware import rate_limit, request_memo
 
 LOGGER = logging.getLogger(__name__)
 
 
 def create_app() -> fastapi.FastAPI:
+    server_config = settings.ServerConfig()
+    workers = (
+        lifespans.WORKER_HOOKS.values()
+        if server_config.background_workers
+        else ()
+    )
     app = fastapi.FastAPI(
         title='Imbi',
         lifespan=lifespan.Lifespan(
             sentry.sentry_lifespan,
             lifespans.clickhouse_hook,
+            lifespans.event_buffer_hook,
             graph.graph_lifespan,
             lifespans.email_hook,
             lifespans.storage_hook,
             lifespans.anthropic_hook,
             valkey.valkey_lifespan,
-            lifespans.score_worker_hook,
-            lifespans.commit_sync_worker_hook,
-            lifespans.pr_sync_worker_hook,
-            lifespans.deployment_sync_worker_hook,
-            lifespans.maintenance_worker_hook,
-            lifespans.identity_refresh_hook,
+            invalidation.auth_invalidation_hook,
+            *workers,
         ),
         version=version,
         redoc_url=None,
@@ -40,7 +45,6 @@ def create_app() -> fastapi.FastAPI:
         },
     )
 
-    server_config = settings.ServerConfig()
     # Quiet both the unprefixed and ``/api``-prefixed status route
     # because the served path depends on IMBI_API_URL at startup;
     # listing both keeps the middleware deployment-agnostic.
@@ -48,6 +52,7 @@ def create_app() -> fastapi.FastAPI:
         access_log.AccessLogMiddleware,
         quiet_paths={'/status', '/api/status'},
     )
+    app.add_middleware(request_memo.RequestMemoMiddleware)
     app.add_middleware(
         cors.CORSMiddleware,
         allow_origins=server_config.cors_allowed_origins,
@@ -93,3 +98,27 @@ def create_app() -> fastapi.FastAPI:
     app.openapi = openapi.create_custom_openapi(app)  # type: ignore[method-assign]
 
     return app
+
+
+def create_worker_app(names: abc.Iterable[str]) -> fastapi.FastAPI:
+    """Build a route-less app whose lifespan runs only *names* workers.
+
+    Used by ``imbi-api worker``: it opens the same ClickHouse, graph and
+    Valkey connections the workers use under ``serve`` (the graph
+    startup hook loads plugins) but none of the HTTP-only services.
+    """
+    return fastapi.FastAPI(
+        title='Imbi Worker',
+        lifespan=lifespan.Lifespan(
+            sentry.sentry_lifespan,
+            lifespans.clickhouse_hook,
+            lifespans.event_buffer_hook,
+            graph.graph_lifespan,
+            valkey.valkey_lifespan,
+            *(lifespans.WORKER_HOOKS[name] for name in names),
+        ),
+        version=version,
+        openapi_url=None,
+        redoc_url=None,
+        docs_url=None,
+    )
@@ -0,0 +1,148 @@
+"""Valkey pub/sub fan-out for auth-context cache invalidation.
+
+:mod:`imbi_api.auth.permissions` keeps per-process caches of resolved
+``AuthContext`` objects. A write that changes what those contexts
+would contain (token revocation, role grants, org membership, user
+deactivation, identity connections) calls one of the ``publish_*``
+helpers here: the local cache entry is dropped immediately and a
+message is published on ``imbi:auth:invalidate`` so every other pod
+drops its copy too.
+
+Messages only ever *drop* cache entries, so unlike the plugin-reload
+channel they are not signed -- a forged message costs at most a cache
+miss. Payload shape: ``"{kind}:{value}"`` where ``kind`` is one of
+``jti``, ``principal``, ``user`` (a user id) or ``all``.
+"""
+
+import asyncio
+import contextlib
+import logging
+import typing
+from collections.abc import AsyncGenerator
+
+from imbi_common import valkey
+from valkey import asyncio as _valkey_asyncio
+
+from imbi_api.auth import permissions
+
+LOGGER = logging.getLogger(__name__)
+
+_CHANNEL = 'imbi:auth:invalidate'
+
+InvalidationKind = typing.Literal['jti', 'principal', 'user', 'all']
+
+
+def _apply(payload: str) -> None:
+    """Apply a received invalidation payload to the local caches."""
+    kind, _, value = payload.partition(':')
+    if kind == 'jti' and value:
+        permissions.invalidate_token(value)
+    elif kind == 'principal' and value:
+        permissions.invalidate_principal(value)
+    elif kind == 'user' and value:
+        permissions.invalidate_user(value)
+    elif kind == 'all':
+        permissions.invalidate_all()
+    else:
+        LOGGER.warning('Auth invalidation: ignoring payload %r', payload)
+
+
+async def _publish(kind: InvalidationKind, value: str = '') -> None:
+    """Publish an invalidation to the other pods; best-effort.
+
+    A Valkey outage must not fail the write that triggered the
+    invalidation -- remote pods fall back to the cache TTL.
+    """
+    try:
+        client = valkey.get_client()
+    except RuntimeError:
+        return
+    try:
+        await client.publish(  # pyright: ignore[reportUnknownMemberType]
+            _CHANNEL, f'{kind}:{value}'
+        )
+    except Exception:
+        LOGGER.warning(
+            'Failed to publish auth invalidation %s:%s',
+            kind,
+            value,
+            exc_info=True,
+        )
+
+
+async def publish_token_revoked(jti: str | None) -> None:
+    """Drop the cached context for a revoked token on every pod."""
+    if not jti:
+        return
+    permissions.invalidate_token(jti)
+    await _publish('jti', jti)
+
+
+async def publish_principal_changed(principal: str) -> None:
+    """Drop cached contexts for a user email / SA slug on every pod."""
+    permissions.invalidate_principal(principal)
+    await _publish('principal', principal)
+
+
+async def publish_user_changed(user_id: str) -> None:
+    """Drop cached contexts for a user id on every pod."""
+    permissions.invalidate_user(user_id)
+    await _publish('user', user_id)
+
+
+async def publish_all_changed() -> None:
+    """Drop every cached context on every pod."""
+    permissions.invalidate_all()
+    await _publish('all')
+
+
+async def _subscribe(
+    client: _valkey_asyncio.Valkey,
+    stop: asyncio.Event,
+) -> None:
+    pubsub = client.pubsub()
+    await pubsub.subscribe(_CHANNEL)  # pyright: ignore[reportUnknownMemberType]
+    LOGGER.info('Auth invalidation subscriber started on %r', _CHANNEL)
+    try:
+        while not stop.is_set():
+            try:
+                msg = await asyncio.wait_for(  # pyright: ignore[reportUnknownVariableType,reportUnknownArgumentType]
+                    pubsub.get_message(ignore_subscribe_messages=True),  # pyright: ignore[reportUnknownArgumentType,reportUnknownMemberType]
+                    timeout=1.0,
+                )
+            except TimeoutError:
+                continue
+            if msg is None:
+                continue
+            raw_data = typing.cast(
+                'object',
+                msg.get('data'),  # pyright: ignore[reportUnknownMemberType]
+            )
+            if isinstance(raw_data, (bytes, bytearray)):
+                _apply(bytes(raw_data).decode('utf-8', errors='replace'))
+            elif isinstance(raw_data, str):
+                _apply(raw_data)
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await pubsub.unsubscribe(_CHANNEL)  # pyright: ignore[reportUnknownMemberType]
+
+
+@contextlib.asynccontextmanager
+async def auth_invalidation_hook() -> AsyncGenerator[None]:
+    """Async context manager that runs the invalidation subscriber."""
+    try:
+        client = valkey.get_client()
+    except RuntimeError:
+        LOGGER.warning('Valkey unavailable; auth invalidation not started')
+        yield
+        return
+    stop = asyncio.Event()
+    task = asyncio.create_task(_subscribe(client, stop))
+    try:
+        yield
+    finally:
+        stop.set()
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -50,6 +50,14 @@ class AuthContext(pydantic.BaseModel):
     permissions: set[str] = pydantic.Field(default_factory=set)
     identities: list[IdentityInfo] = pydantic.Field(default_factory=list)
 
+    # Lazily-loaded ``(label, slug) -> actions`` map of the user's
+    # ``CAN_ACCESS`` edges; see :func:`load_resource_access`. Carried
+    # on the (cached) context so repeat checks cost no graph
+    # round-trip, and excluded from serialization.
+    resource_access: dict[tuple[str, str], frozenset[str]] | None = (
+        pydantic.Field(default=None, exclude=True)
+    )
+
     def identity_for(self, plugin_slug: str) -> str | None:
         """Return the subject for the given plugin_slug, or None."""
         for i in self.identities:
@@ -139,6 +147,118 @@ def clear_api_key_cache() -> None:
     _api_key_cache.clear()
 
 
+# Bounded per-process cache for JWT-authenticated AuthContexts keyed
+# by the token's ``jti``. Without it every request pays four graph
+# round-trips (revocation lookup, principal match, role traversal,
+# identities). Signature and expiry are still verified on every call;
+# only the graph-derived state is cached. Writes that change that
+# state (revocation, role grants, membership, deactivation) call the
+# ``invalidate_*`` helpers below, and :mod:`imbi_api.auth.invalidation`
+# fans them out to every pod over Valkey pub/sub. The TTL bounds
+# staleness if a pod misses a message.
+_JWT_CACHE_TTL_SECONDS = 60
+_JWT_CACHE_MAX_ENTRIES = 4096
+_jwt_cache: collections.OrderedDict[str, tuple[float, AuthContext]] = (
+    collections.OrderedDict()
+)
+_jwt_cache_counters: collections.Counter[str] = collections.Counter()
+
+
+def _jwt_cache_lookup(jti: str) -> AuthContext | None:
+    """Return a cached AuthContext for ``jti`` if present and unexpired."""
+    entry = _jwt_cache.get(jti)
+    if entry is None:
+        _jwt_cache_counters['misses'] += 1
+        return None
+    expires, ctx = entry
+    if time.monotonic() > expires:
+        _jwt_cache.pop(jti, None)
+        _jwt_cache_counters['misses'] += 1
+        return None
+    _jwt_cache.move_to_end(jti)
+    _jwt_cache_counters['hits'] += 1
+    return ctx
+
+
+def _jwt_cache_store(jti: str, ctx: AuthContext) -> None:
+    """Store an AuthContext in the bounded JWT LRU cache."""
+    while len(_jwt_cache) >= _JWT_CACHE_MAX_ENTRIES:
+        _jwt_cache.popitem(last=False)
+        _jwt_cache_counters['evictions'] += 1
+    _jwt_cache[jti] = (time.monotonic() + _JWT_CACHE_TTL_SECONDS, ctx)
+
+
+def clear_jwt_cache() -> None:
+    """Drop every cached JWT AuthContext and reset the counters."""
+    _jwt_cache.clear()
+    _jwt_cache_counters.clear()
+
+
+def jwt_cache_stats() -> dict[str, int]:
+    """Return hit / miss / eviction / invalidation counters and size."""
+    return {
+        'hits': _jwt_cache_counters['hits'],
+        'misses': _jwt_cache_counters['misses'],
+        'evictions': _jwt_cache_counters['evictions'],
+        'invalidations': _jwt_cache_counters['invalidations'],
+        'size': len(_jwt_cache),
+    }
+
+
+def invalidate_token(jti: str) -> None:
+    """Drop the cached AuthContext for a single token ``jti``."""
+    if _jwt_cache.pop(jti, None) is not None:
+        _jwt_cache_counters['invalidations'] += 1
+
+
+def invalidate_principal(principal: str) -> None:
+    """Drop every cached AuthContext for a user email or SA slug.
+
+    Covers both the JWT and API-key caches so a deactivation or
+    membership change takes effect for every credential the
+    principal holds.
+    """
+    for cache in (_jwt_cache, _api_key_cache):
+        stale = [
+            key
+            for key, (_expires, ctx) in cache.items()
+            if ctx.principal_name == principal
+        ]
+        for key in stale:
+            cache.pop(key, None)
+        _jwt_cache_counters['invalidations'] += len(stale)
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop every cached AuthContext for the user with ``user_id``.
+
+    For writes keyed by user id rather than email, such as identity
+    connection changes that alter the context's ``identities``.
+    """
+    for cache in (_jwt_cache, _api_key_cache):
+        stale = [
+            key
+            for key, (_expires, ctx) in cache.items()
+            if ctx.user is not None and ctx.user.id == user_id
+        ]
+        for key in stale:
+            cache.pop(key, None)
+        _jwt_cache_counters['invalidations'] += len(stale)
+
+
+def invalidate_all() -> None:
+    """Drop every cached AuthContext (JWT and API key).
+
+    Used for changes whose blast radius isn't worth computing, such
+    as editing a role's grants or inheritance.
+    """
+    _jwt_cache_counters['invalidations'] += len(_jwt_cache) + len(
+        _api_key_cache
+    )
+    _jwt_cache.clear()
+    _api_key_cache.clear()
+
+
 PrincipalLabel = typing.Literal['User', 'ServiceAccount']
 PrincipalMatchProp = typing.Literal['email', 'slug']
 
@@ -346,6 +466,29 @@ async def authenticate_jwt(
             status_code=401, detail='Invalid token type'
         )
 
+    # Fast path: the signature and expiry were verified above, so a
+    # cached context for this jti only skips the graph round-trips.
+    jti = claims.get('jti')
+    if jti:
+        cached = _jwt_cache_lookup(jti)
+        if cached is not None:
+            return cached
+
+    ctx = await _load_jwt_context(db, claims)
+    if jti:
+        _jwt_cache_store(jti, ctx)
+    return ctx
+
+
+async def _load_jwt_context(
+    db: graph.Graph, claims: dict[str, typing.Any]
+) -> AuthContext:
+    """Resolve the AuthContext for verified access-token claims.
+
+    Raises:
+        fastapi.HTTPException: On revoked token, missing subject,
+            principal not found, or inactive principal.
+    """
     # Check if token is revoked
     jti = claims.get('jti')
     query = 'MATCH (t:TokenMetadata {{jti: {jti}}}) RETURN t.revoked'
@@ -806,6 +949,19 @@ def _resolve_resource_label(resource_type: str) -> str:
         ) from exc
 
 
+_RESOURCE_LABELS: frozenset[str] = frozenset(_RESOURCE_LABEL_MAP.values())
+
+
+def _check_resource_label(label: str) -> None:
+    """Reject labels outside :data:`_RESOURCE_LABEL_MAP`.
+
+    The label is interpolated into the Cypher pattern (AGE cannot
+    parameterize labels), so only known values may reach the query.
+    """
+    if label not in _RESOURCE_LABELS:
+        raise ValueError(f'Unsupported resource label: {label!r}')
+
+
 async def check_resource_permission(
     db: graph.Graph,
     email: str,
@@ -817,6 +973,11 @@ async def check_resource_permission(
     Determine whether the given user is allowed to perform the
     specified action on the named resource.
 
+    The resource label is part of the match pattern and the match is
+    anchored on the user's outgoing ``CAN_ACCESS`` edges, so AGE only
+    probes the user's own edges and the one label table instead of
+    scanning every vertex in the graph.
+
     Parameters:
         db: Graph database connection.
         email (str): Email of the user to check.
@@ -829,19 +990,22 @@ async def check_resource_permission(
     Returns:
         bool: `True` if the user has the requested action for the
             resource, `False` otherwise.
+
+    Raises:
+        ValueError: If ``resource_type`` is not a label from
+            :data:`_RESOURCE_LABEL_MAP`.
     """
+    _check_resource_label(resource_type)
     query = (
-        'MATCH (u:User {{email: {email}}}) '
-        'MATCH (resource {{slug: {resource_slug}}}) '
-        'WHERE {resource_type} IN labels(resource) '
-        'MATCH (u)-[access:CAN_ACCESS]->(resource) '
+        'MATCH (u:User {{email: {email}}})'
+        f'-[access:CAN_ACCESS]->(resource:{resource_type} '
+        '{{slug: {resource_slug}}}) '
         'RETURN {action} IN access.actions'
     )
     records = await db.execute(
         query,
         {
             'email': email,
-            'resource_type': resource_type,
             'resource_slug': resource_slug,
             'action': action,
         },
@@ -849,7 +1013,51 @@ async def check_resource_permission(
     )
     if not records:
         return False
-    return bool(graph.parse_agtype(records[0].get('allowed')))
+    return any(bool(graph.parse_agtype(r.get('allowed'))) for r in records)
+
+
+async def load_resource_access(
+    db: graph.Graph, auth: AuthContext
+) -> dict[tuple[str, str], frozenset[str]]:
+    """Return the principal's ``CAN_ACCESS`` map, loading it once.
+
+    One query collects every ``CAN_ACCESS`` edge leaving the user as
+    a ``(label, slug) -> actions`` map, which is memoized on ``auth``.
+    Because authenticated contexts are cached per token, endpoints
+    that check many resources -- or many requests on the same token
+    -- share a single round-trip. Service accounts have no
+    resource-level grants and always get an empty map.
+    """
+    if auth.resource_access is not None:
+        return auth.resource_access
+    access: dict[tuple[str, str], frozenset[str]] = {}
+    if auth.user is not None:
+        records = await db.execute(
+            'MATCH (u:User {{email: {email}}})-[a:CAN_ACCESS]->(r) '
+            'RETURN labels(r) AS labels, r.slug AS slug, '
+            'a.actions AS actions',
+            {'email': auth.user.email},
+            columns=['labels', 'slug', 'actions'],
+        )
+        for row in records:
+            labels: typing.Any = graph.parse_agtype(row.get('labels'))
+            slug = graph.parse_agtype(row.get('slug'))
+            actions: typing.Any = graph.parse_agtype(row.get('actions'))
+            if isinstance(labels, str):
+                labels = [labels]
+            if not isinstance(slug, str) or not isinstance(labels, list):
+                continue
+            action_set = frozenset(
+                a
+                for a in typing.cast(list[typing.Any], actions or [])
+                if isinstance(a, str)
+            )
+            for label in typing.cast(list[typing.Any], labels):
+                if label in _RESOURCE_LABELS:
+                    key = (label, slug)
+                    access[key] = access.get(key, frozenset()) | action_set
+    auth.resource_access = access
+    return access
 
 
 def require_resource_access(
@@ -901,13 +1109,12 @@ def require_resource_access(
         if global_permission in auth.permissions:
             return auth
 
-        # Check resource-level permission (users only)
+        # Check resource-level permission (users only) against the
+        # principal's memoized CAN_ACCESS map
+        label = _resolve_resource_label(resource_type)
         if auth.user:
-            label = _resolve_resource_label(resource_type)
-            has_access = await check_resource_permission(
-                db, auth.user.email, label, slug, action
-            )
-            if has_access:
+            access = await load_resource_access(db, auth)
+            if action in access.get((label, slug), frozenset()):
                 return auth
 
         LOGGER.warning(
@@ -0,0 +1,95 @@
+"""Valkey access and call coalescing shared by the read-through caches.
+
+The plugin status, compare and log caches, the plugin binding cache
+and the search scope cache all read and write Valkey best-effort --
+an unconfigured or unreachable Valkey degrades to an upstream call,
+never to an error -- and the request-path caches share one in-flight
+call per key among concurrent callers.  Those pieces live here so the
+caches only differ in what they key, encode and expire.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import typing
+from collections import abc
+
+from imbi_common import valkey
+from valkey import asyncio as _valkey_asyncio
+
+LOGGER = logging.getLogger(__name__)
+
+
+def client() -> _valkey_asyncio.Valkey | None:
+    """Return the shared Valkey client, or ``None`` when unconfigured."""
+    try:
+        return valkey.get_client()
+    except RuntimeError:
+        return None
+
+
+async def resolve(value: object) -> object:
+    """Resolve valkey-py's ``Awaitable[T] | T`` command return typing."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def load(
+    client: _valkey_asyncio.Valkey, key: str, kind: str
+) -> str | None:
+    """Read ``key`` as text; read failures are logged and miss."""
+    try:
+        raw = await resolve(client.get(key))
+    except Exception:
+        LOGGER.warning('Failed to read cached %s %s', kind, key, exc_info=True)
+        return None
+    if isinstance(raw, bytes):
+        return raw.decode()
+    return typing.cast('str | None', raw)
+
+
+async def store(
+    client: _valkey_asyncio.Valkey, key: str, value: str, ttl: int, kind: str
+) -> None:
+    """Write ``value`` under ``key`` for ``ttl`` seconds, best-effort."""
+    try:
+        await resolve(client.set(key, value, ex=ttl))
+    except Exception:
+        LOGGER.warning(
+            'Failed to store cached %s %s', kind, key, exc_info=True
+        )
+
+
+class SingleFlight[T]:
+    """Share one in-flight call per key among concurrent callers.
+
+    The call runs as its own task and every caller awaits it shielded,
+    so one caller being cancelled (a viewer disconnecting) does not
+    cancel the call the others are waiting on.  Its exception, if any,
+    reaches every caller.  The key is forgotten once the call settles.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[T]] = {}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._inflight
+
+    async def run(
+        self, key: str, call: abc.Callable[[], abc.Awaitable[T]]
+    ) -> T:
+        """Await the in-flight call for ``key``, starting it if idle."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[key] = future
+
+            def _forget(done: asyncio.Future[T]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            future.add_done_callback(_forget)
+        return await asyncio.shield(future)
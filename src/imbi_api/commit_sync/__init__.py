@@ -2,9 +2,10 @@
 
 A project-scoped "Sync Commits & Tags" action (Project Doctor) enqueues a
 Valkey-stream job; a background worker resolves the project's
-``github-commit-sync`` webhook plugin, runs a full default-branch +
-all-tags backfill via the plugin's service credential, and records the
-last-sync status on the ``Project`` node for the UI to poll.
+``github-commit-sync`` webhook plugin, syncs default-branch commits and
+tags via the plugin's service credential -- incrementally from the
+project's persisted cursor, or as a full backfill on demand -- and
+records the last-sync status on the ``Project`` node for the UI to poll.
 """
 
 from imbi_api.commit_sync.queue import (
@@ -14,6 +15,10 @@ from imbi_api.commit_sync.queue import (
 from imbi_api.commit_sync.service import (
     CommitSyncStatus,
     CommitSyncUnavailable,
+    IncrementalCommitSync,
+    SyncCursor,
+    SyncResult,
+    read_cursor,
     read_status,
     run_sync,
 )
@@ -21,8 +26,12 @@ from imbi_api.commit_sync.service import (
 __all__ = [
     'CommitSyncStatus',
     'CommitSyncUnavailable',
+    'IncrementalCommitSync',
+    'SyncCursor',
+    'SyncResult',
     'consume_commit_sync',
     'enqueue_commit_sync',
+    'read_cursor',
     'read_status',
     'run_sync',
 ]
@@ -3,7 +3,8 @@
 Mirrors :mod:`imbi_api.scoring.queue`: a single consumer group drains an
 ``imbi:commit-sync`` stream, with a per-project debounce, stale-entry
 reclaim, and a dead-letter queue after repeated failures.  Each job runs
-a full commit/tag backfill via :func:`commit_sync.service.run_sync` and
+a commit/tag sync via :func:`commit_sync.service.run_sync` -- incremental
+from the project's cursor unless the job asks for a full backfill -- and
 records the outcome on the ``Project`` node.
 """
 
@@ -21,6 +22,7 @@ from imbi_common import graph
 from imbi_common.plugins.errors import PluginRateLimited
 from valkey import asyncio as valkey
 
+from imbi_api import stream_workers
 from imbi_api.commit_sync.service import (
     CommitSyncUnavailable,
     run_sync,
@@ -56,9 +58,12 @@ async def enqueue_commit_sync(
     org_slug: str,
     project_id: str,
     requested_by: str | None = None,
+    full: bool = False,
 ) -> bool:
     """Debounce-then-XADD a commit-sync job. Returns True if enqueued.
 
+    *full* forces a full history backfill instead of an incremental sync.
+
     Tolerates *client* being ``None`` (returns False) so the endpoint can
     surface "queueing unavailable" rather than 500 when Valkey is down.
     """
@@ -75,6 +80,7 @@ async def enqueue_commit_sync(
                 'org_slug': org_slug,
                 'project_id': project_id,
                 'requested_by': requested_by or 'system',
+                'full': '1' if full else '0',
             },
         )
     except Exception:
@@ -102,13 +108,14 @@ async def _process_message(db: graph.Graph, fields: dict[str, str]) -> None:
     project_id = fields.get('project_id')
     org_slug = fields.get('org_slug') or ''
     requested_by = fields.get('requested_by') or 'system'
+    full = fields.get('full') == '1'
     if not project_id:
         return
     await set_status(
         db, project_id, status='running', requested_by=requested_by
     )
     try:
-        commits, tags = await run_sync(db, org_slug, project_id)
+        result = await run_sync(db, org_slug, project_id, full=full)
     except CommitSyncUnavailable as exc:
         # Misconfiguration, not transient: record and don't retry.
         LOGGER.warning('commit-sync unavailable for %s: %s', project_id, exc)
@@ -147,18 +154,20 @@ async def _process_message(db: graph.Graph, fields: dict[str, str]) -> None:
         )
         raise
     LOGGER.info(
-        'commit-sync for %s recorded %d commits, %d tags',
+        'commit-sync (%s) for %s recorded %d commits, %d tags',
+        result.mode,
         project_id,
-        commits,
-        tags,
+        result.commits,
+        result.tags,
     )
     await set_status(
         db,
         project_id,
         status='success',
         requested_by=requested_by,
-        commits=commits,
-        tags=tags,
+        commits=result.commits,
+        tags=result.tags,
+        mode=result.mode,
     )
 
 
@@ -260,30 +269,48 @@ async def _handle_entries(
     entries: list[tuple[bytes, abc.Mapping[bytes | str, bytes | str]]],
     db: graph.Graph,
     check_dlq: bool = False,
+    limiter: stream_workers.AdaptiveConcurrency | None = None,
 ) -> None:
+    """Run one batch through the worker pool (serially without *limiter*).
+
+    Different projects run concurrently up to the limiter's limit; one
+    project's entries run in stream order.
+    """
+    batch: list[stream_workers.Entry] = []
     for msg_id, raw_fields in entries:
         fields = _decode_fields(raw_fields)
         if check_dlq and await _maybe_dead_letter(client, msg_id, fields):
             continue
+        batch.append((msg_id, fields))
+
+    async def handle(msg_id: bytes, fields: dict[str, str]) -> bool:
         try:
             await _process_message(db, fields)
-        except PluginRateLimited as exc:
-            # Don't ack, don't dead-letter: leave the job pending and pause
-            # every worker until GitHub resets.  Stop the batch -- its
-            # siblings hit the same token -- and let the next reclaim drain
-            # it once the pause clears.
-            await _pause_until(client, exc.retry_at)
-            LOGGER.warning(
-                'commit-sync paused ~%.0fs (GitHub rate limit); %d job(s) '
-                'left queued',
-                max(0.0, exc.retry_at - time.time()),
-                len(entries),
-            )
-            return
+        except PluginRateLimited:
+            raise
         except Exception:
             LOGGER.exception('commit-sync failed for %s', fields)
-            continue
+            return False
         await client.xack(STREAM, GROUP, msg_id)
+        return True
+
+    limited = await stream_workers.dispatch(
+        batch,
+        handle,
+        limiter or stream_workers.AdaptiveConcurrency(1),
+        stream_workers.stream_stats(STREAM),
+    )
+    if limited is not None:
+        # Don't ack, don't dead-letter: jobs that had not started stay
+        # pending, and every worker pauses until GitHub resets; the next
+        # reclaim drains them once the pause clears.
+        await _pause_until(client, limited.retry_at)
+        LOGGER.warning(
+            'commit-sync paused ~%.0fs (GitHub rate limit); %d job(s) '
+            'left queued',
+            max(0.0, limited.retry_at - time.time()),
+            len(batch),
+        )
 
 
 async def consume_commit_sync(
@@ -291,8 +318,18 @@ async def consume_commit_sync(
     db: graph.Graph,
     consumer: str | None = None,
     stop: asyncio.Event | None = None,
+    *,
+    concurrency: int = 1,
+    recover_after: int = 8,
 ) -> None:
-    """Run the commit-sync consumer loop until *stop* is set."""
+    """Run the commit-sync consumer loop until *stop* is set.
+
+    Up to *concurrency* jobs run at once, backing off on rate limits;
+    see :mod:`imbi_api.stream_workers`.
+    """
+    limiter = stream_workers.AdaptiveConcurrency(
+        concurrency, recover_after=recover_after
+    )
     # Derive a per-process consumer name so concurrent workers don't share
     # a Pending Entries List and stale-claim each other's in-flight jobs.
     consumer = (
@@ -308,7 +345,9 @@ async def consume_commit_sync(
         stale = await _claim_stale(client, consumer)
         if stale:
             try:
-                await _handle_entries(client, stale, db, check_dlq=True)
+                await _handle_entries(
+                    client, stale, db, check_dlq=True, limiter=limiter
+                )
             except Exception:
                 LOGGER.exception('commit-sync stale-entry handling failed')
                 await asyncio.sleep(1)
@@ -322,7 +361,7 @@ async def consume_commit_sync(
                 GROUP,
                 consumer,
                 {STREAM: '>'},
-                count=16,
+                count=max(16, concurrency),
                 block=2000,
             )
         except Exception:
@@ -335,7 +374,7 @@ async def consume_commit_sync(
             'list[tuple[object, list[typing.Any]]]', response
         ):
             try:
-                await _handle_entries(client, entries, db)
+                await _handle_entries(client, entries, db, limiter=limiter)
             except Exception:
                 LOGGER.exception('commit-sync entry handling failed')
                 await asyncio.sleep(1)
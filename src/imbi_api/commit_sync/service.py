@@ -8,6 +8,14 @@ needs (project links + identity-capable integrations for attribution),
 decrypts the credential, and awaits the capability's
 ``sync_all_history`` method.
 
+When the plugin implements :class:`IncrementalCommitSync`, every
+successful run records a :class:`SyncCursor` -- the newest synced
+commit and a hash of the synced tag set, read back from ClickHouse --
+on the ``Project`` node, and later runs only request history after
+it.  Passing ``full=True`` (or a project with no cursor yet) falls back
+to the full backfill.  Plugins without the incremental method always
+backfill, so no cursor is computed or stored for them.
+
 Last-sync state is persisted as a handful of properties on the ``Project``
 node so the UI can poll it without a dedicated status store.
 """
@@ -16,15 +24,17 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import hashlib
 import logging
 import typing
 
 import fastapi
 import pydantic
-from imbi_common import graph
+from imbi_common import clickhouse, graph
 from imbi_common.plugins import decrypt_integration_credentials
 from imbi_common.plugins.base import CommitSyncCapability, PluginContext
 
+from imbi_api import release_state
 from imbi_api.identity import attribution
 from imbi_api.plugins.resolution import (
     ResolvedCapability,
@@ -46,6 +56,7 @@ _STATUS_WRITE_RETRIES = 3
 _STATUS_RETRY_BACKOFF = 0.05
 
 SyncState = typing.Literal['idle', 'queued', 'running', 'success', 'failed']
+SyncMode = typing.Literal['full', 'incremental']
 
 
 class CommitSyncUnavailable(Exception):
@@ -61,6 +72,45 @@ class CommitSyncStatus(pydantic.BaseModel):
     tags_synced: int | None = None
     error: str | None = None
     requested_by: str | None = None
+    mode: SyncMode | None = None
+    head_sha: str | None = None
+
+
+class SyncCursor(pydantic.BaseModel):
+    """High-water mark of the history already synced for a project."""
+
+    head_sha: str
+    head_at: datetime.datetime | None = None
+    tags_hash: str = ''
+
+
+class SyncResult(typing.NamedTuple):
+    """Outcome of :func:`run_sync`; counts are the run's delta."""
+
+    commits: int
+    tags: int
+    mode: SyncMode
+
+
+@typing.runtime_checkable
+class IncrementalCommitSync(typing.Protocol):
+    """Optional plugin method for syncing only history after a cursor.
+
+    ``since_sha`` / ``since`` are the newest commit already synced and
+    its push (or author) time; ``tags_hash`` is :func:`tags_hash` of
+    the synced tag set, so the plugin can skip the tag listing when the
+    upstream set is unchanged.  Returns ``(commits, tags)`` recorded.
+    """
+
+    async def sync_history_since(
+        self,
+        *,
+        ctx: PluginContext,
+        credentials: dict[str, typing.Any],
+        since_sha: str,
+        since: datetime.datetime | None,
+        tags_hash: str,
+    ) -> tuple[int, int]: ...
 
 
 async def _build_context(
@@ -127,13 +177,16 @@ async def check_available(
 
 
 async def run_sync(
-    db: graph.Graph, org_slug: str, project_id: str
-) -> tuple[int, int]:
-    """Resolve the commit-sync capability and run a full history backfill.
-
-    Returns ``(commits_recorded, tags_recorded)``.  Raises
-    :class:`CommitSyncUnavailable` when no integration provides the
-    capability; other failures propagate so the caller can record them.
+    db: graph.Graph, org_slug: str, project_id: str, *, full: bool = False
+) -> SyncResult:
+    """Resolve the commit-sync capability and sync the project's history.
+
+    Incremental when the project has a cursor, the plugin implements
+    :class:`IncrementalCommitSync` and *full* is false; otherwise a full
+    backfill.  Raises :class:`CommitSyncUnavailable` when no integration
+    provides the capability; other failures propagate so the caller can
+    record them.  The cursor (for incremental-capable plugins) and the
+    project's release state are advanced only after a successful run.
     """
     try:
         resolved = await resolve_capability(
@@ -146,7 +199,132 @@ async def run_sync(
         resolved.encrypted_credentials
     )
     handler = typing.cast('CommitSyncCapability', resolved.capability_cls())
-    return await handler.sync_all_history(ctx=ctx, credentials=credentials)
+    incremental = (
+        handler if isinstance(handler, IncrementalCommitSync) else None
+    )
+    cursor = (
+        await read_cursor(db, project_id)
+        if incremental is not None and not full
+        else None
+    )
+    if incremental is not None and cursor is not None:
+        commits, tags = await incremental.sync_history_since(
+            ctx=ctx,
+            credentials=credentials,
+            since_sha=cursor.head_sha,
+            since=cursor.head_at,
+            tags_hash=cursor.tags_hash,
+        )
+        mode: SyncMode = 'incremental'
+    else:
+        commits, tags = await handler.sync_all_history(
+            ctx=ctx, credentials=credentials
+        )
+        mode = 'full'
+    if incremental is not None:
+        await _advance_cursor(db, project_id)
+    await release_state.refresh([project_id])
+    return SyncResult(commits, tags, mode)
+
+
+def tags_hash(tags: typing.Iterable[tuple[str, str]]) -> str:
+    """Hash a ``(name, sha)`` tag set independent of its order."""
+    digest = hashlib.sha256()
+    for name, sha in sorted(tags):
+        digest.update(f'{name}\0{sha}\n'.encode())
+    return digest.hexdigest()
+
+
+async def compute_cursor(project_id: str) -> SyncCursor | None:
+    """Read the synced high-water mark back from ClickHouse.
+
+    ``None`` when no commit has been recorded for the project.
+    """
+    head_rows, tag_rows = await asyncio.gather(
+        clickhouse.query(
+            'SELECT sha, pushed_at, authored_at FROM commits FINAL'
+            ' WHERE project_id = {project_id:String}'
+            ' ORDER BY pushed_at DESC, authored_at DESC LIMIT 1',
+            {'project_id': project_id},
+        ),
+        clickhouse.query(
+            'SELECT name, sha FROM tags FINAL'
+            ' WHERE project_id = {project_id:String}',
+            {'project_id': project_id},
+        ),
+    )
+    if not head_rows:
+        return None
+    head = head_rows[0]
+    head_at = head.get('pushed_at') or head.get('authored_at')
+    return SyncCursor(
+        head_sha=str(head['sha']),
+        head_at=head_at if isinstance(head_at, datetime.datetime) else None,
+        tags_hash=tags_hash(
+            (str(row['name']), str(row['sha'])) for row in tag_rows
+        ),
+    )
+
+
+async def read_cursor(db: graph.Graph, project_id: str) -> SyncCursor | None:
+    """Return the persisted cursor, ``None`` before the first sync."""
+    query: typing.LiteralString = """
+    MATCH (p:Project {{id: {project_id}}})
+    RETURN p.commit_sync_head_sha AS head_sha,
+           p.commit_sync_head_at AS head_at,
+           p.commit_sync_tags_hash AS tags_hash
+    """
+    records = await db.execute(
+        query, {'project_id': project_id}, ['head_sha', 'head_at', 'tags_hash']
+    )
+    if not records:
+        return None
+    row = records[0]
+    head_sha = _opt_str(graph.parse_agtype(row.get('head_sha')))
+    if head_sha is None:
+        return None
+    return SyncCursor(
+        head_sha=head_sha,
+        head_at=_opt_datetime(graph.parse_agtype(row.get('head_at'))),
+        tags_hash=_opt_str(graph.parse_agtype(row.get('tags_hash'))) or '',
+    )
+
+
+async def _advance_cursor(db: graph.Graph, project_id: str) -> None:
+    """Persist the post-run cursor (best-effort).
+
+    A failure only costs the next run its incremental head start; the
+    synced rows themselves are already in ClickHouse.
+    """
+    query: typing.LiteralString = """
+    MATCH (p:Project {{id: {project_id}}})
+    SET p.commit_sync_head_sha = {head_sha},
+        p.commit_sync_head_at = {head_at},
+        p.commit_sync_tags_hash = {tags_hash}
+    RETURN p.id AS id
+    """
+    try:
+        cursor = await compute_cursor(project_id)
+        if cursor is None:
+            return
+        await db.execute(
+            query,
+            {
+                'project_id': project_id,
+                'head_sha': cursor.head_sha,
+                'head_at': (
+                    cursor.head_at.isoformat() if cursor.head_at else ''
+                ),
+                'tags_hash': cursor.tags_hash,
+            },
+            ['id'],
+        )
+    except Exception:
+        LOGGER.warning(
+            'Failed to persist commit-sync cursor for project %s',
+            project_id,
+            exc_info=True,
+        )
 
 
 def _now_iso() -> str:
@@ -167,6 +345,7 @@ async def set_status(
     commits: int = 0,
     tags: int = 0,
     error: str = '',
+    mode: SyncMode | None = None,
     retry: bool = True,
 ) -> None:
     """Persist last-sync state on the ``Project`` node (best-effort).
@@ -177,6 +356,9 @@ async def set_status(
     enqueue endpoint passes ``retry=False`` for its optimistic ``queued``
     write: dropping that on conflict is correct, since the worker's newer
     ``running`` write must win rather than be clobbered back to ``queued``.
+
+    *commits* / *tags* are the run's delta (the whole history for a
+    ``full`` run); *mode* records which kind of run produced them.
     """
     query: typing.LiteralString = """
     MATCH (p:Project {{id: {project_id}}})
@@ -185,7 +367,8 @@ async def set_status(
         p.commit_sync_by = {by},
         p.commit_sync_commits = {commits},
         p.commit_sync_tags = {tags},
-        p.commit_sync_error = {error}
+        p.commit_sync_error = {error},
+        p.commit_sync_mode = {mode}
     RETURN p.id AS id
     """
     params = {
@@ -196,13 +379,14 @@ async def set_status(
         'commits': commits,
         'tags': tags,
         'error': error[:_MAX_ERROR_LEN],
+        'mode': mode or '',
     }
     attempts = _STATUS_WRITE_RETRIES if retry else 1
     for attempt in range(attempts):
         try:
             await db.execute(query, params, ['id'])
             return
-        except Exception as exc:  # noqa: BLE001
+        except Exception as exc:
             conflict = _is_write_conflict(exc)
             if retry and conflict and attempt + 1 < attempts:
                 await asyncio.sleep(_STATUS_RETRY_BACKOFF * (attempt + 1))
@@ -241,6 +425,16 @@ def _opt_int(value: object) -> int | None:
     return None
 
 
+def _opt_datetime(value: object) -> datetime.datetime | None:
+    text = _opt_str(value)
+    if not text:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
 async def read_status(db: graph.Graph, project_id: str) -> CommitSyncStatus:
     """Read last-sync state from the ``Project`` node (``idle`` default)."""
     query: typing.LiteralString = """
@@ -250,12 +444,23 @@ async def read_status(db: graph.Graph, project_id: str) -> CommitSyncStatus:
            p.commit_sync_by AS requested_by,
            p.commit_sync_commits AS commits,
            p.commit_sync_tags AS tags,
-           p.commit_sync_error AS error
+           p.commit_sync_error AS error,
+           p.commit_sync_mode AS mode,
+           p.commit_sync_head_sha AS head_sha
     """
     records = await db.execute(
         query,
         {'project_id': project_id},
-        ['status', 'at', 'requested_by', 'commits', 'tags', 'error'],
+        [
+            'status',
+            'at',
+            'requested_by',
+            'commits',
+            'tags',
+            'error',
+            'mode',
+            'head_sha',
+        ],
     )
     if not records:
         return CommitSyncStatus()
@@ -264,18 +469,17 @@ async def read_status(db: graph.Graph, project_id: str) -> CommitSyncStatus:
     status: SyncState = 'idle'
     if status_raw in ('queued', 'running', 'success', 'failed', 'idle'):
         status = status_raw
-    at_raw = _opt_str(graph.parse_agtype(row.get('at')))
-    last_synced_at: datetime.datetime | None = None
-    if at_raw:
-        try:
-            last_synced_at = datetime.datetime.fromisoformat(at_raw)
-        except ValueError:
-            last_synced_at = None
+    mode_raw = graph.parse_agtype(row.get('mode'))
+    mode: SyncMode | None = None
+    if mode_raw in ('full', 'incremental'):
+        mode = mode_raw
     return CommitSyncStatus(
         status=status,
-        last_synced_at=last_synced_at,
+        last_synced_at=_opt_datetime(graph.parse_agtype(row.get('at'))),
         commits_synced=_opt_int(graph.parse_agtype(row.get('commits'))),
         tags_synced=_opt_int(graph.parse_agtype(row.get('tags'))),
         error=_opt_str(graph.parse_agtype(row.get('error'))),
         requested_by=_opt_str(graph.parse_agtype(row.get('requested_by'))),
+        mode=mode,
+        head_sha=_opt_str(graph.parse_agtype(row.get('head_sha'))),
     )
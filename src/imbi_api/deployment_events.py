@@ -0,0 +1,250 @@
+"""Append-only storage for release deployment history.
+
+Every ``DeploymentEvent`` recorded against a ``Release -[:DEPLOYED_TO]->
+Environment`` edge lands as one row in ``public.deployment_events``,
+keyed by ``(release_id, env_slug, occurred_at)``.  The graph edge only
+carries a ``latest_event`` summary (the event with the newest
+timestamp), which is all the list views need, so appending an event
+no longer rewrites -- and re-parses -- the whole history.
+
+``external_run_id`` dedupe is a lookup on a partial index rather than a
+scan of the history.  Edges written before this table existed still
+hold their history in the ``deployments`` edge property; the release
+endpoints move it here on the next write to the edge.
+
+Rows are only reachable through an existing ``DEPLOYED_TO`` edge.
+:func:`replace` swaps in a whole history in one transaction -- for a
+new edge, whose ``(release_id, env_slug)`` may still hold rows from a
+since-deleted one, and for the legacy move, so a retried move never
+copies the events twice.  :func:`purge` drops the history of deleted
+releases and environments.
+"""
+
+import logging
+import typing
+
+import psycopg
+from imbi_common import graph, models
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA: tuple[typing.LiteralString, ...] = (
+    'CREATE TABLE IF NOT EXISTS public.deployment_events ('
+    ' id BIGSERIAL PRIMARY KEY,'
+    ' release_id TEXT NOT NULL,'
+    ' env_slug TEXT NOT NULL,'
+    ' occurred_at TIMESTAMPTZ NOT NULL,'
+    ' status TEXT NOT NULL,'
+    ' note TEXT,'
+    ' external_run_id TEXT,'
+    ' external_run_url TEXT,'
+    ' performed_by TEXT)',
+    'CREATE INDEX IF NOT EXISTS deployment_events_edge_idx'
+    ' ON public.deployment_events (release_id, env_slug, occurred_at)',
+    'CREATE INDEX IF NOT EXISTS deployment_events_run_idx'
+    ' ON public.deployment_events (release_id, env_slug, external_run_id)'
+    ' WHERE external_run_id IS NOT NULL',
+)
+
+_COLUMNS: typing.LiteralString = (
+    'id, env_slug, occurred_at, status, note,'
+    ' external_run_id, external_run_url, performed_by'
+)
+
+
+class StoredEvent(typing.NamedTuple):
+    """A persisted event and the row id used to update it in place."""
+
+    id: int
+    event: models.DeploymentEvent
+
+
+def _to_event(row: tuple[typing.Any, ...]) -> StoredEvent:
+    return StoredEvent(
+        id=row[0],
+        event=models.DeploymentEvent(
+            timestamp=row[2],
+            status=row[3],
+            note=row[4],
+            external_run_id=row[5],
+            external_run_url=row[6],
+            performed_by=row[7],
+        ),
+    )
+
+
+def _params(event: models.DeploymentEvent) -> dict[str, typing.Any]:
+    return {
+        'occurred_at': event.timestamp,
+        'status': event.status,
+        'note': event.note,
+        'external_run_id': event.external_run_id,
+        'external_run_url': event.external_run_url,
+        'performed_by': event.performed_by,
+    }
+
+
+async def ensure_schema(db: graph.Graph) -> None:
+    """Create the table and its indexes when they do not exist."""
+    async with db.pool.connection() as conn:
+        for statement in _SCHEMA:
+            await conn.execute(statement)
+
+
+_INSERT: typing.LiteralString = (
+    'INSERT INTO public.deployment_events'
+    ' (release_id, env_slug, occurred_at, status, note,'
+    ' external_run_id, external_run_url, performed_by)'
+    ' VALUES (%(release_id)s, %(env_slug)s, %(occurred_at)s,'
+    ' %(status)s, %(note)s, %(external_run_id)s,'
+    ' %(external_run_url)s, %(performed_by)s)'
+)
+
+
+async def _insert(
+    conn: psycopg.AsyncConnection[typing.Any],
+    release_id: str,
+    env_slug: str,
+    events: typing.Sequence[models.DeploymentEvent],
+) -> None:
+    async with conn.cursor() as cur:
+        await cur.executemany(
+            _INSERT,
+            [
+                {
+                    'release_id': release_id,
+                    'env_slug': env_slug,
+                    **_params(event),
+                }
+                for event in events
+            ],
+        )
+
+
+async def append(
+    db: graph.Graph,
+    release_id: str,
+    env_slug: str,
+    events: typing.Sequence[models.DeploymentEvent],
+) -> None:
+    """Append ``events`` to the edge's history, in order."""
+    if not events:
+        return
+    async with db.pool.connection() as conn:
+        await _insert(conn, release_id, env_slug, events)
+
+
+async def replace(
+    db: graph.Graph,
+    release_id: str,
+    env_slug: str,
+    events: typing.Sequence[models.DeploymentEvent],
+) -> None:
+    """Make ``events`` the edge's whole history, atomically."""
+    async with db.pool.connection() as conn, conn.transaction():
+        await conn.execute(
+            'DELETE FROM public.deployment_events'
+            ' WHERE release_id = %(release_id)s AND env_slug = %(env_slug)s',
+            {'release_id': release_id, 'env_slug': env_slug},
+        )
+        if events:
+            await _insert(conn, release_id, env_slug, events)
+
+
+async def update(
+    db: graph.Graph,
+    event_id: int,
+    event: models.DeploymentEvent,
+) -> None:
+    """Overwrite a stored event in place (``external_run_id`` dedupe)."""
+    async with db.pool.connection() as conn:
+        await conn.execute(
+            'UPDATE public.deployment_events'
+            ' SET occurred_at = %(occurred_at)s, status = %(status)s,'
+            ' note = %(note)s, external_run_url = %(external_run_url)s,'
+            ' performed_by = %(performed_by)s'
+            ' WHERE id = %(id)s',
+            {'id': event_id, **_params(event)},
+        )
+
+
+async def find_run(
+    db: graph.Graph,
+    release_id: str,
+    env_slug: str,
+    external_run_id: str,
+) -> StoredEvent | None:
+    """Return the most recently recorded event for a workflow run."""
+    async with db.pool.connection() as conn:
+        cursor = await conn.execute(
+            f'SELECT {_COLUMNS} FROM public.deployment_events'  # noqa: S608
+            ' WHERE release_id = %(release_id)s'
+            ' AND env_slug = %(env_slug)s'
+            ' AND external_run_id = %(external_run_id)s'
+            ' ORDER BY id DESC LIMIT 1',
+            {
+                'release_id': release_id,
+                'env_slug': env_slug,
+                'external_run_id': external_run_id,
+            },
+        )
+        row = await cursor.fetchone()
+    return _to_event(row) if row else None
+
+
+async def history(
+    db: graph.Graph,
+    release_id: str,
+    env_slugs: typing.Sequence[str],
+) -> dict[str, list[models.DeploymentEvent]]:
+    """Return ``{env_slug: events}`` in the order they were recorded."""
+    result: dict[str, list[models.DeploymentEvent]] = {}
+    if not env_slugs:
+        return result
+    async with db.pool.connection() as conn:
+        cursor = await conn.execute(
+            f'SELECT {_COLUMNS} FROM public.deployment_events'  # noqa: S608
+            ' WHERE release_id = %(release_id)s'
+            ' AND env_slug = ANY(%(env_slugs)s)'
+            ' ORDER BY id',
+            {'release_id': release_id, 'env_slugs': list(env_slugs)},
+        )
+        rows = typing.cast(
+            'list[tuple[typing.Any, ...]]', await cursor.fetchall()
+        )
+    for row in rows:
+        result.setdefault(row[1], []).append(_to_event(row).event)
+    return result
+
+
+async def purge(
+    db: graph.Graph,
+    release_ids: typing.Sequence[str],
+    env_slug: str | None = None,
+) -> None:
+    """Drop the history of deleted releases or a deleted environment.
+
+    Called after the graph delete has committed, so a failure is only
+    logged: the rows are unreachable without their edge, and
+    :func:`replace` clears them if the edge is ever recreated.
+    """
+    if not release_ids:
+        return
+    query: typing.LiteralString = (
+        'DELETE FROM public.deployment_events'
+        ' WHERE release_id = ANY(%(release_ids)s)'
+    )
+    if env_slug is not None:
+        query += ' AND env_slug = %(env_slug)s'
+    try:
+        async with db.pool.connection() as conn:
+            await conn.execute(
+                query,
+                {'release_ids': list(release_ids), 'env_slug': env_slug},
+            )
+    except psycopg.Error:
+        LOGGER.warning(
+            'Failed to purge deployment history for %d release(s)',
+            len(release_ids),
+            exc_info=True,
+        )
@@ -23,6 +23,7 @@ from imbi_common import graph
 from imbi_common.plugins.errors import PluginRateLimited
 from valkey import asyncio as valkey
 
+from imbi_api import stream_workers
 from imbi_api.deployment_sync.service import (
     DeploymentSyncUnavailable,
     run_resync,
@@ -304,35 +305,53 @@ async def _handle_entries(
     db: graph.Graph,
     consumer: str,
     check_dlq: bool = False,
+    limiter: stream_workers.AdaptiveConcurrency | None = None,
 ) -> None:
+    """Run one batch through the worker pool (serially without *limiter*).
+
+    Different projects run concurrently up to the limiter's limit; one
+    project's entries run in stream order.
+    """
+    batch: list[stream_workers.Entry] = []
     for msg_id, raw_fields in entries:
         fields = _decode_fields(raw_fields)
         if check_dlq and await _maybe_dead_letter(client, msg_id, fields):
             continue
+        batch.append((msg_id, fields))
+
+    async def handle(msg_id: bytes, fields: dict[str, str]) -> bool:
         renewer = asyncio.ensure_future(_renew_claim(client, consumer, msg_id))
         try:
             await _process_message(db, fields)
-        except PluginRateLimited as exc:
-            # Don't ack, don't dead-letter: leave the job pending and
-            # pause every worker until GitHub resets.  Stop the batch --
-            # its siblings hit the same token -- and let the next
-            # reclaim drain it once the pause clears.
-            await _pause_until(client, exc.retry_at)
-            LOGGER.warning(
-                'deployment-sync paused ~%.0fs (GitHub rate limit); %d '
-                'job(s) left queued',
-                max(0.0, exc.retry_at - time.time()),
-                len(entries),
-            )
-            return
+        except PluginRateLimited:
+            raise
         except Exception:
             LOGGER.exception('deployment-sync failed for %s', fields)
-            continue
+            return False
         finally:
             renewer.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await renewer
         await client.xack(STREAM, GROUP, msg_id)
+        return True
+
+    limited = await stream_workers.dispatch(
+        batch,
+        handle,
+        limiter or stream_workers.AdaptiveConcurrency(1),
+        stream_workers.stream_stats(STREAM),
+    )
+    if limited is not None:
+        # Don't ack, don't dead-letter: jobs that had not started stay
+        # pending, and every worker pauses until GitHub resets; the next
+        # reclaim drains them once the pause clears.
+        await _pause_until(client, limited.retry_at)
+        LOGGER.warning(
+            'deployment-sync paused ~%.0fs (GitHub rate limit); %d job(s) '
+            'left queued',
+            max(0.0, limited.retry_at - time.time()),
+            len(batch),
+        )
 
 
 async def consume_deployment_sync(
@@ -340,8 +359,18 @@ async def consume_deployment_sync(
     db: graph.Graph,
     consumer: str | None = None,
     stop: asyncio.Event | None = None,
+    *,
+    concurrency: int = 1,
+    recover_after: int = 8,
 ) -> None:
-    """Run the deployment-sync consumer loop until *stop* is set."""
+    """Run the deployment-sync consumer loop until *stop* is set.
+
+    Up to *concurrency* jobs run at once, backing off on rate limits;
+    see :mod:`imbi_api.stream_workers`.
+    """
+    limiter = stream_workers.AdaptiveConcurrency(
+        concurrency, recover_after=recover_after
+    )
     # Derive a per-process consumer name so concurrent workers don't
     # share a Pending Entries List and stale-claim each other's
     # in-flight jobs.
@@ -361,7 +390,12 @@ async def consume_deployment_sync(
         if stale:
             try:
                 await _handle_entries(
-                    client, stale, db, consumer, check_dlq=True
+                    client,
+                    stale,
+                    db,
+                    consumer,
+                    check_dlq=True,
+                    limiter=limiter,
                 )
             except Exception:
                 LOGGER.exception('deployment-sync stale-entry handling failed')
@@ -376,7 +410,7 @@ async def consume_deployment_sync(
                 GROUP,
                 consumer,
                 {STREAM: '>'},
-                count=16,
+                count=max(16, concurrency),
                 block=2000,
             )
         except Exception:
@@ -389,7 +423,9 @@ async def consume_deployment_sync(
             'list[tuple[object, list[typing.Any]]]', response
         ):
             try:
-                await _handle_entries(client, entries, db, consumer)
+                await _handle_entries(
+                    client, entries, db, consumer, limiter=limiter
+                )
             except Exception:
                 LOGGER.exception('deployment-sync entry handling failed')
                 await asyncio.sleep(1)
@@ -12,6 +12,7 @@ from imbi_common import graph
 from imbi_common.plugins.base import PluginContext, ServiceConnection
 
 from imbi_api import patch as json_patch
+from imbi_api.auth import invalidation
 
 LOGGER = logging.getLogger(__name__)
 
@@ -141,6 +142,7 @@ async def update_membership_role(
                 f' of organization {org_slug!r}'
             ),
         )
+    await invalidation.publish_principal_changed(principal_value)
 
 
 async def lookup_project_slugs(
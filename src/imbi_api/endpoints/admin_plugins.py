@@ -15,6 +15,7 @@ from imbi_common.plugins.registry import (
 from imbi_api.auth import permissions
 from imbi_api.domain import models
 from imbi_api.endpoints import plugin_edges as _plugin_edges
+from imbi_api.plugins import binding_cache
 from imbi_api.plugins.lifecycle import (
     get_enabled_map,
     set_plugin_enabled,
@@ -108,6 +109,7 @@ async def update_plugin_registration(
             detail=f'Plugin {slug!r} is not installed',
         ) from exc
     await set_plugin_enabled(db, slug, body.enabled)
+    await binding_cache.invalidate()
     return _build_response(entry, body.enabled)
 
 
@@ -19,6 +19,7 @@ from valkey import asyncio as valkey_module
 from imbi_api import models, settings
 from imbi_api.auth import (
     authorization_codes,
+    invalidation,
     local_auth,
     login_providers,
     oauth_clients,
@@ -979,6 +980,9 @@ async def _handle_refresh_reuse(
     if cascade_rows:
         raw = graph.parse_agtype(cascade_rows[0].get('revoked_count'))
         cascaded = int(raw or 0)
+    # The cascade also revokes access tokens whose jtis we don't have
+    # in hand; reuse is rare enough that a full cache flush is fine.
+    await invalidation.publish_all_changed()
     LOGGER.error(
         'Refresh-token reuse detected (jti=%s, family_id=%s); '
         'revoked %d sibling tokens',
@@ -1207,6 +1211,7 @@ async def logout(
         query,
         {'jti': auth.session_id, 'now': now_str},
     )
+    await invalidation.publish_token_revoked(auth.session_id)
 
     if revoke_all_sessions:
         if auth.service_account:
@@ -1252,6 +1257,7 @@ async def logout(
                 del_q,
                 {'email': auth.user.email},
             )
+        await invalidation.publish_principal_changed(auth.principal_name)
     else:
         # Revoke only associated refresh token
         issued_q: typing.LiteralString = """
@@ -23,8 +23,8 @@ import fastapi
 import nanoid
 import pydantic
 from imbi_common import graph
-from imbi_common.clickhouse import client as ch_client
 
+from imbi_api import event_buffer, search_scope
 from imbi_api import patch as json_patch
 from imbi_api.auth import permissions
 
@@ -54,8 +54,18 @@ async def _emit_comment_event(
     failed analytics write must not fail the comment request.
     """
     try:
-        await ch_client.Clickhouse.get_instance().insert(
+        await event_buffer.write(
             'events',
+            [
+                'id',
+                'project_id',
+                'recorded_at',
+                'type',
+                'integration',
+                'attributed_to',
+                'metadata',
+                'payload',
+            ],
             [
                 [
                     nanoid.generate(),
@@ -75,16 +85,6 @@ async def _emit_comment_event(
                     },
                 ]
             ],
-            [
-                'id',
-                'project_id',
-                'recorded_at',
-                'type',
-                'integration',
-                'attributed_to',
-                'metadata',
-                'payload',
-            ],
         )
     except Exception:
         LOGGER.exception(
@@ -519,6 +519,8 @@ async def create_comment_thread(
         principal=auth.principal_name,
         body=data.body,
     )
+    if project_id is not None:
+        await search_scope.add_nodes(org_slug, comment_id)
     return thread
 
 
@@ -594,6 +596,8 @@ async def create_reply(
         principal=auth.principal_name,
         body=data.body,
     )
+    if project_id is not None:
+        await search_scope.add_nodes(org_slug, comment_id)
     return _parse_comment(records[0]['c'])
 
 
@@ -903,3 +907,4 @@ async def delete_comment(
         raise fastapi.HTTPException(
             status_code=404, detail=f'Comment {comment_id!r} not found'
         )
+    await search_scope.remove_nodes(org_slug, comment_id)
@@ -7,6 +7,7 @@ blocks on a degraded dependency.
 """
 
 import asyncio
+import dataclasses
 import datetime
 import logging
 import time
@@ -17,8 +18,9 @@ import httpx
 import pydantic
 from imbi_common import clickhouse, graph, valkey
 
-from imbi_api import settings, version
+from imbi_api import event_buffer, rollups, settings, version
 from imbi_api.auth import permissions
+from imbi_api.plugins import compare_cache, log_cache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -55,12 +57,34 @@ class ServiceStatus(pydantic.BaseModel):
     detail: str | None = None
 
 
+class EventBufferStatus(pydantic.BaseModel):
+    """Request-path ClickHouse insert buffer of this API process."""
+
+    depth: int
+    capacity: int
+    flushes: int
+    rows_written: int
+    rows_failed: int
+    last_flush_ms: float | None = None
+    max_flush_ms: float | None = None
+
+
+class CacheStatus(pydantic.BaseModel):
+    """Hit / miss counters of one of this API process's caches."""
+
+    name: str
+    counters: dict[str, int]
+
+
 class DashboardStatus(pydantic.BaseModel):
     """Aggregate system-health snapshot for the admin dashboard."""
 
     checked_at: datetime.datetime
     datastores: list[DatastoreStatus]
     services: list[ServiceStatus]
+    # ``None`` when the buffer is not running (inserts go direct).
+    event_buffer: EventBufferStatus | None = None
+    caches: list[CacheStatus] = []
 
 
 class MetricSeries(pydantic.BaseModel):
@@ -265,10 +289,23 @@ async def get_dashboard_status(
     api_status = ServiceStatus(
         name='API', status='up', version=version, latency_ms=0.0
     )
+    buffer = event_buffer.get_buffer()
     return DashboardStatus(
         checked_at=datetime.datetime.now(datetime.UTC),
         datastores=list(datastores),
         services=[api_status, *services],
+        event_buffer=(
+            EventBufferStatus(**dataclasses.asdict(buffer.stats))
+            if buffer is not None
+            else None
+        ),
+        caches=[
+            CacheStatus(name='plugin_logs', counters=log_cache.stats()),
+            CacheStatus(name='plugin_compare', counters=compare_cache.stats()),
+            CacheStatus(
+                name='auth_jwt', counters=permissions.jwt_cache_stats()
+            ),
+        ],
     )
 
 
@@ -305,39 +342,33 @@ async def get_dashboard_metrics(
         (start_date + datetime.timedelta(days=offset)).isoformat()
         for offset in range(_METRICS_WINDOW_DAYS)
     ]
-    params: dict[str, typing.Any] = {'since': since}
-    # One scan of the (FINAL, merge-on-read) deploy rows yields both the
-    # per-day series and the per-environment rollup.
+    # The closed days come from the daily rollups; only today (and
+    # whatever the last rollup refresh has not reached) is read raw.
+    deploys_src, deploys_params = rollups.source(
+        rollups.OPERATIONS_LOG, where="entry_type = 'Deployed'", since=since
+    )
+    events_src, events_params = rollups.source(rollups.EVENTS, since=since)
+    ops_src, ops_params = rollups.source(rollups.OPERATIONS_LOG, since=since)
+    prs_src, prs_params = rollups.source(rollups.PULL_REQUESTS, since=since)
     deploys, events, ops, prs = await asyncio.gather(
         clickhouse.query(
-            'SELECT toDate(occurred_at) AS day,'
-            ' environment_slug AS slug, count() AS c'
-            ' FROM operations_log FINAL'
-            " WHERE is_deleted = 0 AND entry_type = 'Deployed'"
-            ' AND occurred_at >= {since:DateTime64(3)}'
-            ' GROUP BY day, environment_slug',
-            params,
+            'SELECT day, environment_slug AS slug, sum(entries) AS c'  # noqa: S608
+            ' FROM ' + deploys_src + ' GROUP BY day, environment_slug',
+            deploys_params,
         ),
         clickhouse.query(
-            'SELECT toDate(recorded_at) AS day, count() AS c'
-            ' FROM events WHERE recorded_at >= {since:DateTime64(3)}'
-            ' GROUP BY day',
-            params,
+            'SELECT day, sum(entries) AS c FROM '  # noqa: S608
+            + events_src
+            + ' GROUP BY day',
+            events_params,
         ),
         clickhouse.query(
-            'SELECT toDate(occurred_at) AS day, count() AS c'
-            ' FROM operations_log FINAL'
-            ' WHERE is_deleted = 0'
-            ' AND occurred_at >= {since:DateTime64(3)}'
-            ' GROUP BY day',
-            params,
+            'SELECT day, sum(entries) AS c FROM ' + ops_src + ' GROUP BY day',  # noqa: S608
+            ops_params,
         ),
         clickhouse.query(
-            'SELECT toDate(created_at) AS day, count() AS c'
-            ' FROM pull_requests FINAL'
-            ' WHERE created_at >= {since:DateTime64(3)}'
-            ' GROUP BY day',
-            params,
+            'SELECT day, sum(entries) AS c FROM ' + prs_src + ' GROUP BY day',  # noqa: S608
+            prs_params,
         ),
     )
     releases_by_day: dict[str, int] = {}
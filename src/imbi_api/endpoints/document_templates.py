@@ -15,6 +15,7 @@ import pydantic
 from imbi_common import graph
 
 from imbi_api import patch as json_patch
+from imbi_api import search_scope
 from imbi_api.auth import permissions
 from imbi_api.endpoints._helpers import fetch_or_404
 from imbi_api.graph_sql import props_template, set_clause
@@ -316,6 +317,7 @@ async def create_document_template(
             status_code=500,
             detail='Document template created but could not be read back',
         )
+    await search_scope.add_nodes(org_slug, template.get('id'))
     return template
 
 
@@ -620,3 +622,4 @@ async def delete_document_template(
             status_code=404,
             detail=f'Document template with slug {slug!r} not found',
         )
+    await search_scope.invalidate(org_slug)
@@ -24,6 +24,7 @@ import pydantic
 from imbi_common import graph
 
 from imbi_api import patch as json_patch
+from imbi_api import search_scope
 from imbi_api.auth import permissions
 from imbi_api.endpoints._helpers import fetch_or_404
 from imbi_api.endpoints._pagination import (
@@ -377,7 +378,7 @@ async def create_document(
           -[:OWNED_BY]->(:Team)
           -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
     """
-    return await _create_document_impl(
+    document = await _create_document_impl(
         db,
         auth,
         org_slug,
@@ -386,6 +387,9 @@ async def create_document(
         {'project_id': project_id},
         f'Project {project_id!r} not found',
     )
+    # Only project documents are searchable within the org scope.
+    await search_scope.add_nodes(org_slug, document.get('id'))
+    return document
 
 
 @documents_project_type_router.post(
@@ -966,6 +970,8 @@ async def _delete_document_impl(
         raise fastapi.HTTPException(
             status_code=404, detail=f'Document {document_id!r} not found'
         )
+    # The document's comment threads drop out of scope with it.
+    await search_scope.invalidate(org_slug)
 
 
 @documents_router.delete('/{document_id}', status_code=204)
@@ -8,6 +8,7 @@ import fastapi
 import pydantic
 from imbi_common import blueprints, graph, models
 
+from imbi_api import deployment_events, search_scope
 from imbi_api import patch as json_patch
 from imbi_api.auth import permissions
 from imbi_api.endpoints import plugin_edges as _plugin_edges
@@ -127,6 +128,7 @@ async def create_environment(
     env_props['relationships'] = _environment_relationships(
         request, org_slug, env_props['slug'], 0
     )
+    await search_scope.add_nodes(org_slug, env_props.get('id'))
     return env_props
 
 
@@ -443,12 +445,15 @@ async def delete_environment(
     query = """
     MATCH (e:Environment {{slug: {slug}}})
           -[:BELONGS_TO]->(o:Organization {{slug: {org_slug}}})
+    OPTIONAL MATCH (r:Release)-[:DEPLOYED_TO]->(e)
+    WITH e, collect(r.id) AS release_ids
     DETACH DELETE e
-    RETURN e
+    RETURN release_ids
     """
     records = await db.execute(
         query,
         {'slug': slug, 'org_slug': org_slug},
+        ['release_ids'],
     )
 
     if not records:
@@ -456,6 +461,9 @@ async def delete_environment(
             status_code=404,
             detail=(f'Environment with slug {slug!r} not found'),
         )
+    await search_scope.invalidate(org_slug)
+    release_ids = graph.parse_agtype(records[0].get('release_ids'))
+    await deployment_events.purge(db, release_ids or [], slug)
 
 
 _ENV_ANCHOR_MATCH: typing.LiteralString = (
@@ -3,8 +3,21 @@
 Exposes raw Cypher execution and schema introspection for the admin
 "Graph Query" tool (inspired by Neo4j Desktop). Restricted to users
 with ``is_admin=True``.
+
+Ad-hoc queries run on their own pooled connection under a
+``statement_timeout`` and an SQL ``LIMIT`` one past the row cap (see
+:class:`~imbi_api.settings.GraphQuery`), so a careless full-graph
+``MATCH`` is cut off by the server instead of pinning a connection
+and materializing every row in the API.  Rows are read in chunks and
+can be streamed to the client as NDJSON.
+
+The schema panel reads label sizes from the catalog statistics rather
+than counting each label table, and caches the result per process.
 """
 
+import asyncio
+import collections.abc
+import datetime
 import json
 import logging
 import re
@@ -16,7 +29,9 @@ import psycopg
 import pydantic
 from imbi_common import graph
 from psycopg import sql
+from starlette import types as starlette_types
 
+from imbi_api import settings
 from imbi_api.auth import permissions
 
 LOGGER = logging.getLogger(__name__)
@@ -51,10 +66,16 @@ async def require_admin(
 
 
 class GraphQueryRequest(pydantic.BaseModel):
-    """Request body for ``POST /admin/graph/query``."""
+    """Request body for ``POST /admin/graph/query``.
+
+    ``timeout`` (seconds) and ``row_limit`` may lower the configured
+    limits; values above them are clamped.
+    """
 
     query: str
     params: dict[str, typing.Any] = pydantic.Field(default_factory=dict)
+    timeout: float | None = pydantic.Field(default=None, gt=0)
+    row_limit: int | None = pydantic.Field(default=None, ge=1)
 
 
 class GraphQueryError(pydantic.BaseModel):
@@ -93,20 +114,33 @@ class GraphQueryResponse(pydantic.BaseModel):
     nodes: list[GraphNode]
     edges: list[GraphEdge]
     elapsed_ms: float
+    row_limit: int
+    truncated: bool = False
+
+
+class GraphQueryProfile(pydantic.BaseModel):
+    """Response body for ``POST /admin/graph/query/profile``."""
+
+    sql: str
+    plan: typing.Any
+    elapsed_ms: float
 
 
 class LabelCount(pydantic.BaseModel):
-    """A node label with its instance count."""
+    """A node label with its estimated instance count."""
 
     label: str
     count: int
+    analyzed_at: datetime.datetime | None = None
+    property_keys: list[str] = []
 
 
 class EdgeTypeCount(pydantic.BaseModel):
-    """An edge type with its instance count."""
+    """An edge type with its estimated instance count."""
 
     type: str
     count: int
+    analyzed_at: datetime.datetime | None = None
 
 
 class GraphSchemaResponse(pydantic.BaseModel):
@@ -115,6 +149,7 @@ class GraphSchemaResponse(pydantic.BaseModel):
     node_labels: list[LabelCount]
     edge_types: list[EdgeTypeCount]
     property_keys: list[str]
+    computed_at: datetime.datetime
 
 
 # ---------------------------------------------------------------
@@ -378,75 +413,324 @@ def _error_from_psycopg(exc: psycopg.Error) -> dict[str, typing.Any]:
     return _build_error_response(message, code, line, column, hint)
 
 
+# ---------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------
+
+_NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+#: Rows pulled from the server per round trip while reading results.
+_FETCH_SIZE = 100
+_PARAM_NAME_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+RawRow = tuple[typing.Any, ...]
+
+
+class _Limits(typing.NamedTuple):
+    timeout: float
+    row_limit: int
+
+
+def _limits(body: GraphQueryRequest) -> _Limits:
+    """Apply the request's limits, clamped to the configured ones."""
+    configured = settings.get_graph_query_settings()
+    return _Limits(
+        timeout=min(body.timeout or configured.timeout, configured.timeout),
+        row_limit=min(
+            body.row_limit or configured.max_rows, configured.max_rows
+        ),
+    )
+
+
+def _build_statement(
+    graph_name: str,
+    query: str,
+    params: dict[str, typing.Any],
+    columns: list[str],
+    row_limit: int,
+) -> sql.Composed:
+    """Wrap ``query`` in AGE's ``cypher()`` call.
+
+    ``{name}`` placeholders -- the syntax ``Graph.execute`` takes, with
+    ``{{``/``}}`` for literal braces -- become AGE ``$name`` parameters
+    bound from the JSON map passed as ``$1``.  The ``LIMIT`` is one
+    past ``row_limit`` so the reader can tell the result was cut off.
+
+    Raises:
+        ValueError, KeyError, IndexError: on a bad parameter name or
+            placeholder reference.
+    """
+    for name in params:
+        if not _PARAM_NAME_RE.match(name):
+            raise ValueError(f'Invalid parameter name: {name!r}')
+    template = typing.cast(typing.LiteralString, query)
+    cypher = (
+        sql.SQL(template)
+        .format(**{name: sql.SQL('$' + name) for name in params})
+        .as_string(None)
+    )
+    return sql.SQL(
+        'SELECT * FROM ag_catalog.cypher({graph}, {cypher}{params})'
+        ' AS ({columns}) LIMIT {limit}'
+    ).format(
+        graph=sql.Literal(graph_name),
+        cypher=sql.Literal(cypher),
+        params=sql.SQL(', $1') if params else sql.SQL(''),
+        columns=sql.SQL(', ').join(
+            sql.SQL('{} ag_catalog.agtype').format(sql.Identifier(col))
+            for col in columns
+        ),
+        limit=sql.Literal(row_limit + 1),
+    )
+
+
+def _statement_timeout(timeout_seconds: float) -> sql.Composed:
+    return sql.SQL('SET LOCAL statement_timeout = {}').format(
+        sql.Literal(max(1, int(timeout_seconds * 1000)))
+    )
+
+
+def _bind(params: dict[str, typing.Any]) -> list[str] | None:
+    return [json.dumps(params)] if params else None
+
+
+async def _fetch_rows(
+    db: graph.Graph,
+    statement: sql.Composed,
+    params: dict[str, typing.Any],
+    timeout_seconds: float,
+) -> collections.abc.AsyncGenerator[RawRow]:
+    """Yield the statement's rows, ``_FETCH_SIZE`` at a time.
+
+    The connection is held only while the generator is open; closing
+    it early (row cap reached, client gone) releases it.
+    """
+    async with db.pool.connection() as conn, conn.transaction():
+        cursor = psycopg.AsyncRawCursor(conn)
+        await cursor.execute(_statement_timeout(timeout_seconds))
+        async for row in cursor.stream(
+            statement, _bind(params), size=_FETCH_SIZE
+        ):
+            yield row
+
+
+async def _explain(
+    db: graph.Graph,
+    statement: sql.Composed,
+    params: dict[str, typing.Any],
+    timeout_seconds: float,
+) -> typing.Any:
+    """Return the ``EXPLAIN (ANALYZE, BUFFERS)`` plan for ``statement``.
+
+    ``ANALYZE`` really runs the query, so it does so in a transaction
+    that is always rolled back -- profiling a write changes nothing.
+    """
+    async with (
+        db.pool.connection() as conn,
+        conn.transaction(force_rollback=True),
+    ):
+        cursor = psycopg.AsyncRawCursor(conn)
+        await cursor.execute(_statement_timeout(timeout_seconds))
+        await cursor.execute(
+            sql.SQL('EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {}').format(
+                statement
+            ),
+            _bind(params),
+        )
+        row = await cursor.fetchone()
+    return row[0] if row else None
+
+
+def _shape_row(row: RawRow, columns: list[str]) -> dict[str, typing.Any]:
+    return {
+        col: _parse_value(value)
+        for col, value in zip(columns, row, strict=False)
+    }
+
+
 # ---------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------
 
 
-@graph_query_router.post('/query', response_model=GraphQueryResponse)
-async def run_graph_query(
-    body: GraphQueryRequest,
-    db: graph.Pool,
-    auth: typing.Annotated[
-        permissions.AuthContext, fastapi.Depends(require_admin)
-    ],
-) -> GraphQueryResponse:
-    """Execute an ad-hoc Cypher query against the graph."""
+def _prepare(
+    db: graph.Graph, body: GraphQueryRequest
+) -> tuple[list[str], sql.Composed, _Limits]:
+    """Validate the request and build its SQL, or raise a 400."""
     query = body.query.strip()
     if not query:
         raise fastapi.HTTPException(
             status_code=400,
             detail=_build_error_response('Query must not be empty'),
         )
-
+    limits = _limits(body)
     try:
         columns = _extract_columns(query)
-    except ValueError as exc:
+        statement = _build_statement(
+            db.settings.graph_name,
+            query,
+            body.params,
+            columns,
+            limits.row_limit,
+        )
+    except (ValueError, KeyError, IndexError) as exc:
+        # sql.SQL.format raises on bad placeholder references in the
+        # user's query (e.g. unmatched ``{param}``).
         raise fastapi.HTTPException(
             status_code=400,
-            detail=_build_error_response(str(exc)),
+            detail=_build_error_response(str(exc) or exc.__class__.__name__),
         ) from exc
+    return columns, statement, limits
+
+
+def _query_failed(
+    auth: permissions.AuthContext, exc: psycopg.Error
+) -> fastapi.HTTPException:
+    LOGGER.info(
+        'Graph query failed: principal=%s error=%s',
+        auth.principal_name,
+        exc,
+    )
+    return fastapi.HTTPException(
+        status_code=400,
+        detail=_error_from_psycopg(exc),
+    )
+
+
+def _ndjson(line: dict[str, typing.Any]) -> str:
+    return json.dumps(line) + '\n'
+
+
+async def _stream_ndjson(
+    rows: collections.abc.AsyncGenerator[RawRow],
+    first: RawRow | None,
+    columns: list[str],
+    limits: _Limits,
+    start: float,
+) -> collections.abc.AsyncIterator[str]:
+    """Emit ``columns``, one ``row`` per result row, then ``summary``.
+
+    A failure after the first row (a timeout mid-read, say) ends the
+    stream with an ``error`` line in the JSON error envelope.
+    """
+    count = 0
+    truncated = False
+    try:
+        yield _ndjson({'type': 'columns', 'columns': columns})
+        row = first
+        while row is not None:
+            if count == limits.row_limit:
+                truncated = True
+                break
+            yield _ndjson({'type': 'row', 'row': _shape_row(row, columns)})
+            count += 1
+            row = await anext(rows, None)
+    except psycopg.Error as exc:
+        yield _ndjson({'type': 'error', **_error_from_psycopg(exc)})
+        return
+    finally:
+        await rows.aclose()
+    yield _ndjson(
+        {
+            'type': 'summary',
+            'row_count': count,
+            'row_limit': limits.row_limit,
+            'truncated': truncated,
+            'elapsed_ms': round((time.monotonic() - start) * 1000.0, 3),
+        }
+    )
+
+
+class _RowStreamResponse(fastapi.responses.StreamingResponse):
+    """Stream a query's rows, always closing the row generator.
+
+    A client that disconnects before the body starts never runs the
+    body's ``finally`` (and skips background tasks), so the generator
+    -- and the pooled connection it holds -- is closed once the
+    response is done, however it ended.
+    """
 
+    def __init__(
+        self,
+        rows: collections.abc.AsyncGenerator[RawRow],
+        content: collections.abc.AsyncIterator[str],
+    ) -> None:
+        super().__init__(content, media_type=_NDJSON_MEDIA_TYPE)
+        self._rows = rows
+
+    async def __call__(
+        self,
+        scope: starlette_types.Scope,
+        receive: starlette_types.Receive,
+        send: starlette_types.Send,
+    ) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._rows.aclose()
+
+
+@graph_query_router.post(
+    '/query',
+    response_model=GraphQueryResponse,
+    responses={200: {'content': {_NDJSON_MEDIA_TYPE: {}}}},
+)
+async def run_graph_query(
+    body: GraphQueryRequest,
+    request: fastapi.Request,
+    db: graph.Pool,
+    auth: typing.Annotated[
+        permissions.AuthContext, fastapi.Depends(require_admin)
+    ],
+) -> GraphQueryResponse | fastapi.Response:
+    """Execute an ad-hoc Cypher query against the graph.
+
+    The query runs under the configured ``statement_timeout`` and
+    returns at most ``row_limit`` rows, with ``truncated`` set when
+    more matched.  Sending ``Accept: application/x-ndjson`` streams the
+    rows as newline-delimited JSON -- a ``columns`` line, one ``row``
+    line per row, then a ``summary`` (or ``error``) line -- without
+    the deduplicated ``nodes`` / ``edges`` lists.
+    """
+    columns, statement, limits = _prepare(db, body)
     LOGGER.info(
-        'Graph query: principal=%s columns=%s',
+        'Graph query: principal=%s columns=%s row_limit=%d timeout=%s',
         auth.principal_name,
         columns,
+        limits.row_limit,
+        limits.timeout,
     )
 
     start = time.monotonic()
+    rows = _fetch_rows(db, statement, body.params, limits.timeout)
     try:
-        raw_rows = await db.execute(
-            query, body.params, columns=columns, raw=True
-        )
+        first = await anext(rows, None)
     except psycopg.Error as exc:
-        LOGGER.info(
-            'Graph query failed: principal=%s error=%s',
-            auth.principal_name,
-            exc,
+        raise _query_failed(auth, exc) from exc
+
+    if _NDJSON_MEDIA_TYPE in request.headers.get('accept', ''):
+        return _RowStreamResponse(
+            rows, _stream_ndjson(rows, first, columns, limits, start)
         )
-        raise fastapi.HTTPException(
-            status_code=400,
-            detail=_error_from_psycopg(exc),
-        ) from exc
-    except (ValueError, KeyError, IndexError) as exc:
-        # sql.SQL.format may raise on bad placeholder references in
-        # the user's query (e.g. unmatched ``{param}``).
-        raise fastapi.HTTPException(
-            status_code=400,
-            detail=_build_error_response(str(exc) or exc.__class__.__name__),
-        ) from exc
-    elapsed_ms = (time.monotonic() - start) * 1000.0
 
     nodes: dict[str, GraphNode] = {}
     edges: dict[str, GraphEdge] = {}
     shaped_rows: list[dict[str, typing.Any]] = []
-    for row in raw_rows:
-        shaped: dict[str, typing.Any] = {}
-        for col in columns:
-            value = _parse_value(row.get(col))
-            shaped[col] = value
-            _collect_graph_elements(value, nodes, edges)
-        shaped_rows.append(shaped)
+    truncated = False
+    try:
+        row = first
+        while row is not None:
+            if len(shaped_rows) == limits.row_limit:
+                truncated = True
+                break
+            shaped = _shape_row(row, columns)
+            _collect_graph_elements(shaped, nodes, edges)
+            shaped_rows.append(shaped)
+            row = await anext(rows, None)
+    except psycopg.Error as exc:
+        raise _query_failed(auth, exc) from exc
+    finally:
+        await rows.aclose()
+    elapsed_ms = (time.monotonic() - start) * 1000.0
 
     return GraphQueryResponse(
         columns=columns,
@@ -454,6 +738,36 @@ async def run_graph_query(
         nodes=list(nodes.values()),
         edges=list(edges.values()),
         elapsed_ms=round(elapsed_ms, 3),
+        row_limit=limits.row_limit,
+        truncated=truncated,
+    )
+
+
+@graph_query_router.post('/query/profile', response_model=GraphQueryProfile)
+async def profile_graph_query(
+    body: GraphQueryRequest,
+    db: graph.Pool,
+    auth: typing.Annotated[
+        permissions.AuthContext, fastapi.Depends(require_admin)
+    ],
+) -> GraphQueryProfile:
+    """Return the PostgreSQL plan for an ad-hoc Cypher query.
+
+    Runs ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` on the SQL the
+    query compiles to, under the same timeout and row limit as
+    ``/query``, in a transaction that is rolled back afterwards.
+    """
+    _columns, statement, limits = _prepare(db, body)
+    LOGGER.info('Graph query profile: principal=%s', auth.principal_name)
+    start = time.monotonic()
+    try:
+        plan = await _explain(db, statement, body.params, limits.timeout)
+    except psycopg.Error as exc:
+        raise _query_failed(auth, exc) from exc
+    return GraphQueryProfile(
+        sql=statement.as_string(None),
+        plan=plan,
+        elapsed_ms=round((time.monotonic() - start) * 1000.0, 3),
     )
 
 
@@ -462,62 +776,101 @@ async def run_graph_query(
 # ---------------------------------------------------------------
 
 
+_SCHEMA_STATS_QUERY: typing.LiteralString = """
+    SELECT l.name, l.kind, c.reltuples::bigint, s.n_live_tup,
+           s.n_mod_since_analyze,
+           greatest(s.last_analyze, s.last_autoanalyze)
+      FROM ag_catalog.ag_label l
+      JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
+      JOIN pg_catalog.pg_class c ON c.oid = l.relation
+      LEFT JOIN pg_catalog.pg_stat_user_tables s ON s.relid = l.relation
+     WHERE g.name = {graph}
+       AND l.name NOT LIKE '\\_ag\\_label\\_%' ESCAPE '\\'
+     ORDER BY l.name
+    """
+
+#: Share of ``reltuples`` that may change after an ``ANALYZE`` before
+#: the live-tuple counter is trusted over it.
+_STALE_ANALYZE_FRACTION = 0.1
+_LABEL_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class _CachedSchema(typing.NamedTuple):
+    response: GraphSchemaResponse
+    loaded_at: float
+
+
+_schemas: dict[str, _CachedSchema] = {}
+_schema_loads: dict[str, asyncio.Task[_CachedSchema]] = {}
+
+
+def _estimate_count(
+    reltuples: int, live: int | None, modified: int | None
+) -> int:
+    """Pick the better of the planner estimate and the live counter.
+
+    ``reltuples`` is ``-1`` until a table is first ``ANALYZE``d and
+    drifts as rows are written afterwards; the statistics collector's
+    ``n_live_tup`` is bumped on every write but is zeroed by a stats
+    reset.  Use ``reltuples`` while it is fresh and the counter
+    otherwise.
+    """
+    if reltuples < 0:
+        return max(live or 0, 0)
+    if (
+        live is not None
+        and modified is not None
+        and modified > reltuples * _STALE_ANALYZE_FRACTION
+    ):
+        return max(live, 0)
+    return reltuples
+
+
 async def _load_label_counts(
     db: graph.Graph,
 ) -> tuple[list[LabelCount], list[EdgeTypeCount]]:
-    """Enumerate vertex/edge labels and count rows in each.
+    """Enumerate vertex/edge labels with their estimated row counts.
 
     AGE creates one row in ``ag_catalog.ag_label`` per label
     (``kind = 'v'`` for vertices, ``'e'`` for edges) plus the
     bookkeeping ``_ag_label_vertex`` / ``_ag_label_edge`` rows which
-    are filtered out. Each label is stored in its own table under the
-    graph's schema, so the count is a plain ``count(*)`` per table.
-
-    Counts are exact rather than estimated. ``pg_class.reltuples``
-    would be cheaper but reports ``-1`` for any table not yet
-    ``ANALYZE``d (PostgreSQL 14+), which surfaced as ``0`` for every
-    lightly-written label (User, Team, Organization, ...). The graph
-    is small enough that exact counts stay cheap.
+    are filtered out.  Each label is stored in its own table, so the
+    catalog statistics for that table give its size without scanning
+    it -- see :func:`_estimate_count`.
     """
-    labels_query = sql.SQL(
-        """
-        SELECT l.name AS name, l.kind AS kind
-          FROM ag_catalog.ag_label l
-          JOIN ag_catalog.ag_graph g ON l.graph = g.graphid
-         WHERE g.name = {graph}
-           AND l.name NOT LIKE '\\_ag\\_label\\_%' ESCAPE '\\'
-         ORDER BY l.name
-        """,
-    ).format(graph=sql.Literal(db.settings.graph_name))
-
+    query = sql.SQL(_SCHEMA_STATS_QUERY).format(
+        graph=sql.Literal(db.settings.graph_name)
+    )
     node_labels: list[LabelCount] = []
     edge_types: list[EdgeTypeCount] = []
     async with db.pool.connection() as conn:
         async with conn.cursor() as cursor:
-            await cursor.execute(labels_query)
-            labels = await cursor.fetchall()
-            for name, kind in labels:
-                count_query = sql.SQL('SELECT count(*) FROM {table}').format(
-                    table=sql.Identifier(db.settings.graph_name, name),
-                )
-                await cursor.execute(count_query)
-                row = await cursor.fetchone()
-                count = int(row[0]) if row else 0
-                if kind == 'v':
-                    node_labels.append(LabelCount(label=name, count=count))
-                elif kind == 'e':
-                    edge_types.append(EdgeTypeCount(type=name, count=count))
+            await cursor.execute(query)
+            rows = await cursor.fetchall()
+    for name, kind, reltuples, live, modified, analyzed_at in rows:
+        count = _estimate_count(int(reltuples), live, modified)
+        if kind == 'v':
+            node_labels.append(
+                LabelCount(label=name, count=count, analyzed_at=analyzed_at)
+            )
+        elif kind == 'e':
+            edge_types.append(
+                EdgeTypeCount(type=name, count=count, analyzed_at=analyzed_at)
+            )
     return node_labels, edge_types
 
 
 async def _sample_property_keys(
-    db: graph.Graph, sample_size: int = 200
+    db: graph.Graph, label: str, sample_size: int = 50
 ) -> list[str]:
-    """Return the union of property keys across a sample of vertices."""
-    query: typing.LiteralString = (
-        'MATCH (n) WITH n LIMIT {limit}'
+    """Return the union of property keys across a sample of ``label``."""
+    if not _LABEL_RE.match(label):
+        return []
+    query = typing.cast(
+        typing.LiteralString,
+        f'MATCH (n:`{label}`) WITH n LIMIT {{limit}}'
         ' UNWIND keys(n) AS k'
-        ' RETURN collect(DISTINCT k) AS keys'
+        ' RETURN collect(DISTINCT k) AS keys',
     )
     try:
         records = await db.execute(
@@ -527,7 +880,8 @@ async def _sample_property_keys(
         )
     except psycopg.Error:
         LOGGER.warning(
-            'Failed to sample property keys for schema endpoint',
+            'Failed to sample property keys for label %s',
+            label,
             exc_info=True,
         )
         return []
@@ -542,6 +896,61 @@ async def _sample_property_keys(
     return sorted({k for k in as_list if isinstance(k, str)})
 
 
+async def _load_schema(db: graph.Graph) -> _CachedSchema:
+    node_labels, edge_types = await _load_label_counts(db)
+    # One label at a time: this runs off the request path and should
+    # not take more than one pooled connection from live traffic.
+    property_keys: set[str] = set()
+    for node_label in node_labels:
+        node_label.property_keys = await _sample_property_keys(
+            db, node_label.label
+        )
+        property_keys.update(node_label.property_keys)
+    return _CachedSchema(
+        response=GraphSchemaResponse(
+            node_labels=node_labels,
+            edge_types=edge_types,
+            property_keys=sorted(property_keys),
+            computed_at=datetime.datetime.now(datetime.UTC),
+        ),
+        loaded_at=time.monotonic(),
+    )
+
+
+def _log_refresh_failure(task: asyncio.Task[_CachedSchema]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        LOGGER.warning(
+            'Failed to refresh graph schema', exc_info=task.exception()
+        )
+
+
+def _refresh_schema(db: graph.Graph) -> asyncio.Task[_CachedSchema]:
+    """Start (or join) the schema load for ``db``'s graph."""
+    key = db.settings.graph_name
+    task = _schema_loads.get(key)
+    if task is not None:
+        return task
+
+    async def run() -> _CachedSchema:
+        try:
+            schema = await _load_schema(db)
+            _schemas[key] = schema
+            return schema
+        finally:
+            _schema_loads.pop(key, None)
+
+    task = asyncio.get_running_loop().create_task(run())
+    task.add_done_callback(_log_refresh_failure)
+    _schema_loads[key] = task
+    return task
+
+
+def clear() -> None:
+    """Forget cached schemas and pending refreshes (tests)."""
+    _schemas.clear()
+    _schema_loads.clear()
+
+
 @graph_query_router.get('/schema', response_model=GraphSchemaResponse)
 async def get_graph_schema(
     db: graph.Pool,
@@ -549,12 +958,21 @@ async def get_graph_schema(
         permissions.AuthContext, fastapi.Depends(require_admin)
     ],
 ) -> GraphSchemaResponse:
-    """Return labels, edge types, and sampled property keys."""
+    """Return labels, edge types, and sampled property keys.
+
+    Served from a per-process cache.  Once the cached copy is older
+    than ``IMBI_GRAPH_QUERY_SCHEMA_TTL`` it is still returned while a
+    fresh one loads in the background; only the first request waits.
+    """
     LOGGER.info('Graph schema requested: principal=%s', auth.principal_name)
-    node_labels, edge_types = await _load_label_counts(db)
-    property_keys = await _sample_property_keys(db)
-    return GraphSchemaResponse(
-        node_labels=node_labels,
-        edge_types=edge_types,
-        property_keys=property_keys,
-    )
+    cached = _schemas.get(db.settings.graph_name)
+    if cached is None:
+        # Shielded so a disconnecting admin does not cancel the load
+        # other requests may be waiting on.
+        cached = await asyncio.shield(_refresh_schema(db))
+    elif (
+        time.monotonic() - cached.loaded_at
+        >= settings.get_graph_query_settings().schema_ttl
+    ):
+        _refresh_schema(db)
+    return cached.response
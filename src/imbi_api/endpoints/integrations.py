@@ -10,11 +10,12 @@ from imbi_common.auth.encryption import TokenEncryption
 from imbi_common.plugins.errors import PluginNotFoundError
 from imbi_common.plugins.registry import get_plugin
 
+from imbi_api import search_scope
 from imbi_api.auth import login_providers, permissions
 from imbi_api.domain import models
 from imbi_api.endpoints._helpers import conflict_on_unique_violation
 from imbi_api.graph_sql import escape_prop, props_template, set_clause
-from imbi_api.plugins import parse_options
+from imbi_api.plugins import binding_cache, parse_options
 from imbi_api.plugins.assignments import hydrate_integration
 from imbi_api.plugins.credentials import patch_integration_credentials
 
@@ -270,7 +271,12 @@ async def create_integration(
             detail=f'Organization with slug {org_slug!r} not found',
         )
 
-    return build_response(graph.parse_agtype(records[0]['integration']))
+    integration = graph.parse_agtype(records[0]['integration'])
+    await search_scope.add_nodes(org_slug, integration.get('id'))
+    # With no project-type assignments yet, the default-all rule binds
+    # the new Integration to every project in the org.
+    await binding_cache.invalidate()
+    return build_response(integration)
 
 
 @integrations_router.get('/{slug}')
@@ -457,6 +463,7 @@ async def update_integration(
             detail=f'Integration with slug {slug!r} not found',
         )
 
+    await binding_cache.invalidate()
     return build_response(graph.parse_agtype(updated[0]['integration']))
 
 
@@ -494,6 +501,8 @@ async def delete_integration(
             status_code=404,
             detail=f'Integration with slug {slug!r} not found',
         )
+    await search_scope.invalidate(org_slug)
+    await binding_cache.invalidate()
 
 
 @integrations_router.put('/{slug}/credentials')
@@ -898,3 +907,4 @@ async def _replace_type_assignments_for_integration(
         query = delete_clause
 
     await db.execute(query, params, [])
+    await binding_cache.invalidate()
@@ -9,6 +9,7 @@ import pydantic
 from imbi_common import blueprints, graph, models
 
 from imbi_api import patch as json_patch
+from imbi_api import search_scope
 from imbi_api.auth import permissions
 from imbi_api.endpoints._helpers import conflict_on_unique_violation
 from imbi_api.graph_sql import props_template, set_clause
@@ -153,6 +154,7 @@ async def create_link_definition(
     org = graph.parse_agtype(records[0]['o'])
     result['organization'] = org
     result['relationships'] = _projects_relationship(0)
+    await search_scope.add_nodes(org_slug, result.get('id'))
     return result
 
 
@@ -476,3 +478,4 @@ async def delete_link_definition(
             status_code=404,
             detail=(f'Link definition with slug {slug!r} not found'),
         )
+    await search_scope.invalidate(org_slug)
@@ -13,13 +13,17 @@ import fastapi
 import pydantic
 from imbi_common import graph
 
+from imbi_api import stream_workers
 from imbi_api.auth import permissions
+from imbi_api.commit_sync import queue as commit_sync_queue
+from imbi_api.deployment_sync import queue as deployment_sync_queue
 from imbi_api.maintenance import (
     OPERATIONS,
     MaintenanceSlug,
     OperationDefinition,
     state,
 )
+from imbi_api.pr_sync import queue as pr_sync_queue
 from imbi_api.scoring import OptionalValkeyClient
 
 LOGGER = logging.getLogger(__name__)
@@ -51,6 +55,8 @@ class MaintenanceProgress(pydantic.BaseModel):
     succeeded: int = 0
     failed: int = 0
     skipped: int = 0
+    items_per_minute: float | None = None
+    eta: datetime.datetime | None = None
 
 
 class MaintenanceOperation(pydantic.BaseModel):
@@ -70,6 +76,24 @@ class MaintenanceOperation(pydantic.BaseModel):
     failures: dict[str, str] | None = None
 
 
+class SyncQueueStats(pydantic.BaseModel):
+    """Backlog of one sync stream plus this process's consumer counters.
+
+    ``lag`` and ``pending`` are fleet-wide (from the consumer group);
+    the remaining fields describe the API process that answered.
+    """
+
+    stream: str
+    lag: int | None = None
+    pending: int | None = None
+    processed: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    in_flight: int = 0
+    concurrency: int = 0
+    jobs_per_minute: float = 0.0
+
+
 class MaintenanceRunResponse(pydantic.BaseModel):
     """Acknowledgement that a run was started."""
 
@@ -91,6 +115,8 @@ def _to_operation(
             succeeded=status.succeeded,
             failed=status.failed,
             skipped=status.skipped,
+            items_per_minute=status.items_per_minute,
+            eta=status.eta,
         )
     return MaintenanceOperation(
         slug=definition.slug,
@@ -216,3 +242,42 @@ async def cancel_maintenance_operation(
     )
     status = await state.read_status(client, definition.slug)
     return _to_operation(definition, status)
+
+
+_SYNC_STREAMS = (
+    (commit_sync_queue.STREAM, commit_sync_queue.GROUP),
+    (pr_sync_queue.STREAM, pr_sync_queue.GROUP),
+    (deployment_sync_queue.STREAM, deployment_sync_queue.GROUP),
+)
+
+
+@maintenance_router.get('/queues')
+async def list_sync_queues(
+    auth: RequireRead,
+    client: OptionalValkeyClient,
+) -> list[SyncQueueStats]:
+    """Lag and throughput of the commit, PR and deployment sync streams."""
+    _ = auth
+    if client is None:
+        raise fastapi.HTTPException(
+            status_code=503,
+            detail='Queue state is unavailable (Valkey is not connected).',
+        )
+    results: list[SyncQueueStats] = []
+    for stream, group in _SYNC_STREAMS:
+        lag, pending = await stream_workers.stream_lag(client, stream, group)
+        stats = stream_workers.stream_stats(stream)
+        results.append(
+            SyncQueueStats(
+                stream=stream,
+                lag=lag,
+                pending=pending,
+                processed=stats.processed,
+                failed=stats.failed,
+                rate_limited=stats.rate_limited,
+                in_flight=stats.in_flight,
+                concurrency=stats.concurrency,
+                jobs_per_minute=round(stats.jobs_per_minute, 2),
+            )
+        )
+    return results
@@ -25,6 +25,7 @@ from imbi_common import clickhouse, models
 from imbi_common.plugins import OpsLogTemplate
 from imbi_common.plugins.registry import list_plugins
 
+from imbi_api import event_buffer, rollups
 from imbi_api import patch as json_patch
 from imbi_api.auth import permissions
 from imbi_api.endpoints._pagination import (
@@ -150,14 +151,13 @@ def _model_to_row(entry: models.OperationLog) -> dict[str, typing.Any]:
 async def _insert_row(row: dict[str, typing.Any]) -> None:
     """Insert a single row into operations_log.
 
-    Calls the class method directly with explicit column names/values
-    because the module-level ``clickhouse.insert`` wrapper only accepts
-    pydantic models and loses the alias during serialization.
+    Passes explicit column names/values because the module-level
+    ``clickhouse.insert`` wrapper only accepts pydantic models and
+    loses the alias during serialization.  Waits for the write so the
+    response never describes a row that is not there.
     """
-    await clickhouse.client.Clickhouse.get_instance().insert(
-        'operations_log',
-        [list(row.values())],
-        list(row.keys()),
+    await event_buffer.write(
+        'operations_log', list(row.keys()), [list(row.values())], wait=True
     )
 
 
@@ -295,31 +295,46 @@ _FILTER_FIELDS: tuple[str, ...] = (
 
 
 async def _compute_metrics(
-    filter_sql: str, filter_params: dict[str, typing.Any]
+    filter_sql: str,
+    filter_params: dict[str, typing.Any],
+    since: datetime.datetime | None,
+    until: datetime.datetime | None,
 ) -> OperationLogMetrics:
     """Run aggregate queries for the summary tiles.
 
-    `filter_sql` is the WHERE-clause body (without `WHERE`) shared with the
-    list query; `filter_params` supplies its placeholders.
+    `filter_sql` is the equality-filter part of the list query's
+    WHERE clause (the `_FILTER_FIELDS` only, ``1`` when none are set)
+    and `filter_params` supplies its placeholders. Whole days inside
+    `since`..`until` are read from the daily rollup; see
+    :func:`imbi_api.rollups.source`.
     """
+    totals_src, totals_params = rollups.source(
+        rollups.OPERATIONS_LOG, where=filter_sql, since=since, until=until
+    )
+    env_src, env_params = rollups.source(
+        rollups.OPERATIONS_LOG,
+        where=filter_sql + " AND entry_type = 'Deployed'",
+        since=since,
+        until=until,
+    )
     totals_sql: str = (
         'SELECT '
-        'count() AS event_count, '
-        "countIf(entry_type = 'Deployed') AS deploys, "
+        'sum(entries) AS event_count, '
+        "sumIf(entries, entry_type = 'Deployed') AS deploys, "
         'uniqExact(project_slug) AS projects, '
         'uniqExact(environment_slug) AS environments, '
         'uniqExact(performed_by) AS team_members '
-        'FROM operations_log FINAL WHERE '
-    ) + filter_sql
+        'FROM '
+    ) + totals_src
     env_sql: str = (
-        'SELECT environment_slug, count() AS c '
-        'FROM operations_log FINAL WHERE '
-        + filter_sql
-        + " AND entry_type = 'Deployed' "
-        'GROUP BY environment_slug'
+        'SELECT environment_slug, sum(entries) AS c FROM '  # noqa: S608
+        + env_src
+        + ' GROUP BY environment_slug'
+    )
+    totals_rows = await clickhouse.query(
+        totals_sql, {**filter_params, **totals_params}
     )
-    totals_rows = await clickhouse.query(totals_sql, filter_params)
-    env_rows = await clickhouse.query(env_sql, filter_params)
+    env_rows = await clickhouse.query(env_sql, {**filter_params, **env_params})
     totals = totals_rows[0] if totals_rows else {}
     deploys_by_env = {
         str(row['environment_slug']): int(row['c'])
@@ -372,17 +387,19 @@ async def _list_impl(
             clauses.append(f'{field} = {{{field}:String}}')
             params[field] = value
 
-    if since is not None:
-        params['since'] = parse_iso(since, 'since')
-        clauses.append('occurred_at >= {since:DateTime64(3)}')
-    if until is not None:
-        params['until'] = parse_iso(until, 'until')
-        clauses.append('occurred_at < {until:DateTime64(3)}')
-
-    # Pre-cursor clause set is also what feeds the /metrics aggregate so
+    # Pre-cursor filters are also what feed the /metrics aggregate so
     # the summary reflects the full filter universe, not the current page.
-    metrics_clauses = list(clauses)
+    metrics_filter = ' AND '.join(clauses[1:]) or '1'
     metrics_params = dict(params)
+    since_ts = parse_iso(since, 'since') if since is not None else None
+    until_ts = parse_iso(until, 'until') if until is not None else None
+
+    if since_ts is not None:
+        params['since'] = since_ts
+        clauses.append('occurred_at >= {since:DateTime64(3)}')
+    if until_ts is not None:
+        params['until'] = until_ts
+        clauses.append('occurred_at < {until:DateTime64(3)}')
 
     if cursor is not None:
         decoded = decode_cursor(cursor)
@@ -430,7 +447,7 @@ async def _list_impl(
     metrics: OperationLogMetrics | None = None
     if cursor is None:
         metrics = await _compute_metrics(
-            ' AND '.join(metrics_clauses), metrics_params
+            metrics_filter, metrics_params, since_ts, until_ts
         )
 
     body = {
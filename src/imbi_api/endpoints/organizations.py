@@ -9,6 +9,7 @@ import pydantic
 from imbi_common import graph, models
 
 from imbi_api import patch as json_patch
+from imbi_api import project_membership
 from imbi_api.auth import permissions
 from imbi_api.endpoints._helpers import conflict_on_unique_violation
 from imbi_api.relationships import RelationshipSpec, build_relationships
@@ -471,6 +472,8 @@ async def _persist_organization(
             ),
         },
     )
+    if org.slug != original_slug:
+        await project_membership.sync_org(db, org.slug)
     return org_dict
 
 
@@ -606,3 +609,4 @@ async def delete_organization(
             status_code=404,
             detail=(f'Organization with slug {slug!r} not found'),
         )
+    await project_membership.remove_org(slug)
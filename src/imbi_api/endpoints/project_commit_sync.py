@@ -1,7 +1,9 @@
 """On-demand commit/tag history sync endpoints (Project Doctor).
 
-``POST /sync`` enqueues a background backfill of the project's full
-default-branch commit history and tag list; ``GET /sync-status`` returns
+``POST /sync`` enqueues a background sync of the project's
+default-branch commit history and tag list -- incremental from the last
+synced commit, or a full backfill with ``?full=true``;
+``GET /sync-status`` returns
 the last-run state for the UI to poll.  The work runs as a Valkey-stream
 job (no request-scoped user) using the resolved commit-sync
 integration's service credential, so the endpoint only validates
@@ -42,8 +44,12 @@ async def sync_commits_and_tags(
         ),
     ],
     source: str | None = fastapi.Query(default=None),
+    full: bool = fastapi.Query(default=False),
 ) -> CommitSyncEnqueueResponse:
-    """Enqueue a full commit + tag history backfill for the project.
+    """Enqueue a commit + tag history sync for the project.
+
+    The sync is incremental from the project's last synced commit; pass
+    ``?full=true`` to re-walk the whole history instead.
 
     Resolves the project's ``commit-sync`` capability (404 when no
     integration provides it, 400 when several are bound and none is the
@@ -59,7 +65,7 @@ async def sync_commits_and_tags(
         raise fastapi.HTTPException(status_code=400, detail=str(exc)) from exc
     requested_by = auth.principal_name
     enqueued = await enqueue_commit_sync(
-        valkey_client, org_slug, project_id, requested_by
+        valkey_client, org_slug, project_id, requested_by, full=full
     )
     if enqueued:
         # Optimistic, best-effort: if the worker has already flipped the
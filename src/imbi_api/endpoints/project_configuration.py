@@ -8,7 +8,7 @@ import typing
 
 import fastapi
 import nanoid
-from imbi_common import clickhouse, graph, valkey
+from imbi_common import graph, valkey
 from imbi_common import models as common_models
 from imbi_common.plugins import decrypt_integration_credentials
 from imbi_common.plugins.base import (
@@ -17,6 +17,7 @@ from imbi_common.plugins.base import (
     PluginContext,
 )
 
+from imbi_api import event_buffer
 from imbi_api.auth import permissions
 from imbi_api.domain import models
 from imbi_api.endpoints._helpers import (
@@ -380,8 +381,6 @@ async def _write_audit(
     )
     row = entry.model_dump(by_alias=True, mode='python')
     row['is_deleted'] = 1 if entry.is_deleted else 0
-    await clickhouse.client.Clickhouse.get_instance().insert(
-        'operations_log',
-        [list(row.values())],
-        list(row.keys()),
+    await event_buffer.write(
+        'operations_log', list(row.keys()), [list(row.values())], wait=True
     )
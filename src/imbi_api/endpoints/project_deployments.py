@@ -38,6 +38,7 @@ from imbi_common.plugins.base import (
     RemoteDeployment,
 )
 
+from imbi_api import event_buffer, release_state, search_scope
 from imbi_api.auth import permissions
 from imbi_api.deployment_sync import queue as deployment_sync_queue
 from imbi_api.deployment_sync import service as deployment_sync_service
@@ -48,6 +49,7 @@ from imbi_api.endpoints._helpers import (
     persist_link_writeback,
 )
 from imbi_api.endpoints.releases import (
+    CURRENT_RELEASES_QUERY,
     AppendOutcome,
     ReleaseEnvironmentEdgeResponse,
     append_deployment_event,
@@ -58,7 +60,7 @@ from imbi_api.identity.host_integration import (
     call_with_identity_retry,
 )
 from imbi_api.llm.dependencies import InjectAnthropicClient
-from imbi_api.plugins import call_with_timeout
+from imbi_api.plugins import call_with_timeout, compare_cache
 from imbi_api.plugins.resolution import ResolvedCapability, resolve_capability
 from imbi_api.scoring import OptionalValkeyClient
 
@@ -296,8 +298,9 @@ def _latest_deployment_timestamp(
 ) -> datetime.datetime | None:
     """Return the most recent deployment-event timestamp, or ``None``.
 
-    The ``deployments`` edge property is stored as a JSON-encoded list
-    of ``DeploymentEvent``-shaped objects.  We parse just the timestamp
+    ``raw`` is the edge's JSON-encoded ``latest_event`` summary, or the
+    legacy ``deployments`` list on edges written before
+    :mod:`imbi_api.deployment_events`.  We parse just the timestamp
     field here so the promotion-options reducer can deterministically
     rank ``(Release, Environment)`` rows by recency without paying for
     full Pydantic validation.
@@ -305,6 +308,8 @@ def _latest_deployment_timestamp(
     if not raw:
         return None
     data = json.loads(raw) if isinstance(raw, str) else raw
+    if isinstance(data, dict):
+        data = [data]
     if not isinstance(data, list):
         return None
     latest: datetime.datetime | None = None
@@ -723,10 +728,8 @@ async def _record_deployment_audit(
     )
     row = entry.model_dump(by_alias=True, mode='python')
     row['is_deleted'] = 1 if entry.is_deleted else 0
-    await clickhouse.client.Clickhouse.get_instance().insert(
-        'operations_log',
-        [list(row.values())],
-        list(row.keys()),
+    await event_buffer.write(
+        'operations_log', list(row.keys()), [list(row.values())], wait=True
     )
 
 
@@ -1137,6 +1140,7 @@ async def _apply_remote_deployment(
     )
     release_id = await _upsert_release_node(
         db,
+        org_slug=org_slug,
         project_id=project_id,
         tag=tag,
         committish=committish,
@@ -1292,6 +1296,35 @@ async def resolve_commit(
     return commit
 
 
+async def _compare(
+    resolved: ResolvedCapability,
+    ctx: PluginContext,
+    credentials: dict[str, str],
+    base: str,
+    head: str,
+) -> CompareResult:
+    """Run the plugin's ``compare(base..head)`` through the compare cache.
+
+    Failures that are not already HTTP errors surface as 502 without
+    the plugin's error text.
+    """
+    handler = _handler(resolved)
+    try:
+        return await compare_cache.compare(
+            resolved.integration_id,
+            base,
+            head,
+            lambda: call_with_timeout(
+                handler.compare(ctx, credentials, base=base, head=head)
+            ),
+        )
+    except compare_cache.CompareFailed as exc:
+        LOGGER.warning('compare %s..%s failed: %s', base, head, exc)
+        raise fastapi.HTTPException(
+            status_code=502, detail='Deployment plugin compare failed'
+        ) from exc
+
+
 @project_deployments_router.get('/compare')
 async def compare_refs(
     org_slug: str,
@@ -1311,10 +1344,7 @@ async def compare_refs(
     resolved, ctx, credentials = await _resolve_and_context(
         db, org_slug, project_id, auth, source=source
     )
-    handler = _handler(resolved)
-    result = await call_with_timeout(
-        handler.compare(ctx, credentials, base=base, head=head)
-    )
+    result = await _compare(resolved, ctx, credentials, base, head)
     await persist_link_writeback(db, ctx)
     return result
 
@@ -1935,6 +1965,7 @@ async def _handle_promote(
     promoted_committish = body.from_committish[:7].lower()
     release_id = await _upsert_release_node(
         db,
+        org_slug=org_slug,
         project_id=project_id,
         tag=body.tag,
         committish=promoted_committish,
@@ -2000,6 +2031,7 @@ async def _handle_promote(
 async def _upsert_release_node(
     db: graph.Graph,
     *,
+    org_slug: str,
     project_id: str,
     tag: str | None,
     committish: str,
@@ -2012,8 +2044,9 @@ async def _upsert_release_node(
 
     Identity is ``(project, committish, tag)``: re-promoting the same
     tag from the same SHA is benign and refreshes notes / links;
-    re-tagging the same SHA produces a new ``Release`` node.
-    Returns the resulting ``Release.id``.
+    re-tagging the same SHA produces a new ``Release`` node, which is
+    added to the org's search scope.  Returns the resulting
+    ``Release.id``.
     """
     now = datetime.datetime.now(datetime.UTC).isoformat()
     links_json = (
@@ -2033,7 +2066,7 @@ async def _upsert_release_node(
     WHERE COALESCE(existing.tag, '') = COALESCE({tag}, '')
     WITH p, existing
     WHERE existing IS NULL
-    CREATE (p)-[:HAS_RELEASE]->(:Release {{
+    CREATE (p)-[:HAS_RELEASE]->(r:Release {{
         id: {id},
         tag: {tag},
         committish: {committish},
@@ -2044,8 +2077,9 @@ async def _upsert_release_node(
         created_at: {now},
         updated_at: {now}
     }})
+    RETURN r.id AS rid
     """
-    await db.execute(
+    created = await db.execute(
         create_query,
         {
             'project_id': project_id,
@@ -2058,8 +2092,10 @@ async def _upsert_release_node(
             'created_by': created_by,
             'now': now,
         },
-        [],
+        ['rid'],
     )
+    if created:
+        await search_scope.add_nodes(org_slug, new_id)
     # Update notes / links on a pre-existing release (idempotent re-run).
     # Match on (committish, tag) — tag matching uses COALESCE so a NULL
     # tag compares equal to a NULL tag (AGE has no NULL equality).
@@ -2115,49 +2151,6 @@ def _release_notes_system() -> str:
     )
 
 
-def _semver_sort_key(name: str) -> tuple[int, int, int] | None:
-    """``(major, minor, patch)`` for version ordering; ``None`` if not semver.
-
-    Pre-release / build metadata is ignored for ordering -- good enough to
-    pick the newest *released* version and to sort the history list.
-    """
-    match = _SEMVER_RE.match(name)
-    if not match:
-        return None
-    major, minor, patch = (int(part) for part in match.groups())
-    return (major, minor, patch)
-
-
-def _release_tag_order_key(
-    name: str, when: typing.Any
-) -> tuple[bool, tuple[int, int, int], str]:
-    """Sort key ranking the latest *release* first.
-
-    Semver-shaped tags outrank non-semver ones; within those, the highest
-    version wins, with the newer timestamp as a tie-break. This deliberately
-    ignores tag/commit *timestamps* for the primary ordering so a backported
-    or late-synced lower version (e.g. ``v4.1.3`` tagged after ``v7.1.0``)
-    can't masquerade as the latest release.
-    """
-    key = _semver_sort_key(name)
-    when_key = when.isoformat() if isinstance(when, datetime.datetime) else ''
-    return (key is not None, key or (0, 0, 0), when_key)
-
-
-def _latest_release_tag(
-    rows: list[dict[str, typing.Any]],
-) -> dict[str, typing.Any] | None:
-    """Pick the latest release tag (highest semver) from ``tags`` rows."""
-    if not rows:
-        return None
-    return max(
-        rows,
-        key=lambda r: _release_tag_order_key(
-            str(r['name']), r.get('tagged_at') or r.get('recorded_at')
-        ),
-    )
-
-
 def _bump_semver(last_tag: str | None, bump: SemverBump) -> str:
     """Bump a semver-shaped tag.  Falls back to ``v0.1.0`` when missing."""
     raw = (last_tag or 'v0.0.0').lstrip('v')
@@ -2259,11 +2252,8 @@ async def draft_release_notes(
     resolved, ctx, credentials = await _resolve_and_context(
         db, org_slug, project_id, auth, source=source
     )
-    handler = _handler(resolved)
-    compare_result = await call_with_timeout(
-        handler.compare(
-            ctx, credentials, base=body.base_sha, head=body.head_sha
-        )
+    compare_result = await _compare(
+        resolved, ctx, credentials, body.base_sha, body.head_sha
     )
     commits = compare_result.commits
     fallback_bump = _classify_bump(commits)
@@ -2310,20 +2300,6 @@ async def draft_release_notes(
 # ---------------------------------------------------------------------------
 
 
-_PROMOTION_OPTIONS_QUERY: typing.LiteralString = """
-MATCH (p:Project {{id: {project_id}}})
-      -[:OWNED_BY]->(:Team)
-      -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
-MATCH (p)-[:DEPLOYED_IN]->(e:Environment)
-OPTIONAL MATCH (p)-[:HAS_RELEASE]->(r:Release)
-               -[d:DEPLOYED_TO]->(e)
-RETURN e{{.slug, .name, .sort_order}} AS env,
-       CASE WHEN r IS NULL THEN null ELSE r{{.*}} END AS release,
-       CASE WHEN d IS NULL THEN null ELSE d.deployments END
-           AS deployments
-"""
-
-
 @project_deployments_router.get('/promotion-options')
 async def list_promotion_options(  # noqa: C901
     org_slug: str,
@@ -2344,20 +2320,22 @@ async def list_promotion_options(  # noqa: C901
     the from-env's current version + SHA, the to-env's current
     version + SHA (when present), and the count of commits between
     them via ``plugin.compare()``.  Plugin failures are tolerated:
-    the entry returns ``commits_pending=None``.
+    the entry returns ``commits_pending=None``.  Each env's current
+    release comes from the same query as ``/releases/current``.
     """
     rows = await db.execute(
-        _PROMOTION_OPTIONS_QUERY,
+        CURRENT_RELEASES_QUERY,
         {'project_id': project_id, 'org_slug': org_slug},
         ['env', 'release', 'deployments'],
     )
     if not rows:
         return []
-    # The query returns one row per (Release, Environment) pair, so an
-    # env with multiple historical releases produces multiple rows.
-    # To pick a stable "current" release per env, parse the deployment
-    # event history on each edge and rank by the most recent event
-    # timestamp. Envs with no deployment history fall back to no
+    # Envs with a current_release pointer return one row, plus the
+    # pending_release row while a deployment is in flight.  Envs
+    # without one (nothing has succeeded there since the pointer was
+    # introduced) return one row per historical release; pick a stable
+    # "current" release for those by the most recent event timestamp
+    # on each edge.  Envs with no deployment history fall back to no
     # release.
     by_slug: dict[str, dict[str, typing.Any]] = {}
     for row in rows:
@@ -2414,7 +2392,6 @@ async def list_promotion_options(  # noqa: C901
     resolved, ctx, credentials = await _resolve_and_context(
         db, org_slug, project_id, auth, source=source
     )
-    handler = _handler(resolved)
 
     # Collect every adjacent-env pair first so we can fan the
     # ``compare()`` calls out with ``asyncio.gather`` instead of
@@ -2436,13 +2413,8 @@ async def list_promotion_options(  # noqa: C901
         ):
             return None
         try:
-            cmp_result = await call_with_timeout(
-                handler.compare(
-                    ctx,
-                    credentials,
-                    base=to_committish,
-                    head=from_committish,
-                )
+            cmp_result = await _compare(
+                resolved, ctx, credentials, to_committish, from_committish
             )
         except Exception:  # noqa: BLE001
             LOGGER.debug(
@@ -2643,64 +2615,31 @@ async def get_release_drift(
 ) -> ReleaseDriftResponse:
     """Commits awaiting a release: the delta from the latest tag to HEAD.
 
-    Computed from ClickHouse: find the latest tag, the HEAD commit, and
-    the commits authored after the tag's commit.  With no prior tag the
-    drift is the full (capped) history and the suggestion is ``v0.1.0``.
+    The latest tag, HEAD and the exact count come from the project's
+    materialized :mod:`~imbi_api.release_state` row; only the (capped)
+    commit list is read from ``commits``.  With no prior tag the drift
+    is the full history and the suggestion is ``v0.1.0``.
     """
-    # Fetch all tags and pick the latest *release* by semver (not by
-    # timestamp): a late-synced or backported lower version must not be
-    # treated as the base, or the "commits since the last tag" delta below
-    # is computed from the wrong tag.
-    tag_rows = await clickhouse.query(
-        'SELECT name, sha, tagged_at, recorded_at FROM tags FINAL '
-        'WHERE project_id = {project_id:String}',
-        {'project_id': project_id},
-    )
-    latest = _latest_release_tag(tag_rows)
-    latest_tag = str(latest['name']) if latest else None
-    latest_tag_sha = str(latest['sha']) if latest else None
-    latest_tag_at = (
-        (latest.get('tagged_at') or latest.get('recorded_at'))
-        if latest
-        else None
-    )
-
-    head_rows = await clickhouse.query(
-        'SELECT sha FROM commits FINAL '
-        'WHERE project_id = {project_id:String} '
-        'ORDER BY pushed_at DESC, authored_at DESC LIMIT 1',
-        {'project_id': project_id},
-    )
-    head_sha = str(head_rows[0]['sha']) if head_rows else None
-
-    since: datetime.datetime | None = None
-    if latest_tag_sha:
-        base_rows = await clickhouse.query(
-            'SELECT authored_at FROM commits FINAL '
-            'WHERE project_id = {project_id:String} AND sha = {sha:String} '
-            'LIMIT 1',
-            {'project_id': project_id, 'sha': latest_tag_sha},
+    state = (await release_state.get([project_id]))[project_id]
+    if state.base_missing:
+        # Tag exists but its commit isn't synced -- we can't bound the
+        # delta, so report no drift rather than dumping all history.
+        return ReleaseDriftResponse(
+            latest_tag=state.latest_tag,
+            latest_tag_sha=state.latest_tag_sha,
+            latest_tag_at=state.latest_tag_at,
+            head_sha=state.head_sha,
+            commits_since_tag=0,
+            commits=[],
+            suggested_bump='patch',
+            suggested_tag=_bump_semver(state.latest_tag, 'patch'),
         )
-        if not base_rows:
-            # Tag exists but its commit isn't synced -- we can't bound the
-            # delta, so report no drift rather than dumping all history.
-            return ReleaseDriftResponse(
-                latest_tag=latest_tag,
-                latest_tag_sha=latest_tag_sha,
-                latest_tag_at=latest_tag_at,
-                head_sha=head_sha,
-                commits_since_tag=0,
-                commits=[],
-                suggested_bump='patch',
-                suggested_tag=_bump_semver(latest_tag, 'patch'),
-            )
-        since = base_rows[0]['authored_at']
 
     where = 'project_id = {project_id:String}'
     params: dict[str, typing.Any] = {'project_id': project_id}
-    if since is not None:
+    if state.base_authored_at is not None:
         where += ' AND authored_at > {since:DateTime64(3)}'
-        params['since'] = since
+        params['since'] = state.base_authored_at
 
     commit_rows = await clickhouse.query(
         # WHERE is a fixed string; all values are bound params.
@@ -2711,11 +2650,6 @@ async def get_release_drift(
         'ORDER BY authored_at DESC LIMIT {cap:UInt32}',
         {**params, 'cap': _DRIFT_COMMIT_CAP},
     )
-    count_rows = await clickhouse.query(
-        f'SELECT count() AS c FROM commits FINAL WHERE {where}',  # noqa: S608
-        params,
-    )
-    commits_since_tag = int(count_rows[0]['c']) if count_rows else 0
     commits = [_recent_commit_from_row(row) for row in commit_rows]
 
     classify_input = [
@@ -2724,14 +2658,14 @@ async def get_release_drift(
     ]
     bump = _classify_bump(classify_input)
     return ReleaseDriftResponse(
-        latest_tag=latest_tag,
-        latest_tag_sha=latest_tag_sha,
-        latest_tag_at=latest_tag_at,
-        head_sha=head_sha,
-        commits_since_tag=commits_since_tag,
+        latest_tag=state.latest_tag,
+        latest_tag_sha=state.latest_tag_sha,
+        latest_tag_at=state.latest_tag_at,
+        head_sha=state.head_sha,
+        commits_since_tag=state.commits_since_tag,
         commits=commits,
         suggested_bump=bump,
-        suggested_tag=_bump_semver(latest_tag, bump),
+        suggested_tag=_bump_semver(state.latest_tag, bump),
     )
 
 
@@ -2794,7 +2728,9 @@ async def get_release_history(
     # list is the current release -- consistent with the drift base, which
     # is also chosen by semver rather than timestamp.
     entries.sort(
-        key=lambda e: _release_tag_order_key(e.tag, e.published_at),
+        key=lambda e: release_state.release_tag_order_key(
+            e.tag, e.published_at
+        ),
         reverse=True,
     )
     return entries[:capped]
@@ -2874,6 +2810,7 @@ async def cut_release(
     committish = body.committish[:7].lower()
     await _upsert_release_node(
         db,
+        org_slug=org_slug,
         project_id=project_id,
         tag=body.tag,
         committish=committish,
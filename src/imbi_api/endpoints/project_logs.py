@@ -1,14 +1,19 @@
 """Project logs plugin endpoints."""
 
 import asyncio
+import base64
 import datetime
+import heapq
+import json
 import logging
 import typing
+from collections import abc
 
 import fastapi
 from imbi_common import graph
 from imbi_common.plugins import decrypt_integration_credentials
 from imbi_common.plugins.base import (
+    LogEntry,
     LogFilter,
     LogHistogramBucket,
     LogQuery,
@@ -22,8 +27,11 @@ from imbi_api.auth import permissions
 from imbi_api.domain import models
 from imbi_api.endpoints._helpers import lookup_project_slugs
 from imbi_api.identity import resolution as identity_resolution
-from imbi_api.identity.host_integration import attach_identity
-from imbi_api.plugins import call_with_timeout
+from imbi_api.identity.host_integration import (
+    attach_identity,
+    effective_identity_integration_id,
+)
+from imbi_api.plugins import call_with_timeout, log_cache
 from imbi_api.plugins.resolution import ResolvedCapability, resolve_capability
 
 LOGGER = logging.getLogger(__name__)
@@ -32,6 +40,26 @@ project_logs_router = fastapi.APIRouter(tags=['Project: Logs'])
 
 _VALID_FILTER_OPS = frozenset({'eq', 'ne', 'contains', 'starts_with', 'regex'})
 
+#: Upper bound on one environment's plugin page in a multi-env search
+#: (the same ceiling the endpoint puts on ``limit``).
+_MAX_ENV_FETCH = 1000
+
+#: How many times a multi-env search reads an environment's next page
+#: when its page came back empty but its plugin reports more.
+_MAX_EMPTY_PAGE_FOLLOWS = 3
+
+
+class _EnvPosition(typing.NamedTuple):
+    """Where one environment's stream resumes in a multi-env search.
+
+    ``cursor`` is the plugin cursor of the page the stream is in (None
+    for the first page) and ``offset`` how many of that page's entries
+    earlier merged pages already returned.
+    """
+
+    cursor: str | None
+    offset: int = 0
+
 
 def _parse_filters(raw: list[str]) -> list[LogFilter]:
     """Parse ``?filter=field:op:value`` query strings."""
@@ -58,6 +86,36 @@ def _parse_filters(raw: list[str]) -> list[LogFilter]:
     return filters
 
 
+def _cache_key(
+    kind: str,
+    ctx_template: PluginContext,
+    resolved: ResolvedCapability,
+    environment: str | None,
+    auth: permissions.AuthContext,
+    query: LogQuery,
+    **extra: typing.Any,
+) -> str:
+    """Build the log cache key, scoped to the caller when identity is.
+
+    Integrations with a per-user identity return what that user may
+    see, so their results are only shared with the same principal.
+    """
+    scope = (
+        auth.principal_name
+        if effective_identity_integration_id(resolved)
+        else None
+    )
+    return log_cache.cache_key(
+        kind,
+        project_id=ctx_template.project_id,
+        integration_id=resolved.integration_id,
+        environment=environment,
+        scope=scope,
+        query=query,
+        **extra,
+    )
+
+
 async def _search_one_env(
     *,
     ctx_template: PluginContext,
@@ -75,21 +133,211 @@ async def _search_one_env(
     walk ``Environment → MAPS_TO → AwsAccount`` to mint env-specific
     STS keys, which can't be done before the env is known. Plugin
     credentials are resolved once by the caller and shared.
+
+    Results go through :mod:`imbi_api.plugins.log_cache`, so polling
+    viewers of the same query share one upstream call.
     """
-    ctx = ctx_template.model_copy(update={'environment': environment})
-    ctx = await attach_identity(
-        db, ctx, resolved, auth, identity_options=identity_options
+
+    async def fetch() -> LogResult:
+        ctx = ctx_template.model_copy(update={'environment': environment})
+        ctx = await attach_identity(
+            db, ctx, resolved, auth, identity_options=identity_options
+        )
+        handler = typing.cast(LogsCapability, resolved.capability_cls())
+        result = await call_with_timeout(
+            handler.search(ctx, credentials, query)
+        )
+        # Stamp the env slug onto each entry's ``raw`` so the UI can
+        # render an env column without requiring the upstream log source
+        # to include one. Existing values are preserved (handler-supplied
+        # env wins).
+        if environment:
+            for entry in result.entries:
+                if 'environment' not in entry.raw:
+                    entry.raw['environment'] = environment
+        return result
+
+    return await log_cache.cached(
+        _cache_key('search', ctx_template, resolved, environment, auth, query),
+        fetch,
+    )
+
+
+def _encode_env_cursor(positions: dict[str, _EnvPosition]) -> str | None:
+    """Encode the per-env positions of a multi-env search.
+
+    Exhausted environments are omitted; None once every env is.
+    """
+    if not positions:
+        return None
+    payload = json.dumps(
+        {env: [p.cursor, p.offset] for env, p in positions.items()},
+        separators=(',', ':'),
+    ).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b'=').decode('ascii')
+
+
+def _decode_env_cursor(cursor: str) -> dict[str, _EnvPosition] | None:
+    """Decode a multi-env cursor; return None for any malformed input."""
+    padding = '=' * (-len(cursor) % 4)
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        positions = {
+            str(env): _EnvPosition(
+                None if page is None else str(page), int(offset)
+            )
+            for env, (page, offset) in data.items()
+        }
+    except AttributeError, TypeError, ValueError:
+        return None
+    if any(p.offset < 0 for p in positions.values()):
+        return None
+    return positions
+
+
+def _merge_env_pages(
+    pages: dict[str, tuple[_EnvPosition, LogResult]],
+    limit: int,
+) -> tuple[list[LogEntry], dict[str, _EnvPosition]]:
+    """K-way merge per-env pages (newest first) into one page.
+
+    Each env's entries are taken in plugin order starting at its
+    position's offset.  The merge stops at ``limit`` entries, or as
+    soon as an env runs out of fetched entries while its plugin still
+    has more -- anything after that point could sort behind entries
+    this page has not seen.  For the same reason nothing is merged
+    while an env has no fetched entries but more to come.  Returns the
+    merged entries and the position each env resumes from; exhausted
+    envs are left out.
+    """
+    buffers: dict[str, list[LogEntry]] = {}
+    heap: list[tuple[float, int, int, str]] = []
+    unresolved = False
+    for index, (env, (position, result)) in enumerate(pages.items()):
+        buffers[env] = result.entries[position.offset :]
+        if buffers[env]:
+            ts = buffers[env][0].timestamp.timestamp()
+            heap.append((-ts, index, 0, env))
+        elif result.next_cursor is not None:
+            unresolved = True
+    heapq.heapify(heap)
+
+    consumed = dict.fromkeys(pages, 0)
+    merged: list[LogEntry] = []
+    while heap and not unresolved and len(merged) < limit:
+        _, index, offset, env = heapq.heappop(heap)
+        buffer = buffers[env]
+        merged.append(buffer[offset])
+        consumed[env] = offset + 1
+        if offset + 1 < len(buffer):
+            ts = buffer[offset + 1].timestamp.timestamp()
+            heapq.heappush(heap, (-ts, index, offset + 1, env))
+        elif pages[env][1].next_cursor is not None:
+            break
+
+    positions: dict[str, _EnvPosition] = {}
+    for env, (position, result) in pages.items():
+        if consumed[env] < len(buffers[env]):
+            positions[env] = _EnvPosition(
+                position.cursor, position.offset + consumed[env]
+            )
+        elif result.next_cursor is not None:
+            positions[env] = _EnvPosition(result.next_cursor)
+    return merged, positions
+
+
+async def _search_env_pages(
+    search: abc.Callable[[str, _EnvPosition], abc.Awaitable[LogResult]],
+    positions: dict[str, _EnvPosition],
+) -> tuple[dict[str, tuple[_EnvPosition, LogResult]], list[str], int]:
+    """Fetch each env's page of a multi-env search.
+
+    Per-env failures become warnings; an env whose first read fails is
+    left out.  An env
+    whose page came back empty while its plugin still has more cannot
+    be ordered against the others, so its next page is read, up to
+    :data:`_MAX_EMPTY_PAGE_FOLLOWS` times; one still unresolved after
+    that holds the merge back (see :func:`_merge_env_pages`).  Returns
+    the pages, the warnings and the summed plugin totals.
+    """
+    pages: dict[str, tuple[_EnvPosition, LogResult]] = {}
+    warnings: list[str] = []
+    total: int = 0
+    pending = positions
+    for _attempt in range(_MAX_EMPTY_PAGE_FOLLOWS + 1):
+        active = list(pending)
+        raw_results = await asyncio.gather(
+            *(search(env, pending[env]) for env in active),
+            return_exceptions=True,
+        )
+        for env, result_or_exc in zip(active, raw_results, strict=True):
+            if isinstance(result_or_exc, CursorExpiredError):
+                raise _cursor_expired(result_or_exc) from result_or_exc
+            if isinstance(result_or_exc, Exception):
+                LOGGER.warning(
+                    'Log search failed for env=%s: %s', env, result_or_exc
+                )
+                warnings.append(
+                    f'Search for environment {env!r} failed: {result_or_exc}'
+                )
+                continue
+            if isinstance(result_or_exc, BaseException):
+                # CancelledError / KeyboardInterrupt / SystemExit must
+                # propagate — never downgrade them to a partial-failure
+                # warning.
+                raise result_or_exc
+            if env not in pages and result_or_exc.total is not None:
+                total += result_or_exc.total
+            pages[env] = (pending[env], result_or_exc)
+            warnings.extend(result_or_exc.warnings)
+        pending = {
+            env: _EnvPosition(result.next_cursor)
+            for env, (position, result) in pages.items()
+            if result.next_cursor is not None
+            and not result.entries[position.offset :]
+        }
+        if not pending:
+            break
+
+    return pages, warnings, total
+
+
+def _merge_histograms(
+    results: list[list[LogHistogramBucket]],
+) -> list[models.LogHistogramBucketResponse]:
+    """Merge per-env histograms, summing buckets that share a timestamp.
+
+    Per-level counts are summed the same way.
+    """
+
+    def _ts(bucket: LogHistogramBucket) -> datetime.datetime:
+        return bucket.timestamp
+
+    merged: list[models.LogHistogramBucketResponse] = []
+    for bucket in heapq.merge(
+        *(sorted(buckets, key=_ts) for buckets in results), key=_ts
+    ):
+        if merged and merged[-1].timestamp == bucket.timestamp:
+            slot = merged[-1]
+            slot.count += bucket.count
+        else:
+            slot = models.LogHistogramBucketResponse(
+                timestamp=bucket.timestamp, count=bucket.count, levels={}
+            )
+            merged.append(slot)
+        for lvl, n in (bucket.levels or {}).items():
+            slot.levels[lvl] = slot.levels.get(lvl, 0) + n
+    return merged
+
+
+def _cursor_expired(exc: CursorExpiredError) -> fastapi.HTTPException:
+    return fastapi.HTTPException(
+        status_code=409,
+        detail={
+            'error': 'cursor_expired',
+            'message': str(exc),
+        },
     )
-    handler = typing.cast(LogsCapability, resolved.capability_cls())
-    result = await call_with_timeout(handler.search(ctx, credentials, query))
-    # Stamp the env slug onto each entry's ``raw`` so the UI can render an
-    # env column without requiring the upstream log source to include one.
-    # Existing values are preserved (handler-supplied env wins).
-    if environment:
-        for entry in result.entries:
-            if 'environment' not in entry.raw:
-                entry.raw['environment'] = environment
-    return result
 
 
 def _to_response_entries(
@@ -137,11 +385,13 @@ async def search_logs(
 
     ``environment`` is a repeated query param: ``?environment=production
     &environment=staging``.  When two or more envs are passed, the
-    endpoint fans out one identity-scoped search per env in parallel,
-    merges entries by timestamp (desc), and returns the first ``limit``
-    entries.  Pagination via ``cursor`` is only supported for
-    single-env searches; multi-env returns ``next_cursor=None`` and
-    surfaces partial-failure / truncation notes via ``warnings``.
+    endpoint fans out one identity-scoped search per env in parallel
+    and k-way merges the per-env streams by timestamp (desc) into one
+    page of ``limit`` entries.  The multi-env ``next_cursor`` is a
+    composite of each env's plugin cursor and merge offset, so paging
+    resumes every stream where the previous page left it.  Per-env
+    failures are surfaced via ``warnings`` and that env is dropped
+    from the cursor.
 
     ``level`` is a repeated query param (``?level=ERROR&level=WARN``)
     that pushes severity filtering down into the plugin's underlying
@@ -173,14 +423,6 @@ async def search_logs(
         end_dt = end_dt.replace(tzinfo=datetime.UTC)
 
     filters = _parse_filters(raw_filters)
-    if cursor and len(environment) > 1:
-        raise fastapi.HTTPException(
-            status_code=400,
-            detail=(
-                'Pagination is only supported for single-environment '
-                'searches; received multiple environments with a cursor'
-            ),
-        )
     query = LogQuery(
         start_time=start_dt,
         end_time=end_dt,
@@ -235,13 +477,7 @@ async def search_logs(
                 identity_options=identity_options,
             )
         except CursorExpiredError as exc:
-            raise fastapi.HTTPException(
-                status_code=409,
-                detail={
-                    'error': 'cursor_expired',
-                    'message': str(exc),
-                },
-            ) from exc
+            raise _cursor_expired(exc) from exc
         return models.LogResultResponse(
             entries=_to_response_entries(result.entries),
             next_cursor=result.next_cursor,
@@ -253,50 +489,45 @@ async def search_logs(
     # env-aware identity plugins can mint per-env STS keys) and per-env
     # failures from identity hydration or ``handler.search`` are
     # surfaced as warnings rather than failing the whole request —
-    # partial results are still useful.
-    raw_results = await asyncio.gather(
-        *(
-            _search_one_env(
-                ctx_template=ctx_template,
-                resolved=resolved,
-                credentials=credentials,
-                query=query,
-                environment=env,
-                db=db,
-                auth=auth,
-                identity_options=identity_options,
+    # partial results are still useful.  Each env resumes from its own
+    # position in the composite cursor; envs missing from a cursor
+    # were exhausted by an earlier page and are not queried again.
+    positions: dict[str, _EnvPosition]
+    if cursor is None:
+        positions = {env: _EnvPosition(None) for env in environment}
+    else:
+        decoded = _decode_env_cursor(cursor)
+        if decoded is None or not decoded.keys() <= set(environment):
+            raise fastapi.HTTPException(
+                status_code=400,
+                detail='Invalid cursor for the requested environments',
             )
-            for env in envs
-        ),
-        return_exceptions=True,
-    )
+        positions = decoded
 
-    merged_entries: list[typing.Any] = []
-    warnings: list[str] = []
-    total: int = 0
-    for env, result_or_exc in zip(envs, raw_results, strict=True):
-        if isinstance(result_or_exc, Exception):
-            LOGGER.warning(
-                'Log search failed for env=%s: %s', env, result_or_exc
-            )
-            warnings.append(
-                f'Search for environment {env!r} failed: {result_or_exc}'
-            )
-            continue
-        if isinstance(result_or_exc, BaseException):
-            # CancelledError / KeyboardInterrupt / SystemExit must
-            # propagate — never downgrade them to a partial-failure
-            # warning.
-            raise result_or_exc
-        merged_entries.extend(result_or_exc.entries)
-        warnings.extend(result_or_exc.warnings)
-        if result_or_exc.total is not None:
-            total += result_or_exc.total
-    merged_entries.sort(key=lambda e: e.timestamp, reverse=True)
-    truncated = merged_entries[:limit]
+    # A position's plugin page is re-read from its start, so fetch the
+    # entries already returned from it plus one page's worth.
+    async def search(env: str, position: _EnvPosition) -> LogResult:
+        return await _search_one_env(
+            ctx_template=ctx_template,
+            resolved=resolved,
+            credentials=credentials,
+            query=query.model_copy(
+                update={
+                    'cursor': position.cursor,
+                    'limit': min(position.offset + limit, _MAX_ENV_FETCH),
+                }
+            ),
+            environment=env,
+            db=db,
+            auth=auth,
+            identity_options=identity_options,
+        )
+
+    pages, warnings, total = await _search_env_pages(search, positions)
+    merged, next_positions = _merge_env_pages(pages, limit)
     return models.LogResultResponse(
-        entries=_to_response_entries(truncated),
-        next_cursor=None,
+        entries=_to_response_entries(merged),
+        next_cursor=_encode_env_cursor(next_positions),
         total=total or None,
         warnings=warnings,
     )
@@ -314,13 +545,27 @@ async def _histogram_one_env(
     auth: permissions.AuthContext,
     identity_options: dict[str, typing.Any] | None,
 ) -> list[LogHistogramBucket]:
-    ctx = ctx_template.model_copy(update={'environment': environment})
-    ctx = await attach_identity(
-        db, ctx, resolved, auth, identity_options=identity_options
-    )
-    handler = typing.cast(LogsCapability, resolved.capability_cls())
-    return await call_with_timeout(
-        handler.histogram(ctx, credentials, query, bucket_count)
+    async def fetch() -> list[LogHistogramBucket]:
+        ctx = ctx_template.model_copy(update={'environment': environment})
+        ctx = await attach_identity(
+            db, ctx, resolved, auth, identity_options=identity_options
+        )
+        handler = typing.cast(LogsCapability, resolved.capability_cls())
+        return await call_with_timeout(
+            handler.histogram(ctx, credentials, query, bucket_count)
+        )
+
+    return await log_cache.cached(
+        _cache_key(
+            'histogram',
+            ctx_template,
+            resolved,
+            environment,
+            auth,
+            query,
+            bucket_count=bucket_count,
+        ),
+        fetch,
     )
 
 
@@ -462,7 +707,7 @@ async def get_log_histogram(
         ),
         return_exceptions=True,
     )
-    summed: dict[datetime.datetime, dict[str, int | dict[str, int]]] = {}
+    results: list[list[LogHistogramBucket]] = []
     for env, result_or_exc in zip(envs, raw_results, strict=True):
         if isinstance(result_or_exc, Exception):
             LOGGER.warning(
@@ -471,20 +716,8 @@ async def get_log_histogram(
             continue
         if isinstance(result_or_exc, BaseException):
             raise result_or_exc
-        for b in result_or_exc:
-            slot = summed.setdefault(b.timestamp, {'count': 0, 'levels': {}})
-            slot['count'] = typing.cast(int, slot['count']) + b.count
-            levels_dict = typing.cast(dict[str, int], slot['levels'])
-            for lvl, n in (b.levels or {}).items():
-                levels_dict[lvl] = levels_dict.get(lvl, 0) + n
-    return [
-        models.LogHistogramBucketResponse(
-            timestamp=ts,
-            count=typing.cast(int, slot['count']),
-            levels=typing.cast(dict[str, int], slot['levels']),
-        )
-        for ts, slot in sorted(summed.items())
-    ]
+        results.append(result_or_exc)
+    return _merge_histograms(results)
 
 
 @project_logs_router.get('/schema')
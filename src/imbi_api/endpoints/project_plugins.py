@@ -25,12 +25,8 @@ from imbi_common.plugins.errors import PluginNotFoundError
 from imbi_common.plugins.registry import get_plugin, list_plugins
 
 from imbi_api.auth import permissions
-from imbi_api.plugins.assignments import (
-    CapabilityBinding,
-    capability_enabled,
-    effective_bindings,
-)
-from imbi_api.plugins.lifecycle import is_plugin_enabled
+from imbi_api.plugins import binding_cache
+from imbi_api.plugins.assignments import CapabilityBinding, capability_enabled
 
 project_plugins_router = fastapi.APIRouter(
     prefix='/organizations/{org_slug}/projects/{project_id}/plugins',
@@ -113,11 +109,13 @@ async def list_project_plugins(
             for capability in entry.manifest.capabilities
         }
     )
-    enabled: dict[str, bool] = {}
+    enabled: dict[str, bool] | None = None
     out: list[PluginAssignmentResponse] = []
     for kind in kinds:
         try:
-            bindings = await effective_bindings(db, project_id, kind)
+            bindings = await binding_cache.effective_bindings(
+                db, project_id, kind
+            )
         except LookupError as exc:
             raise fastapi.HTTPException(
                 status_code=404, detail='Project not found'
@@ -131,9 +129,9 @@ async def list_project_plugins(
             capability = entry.manifest.get_capability(kind)
             if capability is None:
                 continue
-            if plugin_slug not in enabled:
-                enabled[plugin_slug] = await is_plugin_enabled(db, plugin_slug)
-            if not enabled[plugin_slug]:
+            if enabled is None:
+                enabled = await binding_cache.enabled_map(db)
+            if not enabled.get(plugin_slug, False):
                 continue
             out.append(_to_response(binding, kind, capability))
     return out
@@ -8,11 +8,12 @@ import fastapi
 import pydantic
 from imbi_common import blueprints, graph, models
 
-from imbi_api import blueprint_attributes
+from imbi_api import blueprint_attributes, search_scope
 from imbi_api import patch as json_patch
 from imbi_api.auth import permissions
 from imbi_api.endpoints._helpers import conflict_on_unique_violation
 from imbi_api.graph_sql import props_template, set_clause
+from imbi_api.plugins import binding_cache
 from imbi_api.relationships import relationship_link
 
 LOGGER = logging.getLogger(__name__)
@@ -127,6 +128,7 @@ async def create_project_type(
     pt_props['relationships'] = _project_type_relationships(
         request, org_slug, pt_props['slug'], 0
     )
+    await search_scope.add_nodes(org_slug, pt_props.get('id'))
     return pt_props
 
 
@@ -465,3 +467,5 @@ async def delete_project_type(
             status_code=404,
             detail=(f'Project type with slug {slug!r} not found'),
         )
+    await search_scope.invalidate(org_slug)
+    await binding_cache.invalidate()
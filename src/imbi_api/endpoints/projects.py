@@ -12,10 +12,11 @@ import re
 import typing
 
 import fastapi
+import fastapi.responses
 import nanoid
 import psycopg
 import pydantic
-from imbi_common import blueprints, clickhouse, graph, models
+from imbi_common import blueprints, graph, models
 from imbi_common.clickhouse import client as ch_client
 from imbi_common.plugins.base import (
     LifecycleCapability,
@@ -24,7 +25,14 @@ from imbi_common.plugins.base import (
 )
 from imbi_common.scoring import compute_score
 
-from imbi_api import blueprint_attributes
+from imbi_api import (
+    blueprint_attributes,
+    deployment_events,
+    event_buffer,
+    project_membership,
+    release_state,
+    search_scope,
+)
 from imbi_api import patch as json_patch
 from imbi_api.auth import permissions
 from imbi_api.domain import scoring as scoring_models
@@ -35,7 +43,13 @@ from imbi_api.endpoints._json_fields import (
     deserialize_json_fields,
     serialize_json_fields,
 )
+from imbi_api.endpoints._pagination import (
+    build_link_header,
+    decode_keyset,
+    encode_keyset,
+)
 from imbi_api.graph_sql import escape_prop, props_template, set_clause
+from imbi_api.plugins import binding_cache
 from imbi_api.plugins.lifecycle_dispatch import (
     LifecycleInvocation,
     build_lifecycle_context_bundle,
@@ -49,52 +63,6 @@ from imbi_api.settings import get_server_config
 
 LOGGER = logging.getLogger(__name__)
 
-_RELEASE_SEMVER_RE = re.compile(r'^v?(\d+)\.(\d+)\.(\d+)(?:[-+].*)?$')
-
-
-def _release_semver_key(
-    name: str,
-) -> tuple[int, int, int] | None:
-    """Return ``(major, minor, patch)`` for semver tags; ``None`` if not."""
-    m = _RELEASE_SEMVER_RE.match(name)
-    if not m:
-        return None
-    return (int(m.group(1)), int(m.group(2)), int(m.group(3)))
-
-
-def _pick_latest_tag(
-    rows: list[dict[str, typing.Any]],
-) -> dict[str, typing.Any] | None:
-    """Pick the latest release tag (highest semver) from ``tags`` rows.
-
-    Mirrors ``_latest_release_tag`` in ``project_deployments`` but is
-    local to avoid a circular import (project_deployments → releases →
-    projects).
-
-    Only semver tags are considered; non-semver rows are ignored so an
-    ad-hoc tag (e.g. ``deploy-20240101``) never wins over a real release.
-    """
-    semver_rows = [
-        row
-        for row in rows
-        if _release_semver_key(str(row.get('name', ''))) is not None
-    ]
-    if not semver_rows:
-        return None
-
-    def _key(
-        r: dict[str, typing.Any],
-    ) -> tuple[tuple[int, int, int], str]:
-        sv = _release_semver_key(str(r.get('name', '')))
-        when = r.get('tagged_at') or r.get('recorded_at')
-        when_key = (
-            when.isoformat() if isinstance(when, datetime.datetime) else ''
-        )
-        return (sv or (0, 0, 0), when_key)
-
-    return max(semver_rows, key=_key)
-
-
 projects_router = fastapi.APIRouter(tags=['Projects'])
 
 
@@ -636,16 +604,19 @@ def _latest_deployment_event(
 ) -> tuple[datetime.datetime, str | None] | None:
     """Return ``(timestamp, performed_by)`` of the latest event, or ``None``.
 
-    The ``deployments`` edge property is a JSON-encoded list of
-    ``DeploymentEvent``-shaped objects.  ``_fetch_current_releases``
-    only needs the most recent ``(timestamp, performed_by)`` per
-    ``(project, environment)`` pair, so we parse straight off the dicts
-    and skip the per-entry Pydantic validation that
-    ``_parse_deployment_events`` used to pay for.
+    ``raw`` is the edge's JSON-encoded ``latest_event`` summary, or
+    for edges not yet migrated to :mod:`imbi_api.deployment_events`
+    the legacy ``deployments`` list of ``DeploymentEvent``-shaped
+    objects.  ``_fetch_current_releases`` only needs the most recent
+    ``(timestamp, performed_by)`` per ``(project, environment)`` pair,
+    so we parse straight off the dicts and skip the per-entry Pydantic
+    validation that ``_parse_deployment_events`` used to pay for.
     """
     if not raw:
         return None
     data = json.loads(raw) if isinstance(raw, str) else raw
+    if isinstance(data, dict):
+        data = [data]
     if not isinstance(data, list):
         return None
     latest_ts: datetime.datetime | None = None
@@ -728,10 +699,13 @@ async def _fetch_current_releases(
 
     Reads from the AGE graph — the same source the project-detail
     ``/releases/current`` endpoint uses — so both views agree.  For
-    each project we walk every
+    each environment a project deploys in, the ``DEPLOYED_IN`` edge's
+    ``current_release`` pointer names the release (or its
+    ``pending_release`` while a deployment is in flight); where it is
+    unset, we walk every
     ``(p)-[:HAS_RELEASE]->(r:Release)-[d:DEPLOYED_TO]->(e:Environment)``
-    edge and pick the release whose latest ``DeploymentEvent``
-    has the most recent ``timestamp`` per environment.
+    edge into the environment and pick the release whose latest
+    ``DeploymentEvent`` has the most recent ``timestamp``.
 
     ``performed_by`` on each ``DeploymentEvent`` is populated for
     resync-sourced events but is intentionally null for in-product
@@ -746,14 +720,16 @@ async def _fetch_current_releases(
     if not project_ids:
         return {}
     query: typing.LiteralString = """
-    MATCH (p:Project)-[:HAS_RELEASE]->(r:Release)
-                    -[d:DEPLOYED_TO]->(e:Environment)
+    MATCH (p:Project)-[di:DEPLOYED_IN]->(e:Environment)
     WHERE p.id IN {project_ids}
+    MATCH (p)-[:HAS_RELEASE]->(r:Release)-[d:DEPLOYED_TO]->(e)
+    WHERE di.current_release IS NULL OR r.id = di.current_release
+          OR r.id = di.pending_release
     RETURN p.id AS project_id,
            e.slug AS env_slug,
            r.tag AS tag,
            r.committish AS committish,
-           d.deployments AS deployments
+           coalesce(d.latest_event, d.deployments) AS deployments
     """
     try:
         rows = await db.execute(
@@ -768,7 +744,9 @@ async def _fetch_current_releases(
         return {}
 
     # For each (project_id, env_slug), keep the (release, event) pair
-    # with the latest event timestamp.
+    # with the latest event timestamp; only environments without a
+    # current_release pointer, or with a deployment in flight
+    # (pending_release), return more than one row.
     latest: dict[
         tuple[str, str],
         tuple[str | None, str | None, datetime.datetime, str | None],
@@ -831,32 +809,16 @@ async def _fetch_release_summaries(
 ) -> dict[str, ReleaseSummary]:
     """Return {project_id: ReleaseSummary} for releasable projects.
 
-    Two ClickHouse queries: one for latest tags, one for latest commit
-    SHA.  Uses the same semver-max logic as the per-project
-    release-drift endpoint.  Errors are swallowed — release data is
+    One point lookup against the materialized
+    :mod:`~imbi_api.release_state` table, which uses the same semver-max
+    logic as the per-project release-drift endpoint.  Only semver tags
+    count as releases here.  Errors are swallowed — release data is
     best-effort.
     """
     if not project_ids:
         return {}
     try:
-        tag_rows, head_rows = await asyncio.gather(
-            clickhouse.query(
-                'SELECT project_id, name, sha, tagged_at, recorded_at,'
-                ' tagger_name'
-                ' FROM tags FINAL'
-                ' WHERE project_id IN {project_ids:Array(String)}',
-                {'project_ids': project_ids},
-            ),
-            clickhouse.query(
-                'SELECT project_id, sha, short_sha,'
-                ' author_name, author_user, authored_at'
-                ' FROM commits FINAL'
-                ' WHERE project_id IN {project_ids:Array(String)}'
-                ' ORDER BY pushed_at DESC, authored_at DESC'
-                ' LIMIT 1 BY project_id',
-                {'project_ids': project_ids},
-            ),
-        )
+        states = await release_state.get(project_ids)
     except Exception:  # noqa: BLE001
         LOGGER.warning(
             'Failed to fetch release summaries for projects',
@@ -864,128 +826,23 @@ async def _fetch_release_summaries(
         )
         return {}
 
-    tags_by_project: dict[str, list[dict[str, typing.Any]]] = {}
-    for row in tag_rows:
-        pid = str(row.get('project_id', ''))
-        if pid:
-            tags_by_project.setdefault(pid, []).append(row)
-
-    head_by_project: dict[str, dict[str, typing.Any]] = {
-        str(row['project_id']): row
-        for row in head_rows
-        if row.get('project_id') and row.get('sha')
-    }
-
-    # Resolve each project's latest semver tag and its timestamp so we
-    # can query commit counts after that point.
-    all_pids = set(tags_by_project.keys()) | set(head_by_project.keys())
-    latest_by_pid: dict[str, dict[str, typing.Any] | None] = {
-        pid: _pick_latest_tag(tags_by_project.get(pid, [])) for pid in all_pids
-    }
-
-    # Batch-fetch commit counts since each project's latest tag.
-    # Build a list of (project_id, tag_authored_at) tuples so a single
-    # ClickHouse query can count unreleased commits per project.
-    # Projects with no prior tag get a cutoff of epoch-start (count all).
-    tagged_pids = [
-        pid for pid, tag in latest_by_pid.items() if tag is not None
-    ]
-    counts_since_tag: dict[str, int] = {}
-    if tagged_pids:
-        try:
-            # For each project, count commits authored after the tag's
-            # recorded_at/tagged_at (the closest proxy we have to when
-            # the tag commit landed without a separate sha→authored_at
-            # look-up).  This mirrors what the per-project drift endpoint
-            # does via a base-commit authored_at lookup.
-            tag_times = [
-                (latest_by_pid[pid] or {}).get('tagged_at')
-                or (latest_by_pid[pid] or {}).get('recorded_at')
-                for pid in tagged_pids
-            ]
-            # Build per-project WHERE via countIf for a single scan.
-            # Rows without a valid tag timestamp are excluded from the
-            # list, so we can safely cast to datetime.
-            pid_cutoff: list[tuple[str, datetime.datetime]] = [
-                (pid, t)
-                for pid, t in zip(tagged_pids, tag_times, strict=True)
-                if isinstance(t, datetime.datetime)
-            ]
-            if pid_cutoff:
-                cutoff_map = dict(pid_cutoff)
-                # Build the per-project cutoff map server-side from two
-                # parallel arrays.  Passing a dict for a Map(...) parameter
-                # trips a clickhouse-connect binding bug: dicts serialize as
-                # JSON (double-quoted), but ClickHouse's Map text parser
-                # requires single-quoted strings (CANNOT_PARSE_QUOTED_STRING).
-                # Arrays serialize correctly, so mapFromArrays sidesteps it.
-                count_rows = await clickhouse.query(
-                    'SELECT project_id,'
-                    ' countIf(authored_at > mapFromArrays('
-                    '{pids:Array(String)},'
-                    ' {cuts:Array(DateTime64(3))})'
-                    '[project_id]) AS c'
-                    ' FROM commits FINAL'
-                    ' WHERE project_id'
-                    ' IN {pids:Array(String)}'
-                    ' GROUP BY project_id',
-                    {
-                        'pids': list(cutoff_map.keys()),
-                        'cuts': list(cutoff_map.values()),
-                    },
-                )
-                counts_since_tag = {
-                    str(row['project_id']): int(row['c'])
-                    for row in count_rows
-                    if row.get('project_id') is not None
-                }
-        except Exception:  # noqa: BLE001
-            LOGGER.warning(
-                'Failed to fetch commit counts since tag',
-                exc_info=True,
-            )
-
     release_result: dict[str, ReleaseSummary] = {}
-    for pid in all_pids:
-        latest = latest_by_pid.get(pid)
-        head_row = head_by_project.get(pid)
-        head_sha = str(head_row['sha']) if head_row else None
-        short_sha = (
-            str(head_row.get('short_sha') or head_sha or '')[:7] or None
-            if head_row
-            else None
-        )
-        raw_author = (
-            head_row.get('author_name') or head_row.get('author_user')
-            if head_row
-            else None
-        )
-        head_author = str(raw_author) if raw_author else None
-        raw_login = head_row.get('author_user') if head_row else None
-        head_author_login = str(raw_login) if raw_login else None
-        head_authored_at: datetime.datetime | None = (
-            head_row.get('authored_at') if head_row else None
-        )
-        latest_tag = str(latest['name']) if latest else None
-        latest_tag_sha = str(latest['sha']) if latest else None
-        latest_tag_at: datetime.datetime | None = (
-            latest.get('tagged_at') or latest.get('recorded_at')
-            if latest
-            else None
-        )
-        tagger = latest.get('tagger_name') if latest else None
-        latest_tag_author = str(tagger) if tagger else None
+    for pid, state in states.items():
+        if state.head_sha is None and state.latest_tag is None:
+            continue
+        # An ad-hoc tag (e.g. ``deploy-20240101``) is never a release.
+        tagged = state.latest_tag_semver
         release_result[pid] = ReleaseSummary(
-            head_sha=head_sha,
-            head_short_sha=short_sha,
-            head_author=head_author,
-            head_author_login=head_author_login,
-            head_authored_at=head_authored_at,
-            latest_tag=latest_tag,
-            latest_tag_sha=latest_tag_sha,
-            latest_tag_at=latest_tag_at,
-            latest_tag_author=latest_tag_author,
-            commits_since_tag=counts_since_tag.get(pid, 0),
+            head_sha=state.head_sha,
+            head_short_sha=state.head_short_sha,
+            head_author=state.head_author,
+            head_author_login=state.head_author_login,
+            head_authored_at=state.head_authored_at,
+            latest_tag=state.latest_tag if tagged else None,
+            latest_tag_sha=state.latest_tag_sha if tagged else None,
+            latest_tag_at=state.latest_tag_at if tagged else None,
+            latest_tag_author=state.latest_tag_author if tagged else None,
+            commits_since_tag=state.commits_since_tag if tagged else 0,
         )
     return release_result
 
@@ -1037,9 +894,8 @@ async def _emit_change_events(
     if not rows:
         return
     try:
-        await ch_client.Clickhouse.get_instance().insert(
+        await event_buffer.write(
             'events',
-            rows,
             [
                 'id',
                 'project_id',
@@ -1050,6 +906,7 @@ async def _emit_change_events(
                 'metadata',
                 'payload',
             ],
+            rows,
         )
     except Exception:
         LOGGER.exception(
@@ -1376,6 +1233,10 @@ async def create_project(
     await score_queue.enqueue_recompute(
         valkey_client, project_id, 'attribute_change'
     )
+    await search_scope.add_nodes(org_slug, project_id)
+    await project_membership.record_project(
+        project_id, org_slug, data.team_slug, False
+    )
     # Fire the lifecycle ``created`` event so plugins (e.g. the
     # GitHub lifecycle plugin) can provision the backing repo and
     # write the resulting canonical link back via ``LinkWriteback``.
@@ -1565,10 +1426,137 @@ def _build_attribute_filter(
     return 'WHERE ' + ' AND '.join(clauses), params
 
 
-@projects_router.get('/', name='list_projects')
+_LIST_MAX_LIMIT: int = 500
+_LIST_STREAM_PAGE_SIZE: int = 100
+_NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+# Keyset stage inserted ahead of the return fragment when paginating so
+# the per-project OPTIONAL MATCH fan-out only runs for the current page.
+_LIST_AFTER_CURSOR: typing.LiteralString = """
+    WITH p, o
+    WHERE p.name > {cursor_name}
+       OR (p.name = {cursor_name} AND p.id > {cursor_id})
+"""
+_LIST_PAGE_STAGE: typing.LiteralString = """
+    WITH p, o
+    ORDER BY p.name, p.id
+    LIMIT {row_limit}
+"""
+
+
+def _validate_list_page(
+    limit: int | None,
+    cursor: str | None,
+) -> tuple[str, str] | None:
+    """Validate ``limit`` and decode ``cursor``; raise HTTP 400 if bad."""
+    if limit is not None and (limit < 1 or limit > _LIST_MAX_LIMIT):
+        raise fastapi.HTTPException(
+            status_code=400,
+            detail=f'limit must be 1..{_LIST_MAX_LIMIT}',
+        )
+    if cursor is None:
+        return None
+    after = decode_keyset(cursor)
+    if after is None:
+        raise fastapi.HTTPException(status_code=400, detail='Invalid cursor')
+    return after
+
+
+def _parse_project_rows(
+    records: list[dict[str, typing.Any]],
+    org_slug: str,
+    request: fastapi.Request,
+    slim: bool,
+) -> list[dict[str, typing.Any]]:
+    """Parse raw list-query rows into project dicts."""
+    project_data_list: list[dict[str, typing.Any]] = []
+    for record in records:
+        project_data = graph.parse_agtype(record['project'])
+        if not slim:
+            _flatten_edge_props(project_data)
+            _attach_project_relationships(
+                project_data,
+                org_slug,
+                request,
+                graph.parse_agtype(record['outbound_count']),
+                graph.parse_agtype(record['inbound_count']),
+            )
+        else:
+            # Strip null/empty entries AGE can inject when
+            # ``collect(CASE WHEN ... END)`` matches nothing.
+            for key in ('project_types', 'environments'):
+                raw: list[typing.Any] = project_data.get(key) or []
+                project_data[key] = [
+                    item for item in raw if isinstance(item, dict) and item
+                ]
+        project_data_list.append(project_data)
+    return project_data_list
+
+
+async def _hydrate_projects(
+    db: graph.Pool,
+    auth: permissions.AuthContext,
+    project_data_list: list[dict[str, typing.Any]],
+    slim: bool,
+) -> list[ProjectListItem] | list[ProjectResponse]:
+    """Attach PR counts and release data, then validate each row.
+
+    Only the projects passed in are enriched, so a paginated or
+    streamed listing pays the ClickHouse / release lookups per page
+    rather than for the whole organization.
+    """
+    project_ids = [
+        str(p.get('id', '')) for p in project_data_list if p.get('id')
+    ]
+    releasable_ids = [
+        str(p.get('id', ''))
+        for p in project_data_list
+        if p.get('id')
+        and any(
+            pt.get('releasable')
+            for pt in typing.cast(
+                list[dict[str, typing.Any]],
+                p.get('project_types') or [],
+            )
+        )
+    ]
+    viewer = auth.identity_for('github-enterprise-cloud')
+    pr_counts, releases, release_summaries = await asyncio.gather(
+        _fetch_pr_counts(project_ids, viewer=viewer),
+        _fetch_current_releases(db, project_ids),
+        _fetch_release_summaries(releasable_ids),
+    )
+
+    await _resolve_release_display_names(db, releases)
+
+    for project_data in project_data_list:
+        pid = str(project_data.get('id', ''))
+        open_count, closed_count, viewer_open, viewer_closed = pr_counts.get(
+            pid, (0, 0, 0, 0)
+        )
+        project_data['open_pr_count'] = open_count
+        project_data['closed_pr_count'] = closed_count
+        project_data['viewer_open_pr_count'] = viewer_open
+        project_data['viewer_closed_pr_count'] = viewer_closed
+        project_data['current_releases'] = releases.get(pid, {})
+        summary = release_summaries.get(pid)
+        if summary is not None:
+            project_data['release_summary'] = summary.model_dump()
+
+    if slim:
+        return [ProjectListItem.model_validate(p) for p in project_data_list]
+    return [ProjectResponse.model_validate(p) for p in project_data_list]
+
+
+@projects_router.get(
+    '/',
+    name='list_projects',
+    response_model=list[ProjectListItem] | list[ProjectResponse],
+)
 async def list_projects(
     org_slug: str,
     request: fastapi.Request,
+    response: fastapi.Response,
     db: graph.Pool,
     auth: typing.Annotated[
         permissions.AuthContext,
@@ -1617,7 +1605,24 @@ async def list_projects(
             ),
         ),
     ] = None,
-) -> list[ProjectListItem] | list[ProjectResponse]:
+    limit: typing.Annotated[
+        int | None,
+        fastapi.Query(
+            description=(
+                'Page size. When set (or when ``cursor`` is given) the '
+                'listing is keyset-paginated on ``(name, id)`` and a '
+                '``Link`` header carries the ``next`` page URL. Omit '
+                'for the full, unpaginated listing.'
+            ),
+        ),
+    ] = None,
+    cursor: typing.Annotated[
+        str | None,
+        fastapi.Query(
+            description='Opaque cursor from a previous ``Link`` header.',
+        ),
+    ] = None,
+) -> list[ProjectListItem] | list[ProjectResponse] | fastapi.Response:
     """List projects in the organization.
 
     By default archived projects are excluded.  Pass
@@ -1643,6 +1648,12 @@ async def list_projects(
     DEPLOYED_IN edge properties, and the hypermedia
     ``relationships`` block. Cuts the response from megabytes to
     kilobytes for large orgs.
+
+    ``limit`` / ``cursor`` page the listing on ``(name, id)``; PR
+    counts and release data are only fetched for the returned page.
+    Sending ``Accept: application/x-ndjson`` streams every matching
+    project (from ``cursor`` onward) as newline-delimited JSON,
+    hydrating ``limit`` projects (default 100) at a time.
     """
     if identifier is not None and integration_slug is None:
         raise fastapi.HTTPException(
@@ -1653,6 +1664,10 @@ async def list_projects(
                 'integration'
             ),
         )
+    after = _validate_list_page(limit, cursor)
+    streaming = _NDJSON_MEDIA_TYPE in request.headers.get('accept', '')
+    paginated = streaming or limit is not None or cursor is not None
+    page_size = limit or _LIST_STREAM_PAGE_SIZE
     # Restrict to projects linked to an integration (and,
     # optionally, a specific external identifier on that edge). Closed
     # with ``WITH DISTINCT p, o`` so the optional ``identifier`` WHERE
@@ -1691,7 +1706,7 @@ async def list_projects(
         )
         fragment, attr_params = _build_attribute_filter(filters, whitelist)
         attr_filter = '\n    ' + fragment + '\n' if fragment else ''
-    query: str = (
+    base_query: str = (
         """
     MATCH (p:Project)-[:OWNED_BY]->(:Team)
           -[:BELONGS_TO]->(o:Organization {{slug: {org_slug}}})
@@ -1703,88 +1718,67 @@ async def list_projects(
         + service_filter
         + type_filter
         + attr_filter
-        + return_fragment
-        + """
-    ORDER BY p.name
-    """
     )
     columns: list[str] = (
         ['project'] if slim else ['project', 'outbound_count', 'inbound_count']
     )
-    records = await db.execute(
-        query,
-        {
-            'org_slug': org_slug,
-            'project_type': project_type,
-            'integration_slug': integration_slug,
-            'identifier': identifier,
-            **attr_params,
-        },
-        columns,
-    )
-    project_data_list: list[dict[str, typing.Any]] = []
-    for record in records:
-        project_data = graph.parse_agtype(record['project'])
-        if not slim:
-            _flatten_edge_props(project_data)
-            _attach_project_relationships(
-                project_data,
-                org_slug,
-                request,
-                graph.parse_agtype(record['outbound_count']),
-                graph.parse_agtype(record['inbound_count']),
-            )
-        else:
-            # Strip null/empty entries AGE can inject when
-            # ``collect(CASE WHEN ... END)`` matches nothing.
-            for key in ('project_types', 'environments'):
-                raw: list[typing.Any] = project_data.get(key) or []
-                project_data[key] = [
-                    item for item in raw if isinstance(item, dict) and item
-                ]
-        project_data_list.append(project_data)
-
-    project_ids = [
-        str(p.get('id', '')) for p in project_data_list if p.get('id')
-    ]
-    releasable_ids = [
-        str(p.get('id', ''))
-        for p in project_data_list
-        if p.get('id')
-        and any(
-            pt.get('releasable')
-            for pt in typing.cast(
-                list[dict[str, typing.Any]],
-                p.get('project_types') or [],
-            )
-        )
-    ]
-    viewer = auth.identity_for('github-enterprise-cloud')
-    pr_counts, releases, release_summaries = await asyncio.gather(
-        _fetch_pr_counts(project_ids, viewer=viewer),
-        _fetch_current_releases(db, project_ids),
-        _fetch_release_summaries(releasable_ids),
-    )
-
-    await _resolve_release_display_names(db, releases)
-
-    for project_data in project_data_list:
-        pid = str(project_data.get('id', ''))
-        open_count, closed_count, viewer_open, viewer_closed = pr_counts.get(
-            pid, (0, 0, 0, 0)
-        )
-        project_data['open_pr_count'] = open_count
-        project_data['closed_pr_count'] = closed_count
-        project_data['viewer_open_pr_count'] = viewer_open
-        project_data['viewer_closed_pr_count'] = viewer_closed
-        project_data['current_releases'] = releases.get(pid, {})
-        summary = release_summaries.get(pid)
-        if summary is not None:
-            project_data['release_summary'] = summary.model_dump()
+    params: dict[str, typing.Any] = {
+        'org_slug': org_slug,
+        'project_type': project_type,
+        'integration_slug': integration_slug,
+        'identifier': identifier,
+        **attr_params,
+    }
 
-    if slim:
-        return [ProjectListItem.model_validate(p) for p in project_data_list]
-    return [ProjectResponse.model_validate(p) for p in project_data_list]
+    if not paginated:
+        records = await db.execute(
+            base_query + return_fragment + '\n    ORDER BY p.name\n',
+            params,
+            columns,
+        )
+        rows = _parse_project_rows(records, org_slug, request, slim)
+        return await _hydrate_projects(db, auth, rows, slim)
+
+    async def fetch_page(
+        position: tuple[str, str] | None,
+    ) -> tuple[list[dict[str, typing.Any]], tuple[str, str] | None]:
+        """Fetch one page after ``position``; return rows + next key."""
+        page_query = base_query
+        page_params = dict(params, row_limit=page_size + 1)
+        if position is not None:
+            page_query += _LIST_AFTER_CURSOR
+            page_params['cursor_name'], page_params['cursor_id'] = position
+        page_query += (
+            _LIST_PAGE_STAGE
+            + return_fragment
+            + '\n    ORDER BY p.name, p.id\n'
+        )
+        records = await db.execute(page_query, page_params, columns)
+        rows = _parse_project_rows(records, org_slug, request, slim)
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        return rows, (str(rows[-1]['name']), str(rows[-1]['id']))
+
+    if streaming:
+
+        async def stream() -> typing.AsyncIterator[str]:
+            position = after
+            while True:
+                rows, position = await fetch_page(position)
+                for item in await _hydrate_projects(db, auth, rows, slim):
+                    yield item.model_dump_json(by_alias=True) + '\n'
+                if position is None:
+                    return
+
+        return fastapi.responses.StreamingResponse(
+            stream(), media_type=_NDJSON_MEDIA_TYPE
+        )
+
+    rows, next_key = await fetch_page(after)
+    next_cursor = encode_keyset(*next_key) if next_key else None
+    response.headers['Link'] = build_link_header(request, next_cursor)
+    return await _hydrate_projects(db, auth, rows, slim)
 
 
 class BlueprintSectionProperty(pydantic.BaseModel):
@@ -2863,6 +2857,19 @@ async def patch_project(
         request,
         db,
     )
+    if (
+        update_data.team_slug and update_data.team_slug != current_team_slug
+    ) or (
+        update_data.project_type_slugs is not None
+        and set(update_data.project_type_slugs) != set(current_type_slugs)
+    ):
+        # The owning team and project types decide which Integrations
+        # the project's capabilities bind to.
+        await binding_cache.invalidate()
+    if update_data.team_slug and update_data.team_slug != current_team_slug:
+        await project_membership.record_project(
+            project_id, org_slug, response.team.slug, response.archived
+        )
     await score_queue.enqueue_recompute(
         valkey_client, project_id, 'attribute_change'
     )
@@ -3152,6 +3159,12 @@ async def archive_project(
     project = await _set_archived_state(
         org_slug, project_id, True, request, db
     )
+    # Archiving hides the project's documents, releases, comments and
+    # components from search too; rebuild rather than enumerate them.
+    await search_scope.invalidate(org_slug)
+    await project_membership.record_project(
+        project_id, org_slug, project.team.slug, True
+    )
     # State change is already committed; never let an unexpected
     # dispatcher failure turn a successful archive into a 500.
     try:
@@ -3187,6 +3200,10 @@ async def unarchive_project(
     project = await _set_archived_state(
         org_slug, project_id, False, request, db
     )
+    await search_scope.invalidate(org_slug)
+    await project_membership.record_project(
+        project_id, org_slug, project.team.slug, False
+    )
     # State change is already committed; never let an unexpected
     # dispatcher failure turn a successful unarchive into a 500.
     try:
@@ -3259,8 +3276,10 @@ async def delete_project(
     MATCH (p:Project {{id: {project_id}}})
           -[:OWNED_BY]->(:Team)
           -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
+    OPTIONAL MATCH (p)-[:HAS_RELEASE]->(r:Release)
+    WITH p, collect(r.id) AS release_ids
     DETACH DELETE p
-    RETURN p
+    RETURN release_ids
     """
     records = await db.execute(
         query,
@@ -3268,6 +3287,7 @@ async def delete_project(
             'project_id': project_id,
             'org_slug': org_slug,
         },
+        ['release_ids'],
     )
 
     if not records:
@@ -3275,6 +3295,10 @@ async def delete_project(
             status_code=404,
             detail=f'Project {project_id!r} not found',
         )
+    await search_scope.invalidate(org_slug)
+    await project_membership.remove_project(project_id)
+    release_ids = graph.parse_agtype(records[0].get('release_ids'))
+    await deployment_events.purge(db, release_ids or [])
 
     # Project node is gone; never let a dispatch hiccup turn a
     # successful delete into a 500.  ``delete_repository=false`` skips
@@ -8,8 +8,9 @@ Two routers are provided:
 
 - ``pull_requests_router`` — mounted under
   ``/organizations/{org_slug}/pull-requests``
-  returns PRs across all projects in the org.  The org's project IDs
-  are resolved from the graph first so the response is scoped correctly.
+  returns PRs across all projects in the org.  The org scope is applied
+  inside ClickHouse against the ``project_membership`` table (see
+  :mod:`imbi_api.project_membership`).
 """
 
 from __future__ import annotations
@@ -23,7 +24,9 @@ import fastapi
 import pydantic
 from imbi_common import clickhouse, graph
 
+from imbi_api import project_membership
 from imbi_api.auth import permissions
+from imbi_api.endpoints._pagination import decode_cursor, encode_cursor
 
 LOGGER = logging.getLogger(__name__)
 
@@ -62,6 +65,7 @@ class PullRequestListResponse(pydantic.BaseModel):
     data: list[PullRequestResponse]
     project_count: int
     total: int
+    next_cursor: str | None = None
 
 
 # Default look-back window for the activity report when ``since`` is absent.
@@ -126,13 +130,21 @@ async def _fetch_org_project_ids(
 
 async def _list_prs(
     *,
-    project_ids: list[str],
+    project_ids: list[str] | None = None,
+    org_slug: str | None = None,
     state: str | None = None,
     author: str | None = None,
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> PullRequestListResponse:
-    """Run the ClickHouse query and return a paginated response."""
+    """Run the ClickHouse query and return a paginated response.
+
+    Scoped to ``project_ids`` when given, otherwise to every project
+    of ``org_slug``.  Pages follow a ``(created_at, pr_id)`` keyset:
+    ``cursor`` is the previous page's ``next_cursor``.  ``offset`` is
+    still honoured for older clients.
+    """
     if limit < 1 or limit > MAX_LIMIT:
         raise fastapi.HTTPException(
             status_code=400,
@@ -143,11 +155,16 @@ async def _list_prs(
             status_code=400,
             detail='offset must be >= 0',
         )
-    if not project_ids:
-        return PullRequestListResponse(data=[], project_count=0, total=0)
-
-    clauses: list[str] = ['project_id IN {project_ids:Array(String)}']
-    params: dict[str, typing.Any] = {'project_ids': project_ids}
+    params: dict[str, typing.Any] = {}
+    clauses: list[str] = []
+    if project_ids is not None:
+        if not project_ids:
+            return PullRequestListResponse(data=[], project_count=0, total=0)
+        clauses.append('project_id IN {project_ids:Array(String)}')
+        params['project_ids'] = project_ids
+    else:
+        clauses.append(project_membership.org_filter())
+        params['org_slug'] = org_slug
 
     if state is not None:
         clauses.append('state = {state:String}')
@@ -163,20 +180,38 @@ async def _list_prs(
         ' count(DISTINCT project_id) AS project_count'
         ' FROM pull_requests FINAL WHERE ' + where
     )
-    params['limit'] = limit
+    count_params = dict(params)
+
+    if cursor is not None:
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            raise fastapi.HTTPException(
+                status_code=400, detail='Invalid cursor'
+            )
+        params['cursor_ts'], params['cursor_id'] = decoded
+        where += (
+            ' AND (created_at, pr_id) <'
+            ' ({cursor_ts:DateTime64(3)}, {cursor_id:String})'
+        )
+    params['row_limit'] = limit + 1
     params['offset'] = offset
     data_sql = (
         'SELECT * FROM pull_requests FINAL WHERE '  # noqa: S608
         + where
         + ' ORDER BY created_at DESC, pr_id DESC'
-        + ' LIMIT {limit:UInt32} OFFSET {offset:UInt32}'
+        + ' LIMIT {row_limit:UInt32} OFFSET {offset:UInt32}'
     )
 
-    count_rows = await clickhouse.query(count_sql, params)
+    count_rows = await clickhouse.query(count_sql, count_params)
     total = int(count_rows[0]['total']) if count_rows else 0
     project_count = int(count_rows[0]['project_count']) if count_rows else 0
 
     data_rows = await clickhouse.query(data_sql, params)
+    next_cursor: str | None = None
+    if len(data_rows) > limit:
+        data_rows = data_rows[:limit]
+        last = _row_to_response(data_rows[-1])
+        next_cursor = encode_cursor(last['created_at'], str(last['pr_id']))
     return PullRequestListResponse(
         data=[
             PullRequestResponse.model_validate(_row_to_response(r))
@@ -184,6 +219,7 @@ async def _list_prs(
         ],
         project_count=project_count,
         total=total,
+        next_cursor=next_cursor,
     )
 
 
@@ -205,12 +241,14 @@ async def list_project_pull_requests(
     author: str | None = None,
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> PullRequestListResponse:
     """List pull requests for a single project.
 
     Optional ``state`` filter accepts ``open`` or ``closed``.
     Optional ``author`` filter accepts a GitHub login.
-    Results are ordered newest first.
+    Results are ordered newest first; pass ``next_cursor`` back as
+    ``cursor`` for the next page.
     """
     org_project_ids = await _fetch_org_project_ids(db, org_slug)
     if project_id not in org_project_ids:
@@ -227,6 +265,7 @@ async def list_project_pull_requests(
         author=author,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
 
@@ -236,7 +275,6 @@ async def list_project_pull_requests(
 )
 async def list_org_pull_requests(
     org_slug: str,
-    db: graph.Pool,
     auth: typing.Annotated[
         permissions.AuthContext,
         fastapi.Depends(
@@ -247,21 +285,23 @@ async def list_org_pull_requests(
     author: str | None = None,
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> PullRequestListResponse:
     """List pull requests across all projects in the organization.
 
-    The set of projects is resolved from the graph so results are
-    scoped to the calling user's org.  Optional ``state`` filter
-    accepts ``open`` or ``closed``.  Optional ``author`` filter
-    accepts a GitHub login.  Results are ordered newest first.
+    Results are scoped to the org's projects inside ClickHouse.
+    Optional ``state`` filter accepts ``open`` or ``closed``.
+    Optional ``author`` filter accepts a GitHub login.  Results are
+    ordered newest first; pass ``next_cursor`` back as ``cursor`` for
+    the next page.
     """
-    project_ids = await _fetch_org_project_ids(db, org_slug)
     return await _list_prs(
-        project_ids=project_ids,
+        org_slug=org_slug,
         state=state,
         author=author,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
 
@@ -356,7 +396,7 @@ async def _fetch_login_users(
 
 
 async def _fetch_pr_activity(
-    project_ids: list[str],
+    org_slug: str,
     since: datetime.datetime,
 ) -> list[dict[str, typing.Any]]:
     """Aggregate created/merged PR counts per author since *since*.
@@ -366,25 +406,21 @@ async def _fetch_pr_activity(
     different anchors, so a PR opened earlier but merged in-window still
     contributes to ``merged``.
     """
-    if not project_ids:
-        return []
     # Alias the aggregates to non-column names: aliasing ``AS merged``
     # would shadow the ``merged`` column, and ClickHouse then resolves
     # ``merged`` in WHERE to the aggregate (ILLEGAL_AGGREGATION).
     sql = (
-        'SELECT author,'
+        'SELECT author,'  # noqa: S608
         ' countIf(created_at >= {since:DateTime64(3)}) AS created_count,'
         ' countIf(merged AND merged_at >= {since:DateTime64(3)})'
         ' AS merged_count'
-        ' FROM pull_requests FINAL'
-        ' WHERE project_id IN {project_ids:Array(String)}'
-        ' AND (created_at >= {since:DateTime64(3)}'
+        ' FROM pull_requests FINAL WHERE '
+        + project_membership.org_filter()
+        + ' AND (created_at >= {since:DateTime64(3)}'
         ' OR (merged AND merged_at >= {since:DateTime64(3)}))'
         ' GROUP BY author'
     )
-    return await clickhouse.query(
-        sql, {'project_ids': project_ids, 'since': since}
-    )
+    return await clickhouse.query(sql, {'org_slug': org_slug, 'since': since})
 
 
 @pull_requests_router.get('/activity', response_model=PRActivityResponse)
@@ -408,8 +444,7 @@ async def pull_request_activity(
     then created, descending.
     """
     since_dt = _parse_since(since)
-    project_ids = await _fetch_org_project_ids(db, org_slug)
-    counts = await _fetch_pr_activity(project_ids, since_dt)
+    counts = await _fetch_pr_activity(org_slug, since_dt)
     login_users = await _fetch_login_users(db)
     rows: list[PRActivityRow] = []
     for row in counts:
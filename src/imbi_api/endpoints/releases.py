@@ -6,7 +6,8 @@ business identity such as ``1.0.0``) and a required 7-char
 ``committish`` (lowercase short SHA).  It is connected to its
 ``Project`` via an incoming ``HAS_RELEASE`` edge and to every
 ``Environment`` it has been deployed to via a ``DEPLOYED_TO`` edge
-carrying an append-only ``deployments`` history.
+carrying a ``latest_event`` summary; the append-only event history
+lives in :mod:`imbi_api.deployment_events`.
 
 """
 
@@ -22,14 +23,14 @@ import pydantic
 from imbi_common import graph, models
 from imbi_common.plugins.base import CheckStatus
 
+from imbi_api import deployment_events, sbom, search_scope
 from imbi_api import patch as json_patch
-from imbi_api import sbom
 from imbi_api.auth import permissions
 from imbi_api.domain.models import User
 from imbi_api.endpoints._helpers import fetch_or_404
 from imbi_api.endpoints.operations_log import complete_opslog_entry
 from imbi_api.endpoints.projects import lookup_ops_log_performed_by
-from imbi_api.plugins import call_with_timeout
+from imbi_api.plugins import call_with_timeout, status_cache
 from imbi_api.scoring import OptionalValkeyClient
 from imbi_api.scoring import queue as score_queue
 
@@ -209,10 +210,16 @@ def _serialize_links(
 def _parse_deployments(
     raw: typing.Any,
 ) -> list[models.DeploymentEvent]:
-    """Parse the JSON-encoded ``deployments`` edge property."""
+    """Parse a JSON-encoded ``DEPLOYED_TO`` event property.
+
+    Accepts both the legacy ``deployments`` list and the single-event
+    ``latest_event`` summary, which parses as a one-element list.
+    """
     if not raw:
         return []
     data = json.loads(raw) if isinstance(raw, str) else raw
+    if isinstance(data, dict):
+        data = [data]
     if not isinstance(data, list):
         return []
     items: list[typing.Any] = data  # type: ignore[assignment]
@@ -305,6 +312,8 @@ _RUN_STATUS_TO_EVENT_STATUS: dict[str, _DEPLOYMENT_STATUS] = {
 
 
 async def _gather_release_hydration(
+    integration_id: str,
+    project_id: str,
     handler: typing.Any,
     ctx: typing.Any,
     credentials: typing.Any,
@@ -313,29 +322,45 @@ async def _gather_release_hydration(
 ) -> tuple[list[typing.Any], list[typing.Any]]:
     """Run the per-env deploy-status + per-committish CI calls.
 
-    Wraps every call in ``_RELEASE_HYDRATION_SEMAPHORE`` so a flurry
-    of concurrent page loads cannot saturate the upstream rate limit,
-    and dedupes identical committishes across environments (a promoted
-    release that landed in N envs would otherwise pay ``get_check_status``
-    N times). The returned ``ci_results`` list keeps the original
+    Both calls go through :mod:`imbi_api.plugins.status_cache`, so
+    viewers of the same project share cached answers and a single
+    upstream call per ``(integration, project, committish)`` or
+    ``(integration, project, run_id)``.  Cache misses are wrapped in
+    ``_RELEASE_HYDRATION_SEMAPHORE`` so a flurry of concurrent page
+    loads cannot saturate the upstream rate limit, and identical
+    committishes are deduped across environments (a promoted release
+    that landed in N envs would otherwise pay ``get_check_status`` N
+    times). The returned ``ci_results`` list keeps the original
     one-per-env shape so callers iterate in lockstep with ``deployed``.
     """
 
     async def _bounded_run(event: models.DeploymentEvent) -> typing.Any:
-        async with _RELEASE_HYDRATION_SEMAPHORE:
-            return await call_with_timeout(
-                handler.get_deployment_status(
-                    ctx, credentials, run_id=str(event.external_run_id)
+        run_id = str(event.external_run_id)
+
+        async def _fetch() -> typing.Any:
+            async with _RELEASE_HYDRATION_SEMAPHORE:
+                return await call_with_timeout(
+                    handler.get_deployment_status(
+                        ctx, credentials, run_id=run_id
+                    )
                 )
-            )
+
+        return await status_cache.deployment_status(
+            integration_id, project_id, run_id, _fetch
+        )
 
     async def _bounded_check(committish: str) -> typing.Any:
-        async with _RELEASE_HYDRATION_SEMAPHORE:
-            return await call_with_timeout(
-                handler.get_check_status(
-                    ctx, credentials, committish=committish
+        async def _fetch() -> typing.Any:
+            async with _RELEASE_HYDRATION_SEMAPHORE:
+                return await call_with_timeout(
+                    handler.get_check_status(
+                        ctx, credentials, committish=committish
+                    )
                 )
-            )
+
+        return await status_cache.check_status(
+            integration_id, project_id, committish, _fetch
+        )
 
     run_results = await asyncio.gather(
         *(_bounded_run(event) for _, _, _, event in in_flight),
@@ -426,7 +451,13 @@ async def _hydrate_release_train(
     handler = _handler(resolved)
 
     run_results, ci_results = await _gather_release_hydration(
-        handler, ctx, credentials, in_flight, deployed
+        resolved.integration_id,
+        project_id,
+        handler,
+        ctx,
+        credentials,
+        in_flight,
+        deployed,
     )
 
     for (slug, release_id, _committish, event), result in zip(
@@ -594,6 +625,7 @@ async def create_release(
             detail=f'Project {project_id!r} not found',
         )
     release_data = graph.parse_agtype(rows[0]['release'])
+    await search_scope.add_nodes(org_slug, release_data.get('id'))
     return _release_to_response(release_data, project_id)
 
 
@@ -672,6 +704,32 @@ async def _users_by_email(
     return out
 
 
+#: One row per environment the project deploys in, joined to the release
+#: its ``DEPLOYED_IN`` edge's ``current_release`` pointer names (see
+#: :func:`_set_current_release`).  Environments whose pointer is unset --
+#: nothing has succeeded there since the pointer was introduced -- fall
+#: back to every ``DEPLOYED_TO`` edge into the environment, so callers
+#: still reduce rows by the latest event timestamp; with the pointer set
+#: the read is one row per environment, plus the ``pending_release`` row
+#: while a deployment is in flight (see :func:`_set_pending_release`) so
+#: its newer event wins the reduction and hydration can poll its run.
+CURRENT_RELEASES_QUERY: typing.LiteralString = """
+MATCH (p:Project {{id: {project_id}}})
+      -[:OWNED_BY]->(:Team)
+      -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
+MATCH (p)-[di:DEPLOYED_IN]->(e:Environment)
+OPTIONAL MATCH (p)-[:HAS_RELEASE]->(r:Release)
+               -[d:DEPLOYED_TO]->(e)
+WHERE di.current_release IS NULL OR r.id = di.current_release
+      OR r.id = di.pending_release
+RETURN e{{.slug, .name, .sort_order}} AS env,
+       CASE WHEN r IS NULL THEN null ELSE r{{.*}} END AS release,
+       CASE WHEN d IS NULL THEN null
+            ELSE coalesce(d.latest_event, d.deployments) END
+           AS deployments
+"""
+
+
 @releases_router.get(
     '/current',
     response_model=list[CurrentReleaseEnvironment],
@@ -690,8 +748,10 @@ async def list_current_releases(
     """List the most-current release per environment for a project.
 
     For each environment the project is configured to deploy in
-    (``DEPLOYED_IN``), returns the release whose ``DEPLOYED_TO`` edge
-    contains the deployment event with the latest timestamp.
+    (``DEPLOYED_IN``), returns the release its ``current_release``
+    pointer names -- the one most recently deployed successfully --
+    or, where no pointer is set yet, the release whose ``DEPLOYED_TO``
+    edge holds the latest deployment event.
     Environments with no deployment events are returned with
     ``release=None``. Results are sorted by ``Environment.sort_order``
     ascending, then by name.
@@ -707,26 +767,16 @@ async def list_current_releases(
             detail=f'Project {project_id!r} not found',
         )
 
-    query: typing.LiteralString = """
-    MATCH (p:Project {{id: {project_id}}})
-          -[:OWNED_BY]->(:Team)
-          -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
-    MATCH (p)-[:DEPLOYED_IN]->(e:Environment)
-    OPTIONAL MATCH (p)-[:HAS_RELEASE]->(r:Release)
-                   -[d:DEPLOYED_TO]->(e)
-    RETURN e{{.slug, .name, .sort_order}} AS env,
-           CASE WHEN r IS NULL THEN null ELSE r{{.*}} END AS release,
-           CASE WHEN d IS NULL THEN null ELSE d.deployments END
-               AS deployments
-    """
     rows = await db.execute(
-        query,
+        CURRENT_RELEASES_QUERY,
         {'project_id': project_id, 'org_slug': org_slug},
         ['env', 'release', 'deployments'],
     )
 
     # Group by env.slug; keep the (release, event) pair with the latest
-    # event timestamp. Envs with no deployments are seeded with None.
+    # event timestamp (only envs without a current_release pointer, or
+    # with a deployment in flight, return more than one row). Envs with
+    # no deployments are seeded with None.
     by_env: dict[
         str,
         tuple[
@@ -991,13 +1041,37 @@ async def patch_release(
 # -- Deployment edge ----------------------------------------------------
 
 
+class _DeploymentEdge(typing.NamedTuple):
+    """The target environment and what the ``DEPLOYED_TO`` edge holds.
+
+    ``latest`` is the edge's newest event.  ``legacy`` is the history
+    of an edge written before :mod:`imbi_api.deployment_events`
+    existed and not yet migrated; it is empty for every other edge.
+    """
+
+    env: dict[str, typing.Any] | None
+    exists: bool
+    latest: models.DeploymentEvent | None
+    legacy: list[models.DeploymentEvent]
+
+
+def _newest(
+    current: models.DeploymentEvent | None,
+    event: models.DeploymentEvent,
+) -> models.DeploymentEvent:
+    """Pick the edge summary after ``event`` lands."""
+    if current is None or event.timestamp >= current.timestamp:
+        return event
+    return current
+
+
 async def _fetch_deployment_edge(
     db: graph.Graph,
     org_slug: str,
     project_id: str,
     release_id: str,
     env_slug: str,
-) -> tuple[dict[str, typing.Any] | None, list[models.DeploymentEvent]]:
+) -> _DeploymentEdge:
     """Fetch environment and any existing DEPLOYED_TO edge."""
     query: typing.LiteralString = """
     MATCH (p:Project {{id: {project_id}}})
@@ -1006,6 +1080,8 @@ async def _fetch_deployment_edge(
           -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
     OPTIONAL MATCH (r)-[d:DEPLOYED_TO]->(e)
     RETURN e{{.slug, .name}} AS env,
+           CASE WHEN d IS NULL THEN null ELSE d.latest_event END
+               AS latest_event,
            CASE WHEN d IS NULL THEN null ELSE d.deployments END
                AS deployments
     """
@@ -1017,15 +1093,21 @@ async def _fetch_deployment_edge(
             'env_slug': env_slug,
             'org_slug': org_slug,
         },
-        ['env', 'deployments'],
+        ['env', 'latest_event', 'deployments'],
     )
     if not rows:
-        return None, []
+        return _DeploymentEdge(None, False, None, [])
     env = graph.parse_agtype(rows[0]['env'])
-    deployments = _parse_deployments(
-        graph.parse_agtype(rows[0]['deployments'])
+    summary = _parse_deployments(
+        graph.parse_agtype(rows[0].get('latest_event'))
     )
-    return env, deployments
+    legacy = _parse_deployments(graph.parse_agtype(rows[0]['deployments']))
+    if summary:
+        return _DeploymentEdge(env, True, summary[0], [])
+    if legacy:
+        latest = max(legacy, key=lambda ev: ev.timestamp)
+        return _DeploymentEdge(env, True, latest, legacy)
+    return _DeploymentEdge(env, False, None, [])
 
 
 def _edge_to_response(
@@ -1040,6 +1122,138 @@ def _edge_to_response(
     )
 
 
+async def _write_edge_summary(
+    db: graph.Graph,
+    *,
+    project_id: str,
+    release_id: str,
+    env_slug: str,
+    org_slug: str,
+    exists: bool,
+    latest: models.DeploymentEvent,
+) -> None:
+    """Create the ``DEPLOYED_TO`` edge or refresh its ``latest_event``.
+
+    Refreshing also drops the legacy ``deployments`` property, whose
+    contents the caller has already moved to the event store.
+    """
+    params = {
+        'project_id': project_id,
+        'release_id': release_id,
+        'env_slug': env_slug,
+        'latest_event': latest.model_dump_json(),
+    }
+    if exists:
+        set_query: typing.LiteralString = """
+        MATCH (:Project {{id: {project_id}}})
+              -[:HAS_RELEASE]->(r:Release {{id: {release_id}}})
+        MATCH (r)-[d:DEPLOYED_TO]->(:Environment {{slug: {env_slug}}})
+        SET d.latest_event = {latest_event}
+        REMOVE d.deployments
+        RETURN d.latest_event AS latest_event
+        """
+        rows = await db.execute(set_query, params, ['latest_event'])
+        if not rows:
+            # The release or DEPLOYED_TO edge vanished between the read
+            # phase and this write -- raise rather than silently report
+            # success and skew resync counters.
+            raise fastapi.HTTPException(
+                status_code=409,
+                detail=(
+                    f'Release {release_id!r} or its deployment to '
+                    f'environment {env_slug!r} no longer exists'
+                ),
+            )
+        return
+    create_query: typing.LiteralString = """
+    MATCH (:Project {{id: {project_id}}})
+          -[:HAS_RELEASE]->(r:Release {{id: {release_id}}})
+    MATCH (e:Environment {{slug: {env_slug}}})
+          -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
+    CREATE (r)-[d:DEPLOYED_TO {{latest_event: {latest_event}}}]->(e)
+    RETURN d.latest_event AS latest_event
+    """
+    rows = await db.execute(
+        create_query, {**params, 'org_slug': org_slug}, ['latest_event']
+    )
+    if not rows:
+        # Either the release or the (env, org) pair disappeared
+        # between the read and this write; surface the failure rather
+        # than silently report 'appended' with no persisted edge.
+        raise fastapi.HTTPException(
+            status_code=409,
+            detail=(
+                f'Release {release_id!r} or environment {env_slug!r} in '
+                f'organization {org_slug!r} no longer exists'
+            ),
+        )
+
+
+async def _migrate_legacy_history(
+    db: graph.Graph,
+    *,
+    org_slug: str,
+    project_id: str,
+    release_id: str,
+    env_slug: str,
+    edge: _DeploymentEdge,
+) -> _DeploymentEdge:
+    """Move an edge's inline ``deployments`` history to the event store.
+
+    The events are stored before the edge property is dropped, so a
+    failed edge write leaves the legacy history in place to retry.
+    The store's rows for the edge are replaced rather than appended
+    to, so the retry does not copy the events a second time.
+    """
+    if not edge.legacy or edge.latest is None:
+        return edge
+    await deployment_events.replace(db, release_id, env_slug, edge.legacy)
+    await _write_edge_summary(
+        db,
+        project_id=project_id,
+        release_id=release_id,
+        env_slug=env_slug,
+        org_slug=org_slug,
+        exists=True,
+        latest=edge.latest,
+    )
+    return edge._replace(legacy=[])
+
+
+async def _append_event(
+    db: graph.Graph,
+    *,
+    org_slug: str,
+    project_id: str,
+    release_id: str,
+    env_slug: str,
+    edge: _DeploymentEdge,
+    event: models.DeploymentEvent,
+) -> None:
+    """Store ``event`` and point the edge summary at it when newest."""
+    if edge.exists and not edge.legacy:
+        await deployment_events.append(db, release_id, env_slug, [event])
+    else:
+        # A new edge must not inherit rows from a since-deleted one,
+        # and a legacy history may already be partly copied by an
+        # earlier attempt whose edge write failed.
+        await deployment_events.replace(
+            db, release_id, env_slug, [*edge.legacy, event]
+        )
+    latest = _newest(edge.latest, event)
+    if edge.exists and not edge.legacy and latest is edge.latest:
+        return
+    await _write_edge_summary(
+        db,
+        project_id=project_id,
+        release_id=release_id,
+        env_slug=env_slug,
+        org_slug=org_slug,
+        exists=edge.exists,
+        latest=latest,
+    )
+
+
 #: Outcome reported by :func:`append_deployment_event`.  Lets callers
 #: distinguish a brand-new row (``appended``) from a dedupe path that
 #: refreshed an existing row in place (``updated``) versus a no-op
@@ -1070,18 +1284,21 @@ async def append_deployment_event(
     ``Release`` or ``Environment`` cannot be found — callers that
     auto-record from a deploy of a SHA (which has no ``Release`` node)
     treat ``None`` as "skip persistence, deploy still succeeded".
+    ``edge.deployments`` holds only the event written or matched; the
+    full history is not loaded on the write path.
 
     ``outcome`` is one of ``'appended'`` (new row), ``'updated'``
     (dedupe path refreshed an existing row in place), or ``'noop'``
     (dedupe path matched an identical existing row and made no write).
 
     Deduplicates on ``external_run_id``: when the caller supplies one
-    and the most recent existing event already carries the same id,
-    the row is treated as a status update -- if ``status`` changed
-    the existing event is updated in-place, otherwise the call is a
+    and an existing event already carries the same id, the most
+    recently recorded such event is treated as a status update -- if
+    anything changed it is updated in-place, otherwise the call is a
     no-op.  This lets resync re-replay the remote's recent history
-    without doubling up rows on the edge, while still letting an
-    in-flight workflow advance from ``in_progress`` -> ``success``.
+    without doubling up rows, while still letting an in-flight
+    workflow advance from ``in_progress`` -> ``success``.  The lookup
+    is an indexed query against :mod:`imbi_api.deployment_events`.
     Callers that omit ``external_run_id`` keep the previous append-
     only semantics so the deploy / promote flows are unchanged.
 
@@ -1097,87 +1314,78 @@ async def append_deployment_event(
     release = await _fetch_release(db, org_slug, project_id, release_id)
     if release is None:
         return None
-    env, existing = await _fetch_deployment_edge(
+    edge = await _fetch_deployment_edge(
         db, org_slug, project_id, release_id, env_slug
     )
-    if env is None:
+    if edge.env is None:
         return None
-    if external_run_id and existing:
-        # Walk newest-first so the "most recent event for this run"
-        # wins when older entries with the same id exist (rare; only
-        # possible if a caller appended duplicates before the dedupe
-        # landed).  Comparing by status keeps the no-op fast path
-        # cheap when resync re-runs against an idle remote.
-        for idx in range(len(existing) - 1, -1, -1):
-            candidate = existing[idx]
-            if candidate.external_run_id == external_run_id:
-                if (
-                    candidate.status == status
-                    and candidate.note == note
-                    and candidate.external_run_url == external_run_url
-                    and candidate.performed_by == performed_by
-                ):
-                    return _edge_to_response(env, existing), 'noop'
-                refreshed = candidate.model_copy(
-                    update={
-                        'status': status,
-                        'note': note,
-                        'external_run_url': external_run_url,
-                        'timestamp': timestamp
-                        or datetime.datetime.now(datetime.UTC),
-                        'performed_by': performed_by,
-                    }
-                )
-                updated_list = [
-                    *existing[:idx],
-                    refreshed,
-                    *existing[idx + 1 :],
-                ]
-                updated_edge = await _set_deployments(
+    env = edge.env
+    event: models.DeploymentEvent | None = None
+    if external_run_id and edge.exists:
+        edge = await _migrate_legacy_history(
+            db,
+            org_slug=org_slug,
+            project_id=project_id,
+            release_id=release_id,
+            env_slug=env_slug,
+            edge=edge,
+        )
+        match = await deployment_events.find_run(
+            db, release_id, env_slug, external_run_id
+        )
+        if match is not None:
+            candidate = match.event
+            if (
+                candidate.status == status
+                and candidate.note == note
+                and candidate.external_run_url == external_run_url
+                and candidate.performed_by == performed_by
+            ):
+                return _edge_to_response(env, [candidate]), 'noop'
+            event = candidate.model_copy(
+                update={
+                    'status': status,
+                    'note': note,
+                    'external_run_url': external_run_url,
+                    'timestamp': timestamp
+                    or datetime.datetime.now(datetime.UTC),
+                    'performed_by': performed_by,
+                }
+            )
+            await deployment_events.update(db, match.id, event)
+            if (
+                edge.latest is None
+                or edge.latest.external_run_id == external_run_id
+                or _newest(edge.latest, event) is event
+            ):
+                await _write_edge_summary(
                     db,
                     project_id=project_id,
                     release_id=release_id,
                     env_slug=env_slug,
-                    deployments=updated_list,
-                    env=env,
+                    org_slug=org_slug,
+                    exists=True,
+                    latest=event,
                 )
-                if status == 'success':
-                    await _set_current_release(
-                        db,
-                        org_slug=org_slug,
-                        project_id=project_id,
-                        env_slug=env_slug,
-                        release_id=release_id,
-                        timestamp=refreshed.timestamp,
-                    )
-                return updated_edge, 'updated'
-    event = models.DeploymentEvent(
-        timestamp=timestamp or datetime.datetime.now(datetime.UTC),
-        status=status,
-        note=note,
-        external_run_id=external_run_id,
-        external_run_url=external_run_url,
-        performed_by=performed_by,
-    )
-    deployments = [*existing, event]
-    if existing:
-        edge = await _set_deployments(
-            db,
-            project_id=project_id,
-            release_id=release_id,
-            env_slug=env_slug,
-            deployments=deployments,
-            env=env,
+    outcome: AppendOutcome = 'updated'
+    if event is None:
+        outcome = 'appended'
+        event = models.DeploymentEvent(
+            timestamp=timestamp or datetime.datetime.now(datetime.UTC),
+            status=status,
+            note=note,
+            external_run_id=external_run_id,
+            external_run_url=external_run_url,
+            performed_by=performed_by,
         )
-    else:
-        edge = await _create_deployments_edge(
+        await _append_event(
             db,
+            org_slug=org_slug,
             project_id=project_id,
             release_id=release_id,
             env_slug=env_slug,
-            org_slug=org_slug,
-            deployments=deployments,
-            env=env,
+            edge=edge,
+            event=event,
         )
     if status == 'success':
         await _set_current_release(
@@ -1188,94 +1396,19 @@ async def append_deployment_event(
             release_id=release_id,
             timestamp=event.timestamp,
         )
-    return edge, 'appended'
-
-
-async def _set_deployments(
-    db: graph.Graph,
-    *,
-    project_id: str,
-    release_id: str,
-    env_slug: str,
-    deployments: list[models.DeploymentEvent],
-    env: dict[str, typing.Any],
-) -> ReleaseEnvironmentEdgeResponse:
-    """Overwrite ``deployments`` on an existing ``DEPLOYED_TO`` edge."""
-    serialized = json.dumps([e.model_dump(mode='json') for e in deployments])
-    set_query: typing.LiteralString = """
-    MATCH (:Project {{id: {project_id}}})
-          -[:HAS_RELEASE]->(r:Release {{id: {release_id}}})
-    MATCH (r)-[d:DEPLOYED_TO]->(:Environment {{slug: {env_slug}}})
-    SET d.deployments = {deployments}
-    RETURN d.deployments AS deployments
-    """
-    rows = await db.execute(
-        set_query,
-        {
-            'project_id': project_id,
-            'release_id': release_id,
-            'env_slug': env_slug,
-            'deployments': serialized,
-        },
-        ['deployments'],
-    )
-    if not rows:
-        # The release or DEPLOYED_TO edge vanished between the read
-        # phase and this write -- raise rather than silently report
-        # success and skew resync counters.
-        raise fastapi.HTTPException(
-            status_code=409,
-            detail=(
-                f'Release {release_id!r} or its deployment to '
-                f'environment {env_slug!r} no longer exists'
-            ),
-        )
-    return _edge_to_response(env, deployments)
-
-
-async def _create_deployments_edge(
-    db: graph.Graph,
-    *,
-    project_id: str,
-    release_id: str,
-    env_slug: str,
-    org_slug: str,
-    deployments: list[models.DeploymentEvent],
-    env: dict[str, typing.Any],
-) -> ReleaseEnvironmentEdgeResponse:
-    """Create the first ``DEPLOYED_TO`` edge for ``(release, env)``."""
-    serialized = json.dumps([e.model_dump(mode='json') for e in deployments])
-    create_query: typing.LiteralString = """
-    MATCH (:Project {{id: {project_id}}})
-          -[:HAS_RELEASE]->(r:Release {{id: {release_id}}})
-    MATCH (e:Environment {{slug: {env_slug}}})
-          -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
-    CREATE (r)-[d:DEPLOYED_TO {{deployments: {deployments}}}]->(e)
-    RETURN d.deployments AS deployments
-    """
-    rows = await db.execute(
-        create_query,
-        {
-            'project_id': project_id,
-            'release_id': release_id,
-            'env_slug': env_slug,
-            'org_slug': org_slug,
-            'deployments': serialized,
-        },
-        ['deployments'],
-    )
-    if not rows:
-        # Either the release or the (env, org) pair disappeared
-        # between the read and this write; surface the failure rather
-        # than silently report 'appended' with no persisted edge.
-        raise fastapi.HTTPException(
-            status_code=409,
-            detail=(
-                f'Release {release_id!r} or environment {env_slug!r} in '
-                f'organization {org_slug!r} no longer exists'
-            ),
+    elif edge.latest is None or _newest(edge.latest, event) is event:
+        # A backfilled event older than the edge's latest says nothing
+        # about what is in flight now.
+        await _set_pending_release(
+            db,
+            org_slug=org_slug,
+            project_id=project_id,
+            env_slug=env_slug,
+            release_id=release_id,
+            status=status,
+            timestamp=event.timestamp,
         )
-    return _edge_to_response(env, deployments)
+    return _edge_to_response(env, [event]), outcome
 
 
 async def _set_current_release(
@@ -1305,7 +1438,9 @@ async def _set_current_release(
     deep resync backfill returning deployments newest-first, or a
     delayed webhook) cannot regress it to an older release. Timestamps
     are normalized to UTC ISO-8601 so the stored string comparison is
-    chronologically correct.
+    chronologically correct.  The success also ends the release's
+    deployment in flight, so a matching ``pending_release`` (see
+    :func:`_set_pending_release`) is cleared in the same write.
     """
     ts = timestamp.astimezone(datetime.UTC).isoformat()
     query: typing.LiteralString = """
@@ -1318,7 +1453,11 @@ async def _set_current_release(
           THEN {release_id} ELSE d.current_release END,
         d.current_release_at = CASE
           WHEN d.current_release_at IS NULL OR d.current_release_at < {ts}
-          THEN {ts} ELSE d.current_release_at END
+          THEN {ts} ELSE d.current_release_at END,
+        d.pending_release = CASE
+          WHEN d.pending_release = {release_id}
+               AND d.pending_release_at <= {ts}
+          THEN null ELSE d.pending_release END
     RETURN d.current_release AS current_release
     """
     rows = await db.execute(
@@ -1342,6 +1481,89 @@ async def _set_current_release(
         )
 
 
+#: Deployment statuses that leave a run in flight; an event with one of
+#: these marks its release as the environment's ``pending_release``.
+_IN_FLIGHT_STATUSES = frozenset({'pending', 'in_progress'})
+
+
+async def _set_pending_release(
+    db: graph.Graph,
+    *,
+    org_slug: str,
+    project_id: str,
+    env_slug: str,
+    release_id: str,
+    status: str,
+    timestamp: datetime.datetime,
+) -> None:
+    """Track the release with a deployment in flight to an environment.
+
+    ``current_release`` only moves on ``success``, so the current
+    releases read would never see a deploy that is still running and
+    the release-train hydration would never poll its run to completion.
+    A ``pending`` or ``in_progress`` event records ``release_id`` as
+    ``pending_release`` on the ``DEPLOYED_IN`` edge (newest wins, as
+    with :func:`_set_current_release`) so that read returns the
+    in-flight row alongside the current one.  A ``failed`` or
+    ``rolled_back`` event for the same release clears it again, as
+    :func:`_set_current_release` does on ``success``.
+    """
+    ts = timestamp.astimezone(datetime.UTC).isoformat()
+    params = {
+        'project_id': project_id,
+        'env_slug': env_slug,
+        'org_slug': org_slug,
+        'release_id': release_id,
+        'ts': ts,
+    }
+    if status in _IN_FLIGHT_STATUSES:
+        query: typing.LiteralString = """
+        MATCH (p:Project {{id: {project_id}}})
+        MATCH (e:Environment {{slug: {env_slug}}})
+              -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
+        MERGE (p)-[d:DEPLOYED_IN]->(e)
+        SET d.pending_release = CASE
+              WHEN d.pending_release_at IS NULL
+                   OR d.pending_release_at <= {ts}
+              THEN {release_id} ELSE d.pending_release END,
+            d.pending_release_at = CASE
+              WHEN d.pending_release_at IS NULL
+                   OR d.pending_release_at <= {ts}
+              THEN {ts} ELSE d.pending_release_at END
+        RETURN d.pending_release AS pending_release
+        """
+    else:
+        query = """
+        MATCH (p:Project {{id: {project_id}}})-[d:DEPLOYED_IN]->
+              (e:Environment {{slug: {env_slug}}})
+              -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
+        WHERE d.pending_release = {release_id}
+              AND d.pending_release_at <= {ts}
+        SET d.pending_release = null
+        RETURN d.pending_release AS pending_release
+        """
+    await db.execute(query, params, ['pending_release'])
+
+
+async def _edge_history(
+    db: graph.Graph,
+    release_id: str,
+    edges: list[tuple[dict[str, typing.Any], list[models.DeploymentEvent]]],
+) -> list[ReleaseEnvironmentEdgeResponse]:
+    """Build edge responses, reading stored history in one query.
+
+    ``edges`` pairs each environment with its legacy inline history,
+    which is used as-is until the edge's next write migrates it.
+    """
+    stored = await deployment_events.history(
+        db, release_id, [env['slug'] for env, legacy in edges if not legacy]
+    )
+    return [
+        _edge_to_response(env, legacy or stored.get(env['slug'], []))
+        for env, legacy in edges
+    ]
+
+
 @releases_router.post(
     '/{release_id}/environments/{env_slug}',
     response_model=ReleaseEnvironmentEdgeResponse,
@@ -1371,10 +1593,10 @@ async def record_deployment(
             ),
         )
 
-    env, existing = await _fetch_deployment_edge(
+    edge = await _fetch_deployment_edge(
         db, org_slug, project_id, release_id, env_slug
     )
-    if env is None:
+    if edge.env is None:
         raise fastapi.HTTPException(
             status_code=422,
             detail=(
@@ -1388,50 +1610,16 @@ async def record_deployment(
         status=data.status,
         note=data.note,
     )
-    deployments = [*existing, event]
-    serialized = json.dumps(
-        [e.model_dump(mode='json') for e in deployments],
+    await _append_event(
+        db,
+        org_slug=org_slug,
+        project_id=project_id,
+        release_id=release_id,
+        env_slug=env_slug,
+        edge=edge,
+        event=event,
     )
 
-    if existing:
-        set_query: typing.LiteralString = """
-        MATCH (:Project {{id: {project_id}}})
-              -[:HAS_RELEASE]->(r:Release {{id: {release_id}}})
-        MATCH (r)-[d:DEPLOYED_TO]->(:Environment {{slug: {env_slug}}})
-        SET d.deployments = {deployments}
-        RETURN d.deployments AS deployments
-        """
-        await db.execute(
-            set_query,
-            {
-                'project_id': project_id,
-                'release_id': release_id,
-                'env_slug': env_slug,
-                'deployments': serialized,
-            },
-            ['deployments'],
-        )
-    else:
-        create_query: typing.LiteralString = """
-        MATCH (:Project {{id: {project_id}}})
-              -[:HAS_RELEASE]->(r:Release {{id: {release_id}}})
-        MATCH (e:Environment {{slug: {env_slug}}})
-              -[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})
-        CREATE (r)-[d:DEPLOYED_TO {{deployments: {deployments}}}]->(e)
-        RETURN d.deployments AS deployments
-        """
-        await db.execute(
-            create_query,
-            {
-                'project_id': project_id,
-                'release_id': release_id,
-                'env_slug': env_slug,
-                'org_slug': org_slug,
-                'deployments': serialized,
-            },
-            ['deployments'],
-        )
-
     if data.status == 'success':
         # A successful deployment makes this release the current one for
         # the environment; record it on the DEPLOYED_IN edge.
@@ -1443,6 +1631,16 @@ async def record_deployment(
             release_id=release_id,
             timestamp=event.timestamp,
         )
+    else:
+        await _set_pending_release(
+            db,
+            org_slug=org_slug,
+            project_id=project_id,
+            env_slug=env_slug,
+            release_id=release_id,
+            status=data.status,
+            timestamp=event.timestamp,
+        )
 
     if data.external_run_id and data.status in {
         'success',
@@ -1460,7 +1658,8 @@ async def record_deployment(
         valkey_client, project_id, 'deployment_status_change'
     )
 
-    return _edge_to_response(env, deployments)
+    (response,) = await _edge_history(db, release_id, [(edge.env, [])])
+    return response
 
 
 @releases_router.get(
@@ -1507,16 +1706,16 @@ async def list_deployment_edges(
         },
         ['env', 'deployments'],
     )
-    results: list[ReleaseEnvironmentEdgeResponse] = []
+    edges: list[
+        tuple[dict[str, typing.Any], list[models.DeploymentEvent]]
+    ] = []
     for row in rows:
         env = graph.parse_agtype(row['env'])
         if not env:
             continue
-        deployments = _parse_deployments(
-            graph.parse_agtype(row['deployments'])
-        )
-        results.append(_edge_to_response(env, deployments))
-    return results
+        legacy = _parse_deployments(graph.parse_agtype(row['deployments']))
+        edges.append((env, legacy))
+    return await _edge_history(db, release_id, edges)
 
 
 @releases_router.get(
@@ -1545,10 +1744,10 @@ async def get_deployment_edge(
                 f'Release {release_id!r} for project {project_id!r} not found'
             ),
         )
-    env, deployments = await _fetch_deployment_edge(
+    edge = await _fetch_deployment_edge(
         db, org_slug, project_id, release_id, env_slug
     )
-    if env is None or not deployments:
+    if edge.env is None or not edge.exists:
         raise fastapi.HTTPException(
             status_code=404,
             detail=(
@@ -1556,7 +1755,10 @@ async def get_deployment_edge(
                 f' environment {env_slug!r} not found'
             ),
         )
-    return _edge_to_response(env, deployments)
+    (response,) = await _edge_history(
+        db, release_id, [(edge.env, edge.legacy)]
+    )
+    return response
 
 
 # -- SBoM ingest / dependency listing ---------------------------------
@@ -1648,10 +1850,11 @@ async def put_release_sbom(
     """Ingest a CycloneDX 1.7 SBoM for a release.
 
     The payload is the verbatim CycloneDX document — no envelope.
-    The PUT is idempotent: existing dependency edges from this
-    release are dropped and rebuilt from the new SBoM, while
-    ``Component`` / ``ComponentRelease`` / ``ComponentIdentifier``
-    nodes are MERGE-ed so other projects keep their references.
+    The PUT is idempotent: the new SBoM is diffed against the
+    release's existing dependency edges and only added, changed, and
+    removed components are written, while ``Component`` /
+    ``ComponentRelease`` / ``ComponentIdentifier`` nodes are MERGE-ed
+    so other projects keep their references.
     """
     if await _fetch_release(db, org_slug, project_id, release_id) is None:
         raise fastapi.HTTPException(
@@ -1672,7 +1875,9 @@ async def put_release_sbom(
             status_code=400,
             detail=str(exc),
         ) from exc
-    await sbom.replace_release_components(db, release_id, components)
+    summary = await sbom.replace_release_components(db, release_id, components)
+    if summary.added:
+        await search_scope.add_release_components(db, org_slug, release_id)
     return fastapi.Response(status_code=204)
 
 
@@ -10,7 +10,7 @@ from imbi_common import graph
 
 from imbi_api import models
 from imbi_api import patch as json_patch
-from imbi_api.auth import permissions
+from imbi_api.auth import invalidation, permissions
 from imbi_api.endpoints._helpers import conflict_on_unique_violation
 from imbi_api.relationships import relationship_link
 
@@ -440,6 +440,7 @@ async def delete_role(
             status_code=404,
             detail=f'Role with slug {slug!r} not found',
         )
+    await invalidation.publish_all_changed()
 
 
 @roles_router.post(
@@ -504,6 +505,7 @@ async def grant_permission(
         query,
         {'slug': slug, 'permission_name': permission_name},
     )
+    await invalidation.publish_all_changed()
 
     LOGGER.info(
         'Granted permission %s to role %s',
@@ -572,6 +574,7 @@ async def revoke_permission(
             detail=f'Permission {permission_name!r} not granted'
             f' to role {slug!r}',
         )
+    await invalidation.publish_all_changed()
 
     LOGGER.info(
         'Revoked permission %s from role %s',
@@ -7,6 +7,7 @@ import fastapi
 import pydantic
 from imbi_common import graph
 
+from imbi_api import search_scope
 from imbi_api.auth import permissions
 
 LOGGER = logging.getLogger(__name__)
@@ -37,112 +38,6 @@ class SearchResult(pydantic.BaseModel):
     project_id: str | None = None
 
 
-async def _get_org_node_ids(
-    db: graph.Graph,
-    org_slug: str,
-) -> set[str] | None:
-    """Return node IDs for all nodes in the org, or None if org not found.
-
-    Covers: the org itself, direct BELONGS_TO children (Team, Environment,
-    ProjectType, Integration, Tag, DocumentTemplate, LinkDefinition),
-    Projects, Documents, Releases, Comments, and the Components reachable
-    through the org's release dependency graph. Components are shared,
-    cross-org identities, so they are scoped to those an org actually
-    depends on rather than enumerated globally.
-
-    Archived projects are excluded, along with the Documents, Releases,
-    Comments, and Components reached through them, so search never
-    surfaces content from an archived project.
-    """
-    org_rows = await db.execute(
-        'MATCH (o:Organization {{slug: {org_slug}}}) RETURN o.id AS org_id',
-        {'org_slug': org_slug},
-        columns=['org_id'],
-    )
-    if not org_rows:
-        return None
-
-    node_ids: set[str] = set()
-    org_id = graph.parse_agtype(org_rows[0]['org_id'])
-    if org_id:
-        node_ids.add(org_id)
-
-    for row in await db.execute(
-        'MATCH (n)-[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})'
-        ' RETURN n.id AS nid',
-        {'org_slug': org_slug},
-        columns=['nid'],
-    ):
-        nid = graph.parse_agtype(row['nid'])
-        if nid:
-            node_ids.add(nid)
-
-    for row in await db.execute(
-        'MATCH (p:Project)-[:OWNED_BY]->(:Team)-[:BELONGS_TO]->'
-        '(:Organization {{slug: {org_slug}}})'
-        ' WHERE coalesce(p.archived, false) = false'
-        ' RETURN p.id AS nid',
-        {'org_slug': org_slug},
-        columns=['nid'],
-    ):
-        nid = graph.parse_agtype(row['nid'])
-        if nid:
-            node_ids.add(nid)
-
-    for row in await db.execute(
-        'MATCH (d:Document)-[:ATTACHED_TO]->(p:Project)-[:OWNED_BY]->'
-        '(:Team)-[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})'
-        ' WHERE coalesce(p.archived, false) = false'
-        ' RETURN d.id AS nid',
-        {'org_slug': org_slug},
-        columns=['nid'],
-    ):
-        nid = graph.parse_agtype(row['nid'])
-        if nid:
-            node_ids.add(nid)
-
-    for row in await db.execute(
-        'MATCH (:Organization {{slug: {org_slug}}})<-[:BELONGS_TO]-'
-        '(:Team)<-[:OWNED_BY]-(p:Project)-[:HAS_RELEASE]->(r:Release)'
-        ' WHERE coalesce(p.archived, false) = false'
-        ' RETURN r.id AS nid',
-        {'org_slug': org_slug},
-        columns=['nid'],
-    ):
-        nid = graph.parse_agtype(row['nid'])
-        if nid:
-            node_ids.add(nid)
-
-    for row in await db.execute(
-        'MATCH (c:Comment)-[:IN_THREAD]->(:CommentThread)-[:ON_DOCUMENT]->'
-        '(:Document)-[:ATTACHED_TO]->(p:Project)-[:OWNED_BY]->(:Team)'
-        '-[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})'
-        ' WHERE coalesce(p.archived, false) = false'
-        ' RETURN c.id AS nid',
-        {'org_slug': org_slug},
-        columns=['nid'],
-    ):
-        nid = graph.parse_agtype(row['nid'])
-        if nid:
-            node_ids.add(nid)
-
-    for row in await db.execute(
-        'MATCH (comp:Component)-[:HAS_RELEASE]->(:ComponentRelease)'
-        '<-[:USES_COMPONENT_RELEASE]-(:Release)<-[:HAS_RELEASE]-(p:Project)'
-        '-[:OWNED_BY]->(:Team)-[:BELONGS_TO]->'
-        '(:Organization {{slug: {org_slug}}})'
-        ' WHERE coalesce(p.archived, false) = false'
-        ' RETURN comp.id AS nid',
-        {'org_slug': org_slug},
-        columns=['nid'],
-    ):
-        nid = graph.parse_agtype(row['nid'])
-        if nid:
-            node_ids.add(nid)
-
-    return node_ids
-
-
 async def _enrich_results(
     db: graph.Graph,
     results: list[SearchResult],
@@ -237,8 +132,11 @@ async def search(
     Results are ordered by cosine distance ascending (most similar
     first). ``threshold`` is a distance ceiling: 0.0 = identical,
     2.0 = maximally dissimilar.
+
+    The org's node-id scope comes from :mod:`imbi_api.search_scope`,
+    which caches it and keeps it current as nodes are written.
     """
-    org_node_ids = await _get_org_node_ids(db, org_slug)
+    org_node_ids = await search_scope.get_org_node_ids(db, org_slug)
     if org_node_ids is None:
         raise fastapi.HTTPException(
             status_code=404,
@@ -10,7 +10,7 @@ from imbi_common import graph
 
 from imbi_api import models
 from imbi_api import patch as json_patch
-from imbi_api.auth import permissions
+from imbi_api.auth import invalidation, permissions
 from imbi_api.endpoints import _helpers
 
 LOGGER = logging.getLogger(__name__)
@@ -280,6 +280,8 @@ async def patch_service_account(
         ) from e
 
     await db.merge(updated, match_on=['slug'])
+    if updated.is_active != existing.is_active:
+        await invalidation.publish_principal_changed(slug)
 
     return models.ServiceAccountResponse(
         slug=updated.slug,
@@ -322,6 +324,7 @@ async def delete_service_account(
             status_code=404,
             detail=f'Service account {slug!r} not found',
         )
+    await invalidation.publish_principal_changed(slug)
 
 
 @service_accounts_router.post('/{slug}/organizations', status_code=204)
@@ -369,6 +372,7 @@ async def add_to_organization(
             f'organization {org_slug!r}, '
             f'or role {role_slug!r} not found',
         )
+    await invalidation.publish_principal_changed(slug)
 
 
 @service_accounts_router.patch(
@@ -443,3 +447,4 @@ async def remove_from_organization(
             detail=f'Service account {slug!r} is not a '
             f'member of organization {org_slug!r}',
         )
+    await invalidation.publish_principal_changed(slug)
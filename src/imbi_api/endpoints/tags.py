@@ -17,6 +17,7 @@ import slugify
 from imbi_common import graph, models
 
 from imbi_api import patch as json_patch
+from imbi_api import search_scope
 from imbi_api.auth import permissions
 from imbi_api.endpoints._helpers import conflict_on_unique_violation
 from imbi_api.relationships import RelationshipSpec, build_relationships
@@ -113,6 +114,7 @@ async def create_tag(
     tag['relationships'] = _tag_relationships(
         request, org_slug, tag['slug'], 0
     )
+    await search_scope.add_nodes(org_slug, tag.get('id'))
     return tag
 
 
@@ -326,3 +328,4 @@ async def delete_tag(
             status_code=404,
             detail=f'Tag {tag_slug!r} not found',
         )
+    await search_scope.invalidate(org_slug)
@@ -9,6 +9,7 @@ import pydantic
 from imbi_common import blueprints, graph, models
 
 from imbi_api import patch as json_patch
+from imbi_api import project_membership, search_scope
 from imbi_api.auth import permissions
 from imbi_api.endpoints._helpers import conflict_on_unique_violation
 from imbi_api.graph_sql import props_template, set_clause
@@ -131,6 +132,7 @@ async def create_team(
     team_props['relationships'] = _team_relationships(
         request, org_slug, slug, 0, 0
     )
+    await search_scope.add_nodes(org_slug, team_props.get('id'))
     return team_props
 
 
@@ -392,7 +394,7 @@ async def patch_team(
     if 'slug' not in patched:
         patched['slug'] = slug
 
-    return await _persist_team(
+    team = await _persist_team(
         slug,
         org_slug,
         dynamic_model,
@@ -402,6 +404,9 @@ async def patch_team(
         request,
         db,
     )
+    if team['slug'] != slug:
+        await project_membership.sync_org(db, org_slug)
+    return team
 
 
 @teams_router.delete('/{slug}', status_code=204)
@@ -440,6 +445,9 @@ async def delete_team(
             status_code=404,
             detail=f'Team with slug {slug!r} not found',
         )
+    # Projects owned by the team drop out of the org with it.
+    await search_scope.invalidate(org_slug)
+    await project_membership.sync_org(db, org_slug)
 
 
 @teams_router.get('/{slug}/members', name='list_team_members')
@@ -1,6 +1,7 @@
 """Upload CRUD endpoints."""
 
 import datetime
+import io
 import logging
 import re
 import typing
@@ -30,6 +31,116 @@ def _safe_s3_basename(filename: str) -> str:
     return cleaned[:128]
 
 
+# A single ``bytes=a-b`` / ``bytes=a-`` / ``bytes=-n`` range, which is
+# what S3 accepts. Anything else (multiple ranges, other units) is
+# ignored and the full body served, as RFC 9110 allows.
+_RANGE_RE = re.compile(r'^bytes=(\d+-\d*|-\d+)$')
+
+# Upload objects are never rewritten (the key embeds the upload id),
+# so the id is a strong validator and thumbnails can be cached forever.
+_ORIGINAL_CACHE_CONTROL = 'public, max-age=3600'
+_THUMBNAIL_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return etag in {
+        tag.strip().removeprefix('W/') for tag in if_none_match.split(',')
+    }
+
+
+def _requested_range(request: fastapi.Request, etag: str) -> str | None:
+    byte_range = (request.headers.get('range') or '').strip()
+    if not _RANGE_RE.match(byte_range):
+        return None
+    if_range = request.headers.get('if-range')
+    if if_range is not None and if_range.strip() != etag:
+        return None
+    return byte_range
+
+
+async def _serve_object(
+    request: fastapi.Request,
+    storage_client: storage.StorageClient,
+    key: str,
+    *,
+    etag: str,
+    media_type: str,
+    cache_control: str,
+    missing_detail: str,
+    size: int | None = None,
+) -> fastapi.responses.Response:
+    """Stream an S3 object, honouring conditional and range requests.
+
+    Answers ``If-None-Match`` hits with 304 without touching S3, and
+    redirects to a presigned URL when
+    :attr:`~imbi_api.settings.Storage.presigned_downloads` is on.
+
+    """
+    headers = {'ETag': etag, 'Cache-Control': cache_control}
+    if _etag_matches(request.headers.get('if-none-match'), etag):
+        return fastapi.responses.Response(status_code=304, headers=headers)
+
+    if settings.get_storage_settings().presigned_downloads:
+        url = await storage_client.presigned_url(
+            key, content_type=media_type, cache_control=cache_control
+        )
+        return fastapi.responses.RedirectResponse(
+            url, status_code=307, headers={'Cache-Control': 'no-store'}
+        )
+
+    byte_range = _requested_range(request, etag)
+    try:
+        obj = await storage_client.stream(key, byte_range=byte_range)
+    except botocore_exceptions.ClientError as err:  # pyright: ignore[reportMissingTypeStubs]
+        resp = typing.cast(
+            dict[str, typing.Any],
+            err.response,  # pyright: ignore[reportUnknownMemberType]
+        )
+        error_code = resp.get('Error', {}).get('Code')
+        if error_code == 'NoSuchKey':
+            raise fastapi.HTTPException(
+                status_code=404,
+                detail=missing_detail,
+            ) from err
+        if error_code == 'InvalidRange':
+            raise fastapi.HTTPException(
+                status_code=416,
+                detail='Requested range not satisfiable',
+                headers=(
+                    {'Content-Range': f'bytes */{size}'}
+                    if size is not None
+                    else None
+                ),
+            ) from err
+        raise
+
+    headers['Accept-Ranges'] = 'bytes'
+    headers['Content-Length'] = str(obj.content_length)
+    status_code = 200
+    if byte_range and obj.content_range:
+        headers['Content-Range'] = obj.content_range
+        status_code = 206
+    return fastapi.responses.StreamingResponse(
+        obj.chunks,
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+async def _upload_size(file: fastapi.UploadFile) -> int:
+    if file.size is not None:
+        return file.size
+    file.file.seek(0, io.SEEK_END)
+    size = file.file.tell()
+    await file.seek(0)
+    return size
+
+
 uploads_router = fastapi.APIRouter(
     prefix='/uploads',
     tags=['Uploads'],
@@ -77,6 +188,10 @@ async def create_upload(
     size, stores the file in S3, generates a thumbnail for raster
     images, and creates an Upload node in the graph.
 
+    The file is never read into memory whole: it is validated from its
+    size and leading bytes, then streamed to S3 (multipart for large
+    files) from the request's spooled temporary file.
+
     Returns:
         Upload metadata including the generated ID.
 
@@ -86,15 +201,17 @@ async def create_upload(
         403: Missing ``upload:create`` permission.
 
     """
-    data = await file.read()
     content_type = file.content_type or 'application/octet-stream'
     filename = file.filename or 'unnamed'
 
     storage_settings = settings.get_storage_settings()
 
+    head = await file.read(validation.HEAD_BYTES)
+    size = await _upload_size(file)
     try:
-        validation.validate_upload(
-            data,
+        validation.validate_upload_head(
+            head,
+            size,
             content_type,
             storage_settings,
         )
@@ -108,15 +225,17 @@ async def create_upload(
     s3_key = f'uploads/{upload_id}/{_safe_s3_basename(filename)}'
 
     # Upload original file
-    await storage_client.upload(s3_key, data, content_type)
+    await file.seek(0)
+    await storage_client.upload_fileobj(s3_key, file, content_type)
 
     # Generate thumbnail if applicable
     has_thumbnail = False
     thumbnail_s3_key: str | None = None
     if thumbnails.can_thumbnail(content_type):
         try:
+            await file.seek(0)
             thumb_data = await thumbnails.generate_thumbnail(
-                data,
+                file.file,
                 storage_settings,
             )
             thumbnail_s3_key = f'uploads/{upload_id}/thumbnail.webp'
@@ -137,7 +256,7 @@ async def create_upload(
         id=upload_id,
         filename=filename,
         content_type=content_type,
-        size=len(data),
+        size=size,
         s3_key=s3_key,
         has_thumbnail=has_thumbnail,
         thumbnail_s3_key=thumbnail_s3_key,
@@ -162,7 +281,7 @@ async def create_upload(
         upload_id,
         auth.require_user.email,
         content_type,
-        len(data),
+        size,
     )
 
     return _upload_response(upload_model)
@@ -205,6 +324,7 @@ async def list_uploads(
 @uploads_router.get('/{upload_id}')
 async def get_upload(
     upload_id: str,
+    request: fastapi.Request,
     storage_client: storage.InjectStorageClient,
     db: graph.Pool,
     _auth: typing.Annotated[
@@ -216,13 +336,17 @@ async def get_upload(
 ) -> fastapi.responses.Response:
     """Serve the uploaded file.
 
-    Pulls the file through from S3 and serves it directly.
+    Streams the file from S3 in chunks. Supports single ``Range``
+    requests (206) and ``If-None-Match`` revalidation (304), or
+    redirects to a presigned S3 URL when presigned downloads are
+    enabled.
 
     Returns:
         The file content with appropriate content type.
 
     Raises:
         404: If the upload does not exist.
+        416: If the requested range is not satisfiable.
 
     """
     results = await db.match(
@@ -236,24 +360,15 @@ async def get_upload(
             detail=f'Upload {upload_id!r} not found',
         )
 
-    try:
-        data = await storage_client.download(upload.s3_key)
-    except botocore_exceptions.ClientError as err:  # pyright: ignore[reportMissingTypeStubs]
-        resp = typing.cast(
-            dict[str, typing.Any],
-            err.response,  # pyright: ignore[reportUnknownMemberType]
-        )
-        error_code = resp.get('Error', {}).get('Code')
-        if error_code == 'NoSuchKey':
-            raise fastapi.HTTPException(
-                status_code=404,
-                detail=(f'Upload {upload_id!r} content not found'),
-            ) from err
-        raise
-    return fastapi.responses.Response(
-        content=data,
+    return await _serve_object(
+        request,
+        storage_client,
+        upload.s3_key,
+        etag=f'"{upload.id}"',
         media_type=upload.content_type,
-        headers={'Cache-Control': 'public, max-age=3600'},
+        cache_control=_ORIGINAL_CACHE_CONTROL,
+        missing_detail=f'Upload {upload_id!r} content not found',
+        size=upload.size,
     )
 
 
@@ -288,6 +403,7 @@ async def get_upload_meta(
 @uploads_router.get('/{upload_id}/thumbnail')
 async def get_upload_thumbnail(
     upload_id: str,
+    request: fastapi.Request,
     storage_client: storage.InjectStorageClient,
     db: graph.Pool,
     _auth: typing.Annotated[
@@ -299,7 +415,8 @@ async def get_upload_thumbnail(
 ) -> fastapi.responses.Response:
     """Serve the upload thumbnail.
 
-    Pulls the thumbnail through from S3 and serves it directly.
+    Streams the thumbnail from S3 with an immutable, year-long
+    ``Cache-Control`` and an ``ETag`` for revalidation.
 
     Returns:
         The thumbnail image as image/webp.
@@ -324,24 +441,14 @@ async def get_upload_thumbnail(
             detail=f'Upload {upload_id!r} has no thumbnail',
         )
 
-    try:
-        data = await storage_client.download(upload.thumbnail_s3_key)
-    except botocore_exceptions.ClientError as err:  # pyright: ignore[reportMissingTypeStubs]
-        resp = typing.cast(
-            dict[str, typing.Any],
-            err.response,  # pyright: ignore[reportUnknownMemberType]
-        )
-        error_code = resp.get('Error', {}).get('Code')
-        if error_code == 'NoSuchKey':
-            raise fastapi.HTTPException(
-                status_code=404,
-                detail=(f'Upload {upload_id!r} thumbnail not found'),
-            ) from err
-        raise
-    return fastapi.responses.Response(
-        content=data,
+    return await _serve_object(
+        request,
+        storage_client,
+        upload.thumbnail_s3_key,
+        etag=f'"{upload.id}-thumbnail"',
         media_type='image/webp',
-        headers={'Cache-Control': 'public, max-age=3600'},
+        cache_control=_THUMBNAIL_CACHE_CONTROL,
+        missing_detail=f'Upload {upload_id!r} thumbnail not found',
     )
 
 
@@ -23,6 +23,7 @@ import fastapi.responses
 import pydantic
 from imbi_common import clickhouse, graph
 
+from imbi_api import rollups
 from imbi_api.auth import permissions
 from imbi_api.endpoints._pagination import (
     build_link_header,
@@ -220,6 +221,19 @@ async def _opslog_buckets(
     until: datetime.datetime,
     tz: str,
 ) -> dict[datetime.date, int]:
+    if tz == 'UTC':
+        # UTC days line up with the daily rollup.
+        src, params = rollups.source(
+            rollups.OPERATIONS_LOG,
+            where='performed_by = {email:String}',
+            since=since,
+            until=until,
+        )
+        rows = await clickhouse.query(
+            'SELECT day AS d, sum(entries) AS c FROM ' + src + ' GROUP BY d',  # noqa: S608
+            {'email': email, **params},
+        )
+        return {row['d']: int(row['c']) for row in rows if row.get('d')}
     sql: str = (
         'SELECT toDate(toStartOfDay(occurred_at, {tz:String})) AS d, '
         'count() AS c '
@@ -246,6 +260,18 @@ async def _events_buckets(
 ) -> dict[datetime.date, int]:
     if not subjects:
         return {}
+    if tz == 'UTC':
+        src, params = rollups.source(
+            rollups.EVENTS,
+            where='attributed_to IN {subjects:Array(String)}',
+            since=since,
+            until=until,
+        )
+        rows = await clickhouse.query(
+            'SELECT day AS d, sum(entries) AS c FROM ' + src + ' GROUP BY d',  # noqa: S608
+            {'subjects': subjects, **params},
+        )
+        return {row['d']: int(row['c']) for row in rows if row.get('d')}
     sql: str = (
         'SELECT toDate(toStartOfDay(recorded_at, {tz:String})) AS d, '
         'count() AS c '
@@ -507,31 +533,33 @@ async def get_user_stats(
     start, end = _resolve_window(since, until)
     subjects = await _resolve_user_subjects(db, email)
 
+    totals_src, totals_params = rollups.source(
+        rollups.OPERATIONS_LOG,
+        where='performed_by = {email:String}',
+        since=start,
+        until=end,
+    )
+    env_src, env_params = rollups.source(
+        rollups.OPERATIONS_LOG,
+        where="performed_by = {email:String} AND entry_type = 'Deployed'",
+        since=start,
+        until=end,
+    )
     deploy_totals_sql = (
         'SELECT '
-        "countIf(entry_type = 'Deployed') AS deployed, "
-        "countIf(entry_type = 'Rolled Back') AS rolled_back "
-        'FROM operations_log FINAL '
-        'WHERE is_deleted = 0 '
-        '  AND performed_by = {email:String} '
-        '  AND occurred_at >= {since:DateTime64(3)} '
-        '  AND occurred_at <  {until:DateTime64(3)}'
+        "sumIf(entries, entry_type = 'Deployed') AS deployed, "
+        "sumIf(entries, entry_type = 'Rolled Back') AS rolled_back "
+        'FROM ' + totals_src
     )
     by_env_sql = (
-        'SELECT environment_slug, count() AS c '
-        'FROM operations_log FINAL '
-        'WHERE is_deleted = 0 '
-        '  AND performed_by = {email:String} '
-        "  AND entry_type = 'Deployed' "
-        '  AND occurred_at >= {since:DateTime64(3)} '
-        '  AND occurred_at <  {until:DateTime64(3)} '
-        'GROUP BY environment_slug'
+        'SELECT environment_slug, sum(entries) AS c FROM '  # noqa: S608
+        + env_src
+        + ' GROUP BY environment_slug'
     )
-    params = {'email': email, 'since': start, 'until': end}
 
     totals_rows, env_rows, projects_touched = await asyncio.gather(
-        clickhouse.query(deploy_totals_sql, params),
-        clickhouse.query(by_env_sql, params),
+        clickhouse.query(deploy_totals_sql, {'email': email, **totals_params}),
+        clickhouse.query(by_env_sql, {'email': email, **env_params}),
         _projects_touched(
             db,
             email=email,
@@ -10,7 +10,7 @@ from imbi_common import graph
 
 from imbi_api import models
 from imbi_api import patch as json_patch
-from imbi_api.auth import password, permissions
+from imbi_api.auth import invalidation, password, permissions
 from imbi_api.endpoints import _helpers
 from imbi_api.identity import repository as identity_repository
 
@@ -687,6 +687,13 @@ async def patch_user(
     if memberships_changed:
         await _reconcile_user_memberships(db, email, existing_orgs, new_orgs)
 
+    if (
+        memberships_changed
+        or updated_user.is_active != existing_user.is_active
+        or updated_user.is_admin != existing_user.is_admin
+    ):
+        await invalidation.publish_principal_changed(email)
+
     # Return the user with the post-reconciliation memberships
     final_orgs = await _load_user_memberships(db, email)
     return models.UserResponse(
@@ -748,6 +755,7 @@ async def delete_user(
             status_code=404,
             detail=f'User with email {email!r} not found',
         )
+    await invalidation.publish_principal_changed(email)
 
 
 @users_router.post('/{email}/password', status_code=204)
@@ -898,6 +906,7 @@ async def add_to_organization(
             ' SET m.role = {role_slug}',
             {'email': email, 'org_slug': org_slug, 'role_slug': role_slug},
         )
+    await invalidation.publish_principal_changed(email)
 
 
 @users_router.patch(
@@ -984,3 +993,4 @@ async def remove_from_organization(
             detail=f'User {email!r} is not a member of '
             f'organization {org_slug!r}',
         )
+    await invalidation.publish_principal_changed(email)
@@ -1,6 +1,8 @@
 import asyncio
 import datetime
 import getpass
+import logging
+import signal
 import typing
 
 import nanoid
@@ -16,6 +18,57 @@ main = typer.Typer(no_args_is_help=True)
 main.command('serve')(server.bind_entrypoint('imbi_api.app:create_app'))
 
 
+@main.command('worker')
+def worker(
+    names: typing.Annotated[
+        list[str] | None,
+        typer.Argument(
+            help='Workers to run (default: all). One or more of: '
+            'score, commit-sync, pr-sync, deployment-sync, maintenance, '
+            'identity-refresh.',
+            show_default=False,
+        ),
+    ] = None,
+) -> None:
+    """Run background workers without the HTTP server.
+
+    Pair with ``IMBI_API_BACKGROUND_WORKERS=false`` on the ``serve``
+    processes so backfills and recomputes scale (and fail)
+    independently of request handling.  Runs until SIGINT/SIGTERM.
+    """
+    from imbi_api import lifespans
+
+    selected = list(dict.fromkeys(names or lifespans.WORKER_HOOKS))
+    unknown = [name for name in selected if name not in lifespans.WORKER_HOOKS]
+    if unknown:
+        typer.echo(
+            f'✗ Unknown worker(s): {", ".join(unknown)}. Choose from: '
+            f'{", ".join(lifespans.WORKER_HOOKS)}',
+            err=True,
+        )
+        raise typer.Exit(code=2)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+    )
+    asyncio.run(_run_workers(selected))
+
+
+async def _run_workers(names: list[str]) -> None:
+    """Hold the worker app's lifespan open until a stop signal arrives."""
+    from imbi_api import app
+
+    worker_app = app.create_worker_app(names)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    async with worker_app.router.lifespan_context(worker_app):
+        typer.echo(f'✓ Running workers: {", ".join(names)}')
+        await stop.wait()
+    typer.echo('✓ Workers stopped')
+
+
 @main.command('backfill-node-ids')
 def backfill_node_ids() -> None:
     """Backfill ``id`` on graph nodes that were created without one.
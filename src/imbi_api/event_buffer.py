@@ -0,0 +1,289 @@
+"""Buffered, batched ClickHouse inserts for the request path.
+
+Request handlers used to pay a full ClickHouse insert round trip per
+row (comment and project-change events, lifecycle events, operations
+log entries), and every one of those tiny inserts became its own part
+on the server.  :func:`write` hands rows to a process-wide
+:class:`Buffer` instead; a background task coalesces them into one
+multi-row insert per ``(table, columns)`` whenever ``max_rows`` are
+waiting or ``flush_interval`` seconds have passed since the first
+unflushed row.
+
+The queue is bounded at ``max_queue`` rows: once it is full,
+:func:`write` waits for the flusher to make room rather than growing
+without limit.  Best-effort writers (analytics events) return as soon
+as their rows are queued and a failed flush is only logged.  Writers
+that need the row on disk before they respond pass ``wait=True``: the
+flusher writes their row straight away, together with whatever else
+is already queued, and hands back the result -- including its
+exception.  A batch ClickHouse rejects is retried one writer's rows
+at a time, so a malformed row fails only the writer that sent it.
+
+Outside of the API lifespan (CLI commands, tests that never start the
+app) no buffer is running and :func:`write` inserts directly.
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import time
+import typing
+from collections import abc
+
+from imbi_common import clickhouse
+
+from imbi_api import settings
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _Entry(typing.NamedTuple):
+    table: str
+    columns: tuple[str, ...]
+    rows: list[list[typing.Any]]
+    done: asyncio.Future[None] | None
+
+
+@dataclasses.dataclass(slots=True)
+class Stats:
+    """Counters reported on the admin dashboard."""
+
+    depth: int = 0
+    capacity: int = 0
+    flushes: int = 0
+    rows_written: int = 0
+    rows_failed: int = 0
+    last_flush_ms: float | None = None
+    max_flush_ms: float | None = None
+
+
+async def _insert(
+    table: str,
+    columns: typing.Sequence[str],
+    rows: list[list[typing.Any]],
+) -> None:
+    await clickhouse.client.Clickhouse.get_instance().insert(
+        table, rows, list(columns)
+    )
+
+
+class Buffer:
+    """Coalesce request-path inserts into periodic multi-row batches."""
+
+    def __init__(
+        self,
+        *,
+        max_rows: int = 500,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+    ) -> None:
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.stats = Stats(capacity=max_queue)
+        self._queue: asyncio.Queue[_Entry | None] = asyncio.Queue(max_queue)
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Flush everything queued so far and stop the flusher."""
+        self._closed = True
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        if not task.done():
+            await self._queue.put(None)
+        await task
+
+    async def put(
+        self,
+        table: str,
+        columns: typing.Sequence[str],
+        rows: typing.Iterable[typing.Sequence[typing.Any]],
+        *,
+        wait: bool = False,
+    ) -> None:
+        """Queue ``rows``; with ``wait`` return once they are written.
+
+        Raises :exc:`RuntimeError` once the buffer has been closed,
+        since nothing would ever write the rows.
+        """
+        if self._closed:
+            raise RuntimeError('Event buffer is closed')
+        loop = asyncio.get_running_loop()
+        key = tuple(columns)
+        futures: list[asyncio.Future[None]] = []
+        for row in rows:
+            done = loop.create_future() if wait else None
+            await self._queue.put(_Entry(table, key, [list(row)], done))
+            if done is not None:
+                futures.append(done)
+        self.stats.depth = self._queue.qsize()
+        if futures:
+            await asyncio.gather(*futures)
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            entry = await self._queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_rows:
+                if batch[-1].done is not None:
+                    # Someone is waiting on this row: take what is
+                    # already queued and write it now.
+                    deadline = 0.0
+                try:
+                    entry = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        entry = await asyncio.wait_for(
+                            self._queue.get(), timeout
+                        )
+                    except TimeoutError:
+                        break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            self.stats.depth = self._queue.qsize()
+            await self._flush(batch)
+        # Anything queued behind the stop marker still gets written.
+        leftover = self._drain()
+        while leftover:
+            await self._flush(leftover)
+            leftover = self._drain()
+        self.stats.depth = 0
+
+    def _drain(self) -> list[_Entry]:
+        entries: list[_Entry] = []
+        while not self._queue.empty():
+            entry = self._queue.get_nowait()
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    async def _flush(self, batch: list[_Entry]) -> None:
+        groups: dict[tuple[str, tuple[str, ...]], list[_Entry]] = {}
+        for entry in batch:
+            groups.setdefault((entry.table, entry.columns), []).append(entry)
+        for (table, columns), entries in groups.items():
+            try:
+                await self._write(table, columns, entries)
+            except Exception as error:
+                if len(entries) == 1:
+                    LOGGER.exception(
+                        'Failed to write %d buffered rows to %s',
+                        len(entries[0].rows),
+                        table,
+                    )
+                    self._fail(entries[0], error)
+                    continue
+                LOGGER.warning(
+                    'Failed to write a batch of %d buffered rows to %s;'
+                    ' retrying each writer separately',
+                    sum(len(entry.rows) for entry in entries),
+                    table,
+                    exc_info=True,
+                )
+                await self._retry(table, columns, entries)
+
+    async def _retry(
+        self, table: str, columns: tuple[str, ...], entries: list[_Entry]
+    ) -> None:
+        """Write ``entries`` one at a time, failing only rejected ones."""
+        for entry in entries:
+            try:
+                await self._write(table, columns, [entry])
+            except Exception as error:
+                LOGGER.exception(
+                    'Failed to write %d buffered rows to %s',
+                    len(entry.rows),
+                    table,
+                )
+                self._fail(entry, error)
+
+    async def _write(
+        self, table: str, columns: tuple[str, ...], entries: list[_Entry]
+    ) -> None:
+        rows = [row for entry in entries for row in entry.rows]
+        start = time.perf_counter()
+        try:
+            await _insert(table, columns, rows)
+        finally:
+            elapsed = round((time.perf_counter() - start) * 1000, 1)
+            self.stats.flushes += 1
+            self.stats.last_flush_ms = elapsed
+            self.stats.max_flush_ms = max(
+                elapsed, self.stats.max_flush_ms or 0.0
+            )
+        self.stats.rows_written += len(rows)
+        for entry in entries:
+            if entry.done is not None and not entry.done.done():
+                entry.done.set_result(None)
+
+    def _fail(self, entry: _Entry, error: Exception) -> None:
+        self.stats.rows_failed += len(entry.rows)
+        if entry.done is not None and not entry.done.done():
+            entry.done.set_exception(error)
+
+
+_buffer: Buffer | None = None
+
+
+def get_buffer() -> Buffer | None:
+    """Return the running buffer, if the API lifespan started one."""
+    if _buffer is not None and _buffer.running:
+        return _buffer
+    return None
+
+
+async def write(
+    table: str,
+    columns: typing.Sequence[str],
+    rows: typing.Iterable[typing.Sequence[typing.Any]],
+    *,
+    wait: bool = False,
+) -> None:
+    """Insert ``rows`` into ``table`` through the running buffer.
+
+    Falls back to a direct insert when no buffer is running, in which
+    case insert errors propagate whether or not ``wait`` is set.
+    """
+    buffer = get_buffer()
+    if buffer is None:
+        await _insert(table, columns, [list(row) for row in rows])
+        return
+    await buffer.put(table, columns, rows, wait=wait)
+
+
+@contextlib.asynccontextmanager
+async def running() -> abc.AsyncGenerator[Buffer]:
+    """Run the process-wide buffer for the duration of the block."""
+    global _buffer
+    config = settings.get_event_buffer_settings()
+    buffer = Buffer(
+        max_rows=config.max_rows,
+        flush_interval=config.flush_interval,
+        max_queue=config.max_queue,
+    )
+    buffer.start()
+    _buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _buffer = None
+        await buffer.close()
@@ -7,6 +7,10 @@ and leave via :class:`IdentityCredentialsInternal` from
 ``load_connection``; the rest of the API code path never handles
 ciphertext directly.
 
+Every write here changes the ``identities`` a user's cached
+``AuthContext`` carries, so each one drops that user's cached
+contexts on every pod through :mod:`imbi_api.auth.invalidation`.
+
 Plugin Architecture v3: connections key off ``integration_id`` (an
 ``Integration`` node id), not a ``Plugin`` node.  Lookups that need the
 Integration's slug / name join by property equality on
@@ -24,6 +28,7 @@ from imbi_common import graph
 from imbi_common.auth.encryption import TokenEncryption
 from imbi_common.plugins.base import IdentityCredentials, IdentityProfile
 
+from imbi_api.auth import invalidation
 from imbi_api.identity.models import IdentityCredentialsInternal
 
 LOGGER = logging.getLogger(__name__)
@@ -161,6 +166,7 @@ async def upsert_connection(
         raise
     if not records:
         raise RuntimeError('upsert_connection returned no rows')
+    await invalidation.publish_user_changed(user_id)
     return str(graph.parse_agtype(records[0]['id']))
 
 
@@ -248,12 +254,17 @@ async def mark_status(
     query: typing.LiteralString = """
     MATCH (c:IdentityConnection {{id: {id}}})
     SET c.status = {status}, c.updated_at = {now}
+    RETURN c.user_id AS user_id
     """
-    await db.execute(
+    records = await db.execute(
         query,
         {'id': connection_id, 'status': status, 'now': _now_iso()},
-        [],
+        ['user_id'],
     )
+    for record in records:
+        user_id = graph.parse_agtype(record['user_id'])
+        if user_id:
+            await invalidation.publish_user_changed(str(user_id))
 
 
 async def connection_status(
@@ -299,6 +310,7 @@ async def delete_connection(
     await db.execute(
         query, {'integration_id': integration_id, 'user_id': user_id}, []
     )
+    await invalidation.publish_user_changed(user_id)
 
 
 async def revoke(
@@ -325,6 +337,7 @@ async def revoke(
         },
         [],
     )
+    await invalidation.publish_user_changed(user_id)
 
 
 async def list_for_user(
@@ -8,12 +8,22 @@ startup and cleans it up on shutdown. Hooks are composed using
 import asyncio
 import contextlib
 import logging
+import typing
 from collections import abc
 
 from imbi_common import clickhouse, graph, valkey
 from imbi_common.llm import AnthropicClient
-
-from imbi_api import openapi
+from valkey import asyncio as valkey_module
+
+from imbi_api import (
+    deployment_events,
+    event_buffer,
+    openapi,
+    project_membership,
+    release_state,
+    rollups,
+    settings,
+)
 from imbi_api.commit_sync import queue as commit_sync_queue
 from imbi_api.deployment_sync import queue as deployment_sync_queue
 from imbi_api.email.client import EmailClient
@@ -34,6 +44,10 @@ async def _on_graph_startup(db: graph.Graph) -> None:
     """Refresh blueprint models and load plugins after the graph pool opens."""
     global _graph
     _graph = db
+    try:
+        await deployment_events.ensure_schema(db)
+    except Exception:
+        LOGGER.exception('Failed to ensure the deployment events table')
     try:
         await openapi.refresh_blueprint_models(db)
     except Exception:
@@ -53,10 +67,29 @@ async def clickhouse_hook() -> abc.AsyncGenerator[None]:
     result = await clickhouse.initialize()
     if result is False:
         raise RuntimeError('ClickHouse initialization failed')
+    try:
+        await rollups.ensure_schema()
+    except Exception:
+        LOGGER.exception('Failed to ensure the ClickHouse rollup views')
+    try:
+        await project_membership.ensure_schema()
+    except Exception:
+        LOGGER.exception('Failed to ensure the project membership table')
+    try:
+        await release_state.ensure_schema()
+    except Exception:
+        LOGGER.exception('Failed to ensure the release state table')
     async with contextlib.aclosing(clickhouse):
         yield
 
 
+@contextlib.asynccontextmanager
+async def event_buffer_hook() -> abc.AsyncGenerator[None]:
+    """Batch request-path ClickHouse inserts; flush them on shutdown."""
+    async with event_buffer.running():
+        yield
+
+
 @contextlib.asynccontextmanager
 async def email_hook() -> abc.AsyncGenerator[
     tuple[EmailClient, TemplateManager]
@@ -149,9 +182,19 @@ async def commit_sync_worker_hook() -> abc.AsyncGenerator[None]:
         yield None
         return
     stop = asyncio.Event()
-    LOGGER.info('Commit-sync worker starting')
+    worker_settings = settings.get_sync_worker_settings()
+    LOGGER.info(
+        'Commit-sync worker starting (concurrency=%d)',
+        worker_settings.commit_sync_concurrency,
+    )
     consumer_task = asyncio.create_task(
-        commit_sync_queue.consume_commit_sync(client, _graph, stop=stop)
+        commit_sync_queue.consume_commit_sync(
+            client,
+            _graph,
+            stop=stop,
+            concurrency=worker_settings.commit_sync_concurrency,
+            recover_after=worker_settings.recover_after,
+        )
     )
     try:
         yield None
@@ -182,9 +225,19 @@ async def pr_sync_worker_hook() -> abc.AsyncGenerator[None]:
         yield None
         return
     stop = asyncio.Event()
-    LOGGER.info('PR-sync worker starting')
+    worker_settings = settings.get_sync_worker_settings()
+    LOGGER.info(
+        'PR-sync worker starting (concurrency=%d)',
+        worker_settings.pr_sync_concurrency,
+    )
     consumer_task = asyncio.create_task(
-        pr_sync_queue.consume_pr_sync(client, _graph, stop=stop)
+        pr_sync_queue.consume_pr_sync(
+            client,
+            _graph,
+            stop=stop,
+            concurrency=worker_settings.pr_sync_concurrency,
+            recover_after=worker_settings.recover_after,
+        )
     )
     try:
         yield None
@@ -217,10 +270,18 @@ async def deployment_sync_worker_hook() -> abc.AsyncGenerator[None]:
         yield None
         return
     stop = asyncio.Event()
-    LOGGER.info('Deployment-sync worker starting')
+    worker_settings = settings.get_sync_worker_settings()
+    LOGGER.info(
+        'Deployment-sync worker starting (concurrency=%d)',
+        worker_settings.deployment_sync_concurrency,
+    )
     consumer_task = asyncio.create_task(
         deployment_sync_queue.consume_deployment_sync(
-            client, _graph, stop=stop
+            client,
+            _graph,
+            stop=stop,
+            concurrency=worker_settings.deployment_sync_concurrency,
+            recover_after=worker_settings.recover_after,
         )
     )
     try:
@@ -238,9 +299,22 @@ async def deployment_sync_worker_hook() -> abc.AsyncGenerator[None]:
             )
 
 
+async def _sync_project_membership(
+    db: graph.Graph, client: valkey_module.Valkey
+) -> None:
+    try:
+        await project_membership.sync_all_leased(db, client)
+    except Exception:
+        LOGGER.exception('Failed to sync the project membership table')
+
+
 @contextlib.asynccontextmanager
 async def maintenance_worker_hook() -> abc.AsyncGenerator[None]:
-    """Run the global maintenance operation consumer loop."""
+    """Run the global maintenance operation consumer loop.
+
+    Also rebuilds the project membership table in the background, at
+    most once per lease window across all maintenance workers.
+    """
     try:
         client = valkey.get_client()
     except RuntimeError:
@@ -256,19 +330,21 @@ async def maintenance_worker_hook() -> abc.AsyncGenerator[None]:
     consumer_task = asyncio.create_task(
         maintenance_worker.run_worker(client, _graph, stop=stop)
     )
+    membership_task = asyncio.create_task(
+        _sync_project_membership(_graph, client)
+    )
     try:
         yield None
     finally:
         stop.set()
-        consumer_task.cancel()
-        try:
-            await consumer_task
-        except asyncio.CancelledError:
-            pass
-        except Exception:  # noqa: BLE001
-            LOGGER.warning(
-                'Maintenance worker task exited with error', exc_info=True
-            )
+        for task in (consumer_task, membership_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                LOGGER.exception('Maintenance worker task exited with error')
 
 
 @contextlib.asynccontextmanager
@@ -286,12 +362,25 @@ async def score_worker_hook() -> abc.AsyncGenerator[None]:
         return
     ch = clickhouse.client.Clickhouse.get_instance()
     stop = asyncio.Event()
+    worker_settings = settings.get_score_worker_settings()
     LOGGER.info('Score recompute worker starting')
     consumer_task = asyncio.create_task(
-        score_queue.consume_recompute(client, _graph, ch, stop=stop)
+        score_queue.consume_recompute(
+            client,
+            _graph,
+            ch,
+            stop=stop,
+            batch_size=worker_settings.batch_size,
+            concurrency=worker_settings.concurrency,
+        )
     )
     tick_task = asyncio.create_task(
-        score_queue.run_daily_tick(client, _graph, stop=stop)
+        score_queue.run_daily_tick(
+            client,
+            _graph,
+            spread_seconds=worker_settings.daily_tick_spread_seconds,
+            stop=stop,
+        )
     )
     try:
         yield None
@@ -307,3 +396,18 @@ async def score_worker_hook() -> abc.AsyncGenerator[None]:
                 LOGGER.warning(
                     'Score worker task exited with error', exc_info=True
                 )
+
+
+WorkerHook = abc.Callable[[], contextlib.AbstractAsyncContextManager[None]]
+
+#: Background worker hooks by name, in start order.  ``serve`` runs all
+#: of them unless ``IMBI_API_BACKGROUND_WORKERS`` is false;
+#: ``imbi-api worker`` runs a selection in a process of its own.
+WORKER_HOOKS: typing.Final[dict[str, WorkerHook]] = {
+    'score': score_worker_hook,
+    'commit-sync': commit_sync_worker_hook,
+    'pr-sync': pr_sync_worker_hook,
+    'deployment-sync': deployment_sync_worker_hook,
+    'maintenance': maintenance_worker_hook,
+    'identity-refresh': identity_refresh_hook,
+}
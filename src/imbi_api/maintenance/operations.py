@@ -131,8 +131,11 @@ async def execute_remediate(
 async def execute_commit_sync(
     db: graph.Graph, client: valkey.Valkey, project_id: str
 ) -> ExecuteOutcome:
-    """Full commit/tag backfill, mirroring the queue consumer's status
-    transitions so the per-project Doctor status stays truthful."""
+    """Incremental commit/tag sync, mirroring the queue consumer's status
+    transitions so the per-project Doctor status stays truthful.
+
+    Projects never synced before (no cursor) get a full backfill.
+    """
     from imbi_api.commit_sync import service
 
     org_slug = await _org_slug_for(db, project_id)
@@ -142,7 +145,7 @@ async def execute_commit_sync(
         db, project_id, status='running', requested_by=REQUESTED_BY
     )
     try:
-        commits, tags = await service.run_sync(db, org_slug, project_id)
+        result = await service.run_sync(db, org_slug, project_id)
     except service.CommitSyncUnavailable as exc:
         await service.set_status(
             db,
@@ -174,8 +177,9 @@ async def execute_commit_sync(
         project_id,
         status='success',
         requested_by=REQUESTED_BY,
-        commits=commits,
-        tags=tags,
+        commits=result.commits,
+        tags=result.tags,
+        mode=result.mode,
     )
     return 'succeeded'
 
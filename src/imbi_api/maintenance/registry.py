@@ -43,6 +43,10 @@ class OperationDefinition(typing.NamedTuple):
         [graph.Graph, valkey.Valkey, str],
         abc.Awaitable[operations.ExecuteOutcome],
     ]
+    #: Projects each instance executes at once.  Keep operations that
+    #: share a rate-limited plugin token at one; graph-bound operations
+    #: can fan out.
+    concurrency: int = 1
 
 
 OPERATIONS: dict[MaintenanceSlug, OperationDefinition] = {
@@ -58,6 +62,7 @@ OPERATIONS: dict[MaintenanceSlug, OperationDefinition] = {
             pause_key=None,
             enumerate=operations.enumerate_all_projects,
             execute=operations.execute_analysis,
+            concurrency=8,
         ),
         OperationDefinition(
             slug='remediate',
@@ -70,6 +75,7 @@ OPERATIONS: dict[MaintenanceSlug, OperationDefinition] = {
             pause_key=None,
             enumerate=operations.enumerate_all_projects,
             execute=operations.execute_remediate,
+            concurrency=4,
         ),
         OperationDefinition(
             slug='rescore',
@@ -82,6 +88,7 @@ OPERATIONS: dict[MaintenanceSlug, OperationDefinition] = {
             pause_key=None,
             enumerate=operations.enumerate_all_projects,
             execute=operations.execute_rescore,
+            concurrency=16,
         ),
         OperationDefinition(
             slug='deployment-resync',
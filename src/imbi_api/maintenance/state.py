@@ -61,6 +61,29 @@ class RunStatus(pydantic.BaseModel):
     started_at: datetime.datetime | None = None
     started_by: str | None = None
     completed_at: datetime.datetime | None = None
+    #: Finished projects per minute across every instance, over the
+    #: run so far (or the whole run once it has ended).
+    items_per_minute: float | None = None
+    #: Projected completion time of a running run at that rate.
+    eta: datetime.datetime | None = None
+
+
+def _throughput(
+    status: RunStatus,
+) -> tuple[float | None, datetime.datetime | None]:
+    """Return ``(items_per_minute, eta)`` for *status*."""
+    if status.started_at is None:
+        return None, None
+    end = status.completed_at or datetime.datetime.now(datetime.UTC)
+    minutes = (end - status.started_at).total_seconds() / 60
+    done = status.succeeded + status.failed + status.skipped
+    if minutes <= 0 or done == 0:
+        return None, None
+    rate = done / minutes
+    if status.state != 'running':
+        return round(rate, 2), None
+    left = status.remaining + status.in_flight
+    return round(rate, 2), end + datetime.timedelta(minutes=left / rate)
 
 
 def _key(slug: str, part: str) -> str:
@@ -318,7 +341,7 @@ async def read_status(client: valkey.Valkey, slug: str) -> RunStatus:
         state = 'abandoned'
     run_id = run.get('run_id')
     started_by = run.get('started_by')
-    return RunStatus(
+    status = RunStatus(
         state=state,
         run_id=_decode(run_id) if run_id is not None else None,
         total=_opt_int(run.get('total')),
@@ -331,6 +354,8 @@ async def read_status(client: valkey.Valkey, slug: str) -> RunStatus:
         started_by=_decode(started_by) if started_by is not None else None,
         completed_at=_opt_datetime(run.get('completed_at')),
     )
+    status.items_per_minute, status.eta = _throughput(status)
+    return status
 
 
 async def read_failures(client: valkey.Valkey, slug: str) -> dict[str, str]:
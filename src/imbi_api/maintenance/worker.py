@@ -1,9 +1,12 @@
 """Per-instance consumer for global maintenance runs.
 
 Every API instance runs one of these; work is distributed through the
-Valkey pending SET (:mod:`imbi_api.maintenance.state`), so N instances
-give N-way parallelism with one in-flight project per instance -- the
-gentlest shape for plugin APIs that share a rate-limited token.
+Valkey pending SET (:mod:`imbi_api.maintenance.state`).  Each operation
+keeps up to its
+:attr:`~imbi_api.maintenance.registry.OperationDefinition.concurrency`
+projects in flight per instance: operations that call plugin APIs
+sharing a rate-limited token stay at one (the gentlest shape), while
+graph-bound ones such as ``run-analysis`` fan out.
 """
 
 from __future__ import annotations
@@ -11,6 +14,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+import typing
 
 from imbi_common import graph
 from imbi_common.plugins.errors import PluginRateLimited
@@ -52,29 +56,39 @@ async def pause_until(
         LOGGER.exception('failed to set pause marker %s', key)
 
 
-async def _tick_operation(
-    client: valkey.Valkey,
-    db: graph.Graph,
-    operation: registry.OperationDefinition,
-) -> bool:
-    """Execute at most one pending project for *operation*.
+async def _checkout_next(
+    client: valkey.Valkey, operation: registry.OperationDefinition
+) -> str | None:
+    """Check out the next pending project, or ``None`` when idle.
 
-    Returns ``True`` when a project was processed (successfully or
-    not), so the caller loops immediately instead of idling.
+    Idle means no active run, a rate-limit pause, or a drained pending
+    set -- each of which may let the run finalize.
     """
     if not await state.has_active_run(client, operation.slug):
-        return False
+        return None
     if (
         operation.pause_key
         and await paused_remaining(client, operation.pause_key) > 0
     ):
         # Another instance may drain to zero while we're paused.
         await state.maybe_finalize(client, operation.slug)
-        return False
+        return None
     project_id = await state.checkout(client, operation.slug)
     if project_id is None:
         await state.maybe_finalize(client, operation.slug)
-        return False
+    return project_id
+
+
+async def _execute_project(
+    client: valkey.Valkey,
+    db: graph.Graph,
+    operation: registry.OperationDefinition,
+    project_id: str,
+) -> bool:
+    """Execute one checked-out project and record its outcome.
+
+    Returns ``False`` when the project was requeued for a rate limit.
+    """
     outcome: state.Outcome
     error = ''
     try:
@@ -120,28 +134,76 @@ async def _tick_operation(
     return True
 
 
-async def run_worker(
+async def _run_operation(
     client: valkey.Valkey,
     db: graph.Graph,
+    operation: registry.OperationDefinition,
     stop: asyncio.Event,
 ) -> None:
-    """Run the maintenance consumer loop until *stop* is set."""
-    LOGGER.info('Maintenance worker loop running')
-    while not stop.is_set():
-        worked = False
-        for operation in registry.OPERATIONS.values():
-            if stop.is_set():
-                break
-            try:
-                worked = await _tick_operation(client, db, operation) or worked
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                LOGGER.exception(
-                    'maintenance tick failed for %s', operation.slug
+    """Keep up to ``operation.concurrency`` projects in flight."""
+    limit = max(1, operation.concurrency)
+    running: set[asyncio.Task[bool]] = set()
+
+    def _forget(task: asyncio.Task[bool]) -> None:
+        running.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            LOGGER.error(
+                'maintenance %s task failed',
+                operation.slug,
+                exc_info=task.exception(),
+            )
+
+    try:
+        while not stop.is_set():
+            project_id: str | None = None
+            if len(running) < limit:
+                try:
+                    project_id = await _checkout_next(client, operation)
+                except Exception:
+                    LOGGER.exception(
+                        'maintenance checkout failed for %s', operation.slug
+                    )
+            if project_id is not None:
+                task = asyncio.create_task(
+                    _execute_project(client, db, operation, project_id)
                 )
-        if not worked:
+                running.add(task)
+                task.add_done_callback(_forget)
+                continue
+            # Full, idle or paused: wait for a slot to free up (or the
+            # idle poll) before checking out again.
+            waiters: set[asyncio.Future[typing.Any]] = set(running)
+            stopped = asyncio.ensure_future(stop.wait())
+            waiters.add(stopped)
             try:
-                await asyncio.wait_for(stop.wait(), POLL_IDLE_SECONDS)
-            except TimeoutError:
-                pass
+                await asyncio.wait(
+                    waiters,
+                    timeout=POLL_IDLE_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                stopped.cancel()
+    finally:
+        # Cancelled projects requeue themselves in _execute_project.
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+async def run_worker(
+    client: valkey.Valkey,
+    db: graph.Graph,
+    stop: asyncio.Event,
+) -> None:
+    """Run the maintenance consumer loop until *stop* is set.
+
+    Each operation runs in its own loop so a long, single-slot sync
+    never holds back the fan-out of another operation.
+    """
+    LOGGER.info('Maintenance worker loop running')
+    await asyncio.gather(
+        *(
+            _run_operation(client, db, operation, stop)
+            for operation in registry.OPERATIONS.values()
+        )
+    )
@@ -1,5 +1,5 @@
 """Middleware modules for the Imbi application."""
 
-from imbi_api.middleware import rate_limit
+from imbi_api.middleware import rate_limit, request_memo
 
-__all__ = ['rate_limit']
+__all__ = ['rate_limit', 'request_memo']
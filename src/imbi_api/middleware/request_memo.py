@@ -0,0 +1,27 @@
+"""Per-request memoization scope for capability resolution.
+
+Wraps every HTTP request in
+:func:`imbi_api.plugins.binding_cache.request_scope`, so an endpoint
+that resolves several capabilities for the same project reads each
+cached input at most once.
+"""
+
+from starlette import types
+
+from imbi_api.plugins import binding_cache
+
+
+class RequestMemoMiddleware:
+    """Pure ASGI middleware; lifespan and websocket scopes pass through."""
+
+    def __init__(self, app: types.ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: types.Scope, receive: types.Receive, send: types.Send
+    ) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        with binding_cache.request_scope():
+            await self.app(scope, receive, send)
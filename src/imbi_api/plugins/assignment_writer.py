@@ -14,6 +14,7 @@ import typing
 from imbi_common import graph
 
 from imbi_api.graph_sql import escape_prop
+from imbi_api.plugins import binding_cache
 
 _ROW_KEYS: tuple[str, ...] = (
     'integration_id',
@@ -123,3 +124,4 @@ async def replace_capability_assignments(
         },
         [],
     )
+    await binding_cache.invalidate()
@@ -0,0 +1,239 @@
+"""Cached effective bindings and plugin enablement for resolution.
+
+:func:`imbi_api.plugins.resolution.resolve_capability` runs on nearly
+every plugin-backed endpoint, and each call used to walk the project
+context, list the org's Integrations, collect the assigned project
+types and then query every candidate's ``PluginRegistration``.  This
+module caches the two inputs that are expensive to rebuild:
+
+- the :class:`~imbi_api.plugins.assignments.CapabilityBinding` list
+  for a ``(project_id, kind)``, and
+- the ``{slug: enabled}`` map from
+  :func:`~imbi_api.plugins.lifecycle.get_enabled_map`, which replaces
+  the per-binding ``is_plugin_enabled`` query.
+
+Both are versioned by a single generation counter in Valkey
+(``imbi:plugins:bindings:gen``).  Writers of ``USES`` edges,
+Integrations, project types and ``PluginRegistration`` nodes call
+:func:`invalidate`, which bumps it; every pod compares the generation
+before trusting its in-process copy and bindings are stored in Valkey
+under generation-qualified keys, so a bump retires every cached entry
+at once.  The default-all rule lets one Integration change affect any
+project in the org, which is why invalidation is not finer-grained.
+
+Cached bindings never carry the Integration's
+``encrypted_credentials``: they are dropped before a binding is
+cached, in Valkey or in process, and resolution reads them from the
+graph when a capability is used
+(:func:`~imbi_api.plugins.credentials.read_encrypted_credentials`).
+
+Inside a request (see :func:`request_scope`) the generation and each
+lookup are memoized, so resolving several capabilities -- or the same
+one twice -- costs at most one Valkey round trip per input.  Without
+Valkey the caches are per process and expire after
+:data:`LOCAL_TTL_SECONDS`; the Valkey copies expire after
+:data:`CACHE_TTL_SECONDS` as a backstop for writers that do not call
+:func:`invalidate`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import logging
+import time
+import typing
+from collections import abc
+
+from imbi_common import graph
+from valkey import asyncio as _valkey_asyncio
+
+from imbi_api import caching
+from imbi_api.plugins import assignments, lifecycle
+
+LOGGER = logging.getLogger(__name__)
+
+KEY_PREFIX = 'imbi:plugins:bindings'
+CACHE_TTL_SECONDS = 300
+LOCAL_TTL_SECONDS = 60
+
+_Bindings = tuple[assignments.CapabilityBinding, ...]
+
+_local_bindings: dict[tuple[str, str], tuple[float, int, _Bindings]] = {}
+_local_enabled: tuple[float, int, dict[str, bool]] | None = None
+
+_memo: contextvars.ContextVar[dict[typing.Any, typing.Any] | None] = (
+    contextvars.ContextVar('imbi_binding_memo', default=None)
+)
+
+
+def clear_local_cache() -> None:
+    """Drop every in-process entry (tests and manual resets)."""
+    global _local_enabled
+    _local_bindings.clear()
+    _local_enabled = None
+
+
+@contextlib.contextmanager
+def request_scope() -> abc.Iterator[None]:
+    """Memoize lookups for the duration of one request."""
+    token = _memo.set({})
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+async def _generation(client: _valkey_asyncio.Valkey | None) -> int:
+    memo = _memo.get()
+    if memo is not None and 'gen' in memo:
+        return typing.cast('int', memo['gen'])
+    generation = 0
+    if client is not None:
+        try:
+            raw = await caching.resolve(client.get(f'{KEY_PREFIX}:gen'))
+            if isinstance(raw, bytes):
+                raw = raw.decode()
+            generation = int(typing.cast('str', raw)) if raw else 0
+        except Exception:
+            LOGGER.warning('Failed to read binding generation', exc_info=True)
+    if memo is not None:
+        memo['gen'] = generation
+    return generation
+
+
+def _without_credentials(
+    bindings: abc.Iterable[assignments.CapabilityBinding],
+) -> _Bindings:
+    return tuple(
+        binding._replace(
+            integration={
+                key: value
+                for key, value in binding.integration.items()
+                if key != 'encrypted_credentials'
+            }
+        )
+        for binding in bindings
+    )
+
+
+def _bindings_key(generation: int, project_id: str, kind: str) -> str:
+    return f'{KEY_PREFIX}:{generation}:{project_id}:{kind}'
+
+
+async def _load(
+    client: _valkey_asyncio.Valkey | None, key: str
+) -> _Bindings | None:
+    if client is None:
+        return None
+    try:
+        raw = await caching.resolve(client.get(key))
+    except Exception:
+        LOGGER.warning('Failed to read cached bindings', exc_info=True)
+        return None
+    if not raw:
+        return None
+    try:
+        rows = json.loads(typing.cast('str | bytes', raw))
+        return tuple(assignments.CapabilityBinding(**row) for row in rows)
+    except TypeError, ValueError:
+        return None
+
+
+async def _store(
+    client: _valkey_asyncio.Valkey | None, key: str, bindings: _Bindings
+) -> None:
+    if client is None:
+        return
+    try:
+        await caching.resolve(
+            client.set(
+                key,
+                json.dumps([binding._asdict() for binding in bindings]),
+                ex=CACHE_TTL_SECONDS,
+            )
+        )
+    except Exception:
+        LOGGER.warning('Failed to store cached bindings', exc_info=True)
+
+
+async def effective_bindings(
+    db: graph.Graph, project_id: str, kind: str
+) -> _Bindings:
+    """Cached :func:`~imbi_api.plugins.assignments.effective_bindings`.
+
+    The bindings' Integrations come without ``encrypted_credentials``.
+
+    Raises:
+        LookupError: the project does not exist (never cached).
+    """
+    memo = _memo.get()
+    memo_key = ('bindings', project_id, kind)
+    if memo is not None and memo_key in memo:
+        return typing.cast('_Bindings', memo[memo_key])
+    client = caching.client()
+    generation = await _generation(client)
+    now = time.monotonic()
+    cached = _local_bindings.get((project_id, kind))
+    if (
+        cached is not None
+        and cached[1] == generation
+        and now - cached[0] < LOCAL_TTL_SECONDS
+    ):
+        bindings = cached[2]
+    else:
+        key = _bindings_key(generation, project_id, kind)
+        loaded = await _load(client, key)
+        if loaded is None:
+            bindings = _without_credentials(
+                await assignments.effective_bindings(db, project_id, kind)
+            )
+            await _store(client, key, bindings)
+        else:
+            bindings = loaded
+        _local_bindings[(project_id, kind)] = (now, generation, bindings)
+    if memo is not None:
+        memo[memo_key] = bindings
+    return bindings
+
+
+async def enabled_map(db: graph.Graph) -> dict[str, bool]:
+    """Cached ``{slug: enabled}`` snapshot of ``PluginRegistration``."""
+    global _local_enabled
+    memo = _memo.get()
+    if memo is not None and 'enabled' in memo:
+        return typing.cast('dict[str, bool]', memo['enabled'])
+    generation = await _generation(caching.client())
+    now = time.monotonic()
+    if (
+        _local_enabled is not None
+        and _local_enabled[1] == generation
+        and now - _local_enabled[0] < LOCAL_TTL_SECONDS
+    ):
+        enabled = _local_enabled[2]
+    else:
+        enabled = await lifecycle.get_enabled_map(db)
+        _local_enabled = (now, generation, enabled)
+    if memo is not None:
+        memo['enabled'] = enabled
+    return enabled
+
+
+async def invalidate() -> None:
+    """Retire every cached binding and enabled map, on every pod.
+
+    Best-effort: a Valkey outage must not fail the write that triggered
+    it -- other pods then fall back to :data:`LOCAL_TTL_SECONDS`.
+    """
+    clear_local_cache()
+    memo = _memo.get()
+    if memo is not None:
+        memo.clear()
+    client = caching.client()
+    if client is None:
+        return
+    try:
+        await caching.resolve(client.incr(f'{KEY_PREFIX}:gen'))
+    except Exception:
+        LOGGER.warning('Failed to bump binding generation', exc_info=True)
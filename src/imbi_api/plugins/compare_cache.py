@@ -0,0 +1,194 @@
+"""Content-addressed cache for deployment-plugin ``compare()`` results.
+
+The promotion popover compares every adjacent environment pair each
+time it opens, and the release-notes drafter compares the same
+``base..head`` again when the user asks for notes.  Between two fixed
+commits the answer never changes, so each of those calls spent the
+upstream rate limit (GitHub's, for the GitHub plugin) on a result that
+was already known.
+
+Results are cached in Valkey under
+``imbi:plugins:compare:{integration_id}:{base}:{head}`` for
+:data:`RESULT_TTL_SECONDS`.  Only commit ids are cacheable -- a branch
+or tag name can move, so a ref that is not a (possibly abbreviated)
+hex SHA always goes upstream.
+
+Failed compares are cached too, for :data:`FAILURE_TTL_SECONDS`: a
+SHA that was force-pushed away fails the same way on every popover
+open.  Transient failures -- timeouts, rate limits, missing
+credentials, upstream 5xx -- are never cached.  A cached failure is
+raised as the ``HTTPException`` the plugin raised, or as
+:class:`CompareFailed` for any other error (fresh failures of that
+kind are wrapped the same way, so callers see one type either way).
+
+Concurrent lookups of the same key within a pod share one upstream
+call.  Without Valkey only that coalescing applies.  :func:`stats`
+reports the hit rate.
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import logging
+import re
+import typing
+from collections import abc
+
+import fastapi
+import httpx
+from imbi_common.plugins.base import CompareResult
+from imbi_common.plugins.errors import (
+    PluginCredentialsMissing,
+    PluginRateLimited,
+)
+
+from imbi_api import caching
+
+LOGGER = logging.getLogger(__name__)
+
+KEY_PREFIX = 'imbi:plugins:compare'
+RESULT_TTL_SECONDS = 30 * 86_400
+FAILURE_TTL_SECONDS = 300
+
+_SHA_RE = re.compile(r'^[0-9a-f]{7,64}$')
+_MAX_ERROR_LEN = 500
+#: Plugin HTTP errors that say nothing lasting about the two commits.
+_TRANSIENT_STATUSES = frozenset({401, 403, 408, 429})
+
+_flights: caching.SingleFlight[CompareResult] = caching.SingleFlight()
+_counters: collections.Counter[str] = collections.Counter()
+
+
+class CompareFailed(Exception):
+    """The plugin could not compare the two commits."""
+
+
+def cacheable(base: str, head: str) -> bool:
+    """Whether ``base..head`` names two fixed commits."""
+    return bool(_SHA_RE.match(base) and _SHA_RE.match(head))
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(
+        exc,
+        PluginRateLimited
+        | PluginCredentialsMissing
+        | TimeoutError
+        | httpx.TransportError,
+    ):
+        return True
+    if isinstance(exc, fastapi.HTTPException):
+        return exc.status_code >= 500 or exc.status_code in _TRANSIENT_STATUSES
+    return False
+
+
+def _failure_entry(exc: Exception) -> dict[str, typing.Any]:
+    if isinstance(exc, fastapi.HTTPException):
+        return {
+            'error': str(exc.detail)[:_MAX_ERROR_LEN],
+            'status_code': exc.status_code,
+        }
+    return {'error': str(exc)[:_MAX_ERROR_LEN] or type(exc).__name__}
+
+
+def _raise_failure(entry: dict[str, typing.Any]) -> typing.NoReturn:
+    status_code = entry.get('status_code')
+    if isinstance(status_code, int):
+        raise fastapi.HTTPException(
+            status_code=status_code, detail=entry['error']
+        )
+    raise CompareFailed(entry['error'])
+
+
+def _decode(raw: str) -> CompareResult:
+    entry = json.loads(raw)
+    if 'error' in entry:
+        _counters['negative_hits'] += 1
+        _raise_failure(entry)
+    result = CompareResult.model_validate(entry['result'])
+    _counters['hits'] += 1
+    return result
+
+
+async def _fetch_through(
+    key: str, fetch: abc.Callable[[], abc.Awaitable[CompareResult]]
+) -> CompareResult:
+    client = caching.client()
+    raw = (
+        await caching.load(client, key, 'compare')
+        if client is not None
+        else None
+    )
+    if raw is not None:
+        try:
+            return _decode(raw)
+        except KeyError, TypeError, ValueError:
+            LOGGER.debug('Discarding unreadable cached compare %s', key)
+    _counters['misses'] += 1
+    try:
+        result = await fetch()
+    except Exception as exc:
+        if _is_transient(exc):
+            raise
+        _counters['failures'] += 1
+        entry = _failure_entry(exc)
+        if client is not None:
+            await caching.store(
+                client, key, json.dumps(entry), FAILURE_TTL_SECONDS, 'compare'
+            )
+        if isinstance(exc, fastapi.HTTPException):
+            raise
+        raise CompareFailed(entry['error']) from exc
+    if client is not None:
+        await caching.store(
+            client,
+            key,
+            json.dumps({'result': result.model_dump(mode='json')}),
+            RESULT_TTL_SECONDS,
+            'compare',
+        )
+    return result
+
+
+async def compare(
+    integration_id: str,
+    base: str,
+    head: str,
+    fetch: abc.Callable[[], abc.Awaitable[CompareResult]],
+) -> CompareResult:
+    """Return the cached ``base..head`` comparison, or ``fetch`` it.
+
+    Refs that are not commit ids bypass the cache entirely.
+    """
+    if not cacheable(base, head):
+        _counters['uncacheable'] += 1
+        return await fetch()
+    key = f'{KEY_PREFIX}:{integration_id}:{base}:{head}'
+    if key in _flights:
+        _counters['coalesced'] += 1
+    return await _flights.run(key, lambda: _fetch_through(key, fetch))
+
+
+def clear() -> None:
+    """Reset the counters (tests)."""
+    _counters.clear()
+
+
+def stats() -> dict[str, int]:
+    """Return hit / miss / failure counters for this process.
+
+    Reported under ``caches`` by ``GET /admin/dashboard/status``.
+
+    The hit rate is ``(hits + negative_hits + coalesced) / (hits +
+    negative_hits + coalesced + misses)``; ``uncacheable`` counts
+    compares of branch or tag names that were never eligible.
+    """
+    return {
+        'hits': _counters['hits'],
+        'negative_hits': _counters['negative_hits'],
+        'misses': _counters['misses'],
+        'coalesced': _counters['coalesced'],
+        'failures': _counters['failures'],
+        'uncacheable': _counters['uncacheable'],
+    }
@@ -17,6 +17,8 @@ import fastapi
 from imbi_common import graph
 from imbi_common.auth.encryption import TokenEncryption
 
+from imbi_api.plugins import binding_cache
+
 LOGGER = logging.getLogger(__name__)
 
 # Bounded retries for the credential compare-and-swap. Each retry
@@ -43,6 +45,33 @@ RETURN i.encrypted_credentials AS creds
 LIMIT 1
 """
 
+_READ_CREDS_BY_ID: typing.LiteralString = """
+MATCH (i:Integration {{id: {integration_id}}})
+RETURN i.encrypted_credentials AS creds
+LIMIT 1
+"""
+
+
+def _parse_blob(
+    records: list[dict[str, typing.Any]], integration: str
+) -> tuple[bool, str, dict[str, str]]:
+    if not records:
+        return False, '', {}
+    raw = graph.parse_agtype(records[0].get('creds'))
+    if not raw or not isinstance(raw, str):
+        return True, '', {}
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        LOGGER.warning(
+            'Integration %r credentials blob is not valid JSON', integration
+        )
+        return True, raw, {}
+    if not isinstance(parsed, dict):
+        return True, raw, {}
+    typed = typing.cast('dict[str, typing.Any]', parsed)
+    return True, raw, {k: str(v) for k, v in typed.items() if v}
+
 
 async def _read_encrypted_credentials(
     db: graph.Graph,
@@ -66,23 +95,22 @@ async def _read_encrypted_credentials(
             {'slug': integration_slug, 'org_slug': org_slug},
             ['creds'],
         )
-    if not records:
-        return False, '', {}
-    raw = graph.parse_agtype(records[0].get('creds'))
-    if not raw or not isinstance(raw, str):
-        return True, '', {}
-    try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError:
-        LOGGER.warning(
-            'Integration %r credentials blob is not valid JSON',
-            integration_slug,
-        )
-        return True, raw, {}
-    if not isinstance(parsed, dict):
-        return True, raw, {}
-    typed = typing.cast('dict[str, typing.Any]', parsed)
-    return True, raw, {k: str(v) for k, v in typed.items() if v}
+    return _parse_blob(records, integration_slug)
+
+
+async def read_encrypted_credentials(
+    db: graph.Graph, integration_id: str
+) -> dict[str, str]:
+    """Return ``{field: ciphertext}`` for the Integration ``integration_id``.
+
+    Capability resolution reads credentials through here rather than
+    from the cached bindings, which never hold them.  Empty when the
+    Integration has none (or no longer exists).
+    """
+    records = await db.execute(
+        _READ_CREDS_BY_ID, {'integration_id': integration_id}, ['creds']
+    )
+    return _parse_blob(records, integration_id)[2]
 
 
 async def get_integration_credential_fields(
@@ -177,6 +205,7 @@ async def patch_integration_credentials(
                 ['i'],
             )
         if updated:
+            await binding_cache.invalidate()
             return sorted(current)
     raise fastapi.HTTPException(
         status_code=409,
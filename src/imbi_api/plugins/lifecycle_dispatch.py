@@ -24,7 +24,6 @@ import fastapi
 import nanoid
 import pydantic
 from imbi_common import graph
-from imbi_common.clickhouse import client as ch_client
 from imbi_common.plugins import decrypt_integration_credentials
 from imbi_common.plugins.base import (
     LifecycleCapability,
@@ -36,6 +35,7 @@ from imbi_common.plugins.base import (
 )
 from imbi_common.plugins.errors import PluginCredentialsMissing
 
+from imbi_api import event_buffer
 from imbi_api.auth import permissions
 from imbi_api.identity.host_integration import call_with_identity_retry
 from imbi_api.plugins import call_with_timeout
@@ -439,9 +439,7 @@ async def _emit_events_batch(
         )
     ]
     try:
-        await ch_client.Clickhouse.get_instance().insert(
-            'events', rows, _EVENT_COLUMNS
-        )
+        await event_buffer.write('events', _EVENT_COLUMNS, rows)
     except Exception:
         LOGGER.exception(
             'Failed to emit %d lifecycle events for project %s',
@@ -0,0 +1,150 @@
+"""Short-TTL result cache for plugin log searches and histograms.
+
+The log viewer polls ``search_logs`` and ``get_log_histogram`` on an
+interval, and during an incident several engineers tend to watch the
+same service.  Without a cache every poll re-hydrates identity, mints
+env-scoped credentials and sends an identical query upstream.
+
+Results are cached in-process for
+:attr:`~imbi_api.settings.LogCache.ttl_seconds`, keyed by project,
+resolved integration, environment, identity scope, the normalized
+:class:`~imbi_common.plugins.base.LogQuery` and the time bucket its
+window falls into -- a viewer's default "last 30 minutes" window moves
+with the clock, so start and end are floored to the TTL.  Identical
+queries that arrive while one is in flight wait on that call instead
+of issuing their own.  Failed calls are never cached.
+
+When the integration resolves a per-user identity, the scope is the
+caller's principal, so one user's identity-scoped results are never
+served to another.  Log pages can be large, so unlike
+:mod:`imbi_api.plugins.status_cache` nothing is written to Valkey.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import time
+import typing
+from collections import abc
+
+from imbi_common.plugins.base import LogQuery
+
+from imbi_api import caching, settings
+
+_T = typing.TypeVar('_T')
+
+_entries: collections.OrderedDict[str, tuple[float, typing.Any]] = (
+    collections.OrderedDict()
+)
+_flights: caching.SingleFlight[typing.Any] = caching.SingleFlight()
+_counters: collections.Counter[str] = collections.Counter()
+
+
+def cache_key(
+    kind: str,
+    *,
+    project_id: str,
+    integration_id: str,
+    environment: str | None,
+    scope: str | None,
+    query: LogQuery,
+    **extra: typing.Any,
+) -> str:
+    """Build the cache key for one env-scoped plugin query.
+
+    ``scope`` is the caller's principal for identity-scoped
+    integrations and ``None`` when results are shared by every
+    caller.  ``extra`` carries call-specific inputs such as the
+    histogram ``bucket_count``.
+    """
+    bucket = max(settings.get_log_cache_settings().ttl_seconds, 1)
+    normalized = query.model_dump(mode='json')
+    normalized['start_time'] = int(query.start_time.timestamp()) // bucket
+    normalized['end_time'] = int(query.end_time.timestamp()) // bucket
+    normalized['filters'] = sorted(
+        normalized.get('filters') or [],
+        key=lambda f: json.dumps(f, sort_keys=True),
+    )
+    normalized['levels'] = sorted(normalized.get('levels') or [])
+    parts = [project_id, integration_id, environment, scope, normalized]
+    digest = hashlib.sha256(
+        json.dumps([*parts, extra], sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f'{kind}:{digest}'
+
+
+def _lookup(key: str) -> tuple[bool, typing.Any]:
+    entry = _entries.get(key)
+    if entry is None:
+        return False, None
+    expires, value = entry
+    if time.monotonic() > expires:
+        _entries.pop(key, None)
+        return False, None
+    _entries.move_to_end(key)
+    return True, value
+
+
+def _store(key: str, value: typing.Any, cfg: settings.LogCache) -> None:
+    _entries.pop(key, None)
+    while len(_entries) >= cfg.max_entries:
+        _entries.popitem(last=False)
+        _counters['evictions'] += 1
+    _entries[key] = (time.monotonic() + cfg.ttl_seconds, value)
+
+
+async def _fill(
+    key: str,
+    fetch: abc.Callable[[], abc.Awaitable[_T]],
+    cfg: settings.LogCache,
+) -> _T:
+    value = await fetch()
+    _store(key, value, cfg)
+    return value
+
+
+async def cached(key: str, fetch: abc.Callable[[], abc.Awaitable[_T]]) -> _T:
+    """Return the cached result for ``key``, or ``fetch`` it once.
+
+    Concurrent callers with the same key share a single ``fetch``;
+    its exception, if any, reaches every one of them.
+    """
+    cfg = settings.get_log_cache_settings()
+    if cfg.ttl_seconds <= 0:
+        return await fetch()
+    found, value = _lookup(key)
+    if found:
+        _counters['hits'] += 1
+        return typing.cast('_T', value)
+    if key in _flights:
+        _counters['coalesced'] += 1
+    else:
+        _counters['misses'] += 1
+    return typing.cast(
+        '_T', await _flights.run(key, lambda: _fill(key, fetch, cfg))
+    )
+
+
+def clear() -> None:
+    """Drop every cached result and reset the counters."""
+    _entries.clear()
+    _counters.clear()
+
+
+def stats() -> dict[str, int]:
+    """Return hit / miss / coalesced / eviction counters and size.
+
+    Reported under ``caches`` by ``GET /admin/dashboard/status``.
+
+    The hit rate is ``(hits + coalesced) / (hits + coalesced +
+    misses)``: coalesced callers were served without an upstream call.
+    """
+    return {
+        'hits': _counters['hits'],
+        'misses': _counters['misses'],
+        'coalesced': _counters['coalesced'],
+        'evictions': _counters['evictions'],
+        'size': len(_entries),
+    }
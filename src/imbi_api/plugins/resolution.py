@@ -5,7 +5,10 @@ single Integration for a project + capability kind, honoring the
 effective-bindings + default-all rules (see
 :mod:`imbi_api.plugins.assignments`) and the same ambiguity semantics as
 before -- 404 when nothing is bound, 400 (``?source=<integration_slug>``)
-when several are bound and none is the default.
+when several are bound and none is the default.  Bindings and plugin
+enablement come from :mod:`imbi_api.plugins.binding_cache`; the chosen
+Integration's encrypted credentials are read from the graph, since the
+cached bindings do not carry them.
 """
 
 import logging
@@ -20,10 +23,8 @@ from imbi_common.plugins.errors import (
 )
 from imbi_common.plugins.registry import RegistryEntry, get_plugin
 
-from imbi_api.plugins.assignments import (
-    CapabilityBinding,
-    effective_bindings,
-)
+from imbi_api.plugins import binding_cache, credentials
+from imbi_api.plugins.assignments import CapabilityBinding
 
 LOGGER = logging.getLogger(__name__)
 
@@ -43,7 +44,11 @@ class ResolvedCapability(typing.NamedTuple):
     identity_integration_id: str | None = None
 
 
-def _resolved(binding: CapabilityBinding, kind: str) -> ResolvedCapability:
+def _resolved(
+    binding: CapabilityBinding,
+    kind: str,
+    encrypted_credentials: dict[str, str],
+) -> ResolvedCapability:
     integration = binding.integration
     plugin_slug = str(integration['plugin'])
     entry = get_plugin(plugin_slug)
@@ -62,19 +67,17 @@ def _resolved(binding: CapabilityBinding, kind: str) -> ResolvedCapability:
         integration=integration,
         integration_options=integration.get('options') or {},
         capability_options=binding.capability_options,
-        encrypted_credentials=integration.get('encrypted_credentials') or {},
+        encrypted_credentials=encrypted_credentials,
         env_payloads=binding.env_payloads or None,
         identity_integration_id=binding.identity_integration_id,
     )
 
 
-async def _loaded_and_enabled(
-    db: graph.Graph, binding: CapabilityBinding, kind: str
+def _loaded_and_enabled(
+    binding: CapabilityBinding, kind: str, enabled: dict[str, bool]
 ) -> bool:
     """True when the binding's plugin is loaded, declares ``kind``, and its
     ``PluginRegistration`` is enabled."""
-    from imbi_api.plugins.lifecycle import is_plugin_enabled
-
     plugin_slug = binding.integration.get('plugin')
     if not plugin_slug:
         return False
@@ -84,23 +87,22 @@ async def _loaded_and_enabled(
         return False
     if entry.manifest.get_capability(kind) is None:
         return False
-    return await is_plugin_enabled(db, str(plugin_slug))
+    return enabled.get(str(plugin_slug), False)
 
 
 async def _candidates(
     db: graph.Graph, project_id: str, kind: str
 ) -> list[CapabilityBinding]:
     try:
-        bindings = await effective_bindings(db, project_id, kind)
+        bindings = await binding_cache.effective_bindings(db, project_id, kind)
     except LookupError as exc:
         raise fastapi.HTTPException(
             status_code=404, detail='Project not found'
         ) from exc
-    out: list[CapabilityBinding] = []
-    for binding in bindings:
-        if await _loaded_and_enabled(db, binding, kind):
-            out.append(binding)
-    return out
+    if not bindings:
+        return []
+    enabled = await binding_cache.enabled_map(db)
+    return [b for b in bindings if _loaded_and_enabled(b, kind, enabled)]
 
 
 async def resolve_capability(
@@ -165,8 +167,11 @@ async def resolve_capability(
                 ),
             )
         chosen = defaults[0]
+    encrypted = await credentials.read_encrypted_credentials(
+        db, str(chosen.integration['id'])
+    )
     try:
-        return _resolved(chosen, kind)
+        return _resolved(chosen, kind, encrypted)
     except PluginNotFoundError as exc:
         raise PluginUnavailableError(
             str(chosen.integration.get('plugin'))
@@ -188,8 +193,11 @@ async def resolve_all_capabilities(
     candidates = await _candidates(db, project_id, kind)
     resolved: list[ResolvedCapability] = []
     for binding in candidates:
+        encrypted = await credentials.read_encrypted_credentials(
+            db, str(binding.integration['id'])
+        )
         try:
-            resolved.append(_resolved(binding, kind))
+            resolved.append(_resolved(binding, kind, encrypted))
         except PluginNotFoundError:
             LOGGER.warning(
                 'Skipping unresolvable integration %r during %s fan-out',
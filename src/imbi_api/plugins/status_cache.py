@@ -0,0 +1,187 @@
+"""Shared cache for deployment-plugin CI and workflow-run status.
+
+Every release-train page load asks the deployment plugin for
+``get_check_status`` on each deployed committish and
+``get_deployment_status`` on each in-flight run.  Those answers are
+shared by every viewer of the project -- and a terminal check status
+never changes -- yet each page load used to refetch them against the
+upstream rate limit (GitHub's, for the GitHub plugin).
+
+This module caches both answers in Valkey:
+
+- ``imbi:plugins:status:check:{integration_id}:{project_id}:{committish}``
+- ``imbi:plugins:status:run:{integration_id}:{project_id}:{run_id}``
+
+Keys are scoped to the project as well as the integration: one
+integration serves many repositories, and committishes are short SHAs
+(and run ids plugin-defined) that are only unique within one of them.
+
+Terminal answers (a ``pass`` or ``fail`` check, a finished run) are
+kept for :data:`TERMINAL_TTL_SECONDS`; every other answer only for
+:data:`PENDING_TTL_SECONDS` so a running build or deployment is still
+polled.  Failed upstream calls are never cached.
+
+Concurrent lookups of the same key share one upstream call: within a
+pod through an in-flight task map, and across pods through a short
+``SET NX`` lock whose losers poll for the winner's answer for up to
+:data:`LOCK_WAIT_SECONDS` before falling back to their own call.
+Without Valkey only the in-pod coalescing applies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import typing
+from collections import abc
+
+from imbi_common.plugins.base import CheckStatus, DeploymentRun
+from valkey import asyncio as _valkey_asyncio
+
+from imbi_api import caching
+
+LOGGER = logging.getLogger(__name__)
+
+KEY_PREFIX = 'imbi:plugins:status'
+TERMINAL_TTL_SECONDS = 86_400
+PENDING_TTL_SECONDS = 15
+LOCK_TTL_SECONDS = 30
+LOCK_WAIT_SECONDS = 2.0
+LOCK_POLL_SECONDS = 0.1
+
+#: Check statuses that no longer change once reported.
+TERMINAL_CHECK_STATUSES: frozenset[CheckStatus] = frozenset({'pass', 'fail'})
+#: Check statuses that can still change as check runs progress: a
+#: ``warn`` may be a run still in flight, and any status added to
+#: :data:`CheckStatus` later is treated as pending until listed above.
+PENDING_CHECK_STATUSES: frozenset[CheckStatus] = (
+    frozenset(typing.get_args(CheckStatus)) - TERMINAL_CHECK_STATUSES
+)
+#: Workflow run statuses that can still change.
+PENDING_RUN_STATUSES = frozenset({'queued', 'in_progress'})
+
+_T = typing.TypeVar('_T')
+
+_flights: caching.SingleFlight[typing.Any] = caching.SingleFlight()
+
+
+async def _acquire(client: _valkey_asyncio.Valkey, key: str) -> bool:
+    """Take the cross-pod fetch lock; ``True`` means fetch upstream."""
+    try:
+        return bool(
+            await caching.resolve(
+                client.set(f'{key}:lock', '1', nx=True, ex=LOCK_TTL_SECONDS)
+            )
+        )
+    except Exception:
+        LOGGER.warning('Failed to take status lock %s', key, exc_info=True)
+        return True
+
+
+async def _release(client: _valkey_asyncio.Valkey, key: str) -> None:
+    try:
+        await caching.resolve(client.delete(f'{key}:lock'))
+    except Exception:
+        LOGGER.warning('Failed to drop status lock %s', key, exc_info=True)
+
+
+async def _wait_for(client: _valkey_asyncio.Valkey, key: str) -> str | None:
+    """Poll for another pod's answer while it holds the lock."""
+    deadline = time.monotonic() + LOCK_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_SECONDS)
+        raw = await caching.load(client, key, 'status')
+        if raw is not None:
+            return raw
+    return None
+
+
+async def _fetch_through(
+    key: str,
+    fetch: abc.Callable[[], abc.Awaitable[_T]],
+    encode: abc.Callable[[_T], str],
+    decode: abc.Callable[[str], _T],
+    ttl: abc.Callable[[_T], int],
+) -> _T:
+    client = caching.client()
+    if client is None:
+        return await fetch()
+    raw = await caching.load(client, key, 'status')
+    locked = False
+    if raw is None:
+        locked = await _acquire(client, key)
+        if not locked:
+            raw = await _wait_for(client, key)
+    if raw is not None:
+        try:
+            return decode(raw)
+        except TypeError, ValueError:
+            LOGGER.debug('Discarding unreadable cached status %s', key)
+    try:
+        value = await fetch()
+        await caching.store(client, key, encode(value), ttl(value), 'status')
+        return value
+    finally:
+        if locked:
+            await _release(client, key)
+
+
+async def _single_flight(
+    key: str,
+    fetch: abc.Callable[[], abc.Awaitable[_T]],
+    encode: abc.Callable[[_T], str],
+    decode: abc.Callable[[str], _T],
+    ttl: abc.Callable[[_T], int],
+) -> _T:
+    return typing.cast(
+        '_T',
+        await _flights.run(
+            key, lambda: _fetch_through(key, fetch, encode, decode, ttl)
+        ),
+    )
+
+
+def _check_ttl(status: CheckStatus) -> int:
+    if status in TERMINAL_CHECK_STATUSES:
+        return TERMINAL_TTL_SECONDS
+    return PENDING_TTL_SECONDS
+
+
+def _run_ttl(run: DeploymentRun) -> int:
+    if run.status in PENDING_RUN_STATUSES:
+        return PENDING_TTL_SECONDS
+    return TERMINAL_TTL_SECONDS
+
+
+async def check_status(
+    integration_id: str,
+    project_id: str,
+    committish: str,
+    fetch: abc.Callable[[], abc.Awaitable[CheckStatus]],
+) -> CheckStatus:
+    """Return the cached CI status for ``committish``, or ``fetch`` it."""
+    return await _single_flight(
+        f'{KEY_PREFIX}:check:{integration_id}:{project_id}:{committish}',
+        fetch,
+        json.dumps,
+        lambda raw: typing.cast('CheckStatus', json.loads(raw)),
+        _check_ttl,
+    )
+
+
+async def deployment_status(
+    integration_id: str,
+    project_id: str,
+    run_id: str,
+    fetch: abc.Callable[[], abc.Awaitable[DeploymentRun]],
+) -> DeploymentRun:
+    """Return the cached status of workflow run ``run_id``, or ``fetch``."""
+    return await _single_flight(
+        f'{KEY_PREFIX}:run:{integration_id}:{project_id}:{run_id}',
+        fetch,
+        lambda run: run.model_dump_json(),
+        DeploymentRun.model_validate_json,
+        _run_ttl,
+    )
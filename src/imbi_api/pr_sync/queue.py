@@ -22,6 +22,7 @@ from imbi_common import graph
 from imbi_common.plugins.errors import PluginRateLimited
 from valkey import asyncio as valkey
 
+from imbi_api import stream_workers
 from imbi_api.pr_sync.service import (
     PRSyncUnavailable,
     run_sync,
@@ -234,26 +235,47 @@ async def _handle_entries(
     entries: list[tuple[bytes, abc.Mapping[bytes | str, bytes | str]]],
     db: graph.Graph,
     check_dlq: bool = False,
+    limiter: stream_workers.AdaptiveConcurrency | None = None,
 ) -> None:
+    """Run one batch through the worker pool (serially without *limiter*).
+
+    Different projects run concurrently up to the limiter's limit; one
+    project's entries run in stream order.
+    """
+    batch: list[stream_workers.Entry] = []
     for msg_id, raw_fields in entries:
         fields = _decode_fields(raw_fields)
         if check_dlq and await _maybe_dead_letter(client, msg_id, fields):
             continue
+        batch.append((msg_id, fields))
+
+    async def handle(msg_id: bytes, fields: dict[str, str]) -> bool:
         try:
             await _process_message(db, fields)
-        except PluginRateLimited as exc:
-            await _pause_until(client, exc.retry_at)
-            LOGGER.warning(
-                'pr-sync paused ~%.0fs (GitHub rate limit); %d job(s) '
-                'left queued',
-                max(0.0, exc.retry_at - time.time()),
-                len(entries),
-            )
-            return
+        except PluginRateLimited:
+            raise
         except Exception:
             LOGGER.exception('pr-sync failed for %s', fields)
-            continue
+            return False
         await client.xack(STREAM, GROUP, msg_id)
+        return True
+
+    limited = await stream_workers.dispatch(
+        batch,
+        handle,
+        limiter or stream_workers.AdaptiveConcurrency(1),
+        stream_workers.stream_stats(STREAM),
+    )
+    if limited is not None:
+        # Don't ack, don't dead-letter: jobs that had not started stay
+        # pending, and every worker pauses until GitHub resets; the next
+        # reclaim drains them once the pause clears.
+        await _pause_until(client, limited.retry_at)
+        LOGGER.warning(
+            'pr-sync paused ~%.0fs (GitHub rate limit); %d job(s) left queued',
+            max(0.0, limited.retry_at - time.time()),
+            len(batch),
+        )
 
 
 async def consume_pr_sync(
@@ -261,8 +283,18 @@ async def consume_pr_sync(
     db: graph.Graph,
     consumer: str | None = None,
     stop: asyncio.Event | None = None,
+    *,
+    concurrency: int = 1,
+    recover_after: int = 8,
 ) -> None:
-    """Run the PR-sync consumer loop until *stop* is set."""
+    """Run the PR-sync consumer loop until *stop* is set.
+
+    Up to *concurrency* jobs run at once, backing off on rate limits;
+    see :mod:`imbi_api.stream_workers`.
+    """
+    limiter = stream_workers.AdaptiveConcurrency(
+        concurrency, recover_after=recover_after
+    )
     consumer = (
         consumer or f'{CONSUMER_PREFIX}-{socket.gethostname()}-{os.getpid()}'
     )
@@ -276,7 +308,9 @@ async def consume_pr_sync(
         stale = await _claim_stale(client, consumer)
         if stale:
             try:
-                await _handle_entries(client, stale, db, check_dlq=True)
+                await _handle_entries(
+                    client, stale, db, check_dlq=True, limiter=limiter
+                )
             except Exception:
                 LOGGER.exception('pr-sync stale-entry handling failed')
                 await asyncio.sleep(1)
@@ -288,7 +322,7 @@ async def consume_pr_sync(
                 GROUP,
                 consumer,
                 {STREAM: '>'},
-                count=16,
+                count=max(16, concurrency),
                 block=2000,
             )
         except Exception:
@@ -301,7 +335,7 @@ async def consume_pr_sync(
             'list[tuple[object, list[typing.Any]]]', response
         ):
             try:
-                await _handle_entries(client, entries, db)
+                await _handle_entries(client, entries, db, limiter=limiter)
             except Exception:
                 LOGGER.exception('pr-sync entry handling failed')
                 await asyncio.sleep(1)
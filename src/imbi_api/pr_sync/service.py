@@ -25,6 +25,7 @@ from imbi_common import graph
 from imbi_common.plugins import decrypt_integration_credentials
 from imbi_common.plugins.base import PluginContext, PullRequestSyncCapability
 
+from imbi_api import release_state
 from imbi_api.identity import attribution
 from imbi_api.plugins.resolution import (
     ResolvedCapability,
@@ -120,7 +121,8 @@ async def run_sync(db: graph.Graph, org_slug: str, project_id: str) -> int:
 
     Returns the number of PRs recorded.  Raises :class:`PRSyncUnavailable`
     when no integration provides the capability; other failures propagate
-    so the caller can record them.
+    so the caller can record them.  Merged PRs record their merge
+    commits, so the project's release state is refreshed afterwards.
     """
     try:
         resolved = await resolve_capability(
@@ -135,7 +137,9 @@ async def run_sync(db: graph.Graph, org_slug: str, project_id: str) -> int:
     handler = typing.cast(
         'PullRequestSyncCapability', resolved.capability_cls()
     )
-    return await handler.sync_all_history(ctx=ctx, credentials=credentials)
+    synced = await handler.sync_all_history(ctx=ctx, credentials=credentials)
+    await release_state.refresh([project_id])
+    return synced
 
 
 def _now_iso() -> str:
@@ -0,0 +1,247 @@
+"""ClickHouse dimension table of project -> org / team / archived.
+
+Org-scoped ClickHouse listings (the org pull-request list and PR
+activity) used to resolve every project id in the org from the graph
+and send the whole list back as an ``IN {project_ids:Array(String)}``
+parameter, so the payload -- and the graph traversal behind it -- grew
+with the org.  This module keeps a ``project_membership`` table in
+ClickHouse instead, and :func:`org_filter` scopes those queries with a
+server-side subquery against it.
+
+The table is a ``ReplacingMergeTree`` keyed by ``project_id``: each
+write is a full row versioned by ``synced_at`` and deletes are
+tombstones (``is_deleted = 1``), so readers use ``FINAL``.  It is kept
+in sync from the graph writes that change membership:
+
+- :func:`record_project` after a project is created, moved between
+  teams or (un)archived;
+- :func:`remove_project` after a project is deleted;
+- :func:`sync_org` after a change that cascades through an org (team
+  rename or delete, org rename);
+- :func:`remove_org` after an org is deleted.
+
+:func:`sync_all` rebuilds the whole table from the graph as a backstop
+for writers that do not report their changes.  The maintenance worker
+runs it through :func:`sync_all_leased`, so one process per lease
+window does the full graph scan rather than every process at boot.
+All writes are best-effort: a failure is logged and left for the next
+sync.
+
+The syncs read ClickHouse before the graph and version every row they
+write with the time the sync started.  A project created while a sync
+runs is therefore never tombstoned by it, and a project deleted while
+a sync runs keeps its newer tombstone.
+"""
+
+import datetime
+import logging
+import typing
+
+from imbi_common import clickhouse, graph
+from valkey import asyncio as valkey
+
+from imbi_api import event_buffer
+
+LOGGER = logging.getLogger(__name__)
+
+TABLE = 'project_membership'
+SYNC_LEASE_KEY = 'imbi:project-membership:sync'
+#: A full rebuild runs at most once per lease window across processes.
+SYNC_LEASE_SECONDS = 21_600
+COLUMNS = (
+    'project_id',
+    'org_slug',
+    'team_slug',
+    'archived',
+    'is_deleted',
+    'synced_at',
+)
+
+_DDL = (
+    f'CREATE TABLE IF NOT EXISTS {TABLE} ('
+    ' project_id String,'
+    ' org_slug LowCardinality(String),'
+    ' team_slug LowCardinality(String),'
+    ' archived Bool,'
+    ' is_deleted UInt8,'
+    ' synced_at DateTime64(3)'
+    ') ENGINE = ReplacingMergeTree(synced_at)'
+    ' ORDER BY project_id'
+)
+
+_PROJECTS_QUERY: typing.LiteralString = (
+    'MATCH (p:Project)-[:OWNED_BY]->(t:Team)-[:BELONGS_TO]->(o:Organization)'
+)
+_RETURN: typing.LiteralString = (
+    ' RETURN p.id AS project_id, o.slug AS org_slug, t.slug AS team_slug,'
+    ' coalesce(p.archived, false) AS archived'
+)
+_ROW_COLUMNS = ['project_id', 'org_slug', 'team_slug', 'archived']
+
+
+async def ensure_schema() -> None:
+    """Create the membership table when it does not exist."""
+    await clickhouse.query(_DDL)
+
+
+def org_filter(column: str = 'project_id') -> str:
+    """Return a predicate limiting ``column`` to an org's projects.
+
+    The org slug is bound as ``{org_slug:String}``; the caller adds
+    ``org_slug`` to its query parameters.  Archived projects are
+    included, matching the graph traversal this replaces.
+    """
+    return (
+        f'{column} IN (SELECT project_id FROM {TABLE} FINAL'  # noqa: S608
+        ' WHERE org_slug = {org_slug:String} AND is_deleted = 0)'
+    )
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC)
+
+
+def _graph_rows(
+    records: list[dict[str, typing.Any]],
+    synced_at: datetime.datetime,
+) -> list[list[typing.Any]]:
+    rows: list[list[typing.Any]] = []
+    for record in records:
+        project_id = graph.parse_agtype(record['project_id'])
+        if not project_id:
+            continue
+        rows.append(
+            [
+                str(project_id),
+                str(graph.parse_agtype(record['org_slug']) or ''),
+                str(graph.parse_agtype(record['team_slug']) or ''),
+                bool(graph.parse_agtype(record['archived'])),
+                0,
+                synced_at,
+            ]
+        )
+    return rows
+
+
+def _tombstones(
+    project_ids: typing.Iterable[str],
+    synced_at: datetime.datetime,
+) -> list[list[typing.Any]]:
+    return [[pid, '', '', False, 1, synced_at] for pid in project_ids]
+
+
+async def _write(rows: list[list[typing.Any]]) -> None:
+    if not rows:
+        return
+    try:
+        await event_buffer.write(TABLE, COLUMNS, rows)
+    except Exception:
+        LOGGER.warning('Failed to write project membership', exc_info=True)
+
+
+async def _live_ids(org_slug: str | None) -> set[str]:
+    """Return the non-deleted project ids ClickHouse holds."""
+    sql = (
+        f'SELECT project_id FROM {TABLE} FINAL'  # noqa: S608
+        ' WHERE is_deleted = 0'
+    )
+    params: dict[str, typing.Any] = {}
+    if org_slug is not None:
+        sql += ' AND org_slug = {org_slug:String}'
+        params['org_slug'] = org_slug
+    rows = await clickhouse.query(sql, params)
+    return {str(row['project_id']) for row in rows}
+
+
+async def record_project(
+    project_id: str,
+    org_slug: str,
+    team_slug: str,
+    archived: bool,
+) -> None:
+    """Write a project's org, team and archived state after a change."""
+    await _write([[project_id, org_slug, team_slug, archived, 0, _now()]])
+
+
+async def remove_project(project_id: str) -> None:
+    """Tombstone a deleted project."""
+    await _write(_tombstones([project_id], _now()))
+
+
+async def remove_org(org_slug: str) -> None:
+    """Tombstone every project ClickHouse holds for a deleted org."""
+    try:
+        stale = await _live_ids(org_slug)
+    except Exception:
+        LOGGER.warning(
+            'Failed to remove project membership for %s',
+            org_slug,
+            exc_info=True,
+        )
+        return
+    await _write(_tombstones(sorted(stale), _now()))
+
+
+async def sync_org(db: graph.Graph, org_slug: str) -> None:
+    """Rewrite every project of ``org_slug`` and drop ones that left."""
+    synced_at = _now()
+    try:
+        stale = await _live_ids(org_slug)
+        records = await db.execute(
+            _PROJECTS_QUERY + ' WHERE o.slug = {org_slug}' + _RETURN,
+            {'org_slug': org_slug},
+            _ROW_COLUMNS,
+        )
+    except Exception:
+        LOGGER.warning(
+            'Failed to sync project membership for %s',
+            org_slug,
+            exc_info=True,
+        )
+        return
+    rows = _graph_rows(records, synced_at)
+    stale.difference_update(row[0] for row in rows)
+    await _write(rows + _tombstones(sorted(stale), synced_at))
+
+
+async def sync_all(db: graph.Graph) -> None:
+    """Rebuild the membership table from the graph."""
+    synced_at = _now()
+    stale = await _live_ids(None)
+    records = await db.execute(_PROJECTS_QUERY + _RETURN, {}, _ROW_COLUMNS)
+    rows = _graph_rows(records, synced_at)
+    stale.difference_update(row[0] for row in rows)
+    await _write(rows + _tombstones(sorted(stale), synced_at))
+    LOGGER.info(
+        'Synced project membership: %d projects, %d removed',
+        len(rows),
+        len(stale),
+    )
+
+
+async def sync_all_leased(db: graph.Graph, client: valkey.Valkey) -> bool:
+    """Run :func:`sync_all` unless another process has within the lease.
+
+    The lease is a Valkey ``SET NX EX`` key left to expire after a
+    successful rebuild; a failed rebuild drops it so the next process
+    to start retries.  Returns ``True`` when this process ran the sync.
+    """
+    try:
+        acquired = await client.set(
+            SYNC_LEASE_KEY, b'1', ex=SYNC_LEASE_SECONDS, nx=True
+        )
+    except Exception:
+        LOGGER.exception('project membership sync lease acquisition failed')
+        return False
+    if not acquired:
+        LOGGER.debug('project membership synced recently; skipping')
+        return False
+    try:
+        await sync_all(db)
+    except BaseException:
+        try:
+            await client.delete(SYNC_LEASE_KEY)
+        except Exception:
+            LOGGER.exception('releasing project membership sync lease failed')
+        raise
+    return True
@@ -0,0 +1,377 @@
+"""Materialized per-project release state in ClickHouse.
+
+The release-drift endpoint and the projects list both need the same
+facts about a releasable project: its latest release tag, HEAD, and
+how many commits landed since the tag.  They used to rebuild them on
+every request from ``tags FINAL`` and ``commits FINAL`` -- all of a
+project's tags, the semver max picked in Python, then HEAD, the tag's
+base commit and a count -- five sequential round trips for one
+project's drift, repeated per project by the list.
+
+This module keeps one ``release_state`` row per project instead.
+:func:`refresh` recomputes rows in batch (four queries however many
+projects) and writes them; the sync workers call it after they record
+commits and tags.  :func:`get` is the read side: one point lookup
+against the ``ReplacingMergeTree``.  Projects without a row are
+computed inline and written; rows older than :data:`STALE_AFTER` are
+served as-is and refreshed in the background, which covers commits
+and tags recorded by writers outside this service (webhook ingest).
+
+The latest release is the highest semver tag (non-semver tags only
+count when there is no semver tag at all), and ``commits_since_tag``
+counts commits authored after the tag's commit.  When the tag's commit
+has not been synced the delta cannot be bounded, so the count is 0.
+"""
+
+import asyncio
+import datetime
+import logging
+import re
+import typing
+
+import pydantic
+from imbi_common import clickhouse
+
+from imbi_api import event_buffer
+
+LOGGER = logging.getLogger(__name__)
+
+TABLE = 'release_state'
+COLUMNS = (
+    'project_id',
+    'latest_tag',
+    'latest_tag_sha',
+    'latest_tag_at',
+    'latest_tag_author',
+    'latest_tag_semver',
+    'base_authored_at',
+    'head_sha',
+    'head_short_sha',
+    'head_author',
+    'head_author_login',
+    'head_authored_at',
+    'commits_since_tag',
+    'computed_at',
+)
+STALE_AFTER = datetime.timedelta(minutes=5)
+
+_DDL = (
+    f'CREATE TABLE IF NOT EXISTS {TABLE} ('
+    ' project_id String,'
+    ' latest_tag Nullable(String),'
+    ' latest_tag_sha Nullable(String),'
+    ' latest_tag_at Nullable(DateTime64(3)),'
+    ' latest_tag_author Nullable(String),'
+    ' latest_tag_semver Bool,'
+    ' base_authored_at Nullable(DateTime64(3)),'
+    ' head_sha Nullable(String),'
+    ' head_short_sha Nullable(String),'
+    ' head_author Nullable(String),'
+    ' head_author_login Nullable(String),'
+    ' head_authored_at Nullable(DateTime64(3)),'
+    ' commits_since_tag UInt32,'
+    ' computed_at DateTime64(3)'
+    ') ENGINE = ReplacingMergeTree(computed_at)'
+    ' ORDER BY project_id'
+)
+
+_SEMVER_RE = re.compile(r'^v?(\d+)\.(\d+)\.(\d+)(?:[-+].*)?$')
+
+# Keep references to background refreshes so they are not collected
+# mid-flight, and so a project is only refreshed once at a time.
+_refreshing: dict[str, asyncio.Task[None]] = {}
+
+
+class ReleaseState(pydantic.BaseModel):
+    """A project's latest release tag, HEAD and the drift between them."""
+
+    project_id: str
+    latest_tag: str | None = None
+    latest_tag_sha: str | None = None
+    latest_tag_at: datetime.datetime | None = None
+    latest_tag_author: str | None = None
+    latest_tag_semver: bool = False
+    #: ``authored_at`` of the tag's commit; ``None`` when not synced.
+    base_authored_at: datetime.datetime | None = None
+    head_sha: str | None = None
+    head_short_sha: str | None = None
+    head_author: str | None = None
+    head_author_login: str | None = None
+    head_authored_at: datetime.datetime | None = None
+    commits_since_tag: int = 0
+    computed_at: datetime.datetime
+
+    @property
+    def base_missing(self) -> bool:
+        """The project is tagged but the tag's commit is not synced."""
+        return (
+            self.latest_tag_sha is not None and self.base_authored_at is None
+        )
+
+    def row(self) -> list[typing.Any]:
+        """The state as a ``release_state`` row, in :data:`COLUMNS` order."""
+        return [getattr(self, column) for column in COLUMNS]
+
+
+async def ensure_schema() -> None:
+    """Create the release state table when it does not exist."""
+    await clickhouse.query(_DDL)
+
+
+def semver_key(name: str) -> tuple[int, int, int] | None:
+    """``(major, minor, patch)`` for version ordering; ``None`` if not semver.
+
+    Pre-release / build metadata is ignored for ordering -- good enough to
+    pick the newest *released* version and to sort the history list.
+    """
+    match = _SEMVER_RE.match(name)
+    if not match:
+        return None
+    major, minor, patch = (int(part) for part in match.groups())
+    return (major, minor, patch)
+
+
+def release_tag_order_key(
+    name: str, when: typing.Any
+) -> tuple[bool, tuple[int, int, int], str]:
+    """Sort key ranking the latest *release* first.
+
+    Semver-shaped tags outrank non-semver ones; within those, the highest
+    version wins, with the newer timestamp as a tie-break. This deliberately
+    ignores tag/commit *timestamps* for the primary ordering so a backported
+    or late-synced lower version (e.g. ``v4.1.3`` tagged after ``v7.1.0``)
+    can't masquerade as the latest release.
+    """
+    key = semver_key(name)
+    when_key = when.isoformat() if isinstance(when, datetime.datetime) else ''
+    return (key is not None, key or (0, 0, 0), when_key)
+
+
+def latest_release_tag(
+    rows: list[dict[str, typing.Any]],
+) -> dict[str, typing.Any] | None:
+    """Pick the latest release tag (highest semver) from ``tags`` rows."""
+    if not rows:
+        return None
+    return max(
+        rows,
+        key=lambda r: release_tag_order_key(
+            str(r['name']), r.get('tagged_at') or r.get('recorded_at')
+        ),
+    )
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC)
+
+
+def _opt_str(value: typing.Any) -> str | None:
+    return str(value) if value else None
+
+
+def _opt_datetime(value: typing.Any) -> datetime.datetime | None:
+    if not isinstance(value, datetime.datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.UTC)
+    return value
+
+
+async def compute(project_ids: list[str]) -> dict[str, ReleaseState]:
+    """Compute the release state of ``project_ids`` from ClickHouse.
+
+    Every requested project gets a state, empty when it has neither
+    commits nor tags.
+    """
+    if not project_ids:
+        return {}
+    tag_rows, head_rows = await asyncio.gather(
+        clickhouse.query(
+            'SELECT project_id, name, sha, tagged_at, recorded_at,'
+            ' tagger_name FROM tags FINAL'
+            ' WHERE project_id IN {project_ids:Array(String)}',
+            {'project_ids': project_ids},
+        ),
+        clickhouse.query(
+            'SELECT project_id, sha, short_sha,'
+            ' author_name, author_user, authored_at'
+            ' FROM commits FINAL'
+            ' WHERE project_id IN {project_ids:Array(String)}'
+            ' ORDER BY pushed_at DESC, authored_at DESC'
+            ' LIMIT 1 BY project_id',
+            {'project_ids': project_ids},
+        ),
+    )
+    tags_by_project: dict[str, list[dict[str, typing.Any]]] = {}
+    for row in tag_rows:
+        tags_by_project.setdefault(str(row['project_id']), []).append(row)
+    heads = {str(row['project_id']): row for row in head_rows}
+    latest = {
+        pid: latest_release_tag(tags_by_project.get(pid, []))
+        for pid in project_ids
+    }
+
+    base_at: dict[str, datetime.datetime] = {}
+    tag_shas = {pid: str(tag['sha']) for pid, tag in latest.items() if tag}
+    if tag_shas:
+        base_rows = await clickhouse.query(
+            'SELECT project_id, sha, authored_at FROM commits FINAL'
+            ' WHERE project_id IN {pids:Array(String)}'
+            ' AND sha IN {shas:Array(String)}'
+            ' LIMIT 1 BY project_id, sha',
+            {
+                'pids': list(tag_shas),
+                'shas': sorted(set(tag_shas.values())),
+            },
+        )
+        for row in base_rows:
+            pid = str(row['project_id'])
+            when = _opt_datetime(row.get('authored_at'))
+            if tag_shas.get(pid) == str(row['sha']) and when is not None:
+                base_at[pid] = when
+
+    # Untagged projects count every commit: a project missing from the
+    # cutoff map reads the DateTime64 default (the epoch).  Tagged
+    # projects whose base commit is not synced are left out entirely.
+    counted = [
+        pid for pid in project_ids if pid in base_at or pid not in tag_shas
+    ]
+    counts: dict[str, int] = {}
+    if counted:
+        # mapFromArrays rather than a Map parameter: clickhouse-connect
+        # binds dicts as JSON, which ClickHouse's Map parser rejects.
+        count_rows = await clickhouse.query(
+            'SELECT project_id,'
+            ' countIf(authored_at > mapFromArrays('
+            '{cut_pids:Array(String)},'
+            ' {cuts:Array(DateTime64(3))})[project_id]) AS c'
+            ' FROM commits FINAL'
+            ' WHERE project_id IN {pids:Array(String)}'
+            ' GROUP BY project_id',
+            {
+                'pids': counted,
+                'cut_pids': list(base_at),
+                'cuts': list(base_at.values()),
+            },
+        )
+        counts = {str(row['project_id']): int(row['c']) for row in count_rows}
+
+    computed_at = _now()
+    result: dict[str, ReleaseState] = {}
+    for pid in project_ids:
+        tag = latest[pid]
+        head = heads.get(pid) or {}
+        head_sha = _opt_str(head.get('sha'))
+        result[pid] = ReleaseState(
+            project_id=pid,
+            latest_tag=str(tag['name']) if tag else None,
+            latest_tag_sha=str(tag['sha']) if tag else None,
+            latest_tag_at=(
+                _opt_datetime(tag.get('tagged_at') or tag.get('recorded_at'))
+                if tag
+                else None
+            ),
+            latest_tag_author=(
+                _opt_str(tag.get('tagger_name')) if tag else None
+            ),
+            latest_tag_semver=bool(tag and semver_key(str(tag['name']))),
+            base_authored_at=base_at.get(pid),
+            head_sha=head_sha,
+            head_short_sha=(
+                str(head.get('short_sha') or head_sha)[:7]
+                if head_sha
+                else None
+            ),
+            head_author=_opt_str(
+                head.get('author_name') or head.get('author_user')
+            ),
+            head_author_login=_opt_str(head.get('author_user')),
+            head_authored_at=_opt_datetime(head.get('authored_at')),
+            commits_since_tag=counts.get(pid, 0),
+            computed_at=computed_at,
+        )
+    return result
+
+
+async def _store(states: dict[str, ReleaseState]) -> None:
+    try:
+        await event_buffer.write(
+            TABLE, COLUMNS, [state.row() for state in states.values()]
+        )
+    except Exception:
+        LOGGER.warning('Failed to write release state', exc_info=True)
+
+
+async def refresh(project_ids: list[str]) -> dict[str, ReleaseState]:
+    """Recompute and store the release state of ``project_ids``.
+
+    Called after commits or tags are recorded.  Best-effort: a failure
+    is logged and the previous rows are kept until the next refresh.
+    """
+    try:
+        states = await compute(project_ids)
+    except Exception:
+        LOGGER.warning(
+            'Failed to refresh release state for %s',
+            ', '.join(project_ids),
+            exc_info=True,
+        )
+        return {}
+    await _store(states)
+    return states
+
+
+def _refresh_later(project_ids: list[str]) -> None:
+    pending = [pid for pid in project_ids if pid not in _refreshing]
+    if not pending:
+        return
+
+    async def run() -> None:
+        try:
+            await refresh(pending)
+        finally:
+            for pid in pending:
+                _refreshing.pop(pid, None)
+
+    task = asyncio.get_running_loop().create_task(run())
+    for pid in pending:
+        _refreshing[pid] = task
+
+
+async def get(project_ids: list[str]) -> dict[str, ReleaseState]:
+    """Return ``{project_id: ReleaseState}`` with one point lookup.
+
+    Projects without a stored row are computed and stored before
+    returning; stale rows are returned and refreshed in the background.
+    """
+    if not project_ids:
+        return {}
+    rows = await clickhouse.query(
+        f'SELECT {", ".join(COLUMNS)} FROM {TABLE} FINAL'  # noqa: S608
+        ' WHERE project_id IN {project_ids:Array(String)}',
+        {'project_ids': project_ids},
+    )
+    states: dict[str, ReleaseState] = {}
+    for row in rows:
+        state = ReleaseState.model_validate(
+            {
+                **row,
+                'computed_at': _opt_datetime(row.get('computed_at')),
+            }
+        )
+        states[state.project_id] = state
+    cutoff = _now() - STALE_AFTER
+    stale = [pid for pid, s in states.items() if s.computed_at < cutoff]
+    if stale:
+        _refresh_later(stale)
+    missing = [pid for pid in project_ids if pid not in states]
+    if missing:
+        computed = await compute(missing)
+        await _store(computed)
+        states.update(computed)
+    return states
+
+
+def clear() -> None:
+    """Forget pending background refreshes (tests)."""
+    _refreshing.clear()
@@ -0,0 +1,160 @@
+"""Daily ClickHouse rollups behind the activity tiles.
+
+The dashboard, operations-log summary and user-activity tiles count
+rows per day out of ``operations_log`` and ``pull_requests`` (both
+``ReplacingMergeTree`` tables read ``FINAL``) and ``events``.  Each
+source gets a refreshable materialized view that ClickHouse rebuilds
+every hour with one row per day and dimension combination, covering
+the closed days of the last :data:`HORIZON_DAYS`.
+
+Refreshing from ``FINAL`` keeps the rollups exact under the replace
+and tombstone semantics of the source tables -- an insert-triggered
+view would count every version of an updated row.  Every rollup row
+carries the ``[horizon, through)`` day range its refresh covered, so
+:func:`source` can stitch the rollup to the raw table for anything
+outside it: the current partial day, days closed since the last
+refresh, and partial days at the edges of the requested window.
+
+Days are bucketed with ``toDate`` on the server, as the raw queries
+always have, so the split assumes a UTC ClickHouse server.
+"""
+
+import datetime
+import typing
+
+from imbi_common import clickhouse
+
+HORIZON_DAYS = 400
+REFRESH_INTERVAL = '1 HOUR'
+
+_FIRST_DAY = datetime.date(1970, 1, 1)
+_LAST_DAY = datetime.date(2149, 6, 6)
+
+
+class Rollup(typing.NamedTuple):
+    """A daily rollup and the raw table it summarizes."""
+
+    table: str
+    source: str
+    timestamp: str
+    dimensions: tuple[str, ...]
+    #: Row predicate on the raw table that the rollup already applies.
+    source_filter: str = '1'
+
+
+OPERATIONS_LOG = Rollup(
+    table='operations_log_daily',
+    source='operations_log FINAL',
+    timestamp='occurred_at',
+    dimensions=(
+        'entry_type',
+        'environment_slug',
+        'project_id',
+        'project_slug',
+        'ticket_slug',
+        'performed_by',
+    ),
+    source_filter='is_deleted = 0',
+)
+EVENTS = Rollup(
+    table='events_daily',
+    source='events',
+    timestamp='recorded_at',
+    dimensions=('attributed_to',),
+)
+PULL_REQUESTS = Rollup(
+    table='pull_requests_daily',
+    source='pull_requests FINAL',
+    timestamp='created_at',
+    dimensions=(),
+)
+
+ROLLUPS: tuple[Rollup, ...] = (OPERATIONS_LOG, EVENTS, PULL_REQUESTS)
+
+
+def _view_ddl(rollup: Rollup) -> str:
+    dims = ''.join(f', {dim}' for dim in rollup.dimensions)
+    return (
+        f'CREATE MATERIALIZED VIEW IF NOT EXISTS {rollup.table}'  # noqa: S608
+        f' REFRESH EVERY {REFRESH_INTERVAL}'
+        ' ENGINE = MergeTree ORDER BY day'
+        ' AS SELECT today() AS through,'
+        f' today() - {HORIZON_DAYS} AS horizon,'
+        f' toDate({rollup.timestamp}) AS day{dims},'
+        ' count() AS entries'
+        f' FROM {rollup.source}'
+        f' WHERE {rollup.source_filter}'
+        f' AND {rollup.timestamp} >= today() - {HORIZON_DAYS}'
+        f' AND {rollup.timestamp} < today()'
+        f' GROUP BY day{dims}'
+    )
+
+
+async def ensure_schema() -> None:
+    """Create the rollup views when they do not exist."""
+    for rollup in ROLLUPS:
+        await clickhouse.query(_view_ddl(rollup))
+
+
+def _first_full_day(since: datetime.datetime) -> datetime.date:
+    since = since.astimezone(datetime.UTC)
+    day = since.date()
+    if since.time() != datetime.time.min:
+        day += datetime.timedelta(days=1)
+    return day
+
+
+def source(
+    rollup: Rollup,
+    *,
+    where: str = '1',
+    since: datetime.datetime | None = None,
+    until: datetime.datetime | None = None,
+) -> tuple[str, dict[str, typing.Any]]:
+    """Return a subquery of daily counts over ``[since, until)``.
+
+    The subquery yields ``day``, the rollup's dimension columns, and
+    ``entries`` (rows to sum, not count).  ``where`` may only use the
+    dimension columns; it applies to both the rollup and the raw rows
+    that fill in whatever the rollup does not cover.  The returned
+    parameters use a ``rollup_`` prefix so they merge with the
+    caller's own.
+    """
+    dims = ''.join(f', {dim}' for dim in rollup.dimensions)
+    covered = (
+        '{day} >= greatest({rollup_start:Date},'  # noqa: S608
+        f' (SELECT min(horizon) FROM {rollup.table}))'
+        ' AND {day} < least({rollup_end:Date},'
+        f' (SELECT max(through) FROM {rollup.table}))'
+    )
+    raw_window: list[str] = []
+    params: dict[str, typing.Any] = {
+        'rollup_start': _first_full_day(since) if since else _FIRST_DAY,
+        'rollup_end': (
+            until.astimezone(datetime.UTC).date() if until else _LAST_DAY
+        ),
+    }
+    if since is not None:
+        raw_window.append(
+            f' AND {rollup.timestamp} >= {{rollup_since:DateTime64(3)}}'
+        )
+        params['rollup_since'] = since
+    if until is not None:
+        raw_window.append(
+            f' AND {rollup.timestamp} < {{rollup_until:DateTime64(3)}}'
+        )
+        params['rollup_until'] = until
+    sql = (
+        f'(SELECT day{dims}, entries FROM {rollup.table}'  # noqa: S608
+        f' WHERE ({where}) AND '
+        + covered.replace('{day}', 'day')
+        + f' UNION ALL SELECT toDate({rollup.timestamp}) AS day{dims},'  # noqa: S608
+        ' toUInt64(1) AS entries'
+        f' FROM {rollup.source}'
+        f' WHERE {rollup.source_filter} AND ({where})'
+        + ''.join(raw_window)
+        + ' AND NOT ('
+        + covered.replace('{day}', f'toDate({rollup.timestamp})')
+        + '))'
+    )
+    return sql, params
@@ -8,12 +8,17 @@ post-commit state at recompute time.
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import datetime
 import logging
+import math
+import time
 import typing
 from collections import abc
 
+import pydantic
 from imbi_common import blueprints, clickhouse, graph, models
+from imbi_common.graph import cypher as graph_cypher
 from imbi_common.scoring import (
     AgePolicy,
     AnalysisResultPolicy,
@@ -22,9 +27,11 @@ from imbi_common.scoring import (
     DeploymentStatusPolicy,
     LinkPresencePolicy,
     PresencePolicy,
+    ScoreBreakdown,
+    ScoringPolicy,
+    attribute,
     clear_score,
-    compute_score,
-    record_score_change,
+    engine,
 )
 from valkey import asyncio as valkey
 
@@ -49,6 +56,12 @@ CLAIM_IDLE_MS = 60_000
 DAILY_TICK_KEY_PREFIX = 'imbi:score-recompute:daily'
 DAILY_TICK_HOUR_UTC = 6
 DAILY_TICK_POLL_SECONDS = 3600.0
+DAILY_TICK_SPREAD_SECONDS = 3600.0
+DAILY_TICK_PAGE_SIZE = 500
+DAILY_TICK_LEASE_SECONDS = 600
+DAILY_TICK_DONE_SECONDS = 25 * 3600
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_CONCURRENCY = 8
 
 LOGGER = logging.getLogger(__name__)
 
@@ -289,37 +302,294 @@ async def enqueue_dependents(
     return await enqueue_recompute_bulk(client, dependents, reason)
 
 
+_SCORING_POLICIES_QUERY: typing.LiteralString = (
+    'MATCH (p:ScoringPolicy {{enabled: true}})'
+    ' OPTIONAL MATCH (p)-[:TARGETS]->(pt:ProjectType)'
+    ' RETURN p, collect(pt.slug) AS targets'
+)
+
+_PROJECT_TYPES_QUERY: typing.LiteralString = (
+    'MATCH (p:Project {{id: {id}}})-[:TYPE]->(pt:ProjectType)'
+    ' RETURN pt.slug AS slug'
+)
+
+_SET_SCORE_QUERY: typing.LiteralString = (
+    'MATCH (p:Project {{id: {id}}})'
+    ' SET p.score = {score}, p.previous_score = {previous_score}'
+    ' RETURN p'
+)
+
+_HISTORY_COLUMNS = [
+    'project_id',
+    'timestamp',
+    'score',
+    'previous_score',
+    'change_reason',
+    'breakdown',
+]
+
+_POLICY_ADAPTER: pydantic.TypeAdapter[Policy] = pydantic.TypeAdapter(
+    ScoringPolicy
+)
+
+
+@dataclasses.dataclass(slots=True)
+class PolicySnapshot:
+    """Enabled scoring policies and Project blueprints for one batch.
+
+    ``compute_score`` re-reads every enabled policy and blueprint for
+    each project it scores; the consumer loads them once per batch and
+    resolves each project's policies and blueprint-extended model here,
+    memoised by the project's set of type slugs.
+    """
+
+    policies: list[Policy] = dataclasses.field(default_factory=list)
+    blueprints: list[models.Blueprint] = dataclasses.field(
+        default_factory=list
+    )
+    _models: dict[frozenset[str], type[models.Project]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def model_for(self, type_slugs: frozenset[str]) -> type[models.Project]:
+        """The Project model extended by blueprints for *type_slugs*."""
+        model = self._models.get(type_slugs)
+        if model is None:
+            context: dict[str, str | list[str]] | None = (
+                {'project_type': sorted(type_slugs)} if type_slugs else None
+            )
+            model = blueprints.apply_blueprints(
+                models.Project,
+                [
+                    bp
+                    for bp in self.blueprints
+                    if bp.kind == 'node'
+                    and blueprints._matches_filter(bp, context)  # pyright: ignore[reportPrivateUsage]
+                ],
+            )
+            self._models[type_slugs] = model
+        return model
+
+    def applicable(
+        self,
+        model: type[models.Project],
+        type_slugs: frozenset[str],
+    ) -> list[Policy]:
+        """Policies that apply to a project of *type_slugs*.
+
+        Mirrors ``imbi_common.scoring.policies.applicable_policies``:
+        attribute, presence and age policies need their attribute on
+        *model*, and ``TARGETS`` edges must share a type with the
+        project.
+        """
+        return [
+            policy
+            for policy in self.policies
+            if (
+                not isinstance(
+                    policy, (AttributePolicy, PresencePolicy, AgePolicy)
+                )
+                or policy.attribute_name in model.model_fields
+            )
+            and (
+                not policy.targets or not type_slugs.isdisjoint(policy.targets)
+            )
+        ]
+
+
+async def load_policy_snapshot(db: graph.Graph) -> PolicySnapshot:
+    """Load every enabled scoring policy and Project blueprint."""
+    rows, node_blueprints = await asyncio.gather(
+        db.execute(_SCORING_POLICIES_QUERY, {}, ['p', 'targets']),
+        db.match(
+            models.Blueprint,
+            {'type': models.Project.__name__, 'enabled': True},
+            order_by='priority',
+        ),
+    )
+    snapshot = PolicySnapshot(blueprints=list(node_blueprints))
+    for row in rows:
+        props = graph.parse_agtype(row['p'])
+        if not isinstance(props, dict):
+            continue
+        props['targets'] = graph.parse_agtype(row['targets']) or []
+        props['category'] = props.get('category') or 'attribute'
+        try:
+            snapshot.policies.append(_POLICY_ADAPTER.validate_python(props))
+        except pydantic.ValidationError as err:
+            LOGGER.warning(
+                'Skipping invalid scoring policy %s (category=%s): %s',
+                props.get('slug') or props.get('id'),
+                props['category'],
+                err,
+            )
+    return snapshot
+
+
+@dataclasses.dataclass(slots=True)
+class BatchStats:
+    """Throughput and per-stage latency for one consumed batch.
+
+    Stage times are summed across the concurrently scored projects,
+    so with ``concurrency > 1`` they can exceed ``elapsed``.
+    """
+
+    messages: int = 0
+    projects: int = 0
+    failed: int = 0
+    snapshot: float = 0.0
+    lookup: float = 0.0
+    compute: float = 0.0
+    record: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def projects_per_second(self) -> float:
+        return self.projects / self.elapsed if self.elapsed else 0.0
+
+
+class ScoreChange(typing.NamedTuple):
+    """A computed score waiting for the batch's bulk history write."""
+
+    project_id: str
+    score: float
+    previous: float
+    history: list[typing.Any]
+
+
+async def _score(
+    db: graph.Graph,
+    project: models.Project,
+    policies: list[Policy],
+) -> tuple[float, ScoreBreakdown]:
+    """Score *project* (loaded with its extended model) for *policies*.
+
+    The same steps as ``imbi_common.scoring.compute_score`` once the
+    applicable policies and extended project are known.
+    """
+    analysis_results: dict[str, str] = {}
+    if any(isinstance(p, AnalysisResultPolicy) for p in policies):
+        analysis_results = await engine._load_analysis_results(  # pyright: ignore[reportPrivateUsage]
+            db, project.id
+        )
+    deployment_statuses: dict[str, str] = {}
+    if any(isinstance(p, DeploymentStatusPolicy) for p in policies):
+        deployment_statuses = await engine._load_deployment_statuses(  # pyright: ignore[reportPrivateUsage]
+            db, project.id
+        )
+    neighbours: list[dict[str, typing.Any]] = []
+    if any(isinstance(p, ConditionPolicy) for p in policies):
+        neighbours = await engine._load_dependency_neighbours(  # pyright: ignore[reportPrivateUsage]
+            db, project.id
+        )
+    base_score, contributions = attribute.compute_base_score(
+        project, policies, analysis_results, deployment_statuses, neighbours
+    )
+    return max(0.0, base_score), ScoreBreakdown(
+        base_score=base_score,
+        unfloored_total=base_score,
+        attribute_contributions=contributions,
+    )
+
+
 async def _process_message(
     db: graph.Graph,
-    ch: clickhouse.client.Clickhouse,
     fields: dict[str, str],
-) -> None:
+    snapshot: PolicySnapshot,
+    *,
+    stats: BatchStats | None = None,
+) -> ScoreChange | None:
+    """Score one project against the batch's policy *snapshot*.
+
+    Cleared scores are written straight away; a changed score is
+    returned for :func:`_record_changes` to write with the rest of the
+    batch.
+    """
+    stats = stats or BatchStats()
     project_id = fields.get('project_id')
     reason = fields.get('reason') or 'attribute_change'
     if not project_id:
-        return
-    matches = await db.match(models.Project, {'id': project_id})
+        return None
+    start = time.perf_counter()
+    type_slugs: frozenset[str] = frozenset()
+    model = models.Project
+    if snapshot.policies:
+        rows = await db.execute(
+            _PROJECT_TYPES_QUERY, {'id': project_id}, ['slug']
+        )
+        type_slugs = frozenset(
+            s for r in rows if (s := graph.parse_agtype(r['slug']))
+        )
+        model = snapshot.model_for(type_slugs)
+    matches = await db.match(model, {'id': project_id})
+    stats.lookup += time.perf_counter() - start
     if not matches:
         LOGGER.info('Project %s not found; skipping recompute', project_id)
-        return
+        return None
     project = matches[0]
     previous = project.score if project.score is not None else 0.0
-    LOGGER.info(
+    LOGGER.debug(
         'Recomputing score for project %s (reason: %s)', project_id, reason
     )
-    score, breakdown = await compute_score(db, project_id)
-    if score is None:
-        LOGGER.info(
+    policies = snapshot.applicable(model, type_slugs)
+    if not policies:
+        LOGGER.debug(
             'No applicable policies for %s; clearing score', project_id
         )
+        start = time.perf_counter()
         await clear_score(db, project)
-    else:
-        LOGGER.info(
-            'Project %s score: %.1f -> %.1f', project_id, previous, score
-        )
-        await record_score_change(
-            ch, db, project, score, previous, reason, breakdown
-        )
+        stats.record += time.perf_counter() - start
+        return None
+    start = time.perf_counter()
+    score, breakdown = await _score(db, project, policies)
+    stats.compute += time.perf_counter() - start
+    LOGGER.debug('Project %s score: %.1f -> %.1f', project_id, previous, score)
+    if score == previous:
+        return None
+    return ScoreChange(
+        project_id,
+        score,
+        previous,
+        [
+            project_id,
+            datetime.datetime.now(datetime.UTC),
+            score,
+            previous,
+            reason,
+            breakdown.model_dump(mode='json'),
+        ],
+    )
+
+
+async def _record_changes(
+    db: graph.Graph,
+    ch: clickhouse.client.Clickhouse,
+    changes: list[ScoreChange],
+) -> None:
+    """Write a batch of score changes: ClickHouse first, then AGE.
+
+    Keeps ``record_score_change``'s ordering invariant, but as one
+    multi-row ``score_history`` insert and one graph transaction for
+    the whole batch rather than a round trip of each per project.
+    """
+    await ch.insert(
+        'score_history', [c.history for c in changes], _HISTORY_COLUMNS
+    )
+    # ``_execute_batch`` is imbi-common's transactional primitive (see
+    # ``sbom.replace_release_components``).
+    await db._execute_batch(  # pyright: ignore[reportPrivateUsage]
+        [
+            graph_cypher.Statement(
+                cypher=_SET_SCORE_QUERY,
+                params={
+                    'id': c.project_id,
+                    'score': c.score,
+                    'previous_score': c.previous,
+                },
+            )
+            for c in changes
+        ]
+    )
 
 
 def _decode_fields(
@@ -336,6 +606,7 @@ def _decode_fields(
 async def _claim_stale(
     client: valkey.Valkey,
     consumer: str,
+    count: int = 16,
 ) -> list[tuple[bytes, abc.Mapping[bytes | str, bytes | str]]]:
     try:
         result = await client.xautoclaim(
@@ -344,7 +615,7 @@ async def _claim_stale(
             consumer,
             min_idle_time=CLAIM_IDLE_MS,
             start_id='0-0',
-            count=16,
+            count=count,
         )
     except Exception as err:  # noqa: BLE001
         LOGGER.debug('xautoclaim failed: %s', err)
@@ -397,17 +668,87 @@ async def _handle_entries(
     db: graph.Graph,
     ch: clickhouse.client.Clickhouse,
     check_dlq: bool = False,
-) -> None:
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BatchStats:
+    """Score one batch of stream entries, up to *concurrency* at a time.
+
+    Entries for the same project collapse into a single recompute whose
+    success acks all of them; the first entry's ``reason`` is recorded.
+    Policies and blueprints are loaded once for the batch, and every
+    changed score is written by one :func:`_record_changes` call before
+    its entries are acked. A failed recompute or write leaves its
+    entries pending for redelivery.
+    """
+    started = time.perf_counter()
+    stats = BatchStats(messages=len(entries))
+    grouped: dict[str, tuple[dict[str, str], list[bytes]]] = {}
     for msg_id, raw_fields in entries:
         fields = _decode_fields(raw_fields)
         if check_dlq and await _maybe_dead_letter(client, msg_id, fields):
             continue
+        key = fields.get('project_id') or ''
+        grouped.setdefault(key, (fields, []))[1].append(msg_id)
+    if not grouped:
+        return stats
+
+    start = time.perf_counter()
+    try:
+        snapshot = await load_policy_snapshot(db)
+    except Exception:
+        LOGGER.exception('Loading the scoring policy snapshot failed')
+        stats.failed = len(grouped)
+        return stats
+    stats.snapshot = time.perf_counter() - start
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    changed: list[tuple[ScoreChange, list[bytes]]] = []
+
+    async def recompute(fields: dict[str, str], msg_ids: list[bytes]) -> None:
+        async with semaphore:
+            try:
+                change = await _process_message(
+                    db, fields, snapshot, stats=stats
+                )
+            except Exception:
+                LOGGER.exception('recompute failed for %s', fields)
+                stats.failed += 1
+                return
+            if change is not None:
+                changed.append((change, msg_ids))
+                return
+            await client.xack(STREAM, GROUP, *msg_ids)
+
+    await asyncio.gather(
+        *(recompute(fields, ids) for fields, ids in grouped.values())
+    )
+    if changed:
+        start = time.perf_counter()
         try:
-            await _process_message(db, ch, fields)
+            await _record_changes(db, ch, [c for c, _ids in changed])
         except Exception:
-            LOGGER.exception('recompute failed for %s', fields)
-            continue
-        await client.xack(STREAM, GROUP, msg_id)
+            LOGGER.exception('Recording %d score changes failed', len(changed))
+            stats.failed += len(changed)
+        else:
+            await client.xack(
+                STREAM, GROUP, *(i for _c, ids in changed for i in ids)
+            )
+        stats.record += time.perf_counter() - start
+    stats.projects = len(grouped.keys() - {''})
+    stats.elapsed = time.perf_counter() - started
+    LOGGER.info(
+        'Scored %d projects from %d messages in %.1fms (%.1f projects/s,'
+        ' %d failed; snapshot %.1fms, lookup %.1fms, compute %.1fms,'
+        ' record %.1fms)',
+        stats.projects,
+        stats.messages,
+        stats.elapsed * 1000,
+        stats.projects_per_second,
+        stats.failed,
+        stats.snapshot * 1000,
+        stats.lookup * 1000,
+        stats.compute * 1000,
+        stats.record * 1000,
+    )
+    return stats
 
 
 async def consume_recompute(
@@ -416,22 +757,40 @@ async def consume_recompute(
     ch: clickhouse.client.Clickhouse,
     consumer: str = f'{CONSUMER_PREFIX}-0',
     stop: asyncio.Event | None = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> None:
-    """Run the recompute consumer loop until *stop* is set."""
+    """Run the recompute consumer loop until *stop* is set.
+
+    Reads up to *batch_size* entries per ``XREADGROUP`` and scores them
+    *concurrency* projects at a time; see :func:`_handle_entries`.
+    """
     await ensure_group(client)
     LOGGER.info(
-        'Score recompute consumer loop running (consumer=%s)', consumer
+        'Score recompute consumer loop running'
+        ' (consumer=%s, batch_size=%d, concurrency=%d)',
+        consumer,
+        batch_size,
+        concurrency,
     )
     while stop is None or not stop.is_set():
-        stale = await _claim_stale(client, consumer)
+        stale = await _claim_stale(client, consumer, batch_size)
         if stale:
-            await _handle_entries(client, stale, db, ch, check_dlq=True)
+            await _handle_entries(
+                client,
+                stale,
+                db,
+                ch,
+                check_dlq=True,
+                concurrency=concurrency,
+            )
         try:
             response = await client.xreadgroup(
                 GROUP,
                 consumer,
                 {STREAM: '>'},
-                count=16,
+                count=batch_size,
                 block=2000,
             )
         except Exception:
@@ -441,21 +800,90 @@ async def consume_recompute(
         if not response:
             continue
         for _stream, entries in response:
-            await _handle_entries(client, entries, db, ch)
+            await _handle_entries(
+                client, entries, db, ch, concurrency=concurrency
+            )
+
+
+_PROJECT_ID_PAGE_QUERY: typing.LiteralString = (
+    'MATCH (p:Project) WHERE p.id > {after}'
+    ' RETURN p.id AS id ORDER BY p.id LIMIT {limit}'
+)
+
+_PROJECT_COUNT_QUERY: typing.LiteralString = (
+    'MATCH (p:Project) RETURN count(p) AS total'
+)
+
+
+async def iter_project_id_pages(
+    db: graph.Graph,
+    page_size: int = DAILY_TICK_PAGE_SIZE,
+    after: str = '',
+) -> abc.AsyncIterator[list[str]]:
+    """Yield every project id after *after*, *page_size* at a time.
+
+    Keyset-paged on ``p.id`` so the full id list is never held in
+    memory and each page is an index-friendly range scan.
+    """
+    while True:
+        rows = await db.execute(
+            _PROJECT_ID_PAGE_QUERY,
+            {'after': after, 'limit': page_size},
+            ['id'],
+        )
+        ids = [v for r in rows if (v := graph.parse_agtype(r['id']))]
+        if ids:
+            yield ids
+        if not ids or len(rows) < page_size:
+            return
+        after = ids[-1]
+
+
+async def _wait_or_stop(stop: asyncio.Event | None, seconds: float) -> bool:
+    """Sleep *seconds*, returning ``True`` early if *stop* is set."""
+    if stop is None:
+        await asyncio.sleep(seconds)
+        return False
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=seconds)
+    except TimeoutError:
+        return False
+    return True
 
 
 async def _enqueue_all(
     client: valkey.Valkey,
     db: graph.Graph,
     reason: ChangeReason,
+    *,
+    spread_seconds: float = 0.0,
+    page_size: int = DAILY_TICK_PAGE_SIZE,
+    stop: asyncio.Event | None = None,
+    after: str = '',
+    on_page: typing.Callable[[str], abc.Awaitable[None]] | None = None,
 ) -> tuple[int, int]:
-    project_ids = await all_project_ids(db)
-    if not project_ids:
-        return 0, 0
-    results = await asyncio.gather(
-        *[enqueue_recompute(client, pid, reason) for pid in project_ids]
-    )
-    return sum(results), len(project_ids)
+    """Enqueue every project after *after*, one pipelined page at a time.
+
+    With *spread_seconds* set, pages are paced evenly across that
+    window so the consumers — and ClickHouse behind them — see a
+    steady trickle rather than the whole fleet at once. Setting
+    *stop* abandons the remaining pages. *on_page* is awaited with
+    the last id of each enqueued page so a caller can checkpoint.
+    """
+    pause = 0.0
+    if spread_seconds > 0:
+        rows = await db.execute(_PROJECT_COUNT_QUERY, {}, ['total'])
+        total = int(graph.parse_agtype(rows[0]['total']) or 0) if rows else 0
+        pause = spread_seconds / max(1, math.ceil(total / page_size))
+    enqueued = seen = 0
+    async for project_ids in iter_project_id_pages(db, page_size, after):
+        if seen and pause and await _wait_or_stop(stop, pause):
+            break
+        enqueued += await enqueue_recompute_bulk(client, project_ids, reason)
+        seen += len(project_ids)
+        if on_page is not None:
+            await on_page(project_ids[-1])
+    return enqueued, seen
 
 
 async def run_daily_tick(
@@ -464,57 +892,116 @@ async def run_daily_tick(
     *,
     hour_utc: int = DAILY_TICK_HOUR_UTC,
     poll_seconds: float = DAILY_TICK_POLL_SECONDS,
+    spread_seconds: float = DAILY_TICK_SPREAD_SECONDS,
     stop: asyncio.Event | None = None,
     clock: typing.Callable[[], datetime.datetime] | None = None,
 ) -> None:
     """Once per UTC day at *hour_utc*, enqueue every project.
 
-    Cross-worker single-firing is achieved via a Valkey SETNX with a
-    25h TTL keyed by the current UTC date — only the first worker to
-    cross the threshold each day performs the enqueue.
+    Cross-worker single-firing is achieved via a Valkey SETNX lease
+    keyed by the current UTC date — only the worker holding it
+    performs the enqueue, spreading it over *spread_seconds*. See
+    :func:`_try_daily_tick` for how an interrupted spread resumes.
     """
     _now = clock or (lambda: datetime.datetime.now(datetime.UTC))
     LOGGER.info(
-        'Daily scoring tick loop running (hour_utc=%s, poll=%.0fs)',
+        'Daily scoring tick loop running (hour_utc=%s, poll=%.0fs,'
+        ' spread=%.0fs)',
         hour_utc,
         poll_seconds,
+        spread_seconds,
     )
     while stop is None or not stop.is_set():
         now = _now()
         if now.hour >= hour_utc:
             try:
-                await _try_daily_tick(client, db, now.date())
+                await _try_daily_tick(
+                    client,
+                    db,
+                    now.date(),
+                    spread_seconds=spread_seconds,
+                    stop=stop,
+                )
             except Exception:
                 LOGGER.exception(
                     'daily scoring tick iteration failed (date=%s)',
                     now.date().isoformat(),
                 )
-        if stop is None:
-            await asyncio.sleep(poll_seconds)
-            continue
-        try:
-            await asyncio.wait_for(stop.wait(), timeout=poll_seconds)
-        except TimeoutError:
-            continue
+        if await _wait_or_stop(stop, poll_seconds):
+            return
 
 
 async def _try_daily_tick(
     client: valkey.Valkey,
     db: graph.Graph,
     date: datetime.date,
+    *,
+    spread_seconds: float = DAILY_TICK_SPREAD_SECONDS,
+    stop: asyncio.Event | None = None,
 ) -> None:
+    """Run (or resume) the daily enqueue for *date* if nobody else is.
+
+    The date key is a lease renewed after every page, not a 25h claim:
+    after each page the last enqueued project id is checkpointed to a
+    cursor key. A worker that is stopped mid-spread drops the lease,
+    and one that dies lets it lapse, so the next poll on any worker
+    picks the spread up after the cursor instead of abandoning the
+    remaining pages. Only a finished spread marks the date done for
+    25h.
+    """
     key = f'{DAILY_TICK_KEY_PREFIX}:{date.isoformat()}'
+    cursor_key = f'{key}:cursor'
+    lease_seconds = math.ceil(spread_seconds) + DAILY_TICK_LEASE_SECONDS
     try:
-        acquired = await client.set(key, b'1', ex=25 * 3600, nx=True)
+        acquired = await client.set(key, b'1', ex=lease_seconds, nx=True)
+        cursor = await client.get(cursor_key) if acquired else None
     except Exception:
         LOGGER.exception('daily-tick lock acquisition failed')
         return
     if not acquired:
         return
-    enqueued, total = await _enqueue_all(client, db, 'scheduled_recompute')
+    after = cursor.decode() if isinstance(cursor, bytes) else cursor or ''
+
+    async def checkpoint(last_id: str) -> None:
+        await client.set(cursor_key, last_id, ex=DAILY_TICK_DONE_SECONDS)
+        await client.expire(key, lease_seconds)
+
+    try:
+        enqueued, total = await _enqueue_all(
+            client,
+            db,
+            'scheduled_recompute',
+            spread_seconds=spread_seconds,
+            stop=stop,
+            after=after,
+            on_page=checkpoint,
+        )
+    except BaseException:
+        await _release_daily_tick(client, key)
+        raise
+    if stop is not None and stop.is_set():
+        await _release_daily_tick(client, key)
+        LOGGER.info(
+            'Daily scoring tick for %s stopped after %s/%s projects;'
+            ' the next run resumes from the cursor',
+            date.isoformat(),
+            enqueued,
+            total,
+        )
+        return
+    await client.set(key, b'done', ex=DAILY_TICK_DONE_SECONDS)
     LOGGER.info(
-        'Daily scoring tick enqueued %s/%s projects for %s',
+        'Daily scoring tick enqueued %s/%s projects for %s%s',
         enqueued,
         total,
         date.isoformat(),
+        f' (resumed after {after})' if after else '',
     )
+
+
+async def _release_daily_tick(client: valkey.Valkey, key: str) -> None:
+    """Drop an interrupted daily-tick lease so the spread can resume."""
+    try:
+        await client.delete(key)
+    except Exception:
+        LOGGER.exception('releasing daily-tick lease %s failed', key)
@@ -0,0 +1,438 @@
+"""Cached per-organization node-id scope for vector search.
+
+``/search`` restricts ``db.search`` to the node ids that belong to the
+requesting organization. Enumerating that scope takes seven graph
+traversals (the org, its ``BELONGS_TO`` children, projects, documents,
+releases, comments and the components the org's releases use), which
+for large orgs costs more than the vector search itself. This module
+materializes the scope once per org and maintains it incrementally:
+
+- The scope lives in a Valkey SET at ``imbi:search:scope:{org}:ids``.
+  A build seeds the set with :data:`_COMPLETE_MARKER` alongside the ids;
+  a set without the marker (e.g. one re-created by a stray ``SADD``
+  after expiry) is treated as missing and rebuilt.
+- ``imbi:search:scope:{org}:gen`` is bumped on every change so each
+  pod can keep the set in memory.  Adds and removes also append their
+  ids to the ``imbi:search:scope:{org}:log`` list, so a pod whose copy
+  is a few generations behind applies those changes instead of
+  re-reading the whole set; it only re-reads once the log no longer
+  covers its generation (after an invalidation, or when it is more
+  than :data:`LOG_LENGTH` changes behind).
+- A rebuilt set only replaces the stored one if the generation has
+  not moved since the build started, so a change that lands during a
+  build is never overwritten by the older snapshot.
+- Writers call :func:`add_nodes` on create and :func:`remove_nodes` or
+  :func:`invalidate` on delete / archive. Changes that cascade through
+  a project (archive, unarchive, SBoM ingest) invalidate rather than
+  enumerate the affected ids.
+
+All Valkey operations are best-effort: without Valkey the scope is
+cached per process for :data:`LOCAL_TTL_SECONDS`, and the Valkey copy
+expires after :data:`SCOPE_TTL_SECONDS` as a backstop for writers that
+do not report their changes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+import typing
+
+from imbi_common import graph
+from valkey import asyncio as _valkey_asyncio
+from valkey import exceptions as _valkey_exceptions
+
+from imbi_api import caching
+
+LOGGER = logging.getLogger(__name__)
+
+KEY_PREFIX = 'imbi:search:scope'
+SCOPE_TTL_SECONDS = 3_600
+LOCAL_TTL_SECONDS = 300
+SADD_CHUNK = 1_000
+LOG_LENGTH = 256
+
+_COMPLETE_MARKER = '__complete__'
+
+_local: dict[str, tuple[float, int, frozenset[str]]] = {}
+
+
+def clear_local_cache() -> None:
+    """Drop every in-process scope (tests and manual resets)."""
+    _local.clear()
+
+
+def _key(org_slug: str, part: str) -> str:
+    return f'{KEY_PREFIX}:{org_slug}:{part}'
+
+
+def _decode(value: object) -> str:
+    if isinstance(value, bytes):
+        return value.decode()
+    return str(value)
+
+
+async def _build(db: graph.Graph, org_slug: str) -> set[str] | None:
+    """Enumerate node IDs for all nodes in the org; None if not found.
+
+    Covers: the org itself, direct BELONGS_TO children (Team, Environment,
+    ProjectType, Integration, Tag, DocumentTemplate, LinkDefinition),
+    Projects, Documents, Releases, Comments, and the Components reachable
+    through the org's release dependency graph. Components are shared,
+    cross-org identities, so they are scoped to those an org actually
+    depends on rather than enumerated globally.
+
+    Archived projects are excluded, along with the Documents, Releases,
+    Comments, and Components reached through them, so search never
+    surfaces content from an archived project.
+    """
+    org_rows = await db.execute(
+        'MATCH (o:Organization {{slug: {org_slug}}}) RETURN o.id AS org_id',
+        {'org_slug': org_slug},
+        columns=['org_id'],
+    )
+    if not org_rows:
+        return None
+
+    node_ids: set[str] = set()
+    org_id = graph.parse_agtype(org_rows[0]['org_id'])
+    if org_id:
+        node_ids.add(org_id)
+
+    for row in await db.execute(
+        'MATCH (n)-[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})'
+        ' RETURN n.id AS nid',
+        {'org_slug': org_slug},
+        columns=['nid'],
+    ):
+        nid = graph.parse_agtype(row['nid'])
+        if nid:
+            node_ids.add(nid)
+
+    for row in await db.execute(
+        'MATCH (p:Project)-[:OWNED_BY]->(:Team)-[:BELONGS_TO]->'
+        '(:Organization {{slug: {org_slug}}})'
+        ' WHERE coalesce(p.archived, false) = false'
+        ' RETURN p.id AS nid',
+        {'org_slug': org_slug},
+        columns=['nid'],
+    ):
+        nid = graph.parse_agtype(row['nid'])
+        if nid:
+            node_ids.add(nid)
+
+    for row in await db.execute(
+        'MATCH (d:Document)-[:ATTACHED_TO]->(p:Project)-[:OWNED_BY]->'
+        '(:Team)-[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})'
+        ' WHERE coalesce(p.archived, false) = false'
+        ' RETURN d.id AS nid',
+        {'org_slug': org_slug},
+        columns=['nid'],
+    ):
+        nid = graph.parse_agtype(row['nid'])
+        if nid:
+            node_ids.add(nid)
+
+    for row in await db.execute(
+        'MATCH (:Organization {{slug: {org_slug}}})<-[:BELONGS_TO]-'
+        '(:Team)<-[:OWNED_BY]-(p:Project)-[:HAS_RELEASE]->(r:Release)'
+        ' WHERE coalesce(p.archived, false) = false'
+        ' RETURN r.id AS nid',
+        {'org_slug': org_slug},
+        columns=['nid'],
+    ):
+        nid = graph.parse_agtype(row['nid'])
+        if nid:
+            node_ids.add(nid)
+
+    for row in await db.execute(
+        'MATCH (c:Comment)-[:IN_THREAD]->(:CommentThread)-[:ON_DOCUMENT]->'
+        '(:Document)-[:ATTACHED_TO]->(p:Project)-[:OWNED_BY]->(:Team)'
+        '-[:BELONGS_TO]->(:Organization {{slug: {org_slug}}})'
+        ' WHERE coalesce(p.archived, false) = false'
+        ' RETURN c.id AS nid',
+        {'org_slug': org_slug},
+        columns=['nid'],
+    ):
+        nid = graph.parse_agtype(row['nid'])
+        if nid:
+            node_ids.add(nid)
+
+    for row in await db.execute(
+        'MATCH (comp:Component)-[:HAS_RELEASE]->(:ComponentRelease)'
+        '<-[:USES_COMPONENT_RELEASE]-(:Release)<-[:HAS_RELEASE]-(p:Project)'
+        '-[:OWNED_BY]->(:Team)-[:BELONGS_TO]->'
+        '(:Organization {{slug: {org_slug}}})'
+        ' WHERE coalesce(p.archived, false) = false'
+        ' RETURN comp.id AS nid',
+        {'org_slug': org_slug},
+        columns=['nid'],
+    ):
+        nid = graph.parse_agtype(row['nid'])
+        if nid:
+            node_ids.add(nid)
+
+    return node_ids
+
+
+def _parse_generation(raw: object) -> int:
+    try:
+        return int(_decode(raw)) if raw is not None else 0
+    except ValueError:
+        return 0
+
+
+async def _generation(
+    client: _valkey_asyncio.Valkey | None, org_slug: str
+) -> int:
+    if client is None:
+        return 0
+    try:
+        raw = await caching.resolve(client.get(_key(org_slug, 'gen')))
+    except Exception:
+        LOGGER.warning('Failed to read search scope generation', exc_info=True)
+        return 0
+    return _parse_generation(raw)
+
+
+async def _catch_up(
+    client: _valkey_asyncio.Valkey,
+    org_slug: str,
+    generation: int,
+    node_ids: frozenset[str],
+) -> tuple[int, frozenset[str]] | None:
+    """Apply the logged changes after ``generation`` to ``node_ids``.
+
+    Returns the current generation and the updated scope, or ``None``
+    when the log no longer covers ``generation`` and the set must be
+    re-read.  The generation and the log are read in one transaction;
+    the log's last entry is always the current generation's change.
+    """
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.get(_key(org_slug, 'gen'))  # pyright: ignore[reportUnknownMemberType]
+            pipe.lrange(_key(org_slug, 'log'), 0, -1)  # pyright: ignore[reportUnknownMemberType]
+            raw_generation, raw_log = await pipe.execute()  # pyright: ignore[reportUnknownMemberType]
+    except Exception:
+        LOGGER.warning('Failed to read search scope changes', exc_info=True)
+        return None
+    current = _parse_generation(raw_generation)
+    log = list(typing.cast('typing.Iterable[object]', raw_log or []))
+    behind = current - generation
+    if behind <= 0 or behind > len(log):
+        return None
+    ids = set(node_ids)
+    for entry in log[len(log) - behind :]:
+        try:
+            command, changed = json.loads(_decode(entry))
+        except ValueError, TypeError:
+            return None
+        if command == 'sadd':
+            ids.update(changed)
+        elif command == 'srem':
+            ids.difference_update(changed)
+        else:
+            return None
+    return current, frozenset(ids)
+
+
+async def _load(
+    client: _valkey_asyncio.Valkey | None, org_slug: str
+) -> frozenset[str] | None:
+    """Read a complete scope set from Valkey; None if absent/partial."""
+    if client is None:
+        return None
+    try:
+        raw = await caching.resolve(
+            client.smembers(  # pyright: ignore[reportUnknownMemberType]
+                _key(org_slug, 'ids')
+            )
+        )
+    except Exception:
+        LOGGER.warning('Failed to read search scope set', exc_info=True)
+        return None
+    if not isinstance(raw, (set, list, tuple)):
+        return None
+    members = {
+        _decode(item) for item in typing.cast('typing.Iterable[object]', raw)
+    }
+    if _COMPLETE_MARKER not in members:
+        return None
+    members.discard(_COMPLETE_MARKER)
+    return frozenset(members)
+
+
+async def _store(
+    client: _valkey_asyncio.Valkey | None,
+    org_slug: str,
+    node_ids: frozenset[str],
+    generation: int,
+) -> None:
+    """Replace the Valkey scope set with one built at ``generation``.
+
+    Skipped when the generation has moved since: the snapshot may
+    predate a change that is already in the stored set, and the next
+    build picks both up.
+    """
+    if client is None:
+        return
+    key = _key(org_slug, 'ids')
+    gen_key = _key(org_slug, 'gen')
+    ids = [_COMPLETE_MARKER, *node_ids]
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            await pipe.watch(gen_key)  # pyright: ignore[reportUnknownMemberType]
+            current = await pipe.get(gen_key)  # pyright: ignore[reportUnknownMemberType]
+            if _parse_generation(current) != generation:
+                return
+            pipe.multi()  # pyright: ignore[reportUnknownMemberType]
+            pipe.delete(key)  # pyright: ignore[reportUnknownMemberType]
+            for offset in range(0, len(ids), SADD_CHUNK):
+                pipe.sadd(  # pyright: ignore[reportUnknownMemberType]
+                    key, *ids[offset : offset + SADD_CHUNK]
+                )
+            pipe.expire(  # pyright: ignore[reportUnknownMemberType]
+                key, SCOPE_TTL_SECONDS
+            )
+            await pipe.execute()  # pyright: ignore[reportUnknownMemberType]
+    except _valkey_exceptions.WatchError:
+        LOGGER.debug('Search scope for %s changed during a build', org_slug)
+    except Exception:
+        LOGGER.warning('Failed to store search scope set', exc_info=True)
+
+
+async def get_org_node_ids(
+    db: graph.Graph,
+    org_slug: str,
+) -> frozenset[str] | None:
+    """Return the org's search scope, or None if the org is not found.
+
+    Served from the in-process copy while its generation matches
+    Valkey's -- caught up from the change log when it is behind --
+    then from the Valkey set, and only rebuilt from the graph when
+    neither is available.
+    """
+    client = caching.client()
+    generation = await _generation(client, org_slug)
+    now = time.monotonic()
+    cached = _local.get(org_slug)
+    if cached is not None and now - cached[0] < LOCAL_TTL_SECONDS:
+        if cached[1] == generation:
+            return cached[2]
+        if client is not None:
+            caught_up = await _catch_up(client, org_slug, *cached[1:])
+            if caught_up is not None:
+                _local[org_slug] = (cached[0], *caught_up)
+                return caught_up[1]
+    node_ids = await _load(client, org_slug)
+    if node_ids is None:
+        built = await _build(db, org_slug)
+        if built is None:
+            _local.pop(org_slug, None)
+            return None
+        node_ids = frozenset(built)
+        await _store(client, org_slug, node_ids, generation)
+    _local[org_slug] = (now, generation, node_ids)
+    return node_ids
+
+
+_Command = typing.Literal['sadd', 'srem', 'del']
+
+
+async def _mutate(
+    org_slug: str,
+    command: _Command,
+    node_ids: tuple[str, ...],
+) -> None:
+    """Apply ``SADD``/``SREM``/``DEL`` and bump the generation.
+
+    Adds and removes are appended to the change log in the same
+    transaction; a ``DEL`` drops the log, so every pod re-reads.
+    """
+    client = caching.client()
+    if client is None:
+        cached = _local.get(org_slug)
+        if cached is None:
+            return
+        stamp, generation, ids = cached
+        if command == 'sadd':
+            _local[org_slug] = (stamp, generation, ids.union(node_ids))
+        elif command == 'srem':
+            _local[org_slug] = (stamp, generation, ids.difference(node_ids))
+        else:
+            _local.pop(org_slug, None)
+        return
+    key = _key(org_slug, 'ids')
+    log_key = _key(org_slug, 'log')
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            if command == 'sadd':
+                pipe.sadd(key, *node_ids)  # pyright: ignore[reportUnknownMemberType]
+                # A set re-created after expiry lacks the completeness
+                # marker and is discarded by the next build; don't let
+                # it linger without a TTL in the meantime.
+                pipe.expire(  # pyright: ignore[reportUnknownMemberType]
+                    key, SCOPE_TTL_SECONDS, nx=True
+                )
+            elif command == 'srem':
+                pipe.srem(key, *node_ids)  # pyright: ignore[reportUnknownMemberType]
+            else:
+                pipe.delete(key, log_key)  # pyright: ignore[reportUnknownMemberType]
+            pipe.incr(_key(org_slug, 'gen'))  # pyright: ignore[reportUnknownMemberType]
+            if command != 'del':
+                pipe.rpush(  # pyright: ignore[reportUnknownMemberType]
+                    log_key, json.dumps([command, list(node_ids)])
+                )
+                pipe.ltrim(log_key, -LOG_LENGTH, -1)  # pyright: ignore[reportUnknownMemberType]
+                pipe.expire(  # pyright: ignore[reportUnknownMemberType]
+                    log_key, SCOPE_TTL_SECONDS
+                )
+            await pipe.execute()  # pyright: ignore[reportUnknownMemberType]
+    except Exception:
+        LOGGER.warning(
+            'Failed to update search scope for %s', org_slug, exc_info=True
+        )
+        _local.pop(org_slug, None)
+
+
+async def add_nodes(org_slug: str, *node_ids: str | None) -> None:
+    """Add newly created nodes to the org's search scope."""
+    ids = tuple(nid for nid in node_ids if nid)
+    if ids:
+        await _mutate(org_slug, 'sadd', ids)
+
+
+async def remove_nodes(org_slug: str, *node_ids: str | None) -> None:
+    """Remove deleted nodes from the org's search scope."""
+    ids = tuple(nid for nid in node_ids if nid)
+    if ids:
+        await _mutate(org_slug, 'srem', ids)
+
+
+async def invalidate(org_slug: str) -> None:
+    """Drop the org's scope so the next search rebuilds it."""
+    await _mutate(org_slug, 'del', ())
+
+
+async def add_release_components(
+    db: graph.Graph,
+    org_slug: str,
+    release_id: str,
+) -> None:
+    """Add the Components a release's SBoM references to the scope.
+
+    Components dropped by a re-ingest stay in scope until the next
+    rebuild; they are shared identities the org has depended on, so
+    that is harmless.
+    """
+    rows = await db.execute(
+        'MATCH (:Release {{id: {release_id}}})-[:USES_COMPONENT_RELEASE]->'
+        '(:ComponentRelease)<-[:HAS_RELEASE]-(comp:Component)'
+        ' RETURN DISTINCT comp.id AS nid',
+        {'release_id': release_id},
+        columns=['nid'],
+    )
+    await add_nodes(
+        org_slug, *(graph.parse_agtype(row['nid']) for row in rows)
+    )
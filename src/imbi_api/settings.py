@@ -68,6 +68,11 @@ class ServerConfig(pydantic_settings.BaseSettings):
     # back to the empty string, in which case ``project_ui_url`` is
     # ``None`` and plugins skip the homepage write.
     ui_url: str = pydantic.Field(default='', validation_alias='IMBI_UI_URL')
+    # Run the background workers (score, commit/PR/deployment sync,
+    # maintenance, identity refresh) inside the HTTP server's lifespan.
+    # Set to false when they run as separate ``imbi-api worker``
+    # processes so backfills never share the request event loop.
+    background_workers: bool = True
 
     @pydantic.field_validator('url', 'ui_url')
     @classmethod
@@ -212,6 +217,11 @@ class Storage(pydantic_settings.BaseSettings):
     thumbnail_max_size: int = 256
     thumbnail_quality: int = 85
 
+    # Download settings
+    download_chunk_size: int = 64 * 1024
+    presigned_downloads: bool = False  # Redirect GETs to S3
+    presigned_url_ttl: int = 300
+
 
 class InternalServices(pydantic_settings.BaseSettings):
     """Internal base URLs of sibling services, for health probing.
@@ -236,11 +246,107 @@ class InternalServices(pydantic_settings.BaseSettings):
         return value.rstrip('/')
 
 
+class ScoreWorker(pydantic_settings.BaseSettings):
+    """Score-recompute consumer throughput knobs.
+
+    ``batch_size`` entries are read per ``XREADGROUP`` and scored
+    ``concurrency`` projects at a time, each holding a graph
+    connection while it runs.  The daily recompute tick spreads its
+    enqueue over ``daily_tick_spread_seconds`` (``0`` enqueues the
+    whole fleet at once).
+    """
+
+    model_config = settings.base_settings_config(
+        env_prefix='IMBI_SCORE_WORKER_'
+    )
+
+    batch_size: int = pydantic.Field(default=64, ge=1, le=1000)
+    concurrency: int = pydantic.Field(default=8, ge=1, le=64)
+    daily_tick_spread_seconds: float = pydantic.Field(
+        default=3600.0, ge=0, le=86400
+    )
+
+
+class SyncWorker(pydantic_settings.BaseSettings):
+    """Commit, PR and deployment sync consumer pool sizes.
+
+    Each process runs up to ``*_concurrency`` jobs of a stream at once.
+    A plugin rate limit halves a stream's limit; every
+    ``recover_after`` consecutive successes raise it by one, back up to
+    the configured value.
+    """
+
+    model_config = settings.base_settings_config(
+        env_prefix='IMBI_SYNC_WORKER_'
+    )
+
+    commit_sync_concurrency: int = pydantic.Field(default=4, ge=1, le=32)
+    pr_sync_concurrency: int = pydantic.Field(default=4, ge=1, le=32)
+    deployment_sync_concurrency: int = pydantic.Field(default=4, ge=1, le=32)
+    recover_after: int = pydantic.Field(default=8, ge=1, le=1000)
+
+
+class EventBuffer(pydantic_settings.BaseSettings):
+    """Request-path ClickHouse insert buffer.
+
+    Rows are written in batches of up to ``max_rows`` at most
+    ``flush_interval`` seconds after they are queued.  Writers wait
+    once ``max_queue`` rows are pending.
+    """
+
+    model_config = settings.base_settings_config(
+        env_prefix='IMBI_EVENT_BUFFER_'
+    )
+
+    max_rows: int = pydantic.Field(default=500, ge=1, le=100000)
+    flush_interval: float = pydantic.Field(default=1.0, gt=0, le=60)
+    max_queue: int = pydantic.Field(default=10000, ge=1)
+
+
+class LogCache(pydantic_settings.BaseSettings):
+    """Plugin log search / histogram result cache.
+
+    Identical queries within ``ttl_seconds`` of each other share one
+    upstream call; query windows are bucketed to the same interval.
+    ``0`` disables the cache.  At most ``max_entries`` results are
+    kept per process.
+    """
+
+    model_config = settings.base_settings_config(env_prefix='IMBI_LOG_CACHE_')
+
+    ttl_seconds: int = pydantic.Field(default=10, ge=0, le=300)
+    max_entries: int = pydantic.Field(default=512, ge=1)
+
+
+class GraphQuery(pydantic_settings.BaseSettings):
+    """Limits for the admin ad-hoc graph query tool.
+
+    Each query runs under a ``statement_timeout`` of ``timeout``
+    seconds and returns at most ``max_rows`` rows; a request may ask
+    for less of either, never more.  The schema panel's label
+    statistics are cached for ``schema_ttl`` seconds before being
+    refreshed in the background.
+    """
+
+    model_config = settings.base_settings_config(
+        env_prefix='IMBI_GRAPH_QUERY_'
+    )
+
+    timeout: float = pydantic.Field(default=30.0, gt=0, le=600)
+    max_rows: int = pydantic.Field(default=1000, ge=1, le=100000)
+    schema_ttl: float = pydantic.Field(default=300.0, ge=0)
+
+
 # Module-level singletons for extended settings
 _auth_settings: Auth | None = None
 _server_config: ServerConfig | None = None
 _storage_settings: Storage | None = None
 _internal_services: InternalServices | None = None
+_score_worker: ScoreWorker | None = None
+_sync_worker: SyncWorker | None = None
+_event_buffer: EventBuffer | None = None
+_log_cache: LogCache | None = None
+_graph_query: GraphQuery | None = None
 
 
 def get_auth_settings() -> Auth:
@@ -300,6 +406,46 @@ def get_internal_services() -> InternalServices:
     return _internal_services
 
 
+def get_score_worker_settings() -> ScoreWorker:
+    """Get the singleton ScoreWorker settings instance."""
+    global _score_worker
+    if _score_worker is None:
+        _score_worker = ScoreWorker()
+    return _score_worker
+
+
+def get_sync_worker_settings() -> SyncWorker:
+    """Get the singleton SyncWorker settings instance."""
+    global _sync_worker
+    if _sync_worker is None:
+        _sync_worker = SyncWorker()
+    return _sync_worker
+
+
+def get_event_buffer_settings() -> EventBuffer:
+    """Get the singleton EventBuffer settings instance."""
+    global _event_buffer
+    if _event_buffer is None:
+        _event_buffer = EventBuffer()
+    return _event_buffer
+
+
+def get_log_cache_settings() -> LogCache:
+    """Get the singleton LogCache settings instance."""
+    global _log_cache
+    if _log_cache is None:
+        _log_cache = LogCache()
+    return _log_cache
+
+
+def get_graph_query_settings() -> GraphQuery:
+    """Get the singleton GraphQuery settings instance."""
+    global _graph_query
+    if _graph_query is None:
+        _graph_query = GraphQuery()
+    return _graph_query
+
+
 def clear_caches() -> None:
     """Reset the module-level singletons.
 
@@ -307,11 +453,17 @@ def clear_caches() -> None:
     which lazily initialize once per process.
     """
     global _auth_settings, _server_config, _storage_settings
-    global _internal_services
+    global _internal_services, _score_worker, _sync_worker
+    global _event_buffer, _log_cache, _graph_query
     _auth_settings = None
     _server_config = None
     _storage_settings = None
     _internal_services = None
+    _score_worker = None
+    _sync_worker = None
+    _event_buffer = None
+    _log_cache = None
+    _graph_query = None
 
 
 def oauth_callback_url(provider_slug: str, base_url: str | None = None) -> str:
@@ -1,13 +1,15 @@
 """Object storage module for file uploads.
 
 Provides S3-compatible object storage for uploading, downloading,
-and serving files. Uses presigned URLs for efficient file delivery.
+and serving files. Downloads stream from S3 in chunks, or redirect to
+presigned URLs when enabled.
 """
 
-from .client import StorageClient
+from .client import ObjectStream, StorageClient
 from .dependencies import InjectStorageClient
 
 __all__ = [
     'InjectStorageClient',
+    'ObjectStream',
     'StorageClient',
 ]
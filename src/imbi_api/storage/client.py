@@ -2,8 +2,10 @@
 
 import asyncio
 import contextlib
+import dataclasses
 import logging
 import typing
+from collections import abc
 
 import aioboto3  # pyright: ignore[reportMissingTypeStubs]
 from botocore import (  # pyright: ignore[reportMissingTypeStubs]
@@ -15,6 +17,29 @@ from imbi_api import settings
 LOGGER = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True)
+class ObjectStream:
+    """An S3 object (or byte range of one) being streamed.
+
+    ``chunks`` holds the S3 connection open until it is exhausted or
+    closed, so it must be consumed -- typically by a
+    :class:`fastapi.responses.StreamingResponse`.
+
+    """
+
+    chunks: abc.AsyncIterator[bytes]
+    content_length: int
+    content_range: str | None
+
+
+async def _iter_body(
+    body: typing.Any, chunk_size: int
+) -> abc.AsyncIterator[bytes]:
+    async with body:
+        async for chunk in body.iter_chunks(chunk_size):
+            yield chunk
+
+
 class StorageClient:
     """S3 client for object storage operations.
 
@@ -104,6 +129,105 @@ class StorageClient:
         )
         LOGGER.debug('Uploaded %s (%d bytes)', key, len(data))
 
+    async def upload_fileobj(
+        self,
+        key: str,
+        fileobj: typing.Any,
+        content_type: str,
+    ) -> None:
+        """Upload a file-like object to S3 without buffering it.
+
+        Large objects are sent as a multipart upload, a part at a
+        time, so memory use does not grow with the file size.
+
+        Args:
+            key: S3 object key
+            fileobj: Sync or async file-like object positioned at the
+                start of the content
+            content_type: MIME type of the file
+
+        """
+        if self._s3 is None:
+            raise RuntimeError('StorageClient not initialized')
+        await self._s3.upload_fileobj(
+            fileobj,
+            self._settings.bucket,
+            key,
+            ExtraArgs={'ContentType': content_type},
+        )
+        LOGGER.debug('Uploaded %s (streamed)', key)
+
+    async def stream(
+        self,
+        key: str,
+        *,
+        byte_range: str | None = None,
+    ) -> ObjectStream:
+        """Open an S3 object for chunked streaming.
+
+        Args:
+            key: S3 object key
+            byte_range: Optional HTTP ``Range`` value (``bytes=a-b``)
+                passed through to S3
+
+        Returns:
+            The object's chunk iterator and response metadata
+
+        Raises:
+            botocore.exceptions.ClientError: ``NoSuchKey`` for a
+                missing object, ``InvalidRange`` for an unsatisfiable
+                range.
+
+        """
+        if self._s3 is None:
+            raise RuntimeError('StorageClient not initialized')
+        params: dict[str, typing.Any] = {
+            'Bucket': self._settings.bucket,
+            'Key': key,
+        }
+        if byte_range:
+            params['Range'] = byte_range
+        response = await self._s3.get_object(**params)
+        return ObjectStream(
+            chunks=_iter_body(
+                response['Body'], self._settings.download_chunk_size
+            ),
+            content_length=int(response.get('ContentLength') or 0),
+            content_range=response.get('ContentRange'),
+        )
+
+    async def presigned_url(
+        self,
+        key: str,
+        *,
+        content_type: str | None = None,
+        cache_control: str | None = None,
+    ) -> str:
+        """Return a time-limited GET URL for an S3 object.
+
+        Args:
+            key: S3 object key
+            content_type: ``Content-Type`` S3 should answer with
+            cache_control: ``Cache-Control`` S3 should answer with
+
+        """
+        if self._s3 is None:
+            raise RuntimeError('StorageClient not initialized')
+        params: dict[str, typing.Any] = {
+            'Bucket': self._settings.bucket,
+            'Key': key,
+        }
+        if content_type:
+            params['ResponseContentType'] = content_type
+        if cache_control:
+            params['ResponseCacheControl'] = cache_control
+        url: str = await self._s3.generate_presigned_url(
+            'get_object',
+            Params=params,
+            ExpiresIn=self._settings.presigned_url_ttl,
+        )
+        return url
+
     async def download(self, key: str) -> bytes:
         """Download bytes from S3.
 
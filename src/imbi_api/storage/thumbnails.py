@@ -3,6 +3,7 @@
 import asyncio
 import io
 import logging
+import typing
 import warnings
 
 import PIL
@@ -48,7 +49,7 @@ def can_thumbnail(content_type: str) -> bool:
 
 
 async def generate_thumbnail(
-    data: bytes,
+    data: bytes | typing.BinaryIO,
     storage_settings: settings.Storage | None = None,
 ) -> bytes:
     """Generate a WEBP thumbnail from image data.
@@ -58,7 +59,8 @@ async def generate_thumbnail(
     fits within the configured maximum dimensions.
 
     Args:
-        data: Original image bytes
+        data: Original image bytes, or a seekable binary file
+            positioned at its start
         storage_settings: Storage settings (uses defaults if None)
 
     Returns:
@@ -79,14 +81,14 @@ async def generate_thumbnail(
 
 
 def _generate_thumbnail_sync(
-    data: bytes,
+    data: bytes | typing.BinaryIO,
     max_size: int,
     quality: int,
 ) -> bytes:
     """Synchronous thumbnail generation.
 
     Args:
-        data: Original image bytes
+        data: Original image bytes or binary file
         max_size: Maximum dimension (width or height) in pixels
         quality: WEBP compression quality (1-100)
 
@@ -95,7 +97,8 @@ def _generate_thumbnail_sync(
 
     """
     try:
-        with PIL.Image.open(io.BytesIO(data)) as img:
+        source = io.BytesIO(data) if isinstance(data, bytes) else data
+        with PIL.Image.open(source) as img:
             img.thumbnail((max_size, max_size))
             buffer = io.BytesIO()
             img.save(buffer, format='WEBP', quality=quality)
@@ -13,6 +13,9 @@ class UploadValidationError(Exception):
     """Raised when an uploaded file fails validation."""
 
 
+# Leading bytes the magic-byte check inspects (filetype's own limit)
+HEAD_BYTES = 8192
+
 # Content types that support magic-byte detection
 _MAGIC_BYTE_TYPES = frozenset(
     {
@@ -44,13 +47,40 @@ def validate_upload(
     Raises:
         UploadValidationError: If validation fails.
 
+    """
+    validate_upload_head(
+        data, len(data), declared_content_type, storage_settings
+    )
+
+
+def validate_upload_head(
+    head: bytes,
+    size: int,
+    declared_content_type: str,
+    storage_settings: settings.Storage | None = None,
+) -> None:
+    """Validate an upload from its first bytes and total size.
+
+    Lets a streamed upload be checked without reading it into memory:
+    ``head`` only needs to cover :data:`HEAD_BYTES` for the magic-byte
+    check.
+
+    Args:
+        head: Leading bytes of the file content
+        size: Total file size in bytes
+        declared_content_type: MIME type declared by the client
+        storage_settings: Storage settings (uses defaults if None)
+
+    Raises:
+        UploadValidationError: If validation fails.
+
     """
     if storage_settings is None:
         storage_settings = settings.get_storage_settings()
 
     _validate_content_type(declared_content_type, storage_settings)
-    _validate_file_size(data, storage_settings)
-    _validate_magic_bytes(data, declared_content_type)
+    _validate_file_size(size, storage_settings)
+    _validate_magic_bytes(head[:HEAD_BYTES], declared_content_type)
 
 
 def _validate_content_type(
@@ -66,14 +96,14 @@ def _validate_content_type(
 
 
 def _validate_file_size(
-    data: bytes,
+    size: int,
     storage_settings: settings.Storage,
 ) -> None:
     """Check that the file size is within limits."""
-    if len(data) > storage_settings.max_file_size:
+    if size > storage_settings.max_file_size:
         max_mb = storage_settings.max_file_size / (1024 * 1024)
         raise UploadValidationError(
-            f'File size {len(data)} bytes exceeds maximum of {max_mb:.0f} MB'
+            f'File size {size} bytes exceeds maximum of {max_mb:.0f} MB'
         )
 
 
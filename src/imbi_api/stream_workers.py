@@ -0,0 +1,196 @@
+"""Bounded, rate-limit-aware worker pool for the sync stream consumers.
+
+The commit, PR and deployment sync consumers read a batch of stream
+entries and used to work through it one entry at a time, so a fleet
+resync moved at one project per process however much upstream
+headroom there was.  :func:`dispatch` runs a batch with up to
+:attr:`AdaptiveConcurrency.limit` entries in flight:
+
+- entries for the same project still run one after another, in stream
+  order, so two jobs never race on a project's status properties;
+- when a job raises
+  :class:`~imbi_common.plugins.errors.PluginRateLimited`, no further
+  entries start (they stay pending for the next reclaim, exactly as
+  the serial loop left them), in-flight ones finish, and the exception
+  is returned so the caller can set the stream's pause.
+
+Plugins report exhaustion, not the remaining budget, so the limit is
+adjusted additively-increase / multiplicatively-decrease: a rate-limit
+halves it, and every ``recover_after`` consecutive successes raise it
+by one, back up to the configured maximum.
+
+Per-stream counters live in-process (:func:`stream_stats`);
+:func:`stream_lag` reads the consumer group's lag and pending count
+from Valkey for the fleet-wide view.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import time
+import typing
+from collections import abc
+
+from imbi_common.plugins.errors import PluginRateLimited
+from valkey import asyncio as valkey
+
+LOGGER = logging.getLogger(__name__)
+
+Entry = tuple[bytes, dict[str, str]]
+
+
+class AdaptiveConcurrency:
+    """In-flight job limit that backs off on upstream rate limits."""
+
+    def __init__(self, maximum: int, *, recover_after: int = 8) -> None:
+        self.maximum = max(1, maximum)
+        self.recover_after = max(1, recover_after)
+        self.limit = self.maximum
+        self._streak = 0
+
+    def succeeded(self) -> None:
+        """Record a finished job; grow the limit after a clean streak."""
+        self._streak += 1
+        if self._streak >= self.recover_after and self.limit < self.maximum:
+            self.limit += 1
+            self._streak = 0
+
+    def rate_limited(self) -> None:
+        """Halve the limit (never below one)."""
+        self.limit = max(1, self.limit // 2)
+        self._streak = 0
+
+
+@dataclasses.dataclass(slots=True)
+class StreamStats:
+    """This process's counters for one stream consumer."""
+
+    stream: str
+    processed: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    in_flight: int = 0
+    concurrency: int = 0
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def jobs_per_minute(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.processed * 60 / elapsed if elapsed > 0 else 0.0
+
+
+_stats: dict[str, StreamStats] = {}
+
+
+def stream_stats(stream: str) -> StreamStats:
+    """Return (creating on first use) the counters for *stream*."""
+    stats = _stats.get(stream)
+    if stats is None:
+        stats = _stats[stream] = StreamStats(stream=stream)
+    return stats
+
+
+def all_stream_stats() -> list[StreamStats]:
+    """Counters for every stream this process has consumed."""
+    return list(_stats.values())
+
+
+def clear() -> None:
+    """Drop every stream's counters (tests)."""
+    _stats.clear()
+
+
+async def stream_lag(
+    client: valkey.Valkey, stream: str, group: str
+) -> tuple[int | None, int | None]:
+    """Return ``(lag, pending)`` for *group* on *stream*.
+
+    ``lag`` is the number of entries not yet delivered to the group
+    (``None`` when the server does not report it); ``pending`` is the
+    number delivered but not yet acknowledged.
+    """
+    try:
+        groups = await client.xinfo_groups(stream)
+    except Exception:
+        LOGGER.debug('xinfo_groups failed for %s', stream, exc_info=True)
+        return None, None
+    for info in typing.cast('list[dict[typing.Any, typing.Any]]', groups):
+        fields = {
+            (k.decode() if isinstance(k, bytes) else k): v
+            for k, v in info.items()
+        }
+        name = fields.get('name')
+        if isinstance(name, bytes):
+            name = name.decode()
+        if name != group:
+            continue
+        lag = fields.get('lag')
+        pending = fields.get('pending')
+        return (
+            int(lag) if lag is not None else None,
+            int(pending) if pending is not None else None,
+        )
+    return None, None
+
+
+async def dispatch(
+    entries: abc.Sequence[Entry],
+    handle: abc.Callable[[bytes, dict[str, str]], abc.Awaitable[bool]],
+    limiter: AdaptiveConcurrency,
+    stats: StreamStats,
+) -> PluginRateLimited | None:
+    """Run *handle* over *entries*, up to ``limiter.limit`` at a time.
+
+    *handle* processes and acknowledges one entry, returning ``False``
+    for a recorded failure; it raises :class:`PluginRateLimited` to stop
+    the batch.  Returns that exception, or ``None`` when the batch ran
+    to completion.
+    """
+    lanes: dict[str, list[Entry]] = {}
+    for msg_id, fields in entries:
+        lanes.setdefault(fields.get('project_id') or '', []).append(
+            (msg_id, fields)
+        )
+    stopped: list[PluginRateLimited] = []
+    ready = asyncio.Condition()
+
+    async def acquire() -> bool:
+        async with ready:
+            await ready.wait_for(
+                lambda: stopped or stats.in_flight < limiter.limit
+            )
+            if stopped:
+                return False
+            stats.in_flight += 1
+            return True
+
+    async def release() -> None:
+        async with ready:
+            stats.in_flight -= 1
+            stats.concurrency = limiter.limit
+            ready.notify_all()
+
+    async def run_lane(lane: list[Entry]) -> None:
+        for msg_id, fields in lane:
+            if not await acquire():
+                return
+            try:
+                ok = await handle(msg_id, fields)
+            except PluginRateLimited as exc:
+                stats.rate_limited += 1
+                limiter.rate_limited()
+                stopped.append(exc)
+                return
+            finally:
+                await release()
+            stats.processed += 1
+            if ok:
+                limiter.succeeded()
+            else:
+                stats.failed += 1
+
+    stats.concurrency = limiter.limit
+    await asyncio.gather(*(run_lane(lane) for lane in lanes.values()))
+    return stopped[0] if stopped else None
@@ -450,6 +450,29 @@ class ResourcePermissionTestCase(unittest.IsolatedAsyncioTestCase):
 
         self.assertFalse(has_access)
 
+    async def test_check_resource_permission_uses_label(self) -> None:
+        """The resource label is part of the match pattern."""
+        mock_db = mock.AsyncMock()
+        mock_db.execute.return_value = []
+
+        await permissions.check_resource_permission(
+            mock_db, 'testuser', 'Project', 'test-project', 'read'
+        )
+
+        query = mock_db.execute.await_args.args[0]
+        self.assertIn('(resource:Project ', query)
+        self.assertNotIn('labels(resource)', query)
+
+    async def test_check_resource_permission_unknown_label(self) -> None:
+        """Labels outside the resource map are rejected."""
+        mock_db = mock.AsyncMock()
+
+        with self.assertRaises(ValueError):
+            await permissions.check_resource_permission(
+                mock_db, 'testuser', 'Project) DETACH DELETE (x', 'x', 'read'
+            )
+        mock_db.execute.assert_not_awaited()
+
     async def test_check_resource_permission_no_access(self) -> None:
         """Test checking resource permission with no CAN_ACCESS."""
         mock_db = mock.AsyncMock()
@@ -539,7 +562,13 @@ class ResourceAccessDependencyTestCase(
         )
 
         mock_db = mock.AsyncMock()
-        mock_db.execute.return_value = [{'allowed': True}]
+        mock_db.execute.return_value = [
+            {
+                'labels': ['Blueprint'],
+                'slug': 'test-slug',
+                'actions': ['read'],
+            }
+        ]
 
         check_fn = permissions.require_resource_access('blueprint', 'read')
 
@@ -551,6 +580,39 @@ class ResourceAccessDependencyTestCase(
 
         self.assertEqual(result, user_context)
 
+    async def test_require_resource_access_loads_map_once(self) -> None:
+        """Repeat checks reuse the CAN_ACCESS map memoized on auth."""
+        user_context = permissions.AuthContext(
+            user=self.regular_user,
+            session_id='test-session',
+            auth_method='jwt',
+            permissions=set(),
+        )
+        mock_db = mock.AsyncMock()
+        mock_db.execute.return_value = [
+            {'labels': ['Project'], 'slug': 'a', 'actions': ['read']},
+            {'labels': ['Project'], 'slug': 'b', 'actions': ['read']},
+            {'labels': ['Team'], 'slug': 'a', 'actions': ['write']},
+        ]
+
+        check_fn = permissions.require_resource_access('project', 'read')
+
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            await check_fn('a', user_context, mock_db)
+            await check_fn('b', user_context, mock_db)
+            with self.assertRaises(fastapi.HTTPException):
+                await check_fn('c', user_context, mock_db)
+
+        mock_db.execute.assert_awaited_once()
+        self.assertEqual(
+            user_context.resource_access[('Team', 'a')],
+            frozenset({'write'}),
+        )
+        self.assertNotIn('resource_access', user_context.model_dump())
+
     async def test_require_resource_access_denied(self) -> None:
         """Test access denied when user has no permission."""
         user_context = permissions.AuthContext(
@@ -0,0 +1,194 @@
+"""Tests for the JWT AuthContext cache and its pub/sub invalidation."""
+
+import datetime
+import unittest
+from unittest import mock
+
+import fastapi
+from imbi_common.auth import core
+
+from imbi_api import models, settings
+from imbi_api.auth import invalidation, permissions
+
+
+class JWTCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    """authenticate_jwt caches resolved contexts keyed by ``jti``."""
+
+    def setUp(self) -> None:
+        permissions.clear_jwt_cache()
+        permissions.clear_api_key_cache()
+        self.addCleanup(permissions.clear_jwt_cache)
+        self.auth_settings = settings.Auth(
+            jwt_secret='test-secret-key-32-characters!',
+            jwt_algorithm='HS256',
+            access_token_expire_seconds=3600,
+        )
+        self.user = models.User(
+            email='test@example.com',
+            display_name='Test User',
+            is_active=True,
+            created_at=datetime.datetime.now(datetime.UTC),
+        )
+        self.mock_db = mock.AsyncMock()
+
+        def execute_side_effect(query, params=None, columns=None):
+            if 'TokenMetadata' in query:
+                return [{'revoked': False}]
+            if 'MEMBER_OF' in query or 'GRANTS' in query:
+                return [{'permissions': ['blueprint:read']}]
+            return []
+
+        self.mock_db.execute = mock.AsyncMock(side_effect=execute_side_effect)
+        self.mock_db.match.return_value = [self.user]
+        patcher = mock.patch(
+            'imbi_common.graph.parse_agtype', side_effect=lambda x: x
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _token(self) -> str:
+        return core.create_access_token(
+            self.user.email, auth_settings=self.auth_settings
+        )
+
+    async def test_second_call_hits_cache(self) -> None:
+        token = self._token()
+        first = await permissions.authenticate_jwt(
+            self.mock_db, token, self.auth_settings
+        )
+        calls = self.mock_db.execute.await_count
+        second = await permissions.authenticate_jwt(
+            self.mock_db, token, self.auth_settings
+        )
+        self.assertIs(second, first)
+        self.assertEqual(self.mock_db.execute.await_count, calls)
+        self.assertEqual(self.mock_db.match.await_count, 1)
+        stats = permissions.jwt_cache_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    async def test_invalidate_token_forces_reload(self) -> None:
+        token = self._token()
+        ctx = await permissions.authenticate_jwt(
+            self.mock_db, token, self.auth_settings
+        )
+        permissions.invalidate_token(ctx.session_id)
+        await permissions.authenticate_jwt(
+            self.mock_db, token, self.auth_settings
+        )
+        self.assertEqual(self.mock_db.match.await_count, 2)
+        self.assertEqual(permissions.jwt_cache_stats()['invalidations'], 1)
+
+    async def test_invalidate_principal_drops_all_tokens(self) -> None:
+        first, second = self._token(), self._token()
+        for token in (first, second):
+            await permissions.authenticate_jwt(
+                self.mock_db, token, self.auth_settings
+            )
+        permissions.invalidate_principal('other@example.com')
+        self.assertEqual(permissions.jwt_cache_stats()['size'], 2)
+        permissions.invalidate_principal(self.user.email)
+        self.assertEqual(permissions.jwt_cache_stats()['size'], 0)
+
+    async def test_invalidate_user_drops_only_that_user(self) -> None:
+        await permissions.authenticate_jwt(
+            self.mock_db, self._token(), self.auth_settings
+        )
+        permissions.invalidate_user('someone-else')
+        self.assertEqual(permissions.jwt_cache_stats()['size'], 1)
+        permissions.invalidate_user(self.user.id)
+        self.assertEqual(permissions.jwt_cache_stats()['size'], 0)
+
+    async def test_invalidate_all(self) -> None:
+        await permissions.authenticate_jwt(
+            self.mock_db, self._token(), self.auth_settings
+        )
+        permissions.invalidate_all()
+        self.assertEqual(permissions.jwt_cache_stats()['size'], 0)
+
+    async def test_revoked_token_is_not_cached(self) -> None:
+        self.mock_db.execute = mock.AsyncMock(return_value=[{'revoked': True}])
+        token = self._token()
+        for _ in range(2):
+            with self.assertRaises(fastapi.HTTPException):
+                await permissions.authenticate_jwt(
+                    self.mock_db, token, self.auth_settings
+                )
+        self.assertEqual(self.mock_db.execute.await_count, 2)
+        self.assertEqual(permissions.jwt_cache_stats()['size'], 0)
+
+
+class InvalidationPublishTestCase(unittest.IsolatedAsyncioTestCase):
+    """publish_* helpers drop locally and fan out over Valkey."""
+
+    def setUp(self) -> None:
+        permissions.clear_jwt_cache()
+        self.addCleanup(permissions.clear_jwt_cache)
+
+    async def test_publish_principal_changed(self) -> None:
+        mock_client = mock.AsyncMock()
+        with (
+            mock.patch.object(
+                invalidation.valkey, 'get_client', return_value=mock_client
+            ),
+            mock.patch.object(
+                permissions, 'invalidate_principal'
+            ) as invalidate,
+        ):
+            await invalidation.publish_principal_changed('a@example.com')
+        invalidate.assert_called_once_with('a@example.com')
+        mock_client.publish.assert_awaited_once_with(
+            'imbi:auth:invalidate', 'principal:a@example.com'
+        )
+
+    async def test_publish_without_valkey_is_local_only(self) -> None:
+        with (
+            mock.patch.object(
+                invalidation.valkey,
+                'get_client',
+                side_effect=RuntimeError('no valkey'),
+            ),
+            mock.patch.object(permissions, 'invalidate_token') as invalidate,
+        ):
+            await invalidation.publish_token_revoked('jti-1')
+        invalidate.assert_called_once_with('jti-1')
+
+    async def test_publish_failure_is_swallowed(self) -> None:
+        mock_client = mock.AsyncMock()
+        mock_client.publish.side_effect = ConnectionError('down')
+        with mock.patch.object(
+            invalidation.valkey, 'get_client', return_value=mock_client
+        ):
+            await invalidation.publish_all_changed()
+        mock_client.publish.assert_awaited_once_with(
+            'imbi:auth:invalidate', 'all:'
+        )
+
+    def test_apply_dispatches_by_kind(self) -> None:
+        with (
+            mock.patch.object(permissions, 'invalidate_token') as by_jti,
+            mock.patch.object(
+                permissions, 'invalidate_principal'
+            ) as by_principal,
+            mock.patch.object(permissions, 'invalidate_user') as by_user,
+            mock.patch.object(permissions, 'invalidate_all') as everything,
+        ):
+            invalidation._apply('jti:abc')
+            invalidation._apply('principal:svc-bot')
+            invalidation._apply('user:u-1')
+            invalidation._apply('all:')
+            invalidation._apply('bogus')
+        by_jti.assert_called_once_with('abc')
+        by_principal.assert_called_once_with('svc-bot')
+        by_user.assert_called_once_with('u-1')
+        everything.assert_called_once_with()
+
+    async def test_hook_without_valkey(self) -> None:
+        with mock.patch.object(
+            invalidation.valkey,
+            'get_client',
+            side_effect=RuntimeError('no valkey'),
+        ):
+            async with invalidation.auth_invalidation_hook():
+                pass
@@ -0,0 +1,35 @@
+"""Opt-in benchmarks against live backing services.
+
+Skipped unless ``IMBI_BENCHMARKS`` is set; run them after ``just
+docker`` with the generated ``.env`` loaded, e.g.
+``IMBI_BENCHMARKS=1 uv run --env-file=.env pytest tests/benchmarks``.
+"""
+
+import os
+import statistics
+import time
+import typing
+import unittest
+
+ENABLED = bool(os.environ.get('IMBI_BENCHMARKS'))
+
+skip_unless_enabled = unittest.skipUnless(
+    ENABLED, 'set IMBI_BENCHMARKS=1 to run benchmarks'
+)
+
+
+async def median_seconds(
+    func: typing.Callable[[], typing.Awaitable[typing.Any]],
+    *,
+    rounds: int = 25,
+    warmup: int = 3,
+) -> float:
+    """Return the median wall time of ``rounds`` awaited calls."""
+    for _ in range(warmup):
+        await func()
+    samples: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
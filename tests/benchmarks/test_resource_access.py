@@ -0,0 +1,106 @@
+"""Resource-level access checks stay flat as the graph grows.
+
+Seeds one user with a ``CAN_ACCESS`` grant on one project, then adds
+batches of unrelated vertices and re-times
+:func:`permissions.check_resource_permission` and
+:func:`permissions.load_resource_access`. With the label in the match
+pattern neither lookup should scale with the total vertex count.
+"""
+
+import datetime
+import unittest
+
+from imbi_common import graph
+
+from imbi_api import models
+from imbi_api.auth import permissions
+from tests import benchmarks
+
+_EMAIL = 'bench-resource-access@example.com'
+_SLUG = 'bench-resource-access'
+_FILLER_BATCH = 5000
+_FILLER_STEPS = 4
+# Generous bound: timing noise on shared CI runners easily reaches
+# 50%, while an unlabeled scan grows roughly linearly (5x here).
+_MAX_GROWTH = 2.0
+
+
+@benchmarks.skip_unless_enabled
+class ResourceAccessBenchmark(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.db = graph.Graph()
+        await self.db.open()
+        await self._cleanup()
+        await self.db.execute(
+            'CREATE (u:User {{email: {email}}})'
+            '-[:CAN_ACCESS {{actions: ["read"]}}]->'
+            '(p:Project {{slug: {slug}}}) RETURN u',
+            {'email': _EMAIL, 'slug': _SLUG},
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self._cleanup()
+        await self.db.close()
+
+    async def _cleanup(self) -> None:
+        await self.db.execute(
+            'MATCH (n:BenchmarkFiller) DETACH DELETE n RETURN count(n)', {}
+        )
+        await self.db.execute(
+            'MATCH (u:User {{email: {email}}}) '
+            'OPTIONAL MATCH (u)-[:CAN_ACCESS]->(p:Project {{slug: {slug}}}) '
+            'DETACH DELETE u, p RETURN count(u)',
+            {'email': _EMAIL, 'slug': _SLUG},
+        )
+
+    async def _add_filler(self, offset: int) -> None:
+        await self.db.execute(
+            'UNWIND range({start}, {stop}) AS i '
+            "CREATE (:BenchmarkFiller {{slug: 'filler-' + toString(i)}}) "
+            'RETURN count(i)',
+            {'start': offset, 'stop': offset + _FILLER_BATCH - 1},
+        )
+
+    async def _time_lookups(self) -> tuple[float, float]:
+        async def check() -> None:
+            allowed = await permissions.check_resource_permission(
+                self.db, _EMAIL, 'Project', _SLUG, 'read'
+            )
+            self.assertTrue(allowed)
+
+        async def load_map() -> None:
+            auth = permissions.AuthContext(
+                user=models.User(
+                    email=_EMAIL,
+                    display_name='Bench',
+                    created_at=datetime.datetime.now(datetime.UTC),
+                ),
+                auth_method='jwt',
+                session_id='bench',
+            )
+            access = await permissions.load_resource_access(self.db, auth)
+            self.assertIn(('Project', _SLUG), access)
+
+        return (
+            await benchmarks.median_seconds(check),
+            await benchmarks.median_seconds(load_map),
+        )
+
+    async def test_lookup_is_flat_in_vertex_count(self) -> None:
+        baseline_check, baseline_map = await self._time_lookups()
+        for step in range(_FILLER_STEPS):
+            await self._add_filler(step * _FILLER_BATCH)
+        grown_check, grown_map = await self._time_lookups()
+        vertices = _FILLER_STEPS * _FILLER_BATCH
+        self.assertLess(
+            grown_check,
+            baseline_check * _MAX_GROWTH,
+            f'check_resource_permission: {baseline_check * 1000:.2f}ms'
+            f' -> {grown_check * 1000:.2f}ms (+{vertices} vertices)',
+        )
+        self.assertLess(
+            grown_map,
+            baseline_map * _MAX_GROWTH,
+            f'load_resource_access: {baseline_map * 1000:.2f}ms'
+            f' -> {grown_map * 1000:.2f}ms (+{vertices} vertices)',
+        )
@@ -0,0 +1,115 @@
+"""Ingest time per SBoM PUT on a 5,000-component CycloneDX document.
+
+Times :func:`sbom.replace_release_components` for the cold ingest of a
+synthetic document, a re-PUT of the same document, and a re-PUT in
+which a small slice of components moved to a new version. The diff
+means the last two should cost a fraction of the first.
+"""
+
+import time
+import typing
+import unittest
+
+from imbi_common import graph
+
+from imbi_api import sbom
+from tests import benchmarks
+
+_RELEASE_ID = 'bench-sbom-ingest'
+_PURL_PREFIX = 'pkg:generic/bench-sbom-'
+_COMPONENTS = 5000
+_BUMPED = 50
+
+
+def _document(bump: int = 0) -> dict[str, typing.Any]:
+    """A CycloneDX 1.7 document; the first ``bump`` get a new version."""
+    components = []
+    for i in range(_COMPONENTS):
+        version = f'1.{int(i < bump)}.{i}'
+        purl = f'{_PURL_PREFIX}{i}@{version}'
+        components.append(
+            {
+                'type': 'library',
+                'bom-ref': purl,
+                'name': f'bench-sbom-{i}',
+                'version': version,
+                'purl': purl,
+                'licenses': [{'license': {'id': 'MIT'}}],
+                'scope': 'required',
+            }
+        )
+    return {
+        'bomFormat': 'CycloneDX',
+        'specVersion': '1.7',
+        'version': 1,
+        'components': components,
+    }
+
+
+@benchmarks.skip_unless_enabled
+class SbomIngestBenchmark(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.db = graph.Graph()
+        await self.db.open()
+        await self._cleanup()
+        await self.db.execute(
+            'CREATE (r:Release {{id: {release_id}}}) RETURN r',
+            {'release_id': _RELEASE_ID},
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self._cleanup()
+        await self.db.close()
+
+    async def _cleanup(self) -> None:
+        await self.db.execute(
+            'MATCH (r:Release {{id: {release_id}}}) '
+            'DETACH DELETE r RETURN count(r)',
+            {'release_id': _RELEASE_ID},
+        )
+        await self.db.execute(
+            'MATCH (c:Component) WHERE c.purl_name STARTS WITH {prefix} '
+            'OPTIONAL MATCH (c)-[:HAS_RELEASE]->(cr:ComponentRelease) '
+            'OPTIONAL MATCH (c)-[:IDENTIFIED_BY]->(ci:ComponentIdentifier) '
+            'DETACH DELETE c, cr, ci RETURN count(c)',
+            {'prefix': _PURL_PREFIX},
+        )
+
+    async def test_ingest_time_per_put(self) -> None:
+        original = sbom.parse(_document())
+        bumped = sbom.parse(_document(_BUMPED))
+
+        start = time.perf_counter()
+        summary = await sbom.replace_release_components(
+            self.db, _RELEASE_ID, original
+        )
+        cold = time.perf_counter() - start
+        self.assertEqual(summary.added, _COMPONENTS)
+
+        async def unchanged() -> None:
+            result = await sbom.replace_release_components(
+                self.db, _RELEASE_ID, original
+            )
+            self.assertEqual(result.unchanged, _COMPONENTS)
+
+        documents = [bumped, original]
+
+        async def small_change() -> None:
+            documents.reverse()
+            result = await sbom.replace_release_components(
+                self.db, _RELEASE_ID, documents[0]
+            )
+            self.assertEqual(result.removed, _BUMPED)
+
+        repeat = await benchmarks.median_seconds(unchanged, rounds=5, warmup=1)
+        changed = await benchmarks.median_seconds(
+            small_change, rounds=6, warmup=0
+        )
+        timings = (
+            f'SBoM ingest ({_COMPONENTS} components):'
+            f' cold {cold * 1000:.0f}ms,'
+            f' unchanged {repeat * 1000:.0f}ms,'
+            f' {_BUMPED} bumped {changed * 1000:.0f}ms'
+        )
+        self.assertLess(repeat, cold, timings)
+        self.assertLess(changed, cold, timings)
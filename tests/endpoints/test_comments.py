@@ -203,7 +203,7 @@ class CommentEndpointsTestCase(support.SharedAppTestCase):
                 'imbi_common.graph.parse_agtype', side_effect=lambda x: x
             ),
             mock.patch(
-                'imbi_api.endpoints.comments.ch_client.Clickhouse'
+                'imbi_api.event_buffer.clickhouse.client.Clickhouse'
                 '.get_instance',
                 return_value=ch,
             ),
@@ -234,7 +234,7 @@ class CommentEndpointsTestCase(support.SharedAppTestCase):
                 'imbi_common.graph.parse_agtype', side_effect=lambda x: x
             ),
             mock.patch(
-                'imbi_api.endpoints.comments.ch_client.Clickhouse'
+                'imbi_api.event_buffer.clickhouse.client.Clickhouse'
                 '.get_instance',
                 return_value=ch,
             ),
@@ -255,7 +255,7 @@ class CommentEndpointsTestCase(support.SharedAppTestCase):
                 'imbi_common.graph.parse_agtype', side_effect=lambda x: x
             ),
             mock.patch(
-                'imbi_api.endpoints.comments.ch_client.Clickhouse'
+                'imbi_api.event_buffer.clickhouse.client.Clickhouse'
                 '.get_instance',
                 return_value=ch,
             ),
@@ -287,7 +287,7 @@ class CommentEndpointsTestCase(support.SharedAppTestCase):
                 'imbi_common.graph.parse_agtype', side_effect=lambda x: x
             ),
             mock.patch(
-                'imbi_api.endpoints.comments.ch_client.Clickhouse'
+                'imbi_api.event_buffer.clickhouse.client.Clickhouse'
                 '.get_instance',
                 return_value=ch,
             ),
@@ -139,6 +139,12 @@ class DashboardStatusEndpointTestCase(support.SharedAppTestCase):
         self.assertEqual(0.0, services['API']['latency_ms'])
         self.assertEqual('2.8.0', services['Assistant']['version'])
 
+        caches = {c['name']: c['counters'] for c in body['caches']}
+        self.assertEqual(0, caches['plugin_logs']['hits'])
+        self.assertIn('size', caches['plugin_logs'])
+        self.assertIn('negative_hits', caches['plugin_compare'])
+        self.assertIn('invalidations', caches['auth_jwt'])
+
     def test_datastore_error_reported(self) -> None:
         """A failing datastore check returns status=error, not a 500."""
         self.mock_db.execute.side_effect = RuntimeError('pool closed')
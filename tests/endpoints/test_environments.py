@@ -498,6 +498,27 @@ class EnvironmentEndpointsTestCase(support.SharedAppTestCase):
 
         self.assertEqual(response.status_code, 204)
 
+    def test_delete_environment_purges_deployment_history(self) -> None:
+        """Deleting an environment drops its deployment events."""
+        self.mock_db.execute.return_value = [{'release_ids': ['rel-1']}]
+
+        with (
+            mock.patch(
+                'imbi_common.graph.parse_agtype',
+                side_effect=lambda x: x,
+            ),
+            mock.patch(
+                'imbi_api.deployment_events.purge',
+                new_callable=mock.AsyncMock,
+            ) as purge,
+        ):
+            response = self.client.delete(
+                '/organizations/engineering/environments/production',
+            )
+
+        self.assertEqual(response.status_code, 204)
+        purge.assert_awaited_once_with(self.mock_db, ['rel-1'], 'production')
+
     def test_delete_environment_not_found(self) -> None:
         """Test deleting nonexistent environment."""
         self.mock_db.execute.return_value = []
@@ -1,17 +1,25 @@
 """Tests for the admin graph query endpoints."""
 
+import asyncio
 import datetime
 import json
+import time
+import typing
+import unittest
 from unittest import mock
 
 import psycopg
 from fastapi import testclient
 from imbi_common import graph
 
-from imbi_api import models
+from imbi_api import models, settings
 from imbi_api.auth import password, permissions
+from imbi_api.endpoints import graph_query
 from tests import support
 
+_ANALYZED_AT = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+_NO_SCHEMA_TTL = {'IMBI_GRAPH_QUERY_SCHEMA_TTL': '0'}
+
 
 def _build_user(*, is_admin: bool) -> models.User:
     return models.User(
@@ -24,6 +32,22 @@ def _build_user(*, is_admin: bool) -> models.User:
     )
 
 
+def _syntax_error() -> psycopg.Error:
+    class FakeDiag:
+        message_primary = 'syntax error at or near "RETUR"'
+        sqlstate = '42601'
+        statement_position = '14'
+        message_hint = None
+
+    # ``psycopg.Error`` defines ``diag`` as a libpq-backed property with
+    # no setter. A plain attribute on a stand-in subclass would be
+    # shadowed by the descriptor, so we override the class attribute.
+    class FakeSyntaxError(psycopg.Error):
+        diag = FakeDiag()  # type: ignore[assignment]
+
+    return FakeSyntaxError('syntax error at or near "RETUR"')
+
+
 class GraphQueryEndpointTestCase(support.SharedAppTestCase):
     """Tests for ``POST /admin/graph/query``."""
 
@@ -43,12 +67,38 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
         )
 
         self.mock_db = mock.AsyncMock(spec=graph.Graph)
-        # Schema endpoint accesses ``db.settings.graph_name`` and
-        # ``db.pool``; tests touching the schema endpoint configure
-        # these via mocks of their own.
+        self.mock_db.settings = mock.MagicMock()
+        self.mock_db.settings.graph_name = 'imbi'
         self.test_app.dependency_overrides[graph._inject_graph] = lambda: (
             self.mock_db
         )
+
+        # ``_fetch_rows`` owns the pooled connection; stand in for it
+        # with a generator over ``self.rows`` that raises
+        # ``self.fetch_error`` once they run out.
+        self.rows: list[tuple[typing.Any, ...]] = []
+        self.fetch_error: Exception | None = None
+        self.fetch_calls: list[tuple[typing.Any, ...]] = []
+
+        async def fake_fetch_rows(
+            db: typing.Any,
+            statement: typing.Any,
+            params: dict[str, typing.Any],
+            timeout_seconds: float,
+        ) -> typing.AsyncGenerator[tuple[typing.Any, ...]]:
+            self.fetch_calls.append((statement, params, timeout_seconds))
+            for row in self.rows:
+                yield row
+            if self.fetch_error is not None:
+                raise self.fetch_error
+
+        patcher = mock.patch.object(
+            graph_query, '_fetch_rows', fake_fetch_rows
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        settings.clear_caches()
+        self.addCleanup(settings.clear_caches)
         self.client = testclient.TestClient(self.test_app)
 
     def _set_non_admin(self) -> None:
@@ -71,7 +121,7 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
             )
             + '::vertex'
         )
-        self.mock_db.execute.return_value = [{'u': vertex}]
+        self.rows = [(vertex,)]
 
         response = self.client.post(
             '/admin/graph/query',
@@ -93,6 +143,7 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
         self.assertEqual(data['edges'], [])
         self.assertIn('elapsed_ms', data)
         self.assertIsInstance(data['elapsed_ms'], (int, float))
+        self.assertFalse(data['truncated'])
 
     def test_admin_query_dedupes_nodes_and_edges(self) -> None:
         """Same vertex/edge appearing twice across rows is deduped."""
@@ -128,9 +179,9 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
             )
             + '::edge'
         )
-        self.mock_db.execute.return_value = [
-            {'a': vertex_a, 'r': edge, 'b': vertex_b},
-            {'a': vertex_a, 'r': edge, 'b': vertex_b},
+        self.rows = [
+            (vertex_a, edge, vertex_b),
+            (vertex_a, edge, vertex_b),
         ]
 
         response = self.client.post(
@@ -152,7 +203,7 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
 
     def test_admin_query_scalar_columns(self) -> None:
         """Non-vertex scalar columns are returned as-is."""
-        self.mock_db.execute.return_value = [{'cnt': 5}]
+        self.rows = [(5,)]
 
         response = self.client.post(
             '/admin/graph/query',
@@ -177,7 +228,7 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
 
         self.assertEqual(response.status_code, 403)
         self.assertIn('Admin', response.json()['detail'])
-        self.mock_db.execute.assert_not_awaited()
+        self.assertEqual(self.fetch_calls, [])
 
     def test_empty_query_rejected(self) -> None:
         """Whitespace-only query returns 400 with the empty-query error."""
@@ -190,7 +241,7 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
         body = response.json()
         self.assertIn('error', body['detail'])
         self.assertIn('empty', body['detail']['error']['message'].lower())
-        self.mock_db.execute.assert_not_awaited()
+        self.assertEqual(self.fetch_calls, [])
 
     def test_query_without_return_rejected(self) -> None:
         """A query missing a RETURN clause is rejected with 400."""
@@ -202,27 +253,22 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
         self.assertEqual(response.status_code, 400)
         body = response.json()
         self.assertIn('RETURN', body['detail']['error']['message'])
-        self.mock_db.execute.assert_not_awaited()
+        self.assertEqual(self.fetch_calls, [])
 
-    def test_malformed_query_translates_psycopg_error(self) -> None:
-        """A psycopg syntax error becomes a 400 with structured detail."""
-
-        class FakeDiag:
-            message_primary = 'syntax error at or near "RETUR"'
-            sqlstate = '42601'
-            statement_position = '14'
-            message_hint = None
+    def test_unknown_placeholder_rejected(self) -> None:
+        """A ``{param}`` with no matching param is a 400, not a 500."""
+        response = self.client.post(
+            '/admin/graph/query',
+            json={'query': 'MATCH (n {{id: {missing}}}) RETURN n'},
+        )
 
-        # ``psycopg.Error`` defines ``diag`` as a libpq-backed property
-        # with no setter. A plain attribute on a stand-in subclass
-        # would be shadowed by the descriptor, so we override the
-        # class attribute for the lifetime of this test.
-        class FakeSyntaxError(psycopg.Error):
-            diag = FakeDiag()  # type: ignore[assignment]
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('missing', response.json()['detail']['error']['message'])
+        self.assertEqual(self.fetch_calls, [])
 
-        self.mock_db.execute.side_effect = FakeSyntaxError(
-            'syntax error at or near "RETUR"',
-        )
+    def test_malformed_query_translates_psycopg_error(self) -> None:
+        """A psycopg syntax error becomes a 400 with structured detail."""
+        self.fetch_error = _syntax_error()
 
         response = self.client.post(
             '/admin/graph/query',
@@ -240,22 +286,228 @@ class GraphQueryEndpointTestCase(support.SharedAppTestCase):
         self.assertEqual(err['column'], 14)
 
     def test_query_with_params_passes_through(self) -> None:
-        """The request's ``params`` are forwarded to ``db.execute``."""
-        self.mock_db.execute.return_value = []
-
+        """The request's ``params`` become AGE ``$name`` parameters."""
         response = self.client.post(
             '/admin/graph/query',
             json={
-                'query': 'MATCH (u:User {email: {email}}) RETURN u',
+                'query': 'MATCH (u:User {{email: {email}}}) RETURN u',
                 'params': {'email': 'admin@example.com'},
             },
         )
 
         self.assertEqual(response.status_code, 200, response.text)
-        self.mock_db.execute.assert_awaited_once()
-        call = self.mock_db.execute.await_args
-        assert call is not None
-        self.assertEqual(call.args[1], {'email': 'admin@example.com'})
+        self.assertEqual(len(self.fetch_calls), 1)
+        statement, params, _timeout = self.fetch_calls[0]
+        self.assertEqual(params, {'email': 'admin@example.com'})
+        self.assertIn('{email: $email}', statement.as_string(None))
+
+    def test_rows_past_the_limit_are_truncated(self) -> None:
+        self.rows = [(1,), (2,), (3,)]
+
+        response = self.client.post(
+            '/admin/graph/query',
+            json={'query': 'MATCH (n) RETURN n.x AS x', 'row_limit': 2},
+        )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        data = response.json()
+        self.assertEqual(data['rows'], [{'x': 1}, {'x': 2}])
+        self.assertTrue(data['truncated'])
+        self.assertEqual(data['row_limit'], 2)
+        statement = self.fetch_calls[0][0].as_string(None)
+        self.assertTrue(statement.endswith('LIMIT 3'), statement)
+
+    def test_request_limits_cannot_exceed_settings(self) -> None:
+        with mock.patch.dict(
+            'os.environ',
+            {
+                'IMBI_GRAPH_QUERY_TIMEOUT': '5',
+                'IMBI_GRAPH_QUERY_MAX_ROWS': '10',
+            },
+        ):
+            settings.clear_caches()
+            response = self.client.post(
+                '/admin/graph/query',
+                json={
+                    'query': 'MATCH (n) RETURN n',
+                    'timeout': 600,
+                    'row_limit': 5000,
+                },
+            )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()['row_limit'], 10)
+        self.assertEqual(self.fetch_calls[0][2], 5)
+
+    def test_ndjson_streams_rows_and_summary(self) -> None:
+        self.rows = [(1,), (2,), (3,)]
+
+        response = self.client.post(
+            '/admin/graph/query',
+            json={'query': 'MATCH (n) RETURN n.x AS x', 'row_limit': 2},
+            headers={'Accept': 'application/x-ndjson'},
+        )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertTrue(
+            response.headers['content-type'].startswith('application/x-ndjson')
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(lines[0], {'type': 'columns', 'columns': ['x']})
+        self.assertEqual(
+            [line['row'] for line in lines[1:3]], [{'x': 1}, {'x': 2}]
+        )
+        self.assertEqual(lines[3]['type'], 'summary')
+        self.assertEqual(lines[3]['row_count'], 2)
+        self.assertTrue(lines[3]['truncated'])
+
+    def test_ndjson_failure_after_first_row_ends_with_error(self) -> None:
+        self.rows = [(1,)]
+        self.fetch_error = _syntax_error()
+
+        response = self.client.post(
+            '/admin/graph/query',
+            json={'query': 'MATCH (n) RETURN n.x AS x'},
+            headers={'Accept': 'application/x-ndjson'},
+        )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(
+            [line['type'] for line in lines],
+            [
+                'columns',
+                'row',
+                'error',
+            ],
+        )
+        self.assertEqual(lines[2]['error']['code'], '42601')
+
+
+class RowStreamResponseTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_rows_closed_when_client_disconnects_first(self) -> None:
+        closed = False
+
+        async def rows() -> typing.AsyncGenerator[tuple[typing.Any, ...]]:
+            nonlocal closed
+            try:
+                yield (1,)
+                yield (2,)
+            finally:
+                closed = True
+
+        generator = rows()
+        first = await anext(generator)
+        response = graph_query._RowStreamResponse(
+            generator,
+            graph_query._stream_ndjson(
+                generator,
+                first,
+                ['x'],
+                graph_query._Limits(timeout=5.0, row_limit=10),
+                time.monotonic(),
+            ),
+        )
+
+        async def receive() -> dict[str, typing.Any]:
+            return {'type': 'http.disconnect'}
+
+        async def send(_message: typing.Any) -> None:
+            await asyncio.sleep(1)
+
+        await response(
+            {'type': 'http', 'asgi': {'spec_version': '2.3'}}, receive, send
+        )
+        self.assertTrue(closed)
+
+
+class GraphQueryProfileEndpointTestCase(support.SharedAppTestCase):
+    """Tests for ``POST /admin/graph/query/profile``."""
+
+    def setUp(self) -> None:
+        auth_context = permissions.AuthContext(
+            user=_build_user(is_admin=True),
+            session_id='test-session',
+            auth_method='jwt',
+            permissions=set(),
+        )
+
+        async def mock_get_current_user() -> permissions.AuthContext:
+            return auth_context
+
+        self.test_app.dependency_overrides[permissions.get_current_user] = (
+            mock_get_current_user
+        )
+        self.mock_db = mock.AsyncMock(spec=graph.Graph)
+        self.mock_db.settings = mock.MagicMock()
+        self.mock_db.settings.graph_name = 'imbi'
+        self.test_app.dependency_overrides[graph._inject_graph] = lambda: (
+            self.mock_db
+        )
+        self.client = testclient.TestClient(self.test_app)
+
+    def test_returns_plan_and_sql(self) -> None:
+        plan = [{'Plan': {'Node Type': 'Function Scan'}}]
+        with mock.patch.object(
+            graph_query, '_explain', mock.AsyncMock(return_value=plan)
+        ) as explain:
+            response = self.client.post(
+                '/admin/graph/query/profile',
+                json={'query': 'MATCH (n) RETURN n', 'row_limit': 5},
+            )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        data = response.json()
+        self.assertEqual(data['plan'], plan)
+        self.assertIn("ag_catalog.cypher('imbi'", data['sql'])
+        self.assertTrue(data['sql'].endswith('LIMIT 6'))
+        explain.assert_awaited_once()
+
+    def test_psycopg_error_is_400(self) -> None:
+        with mock.patch.object(
+            graph_query,
+            '_explain',
+            mock.AsyncMock(side_effect=_syntax_error()),
+        ):
+            response = self.client.post(
+                '/admin/graph/query/profile',
+                json={'query': 'MATCH (n) RETURN n'},
+            )
+
+        self.assertEqual(response.status_code, 400, response.text)
+        self.assertEqual(response.json()['detail']['error']['code'], '42601')
+
+
+class BuildStatementTestCase(unittest.TestCase):
+    def test_wraps_cypher_with_columns_params_and_limit(self) -> None:
+        statement = graph_query._build_statement(
+            'imbi',
+            "MATCH (u:User {{email: {email}}}) WHERE u.name =~ 'a%' "
+            'RETURN u, u.name AS name',
+            {'email': 'a@example.com'},
+            ['u', 'name'],
+            10,
+        ).as_string(None)
+
+        self.assertIn("ag_catalog.cypher('imbi',", statement)
+        self.assertIn("{email: $email}) WHERE u.name =~ ''a%''", statement)
+        self.assertIn(', $1)', statement)
+        self.assertIn(
+            'AS ("u" ag_catalog.agtype, "name" ag_catalog.agtype)', statement
+        )
+        self.assertTrue(statement.endswith('LIMIT 11'))
+
+    def test_no_params_omits_parameter_map(self) -> None:
+        statement = graph_query._build_statement(
+            'imbi', 'MATCH (n) RETURN n', {}, ['n'], 1
+        ).as_string(None)
+        self.assertNotIn('$1', statement)
+
+    def test_rejects_non_identifier_param_names(self) -> None:
+        with self.assertRaises(ValueError):
+            graph_query._build_statement(
+                'imbi', 'RETURN 1', {'a-b': 1}, ['x'], 1
+            )
 
 
 class GraphSchemaEndpointTestCase(support.SharedAppTestCase):
@@ -283,19 +535,15 @@ class GraphSchemaEndpointTestCase(support.SharedAppTestCase):
 
         # Build an async-context-manager chain for db.pool.connection()
         # → conn.cursor() → cursor.fetchall()
-        # ``_load_label_counts`` enumerates labels with one query, then
-        # runs a ``count(*)`` per label table — so ``fetchall`` yields
-        # ``(name, kind)`` pairs and ``fetchone`` yields the counts in
-        # label order.
+        # ``_load_label_counts`` reads every label's catalog statistics
+        # in one query: (name, kind, reltuples, n_live_tup,
+        # n_mod_since_analyze, analyzed_at).
         self.mock_cursor = mock.AsyncMock()
         self.mock_cursor.fetchall.return_value = [
-            ('User', 'v'),
-            ('Project', 'v'),
-            ('KNOWS', 'e'),
+            ('User', 'v', 42, 42, 0, _ANALYZED_AT),
+            ('Project', 'v', 17, 17, 0, _ANALYZED_AT),
+            ('KNOWS', 'e', 100, 100, 0, _ANALYZED_AT),
         ]
-        self.mock_cursor.fetchone = mock.AsyncMock(
-            side_effect=[(42,), (17,), (100,)],
-        )
 
         cursor_ctx = mock.MagicMock()
         cursor_ctx.__aenter__ = mock.AsyncMock(return_value=self.mock_cursor)
@@ -371,3 +619,161 @@ class GraphSchemaEndpointTestCase(support.SharedAppTestCase):
         self.assertEqual(response.status_code, 403)
         self.mock_db.pool.connection.assert_not_called()
         self.mock_db.execute.assert_not_awaited()
+
+    def test_schema_is_cached_between_requests(self) -> None:
+        """A fresh cached schema is served without touching the graph."""
+        self.mock_db.execute.return_value = []
+
+        first = self.client.get('/admin/graph/schema')
+        second = self.client.get('/admin/graph/schema')
+
+        self.assertEqual(first.status_code, 200, first.text)
+        self.assertEqual(first.json(), second.json())
+        self.mock_db.pool.connection.assert_called_once()
+        # One property-key sample per vertex label, on the first load.
+        self.assertEqual(self.mock_db.execute.await_count, 2)
+
+    def test_property_keys_are_sampled_per_label(self) -> None:
+        """Each vertex label reports its own sampled keys."""
+        self.mock_cursor.fetchall.return_value = [
+            ('Project', 'v', 17, 17, 0, _ANALYZED_AT),
+            ('User', 'v', 42, 42, 0, _ANALYZED_AT),
+            ('bad-label', 'v', 1, 1, 0, None),
+        ]
+
+        async def execute(
+            query: str, params: dict[str, typing.Any], columns: list[str]
+        ) -> list[dict[str, typing.Any]]:
+            if '`User`' in query:
+                return [{'keys': '["email", "id"]'}]
+            return [{'keys': '["id", "slug"]'}]
+
+        self.mock_db.execute.side_effect = execute
+
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: json.loads(x) if isinstance(x, str) else x,
+        ):
+            response = self.client.get('/admin/graph/schema')
+
+        self.assertEqual(response.status_code, 200, response.text)
+        data = response.json()
+        keys = {lc['label']: lc['property_keys'] for lc in data['node_labels']}
+        self.assertEqual(
+            keys,
+            {
+                'Project': ['id', 'slug'],
+                'User': ['email', 'id'],
+                'bad-label': [],
+            },
+        )
+        self.assertEqual(data['property_keys'], ['email', 'id', 'slug'])
+        # Label names that cannot be quoted safely are never queried.
+        self.assertEqual(self.mock_db.execute.await_count, 2)
+
+
+class EstimateCountTestCase(unittest.TestCase):
+    def test_fresh_statistics_use_reltuples(self) -> None:
+        self.assertEqual(graph_query._estimate_count(1000, 990, 5), 1000)
+
+    def test_never_analyzed_uses_live_counter(self) -> None:
+        self.assertEqual(graph_query._estimate_count(-1, 12, 12), 12)
+        self.assertEqual(graph_query._estimate_count(-1, None, None), 0)
+
+    def test_heavily_modified_uses_live_counter(self) -> None:
+        self.assertEqual(graph_query._estimate_count(100, 250, 150), 250)
+        self.assertEqual(graph_query._estimate_count(0, 7, 7), 7)
+
+    def test_missing_stats_row_uses_reltuples(self) -> None:
+        self.assertEqual(graph_query._estimate_count(100, None, None), 100)
+
+
+class SchemaCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        graph_query.clear()
+        self.addCleanup(graph_query.clear)
+        settings.clear_caches()
+        self.addCleanup(settings.clear_caches)
+        self.db = mock.MagicMock(spec=graph.Graph)
+        self.db.settings = mock.MagicMock()
+        self.db.settings.graph_name = 'imbi'
+        self.auth = permissions.AuthContext(
+            user=_build_user(is_admin=True),
+            session_id='test-session',
+            auth_method='jwt',
+            permissions=set(),
+        )
+
+    def _schema(self, count: int) -> graph_query._CachedSchema:
+        return graph_query._CachedSchema(
+            response=graph_query.GraphSchemaResponse(
+                node_labels=[
+                    graph_query.LabelCount(label='User', count=count)
+                ],
+                edge_types=[],
+                property_keys=[],
+                computed_at=_ANALYZED_AT,
+            ),
+            loaded_at=time.monotonic(),
+        )
+
+    async def test_stale_schema_is_served_while_refreshing(self) -> None:
+        load = mock.AsyncMock(side_effect=[self._schema(n) for n in (1, 2, 3)])
+        with (
+            mock.patch.object(graph_query, '_load_schema', load),
+            mock.patch.dict('os.environ', _NO_SCHEMA_TTL),
+        ):
+            settings.clear_caches()
+            first = await graph_query.get_graph_schema(self.db, self.auth)
+            stale = await graph_query.get_graph_schema(self.db, self.auth)
+            await graph_query._schema_loads['imbi']
+            fresh = await graph_query.get_graph_schema(self.db, self.auth)
+            await graph_query._schema_loads['imbi']
+
+        self.assertEqual(first.node_labels[0].count, 1)
+        self.assertEqual(stale.node_labels[0].count, 1)
+        self.assertEqual(fresh.node_labels[0].count, 2)
+        self.assertEqual(load.await_count, 3)
+
+    async def test_concurrent_first_loads_share_one_query(self) -> None:
+        release = asyncio.Event()
+
+        async def load(db: graph.Graph) -> graph_query._CachedSchema:
+            await release.wait()
+            return self._schema(1)
+
+        with mock.patch.object(
+            graph_query, '_load_schema', mock.AsyncMock(side_effect=load)
+        ) as mock_load:
+            lookups = [
+                asyncio.create_task(
+                    graph_query.get_graph_schema(self.db, self.auth)
+                )
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*lookups)
+
+        self.assertEqual([1, 1, 1], [r.node_labels[0].count for r in results])
+        mock_load.assert_awaited_once()
+        self.assertEqual({}, graph_query._schema_loads)
+
+    async def test_failed_background_refresh_keeps_cached_schema(
+        self,
+    ) -> None:
+        cached = self._schema(1)
+        graph_query._schemas['imbi'] = cached
+        load = mock.AsyncMock(side_effect=RuntimeError('down'))
+        with (
+            mock.patch.object(graph_query, '_load_schema', load),
+            mock.patch.dict('os.environ', _NO_SCHEMA_TTL),
+            self.assertLogs(graph_query.LOGGER, 'WARNING'),
+        ):
+            settings.clear_caches()
+            stale = await graph_query.get_graph_schema(self.db, self.auth)
+            with self.assertRaises(RuntimeError):
+                await graph_query._schema_loads['imbi']
+
+        self.assertEqual(stale.node_labels[0].count, 1)
+        self.assertIs(graph_query._schemas['imbi'], cached)
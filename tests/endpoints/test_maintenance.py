@@ -6,8 +6,9 @@ from unittest import mock
 from fastapi import testclient
 from imbi_common import graph
 
-from imbi_api import models, scoring
+from imbi_api import models, scoring, stream_workers
 from imbi_api.auth import permissions
+from imbi_api.commit_sync import queue as commit_sync_queue
 from imbi_api.maintenance import OPERATIONS, state
 from tests import support
 
@@ -196,3 +197,31 @@ class MaintenanceEndpointTestCase(support.SharedAppTestCase):
                     '/maintenance/operations/rescore/cancel'
                 )
         self.assertEqual(409, response.status_code)
+
+    def test_list_sync_queues(self) -> None:
+        stats = stream_workers.stream_stats(commit_sync_queue.STREAM)
+        stats.processed = 5
+        stats.concurrency = 4
+        with mock.patch.object(
+            stream_workers,
+            'stream_lag',
+            mock.AsyncMock(return_value=(12, 3)),
+        ):
+            with testclient.TestClient(self.test_app) as client:
+                response = client.get('/maintenance/queues')
+        self.assertEqual(200, response.status_code)
+        by_stream = {row['stream']: row for row in response.json()}
+        commit = by_stream[commit_sync_queue.STREAM]
+        self.assertEqual(12, commit['lag'])
+        self.assertEqual(3, commit['pending'])
+        self.assertEqual(5, commit['processed'])
+        self.assertEqual(4, commit['concurrency'])
+        self.assertEqual(3, len(by_stream))
+
+    def test_list_sync_queues_without_valkey(self) -> None:
+        self.test_app.dependency_overrides[scoring._inject_optional_client] = (
+            lambda: None
+        )
+        with testclient.TestClient(self.test_app) as client:
+            response = client.get('/maintenance/queues')
+        self.assertEqual(503, response.status_code)
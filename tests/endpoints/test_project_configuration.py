@@ -623,7 +623,7 @@ class ProjectConfigurationEndpointTestCase(unittest.TestCase):
                     return_value={'token': 'x'},
                 ),
                 mock.patch(
-                    'imbi_api.endpoints.project_configuration.clickhouse'
+                    'imbi_api.event_buffer.clickhouse'
                     '.client.Clickhouse.get_instance',
                     side_effect=RuntimeError('CH down'),
                 ),
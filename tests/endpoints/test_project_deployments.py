@@ -28,7 +28,7 @@ from imbi_common.plugins.base import (
 )
 from imbi_common.plugins.registry import RegistryEntry
 
-from imbi_api import models
+from imbi_api import models, release_state
 from imbi_api.auth import password, permissions
 from imbi_api.endpoints import _helpers, project_deployments
 from imbi_api.endpoints.project_deployments import (
@@ -380,6 +380,24 @@ class ProjectDeploymentsTestCase(support.SharedAppTestCase):
         self.assertEqual(data['ahead'], 1)
         self.assertEqual(data['head_sha'], 'v2')
 
+    def test_compare_plugin_error_is_502(self) -> None:
+        class _Boom(_FakeDeploymentPlugin):
+            async def compare(  # type: ignore[override]
+                self, ctx, credentials, base, head
+            ):
+                raise RuntimeError('secret upstream detail')
+
+        self.mocks['resolve_capability'].return_value = _make_resolved(
+            _Boom, slug='boom', options={}
+        )
+        with testclient.TestClient(self.test_app) as client:
+            response = client.get(
+                '/organizations/myorg/projects/proj1/deployments/'
+                'compare?base=abc1234&head=def5678'
+            )
+        self.assertEqual(response.status_code, 502)
+        self.assertNotIn('secret', response.text)
+
     def test_compare_missing_query_param_400(self) -> None:
         with testclient.TestClient(self.test_app) as client:
             response = client.get(
@@ -950,6 +968,12 @@ class ProjectDeploymentsTestCase(support.SharedAppTestCase):
         self.assertEqual(data[0]['commits_pending'], 1)
         self.assertEqual(data[1]['from_environment'], 'staging')
         self.assertEqual(data[1]['to_environment'], 'production')
+        # The current release per env is read through the pointer
+        # query shared with ``/releases/current``.
+        self.assertIn(
+            project_deployments.CURRENT_RELEASES_QUERY,
+            [c.args[0] for c in self.mock_db.execute.await_args_list],
+        )
 
     def test_promotion_options_picks_latest_release_per_env(self) -> None:
         # Two rows for the same env: an older v6.3.0 with an earlier
@@ -1993,16 +2017,32 @@ class ReleasesTabEndpointsTestCase(ProjectDeploymentsTestCase):
         self.assertEqual(params['limit'], 200)
         self.assertEqual(params['ref'], 'main')
 
+    def _patch_state(self, **fields: typing.Any) -> mock.AsyncMock:
+        """Patch ``release_state.get`` to return one project's state."""
+        state = release_state.ReleaseState(
+            project_id='proj1',
+            computed_at=datetime.datetime.now(datetime.UTC),
+            **fields,
+        )
+        m = mock.AsyncMock(return_value={'proj1': state})
+        patcher = mock.patch.object(release_state, 'get', new=m)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return m
+
     def test_release_drift_with_tag(self) -> None:
         when = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
-        self._patch_query(
-            [
-                [{'name': 'v1.0.0', 'sha': 'tagsha', 'tagged_at': when}],
-                [{'sha': 'headsha'}],
-                [{'authored_at': when}],
-                [self._commit_row('feat1', message='feat: new thing')],
-                [{'c': 1}],
-            ]
+        state = self._patch_state(
+            latest_tag='v1.0.0',
+            latest_tag_sha='tagsha',
+            latest_tag_at=when,
+            latest_tag_semver=True,
+            base_authored_at=when,
+            head_sha='headsha',
+            commits_since_tag=1,
+        )
+        query = self._patch_query(
+            [[self._commit_row('feat1', message='feat: new thing')]]
         )
         with testclient.TestClient(self.test_app) as client:
             response = client.get(f'{self._BASE}/release-drift')
@@ -2013,15 +2053,15 @@ class ReleasesTabEndpointsTestCase(ProjectDeploymentsTestCase):
         self.assertEqual(data['commits_since_tag'], 1)
         self.assertEqual(data['suggested_bump'], 'minor')
         self.assertEqual(data['suggested_tag'], 'v1.1.0')
+        state.assert_awaited_once_with(['proj1'])
+        # One point lookup plus the commit list.
+        query.assert_awaited_once()
+        self.assertEqual(query.await_args.args[1]['since'], when)
 
     def test_release_drift_no_tag(self) -> None:
-        self._patch_query(
-            [
-                [],  # no tags
-                [{'sha': 'headsha'}],
-                [self._commit_row('c1', message='feat: first feature')],
-                [{'c': 1}],
-            ]
+        self._patch_state(head_sha='headsha', commits_since_tag=1)
+        query = self._patch_query(
+            [[self._commit_row('c1', message='feat: first feature')]]
         )
         with testclient.TestClient(self.test_app) as client:
             response = client.get(f'{self._BASE}/release-drift')
@@ -2031,15 +2071,16 @@ class ReleasesTabEndpointsTestCase(ProjectDeploymentsTestCase):
         # No prior tag + a feat commit -> minor bump off v0.0.0 -> v0.1.0.
         self.assertEqual(data['suggested_tag'], 'v0.1.0')
         self.assertEqual(data['commits_since_tag'], 1)
+        self.assertNotIn('since', query.await_args.args[1])
 
     def test_release_drift_tag_commit_not_synced(self) -> None:
-        self._patch_query(
-            [
-                [{'name': 'v2.0.0', 'sha': 'missing', 'tagged_at': None}],
-                [{'sha': 'headsha'}],
-                [],  # base commit not in ClickHouse
-            ]
+        self._patch_state(
+            latest_tag='v2.0.0',
+            latest_tag_sha='missing',
+            latest_tag_semver=True,
+            head_sha='headsha',
         )
+        query = self._patch_query([])
         with testclient.TestClient(self.test_app) as client:
             response = client.get(f'{self._BASE}/release-drift')
         self.assertEqual(response.status_code, 200)
@@ -2047,74 +2088,7 @@ class ReleasesTabEndpointsTestCase(ProjectDeploymentsTestCase):
         self.assertEqual(data['commits_since_tag'], 0)
         self.assertEqual(data['commits'], [])
         self.assertEqual(data['suggested_tag'], 'v2.0.1')
-
-    def test_release_drift_picks_highest_semver_not_newest(self) -> None:
-        """A late-synced lower version must not out-rank the latest release."""
-        older = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
-        newer = datetime.datetime(2026, 6, 1, tzinfo=datetime.UTC)
-        self._patch_query(
-            [
-                [
-                    # v4.1.3 (a backport) was tagged most recently, but
-                    # v7.1.0 is the highest version -> the real base.
-                    {
-                        'name': 'v4.1.3',
-                        'sha': 'sha413',
-                        'tagged_at': newer,
-                        'recorded_at': newer,
-                    },
-                    {
-                        'name': 'v7.1.0',
-                        'sha': 'sha710',
-                        'tagged_at': older,
-                        'recorded_at': older,
-                    },
-                ],
-                [{'sha': 'headsha'}],
-                [{'authored_at': older}],
-                [self._commit_row('feat1', message='feat: new thing')],
-                [{'c': 2}],
-            ]
-        )
-        with testclient.TestClient(self.test_app) as client:
-            response = client.get(f'{self._BASE}/release-drift')
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertEqual(data['latest_tag'], 'v7.1.0')
-        self.assertEqual(data['latest_tag_sha'], 'sha710')
-        # A feat commit bumps the minor off v7.1.0, not off v4.1.3.
-        self.assertEqual(data['suggested_tag'], 'v7.2.0')
-
-    def test_release_drift_latest_tag_at_falls_back_to_recorded_at(
-        self,
-    ) -> None:
-        """``latest_tag_at`` uses ``recorded_at`` when ``tagged_at`` null."""
-        recorded = datetime.datetime(2026, 3, 2, tzinfo=datetime.UTC)
-        self._patch_query(
-            [
-                [
-                    {
-                        'name': 'v1.0.0',
-                        'sha': 'tagsha',
-                        'tagged_at': None,
-                        'recorded_at': recorded,
-                    }
-                ],
-                [{'sha': 'headsha'}],
-                [{'authored_at': recorded}],
-                [self._commit_row('feat1', message='feat: new thing')],
-                [{'c': 1}],
-            ]
-        )
-        with testclient.TestClient(self.test_app) as client:
-            response = client.get(f'{self._BASE}/release-drift')
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsNotNone(data['latest_tag_at'])
-        self.assertEqual(
-            datetime.datetime.fromisoformat(data['latest_tag_at']),
-            recorded,
-        )
+        query.assert_not_awaited()
 
     def test_release_history_joins_tags_and_nodes(self) -> None:
         when = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
@@ -2,6 +2,7 @@
 
 import datetime
 import json
+import typing
 import unittest
 from unittest import mock
 
@@ -47,6 +48,45 @@ class _FakeLogsHandler(LogsCapability):
         return [{'name': 'level', 'type': 'string'}]
 
 
+class _PagedLogsHandler(LogsCapability):
+    """Serves fixed per-env streams, paged by an index cursor."""
+
+    minutes: typing.ClassVar[dict[str, list[int]]] = {
+        'production': [10, 8, 6, 4],
+        'staging': [9, 7, 5],
+    }
+
+    async def search(self, ctx, credentials, query):  # type: ignore[override]
+        stream = self.minutes[ctx.environment]
+        start = int(query.cursor or 0)
+        end = start + query.limit
+        return LogResult(
+            entries=[
+                LogEntry(
+                    timestamp=datetime.datetime(
+                        2026, 1, 1, 0, minute, tzinfo=datetime.UTC
+                    ),
+                    message=f'{ctx.environment}-{minute}',
+                    raw={},
+                )
+                for minute in stream[start:end]
+            ],
+            next_cursor=str(end) if end < len(stream) else None,
+        )
+
+    async def schema(self, ctx, credentials):  # type: ignore[override]
+        return []
+
+
+class _EmptyFirstPageLogsHandler(_PagedLogsHandler):
+    """Staging's first page is empty but points at more entries."""
+
+    async def search(self, ctx, credentials, query):  # type: ignore[override]
+        if ctx.environment == 'staging' and query.cursor is None:
+            return LogResult(entries=[], next_cursor='0')
+        return await super().search(ctx, credentials, query)
+
+
 class _FakePlugin(Plugin):
     pass
 
@@ -275,8 +315,163 @@ class ProjectLogsEndpointTestCase(support.SharedAppTestCase):
                 )
         self.assertEqual(response.status_code, 200)
 
+    def test_search_logs_multi_env_pages_with_cursor(self) -> None:
+        messages: list[str] = []
+        pages = 0
+        cursor: str | None = None
+        with (
+            mock.patch(
+                'imbi_api.endpoints.project_logs.resolve_capability',
+                return_value=_resolved(_PagedLogsHandler),
+            ),
+            mock.patch(
+                'imbi_api.endpoints.project_logs'
+                '.decrypt_integration_credentials',
+                return_value={'token': 'x'},
+            ),
+        ):
+            with testclient.TestClient(self.test_app) as client:
+                while True:
+                    params = {
+                        'environment': ['production', 'staging'],
+                        'limit': 3,
+                    }
+                    if cursor:
+                        params['cursor'] = cursor
+                    response = client.get(
+                        '/organizations/myorg/projects/proj1/logs/',
+                        params=params,
+                    )
+                    self.assertEqual(response.status_code, 200)
+                    data = response.json()
+                    messages.extend(e['message'] for e in data['entries'])
+                    pages += 1
+                    cursor = data['next_cursor']
+                    if cursor is None:
+                        break
+        self.assertEqual(pages, 3)
+        self.assertEqual(
+            messages,
+            [
+                'production-10',
+                'staging-9',
+                'production-8',
+                'staging-7',
+                'production-6',
+                'staging-5',
+                'production-4',
+            ],
+        )
+
+    def test_search_logs_multi_env_follows_empty_page(self) -> None:
+        with (
+            mock.patch(
+                'imbi_api.endpoints.project_logs.resolve_capability',
+                return_value=_resolved(_EmptyFirstPageLogsHandler),
+            ),
+            mock.patch(
+                'imbi_api.endpoints.project_logs'
+                '.decrypt_integration_credentials',
+                return_value={'token': 'x'},
+            ),
+        ):
+            with testclient.TestClient(self.test_app) as client:
+                response = client.get(
+                    '/organizations/myorg/projects/proj1/logs/',
+                    params={
+                        'environment': ['production', 'staging'],
+                        'limit': 3,
+                    },
+                )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [e['message'] for e in response.json()['entries']],
+            ['production-10', 'staging-9', 'production-8'],
+        )
+
+    def test_search_logs_multi_env_invalid_cursor_returns_400(self) -> None:
+        with (
+            mock.patch(
+                'imbi_api.endpoints.project_logs.resolve_capability',
+                return_value=_resolved(_PagedLogsHandler),
+            ),
+            mock.patch(
+                'imbi_api.endpoints.project_logs'
+                '.decrypt_integration_credentials',
+                return_value={'token': 'x'},
+            ),
+        ):
+            with testclient.TestClient(self.test_app) as client:
+                response = client.get(
+                    '/organizations/myorg/projects/proj1/logs/',
+                    params={
+                        'environment': ['production', 'staging'],
+                        'cursor': 'not-a-cursor',
+                    },
+                )
+        self.assertEqual(response.status_code, 400)
+
 
 class ParseFiltersTestCase(unittest.TestCase):
+    def test_merge_histograms_sums_matching_buckets(self) -> None:
+        from imbi_common.plugins.base import LogHistogramBucket
+
+        from imbi_api.endpoints.project_logs import _merge_histograms
+
+        t0 = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+        t1 = t0 + datetime.timedelta(minutes=1)
+        merged = _merge_histograms(
+            [
+                [
+                    LogHistogramBucket(
+                        timestamp=t1, count=2, levels={'INFO': 2}
+                    ),
+                    LogHistogramBucket(timestamp=t0, count=1),
+                ],
+                [
+                    LogHistogramBucket(
+                        timestamp=t1, count=3, levels={'INFO': 1, 'ERROR': 2}
+                    ),
+                ],
+            ]
+        )
+        self.assertEqual([b.timestamp for b in merged], [t0, t1])
+        self.assertEqual([b.count for b in merged], [1, 5])
+        self.assertEqual(merged[1].levels, {'INFO': 3, 'ERROR': 2})
+
+    def test_merge_env_pages_waits_for_unresolved_env(self) -> None:
+        from imbi_api.endpoints.project_logs import (
+            _EnvPosition,
+            _merge_env_pages,
+        )
+
+        entry = LogEntry(
+            timestamp=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+            message='production-0',
+            raw={},
+        )
+        merged, positions = _merge_env_pages(
+            {
+                'production': (
+                    _EnvPosition(None),
+                    LogResult(entries=[entry], next_cursor=None),
+                ),
+                'staging': (
+                    _EnvPosition('p1'),
+                    LogResult(entries=[], next_cursor='p2'),
+                ),
+            },
+            10,
+        )
+        self.assertEqual(merged, [])
+        self.assertEqual(
+            positions,
+            {
+                'production': _EnvPosition(None),
+                'staging': _EnvPosition('p2'),
+            },
+        )
+
     def test_filter_parses_with_value_containing_colon(self) -> None:
         from imbi_api.endpoints.project_logs import _parse_filters
 
@@ -91,14 +91,16 @@ class ListProjectPluginsTestCase(unittest.IsolatedAsyncioTestCase):
             mock.patch.object(pp, 'list_plugins', return_value=[entry]),
             mock.patch.object(pp, 'get_plugin', return_value=entry),
             mock.patch.object(
-                pp,
+                pp.binding_cache,
                 'effective_bindings',
                 new=mock.AsyncMock(
                     side_effect=lambda _db, _pid, kind: bindings.get(kind, [])
                 ),
             ),
             mock.patch.object(
-                pp, 'is_plugin_enabled', new=mock.AsyncMock(return_value=True)
+                pp.binding_cache,
+                'enabled_map',
+                new=mock.AsyncMock(return_value={'github': True}),
             ),
         ):
             out = await pp.list_project_plugins(
@@ -113,12 +115,14 @@ class ListProjectPluginsTestCase(unittest.IsolatedAsyncioTestCase):
             mock.patch.object(pp, 'list_plugins', return_value=[entry]),
             mock.patch.object(pp, 'get_plugin', return_value=entry),
             mock.patch.object(
-                pp,
+                pp.binding_cache,
                 'effective_bindings',
                 new=mock.AsyncMock(return_value=[_binding()]),
             ),
             mock.patch.object(
-                pp, 'is_plugin_enabled', new=mock.AsyncMock(return_value=False)
+                pp.binding_cache,
+                'enabled_map',
+                new=mock.AsyncMock(return_value={'github': False}),
             ),
         ):
             out = await pp.list_project_plugins(
@@ -131,7 +135,7 @@ class ListProjectPluginsTestCase(unittest.IsolatedAsyncioTestCase):
         with (
             mock.patch.object(pp, 'list_plugins', return_value=[entry]),
             mock.patch.object(
-                pp,
+                pp.binding_cache,
                 'effective_bindings',
                 new=mock.AsyncMock(side_effect=LookupError('nope')),
             ),
@@ -1,6 +1,7 @@
 """Tests for project CRUD endpoints."""
 
 import datetime
+import json
 import typing
 import unittest
 from unittest import mock
@@ -10,6 +11,7 @@ from fastapi.testclient import TestClient
 from imbi_common import graph
 
 from imbi_api import models
+from imbi_api.endpoints import _pagination
 from tests import support
 
 PROJECT_ID = 'abc123nanoid'
@@ -1108,6 +1110,27 @@ class ProjectEndpointsTestCase(support.SharedAppTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {'lifecycle_results': []})
 
+    def test_delete_purges_deployment_history(self) -> None:
+        """The deleted project's releases lose their deployment events."""
+        self.mock_db.execute.return_value = [{'release_ids': ['rel-1']}]
+
+        with (
+            mock.patch(
+                'imbi_common.graph.parse_agtype',
+                side_effect=lambda x: x,
+            ),
+            mock.patch(
+                'imbi_api.deployment_events.purge',
+                new_callable=mock.AsyncMock,
+            ) as purge,
+        ):
+            response = self.client.delete(
+                f'/organizations/engineering/projects/{PROJECT_ID}',
+            )
+
+        self.assertEqual(response.status_code, 200)
+        purge.assert_awaited_once_with(self.mock_db, ['rel-1'])
+
     def test_delete_not_found(self) -> None:
         """Test deleting nonexistent project."""
         self.mock_db.execute.return_value = []
@@ -1343,6 +1366,136 @@ class ProjectEndpointsTestCase(support.SharedAppTestCase):
         query = self.mock_db.execute.call_args.args[0]
         self.assertNotIn('coalesce(p.archived, false)', query)
 
+    # -- Pagination / streaming ----------------------------------------
+
+    def _list_rows(self, count: int) -> list[dict[str, typing.Any]]:
+        return [
+            {
+                'project': self._project_data(
+                    id=f'id{index:03d}',
+                    name=f'Project {index:03d}',
+                    slug=f'project-{index:03d}',
+                ),
+                'outbound_count': 0,
+                'inbound_count': 0,
+            }
+            for index in range(count)
+        ]
+
+    def test_list_limit_pages_on_name_and_id(self) -> None:
+        """``limit`` caps the page in Cypher and emits a next Link."""
+        self.mock_db.execute.return_value = self._list_rows(3)
+
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.get(
+                '/organizations/engineering/projects/?limit=2',
+            )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        data = response.json()
+        self.assertEqual([p['id'] for p in data], ['id000', 'id001'])
+        query = self.mock_db.execute.call_args_list[0].args[0]
+        params = self.mock_db.execute.call_args_list[0].args[1]
+        self.assertIn('ORDER BY p.name, p.id', query)
+        self.assertIn('LIMIT {row_limit}', query)
+        self.assertNotIn('{cursor_name}', query)
+        self.assertEqual(params['row_limit'], 3)
+        # The page stage precedes the return fragment so enrichment
+        # OPTIONAL MATCHes only run for the page.
+        self.assertLess(
+            query.index('LIMIT {row_limit}'),
+            query.index('OPTIONAL MATCH'),
+        )
+        link = response.headers['Link']
+        self.assertIn('rel="next"', link)
+        cursor = _pagination.encode_keyset('Project 001', 'id001')
+        self.assertIn(f'cursor={cursor}', link)
+
+    def test_list_cursor_resumes_after_keyset(self) -> None:
+        """A cursor adds the ``(name, id)`` keyset predicate."""
+        self.mock_db.execute.return_value = self._list_rows(1)
+        cursor = _pagination.encode_keyset('My | API', 'abc')
+
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.get(
+                '/organizations/engineering/projects/',
+                params={'limit': 5, 'cursor': cursor},
+            )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        query = self.mock_db.execute.call_args_list[0].args[0]
+        params = self.mock_db.execute.call_args_list[0].args[1]
+        self.assertIn('p.name > {cursor_name}', query)
+        self.assertEqual(params['cursor_name'], 'My | API')
+        self.assertEqual(params['cursor_id'], 'abc')
+        self.assertNotIn('rel="next"', response.headers['Link'])
+
+    def test_list_invalid_cursor(self) -> None:
+        response = self.client.get(
+            '/organizations/engineering/projects/?cursor=%%%',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.mock_db.execute.assert_not_called()
+
+    def test_list_limit_out_of_range(self) -> None:
+        response = self.client.get(
+            '/organizations/engineering/projects/?limit=0',
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_unpaginated_has_no_link_header(self) -> None:
+        self.mock_db.execute.return_value = []
+
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.get(
+                '/organizations/engineering/projects/',
+            )
+
+        self.assertNotIn('Link', response.headers)
+        query = self.mock_db.execute.call_args.args[0]
+        self.assertNotIn('LIMIT', query)
+
+    def test_list_ndjson_streams_every_page(self) -> None:
+        """NDJSON mode walks pages until the keyset is exhausted."""
+        rows = self._list_rows(3)
+        pages = [rows[:3], rows[2:]]
+
+        async def execute(query, params=None, columns=None):
+            if 'LIMIT {row_limit}' in query:
+                return pages.pop(0)
+            return []
+
+        self.mock_db.execute.side_effect = execute
+
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.get(
+                '/organizations/engineering/projects/?limit=2',
+                headers={'Accept': 'application/x-ndjson'},
+            )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertTrue(
+            response.headers['content-type'].startswith('application/x-ndjson')
+        )
+        lines = response.text.splitlines()
+        self.assertEqual(
+            [json.loads(line)['id'] for line in lines],
+            ['id000', 'id001', 'id002'],
+        )
+        self.assertEqual(pages, [])
+
     # -- EXISTS_IN service filtering -----------------------------------
 
     def test_list_by_service_returns_matching_projects(self) -> None:
@@ -290,6 +290,13 @@ class FetchCurrentReleasesTestCase(unittest.IsolatedAsyncioTestCase):
             result = await projects._fetch_current_releases(db, ['p1'])
         self.assertEqual(result, {})
 
+    async def test_reads_through_current_release_pointer(self) -> None:
+        db = mock.AsyncMock()
+        db.execute.return_value = []
+        await projects._fetch_current_releases(db, ['p1'])
+        query = db.execute.await_args.args[0]
+        self.assertIn('r.id = di.current_release', query)
+
     async def test_swallows_graph_errors(self) -> None:
         db = mock.AsyncMock()
         db.execute.side_effect = RuntimeError('graph down')
@@ -141,36 +141,33 @@ class ListOrgPullRequestsTestCase(_PullRequestsTestBase):
         return f'/organizations/{ORG}/pull-requests/{query}'
 
     def test_list_empty_when_no_projects(self) -> None:
-        self.mock_db.execute.return_value = []
-        response = self.client.get(self._url())
+        with mock.patch(
+            'imbi_api.endpoints.pull_requests.clickhouse.query',
+            new=mock.AsyncMock(
+                side_effect=[[{'total': 0, 'project_count': 0}], []]
+            ),
+        ):
+            response = self.client.get(self._url())
         self.assertEqual(response.status_code, 200)
         body = response.json()
         self.assertEqual(body['total'], 0)
         self.assertEqual(body['project_count'], 0)
         self.assertEqual(body['data'], [])
+        self.assertIsNone(body['next_cursor'])
+        self.mock_db.execute.assert_not_called()
 
     def test_list_returns_prs_across_org_projects(self) -> None:
-        self.mock_db.execute.return_value = [
-            {'id': PROJECT_ID},
-            {'id': 'proj-2'},
-        ]
-        with (
-            mock.patch(
-                'imbi_common.graph.parse_agtype',
-                side_effect=lambda x: x,
-            ),
-            mock.patch(
-                'imbi_api.endpoints.pull_requests.clickhouse.query',
-                new=mock.AsyncMock(
-                    side_effect=[
-                        [{'total': 2, 'project_count': 2}],
-                        [
-                            _pr_row(pr_id='pr-a', pr_number=1),
-                            _pr_row(pr_id='pr-b', pr_number=2),
-                        ],
-                    ]
-                ),
-            ),
+        query = mock.AsyncMock(
+            side_effect=[
+                [{'total': 2, 'project_count': 2}],
+                [
+                    _pr_row(pr_id='pr-a', pr_number=1),
+                    _pr_row(pr_id='pr-b', pr_number=2),
+                ],
+            ]
+        )
+        with mock.patch(
+            'imbi_api.endpoints.pull_requests.clickhouse.query', new=query
         ):
             response = self.client.get(
                 self._url('?state=open&author=alice&limit=10&offset=0')
@@ -179,6 +176,42 @@ class ListOrgPullRequestsTestCase(_PullRequestsTestBase):
         body = response.json()
         self.assertEqual(body['total'], 2)
         self.assertEqual(len(body['data']), 2)
+        sql, params = query.await_args_list[1].args
+        self.assertIn('project_membership', sql)
+        self.assertEqual(params['org_slug'], ORG)
+        self.assertNotIn('project_ids', params)
+
+    def test_list_pages_by_keyset_cursor(self) -> None:
+        query = mock.AsyncMock(
+            side_effect=[
+                [{'total': 2, 'project_count': 1}],
+                [
+                    _pr_row(pr_id='pr-b', pr_number=2),
+                    _pr_row(pr_id='pr-a', pr_number=1),
+                ],
+                [{'total': 2, 'project_count': 1}],
+                [_pr_row(pr_id='pr-a', pr_number=1)],
+            ]
+        )
+        with mock.patch(
+            'imbi_api.endpoints.pull_requests.clickhouse.query', new=query
+        ):
+            first = self.client.get(self._url('?limit=1')).json()
+            self.assertEqual([pr['pr_id'] for pr in first['data']], ['pr-b'])
+            self.assertIsNotNone(first['next_cursor'])
+            second = self.client.get(
+                self._url(f'?limit=1&cursor={first["next_cursor"]}')
+            ).json()
+        self.assertEqual([pr['pr_id'] for pr in second['data']], ['pr-a'])
+        self.assertIsNone(second['next_cursor'])
+        sql, params = query.await_args_list[3].args
+        self.assertIn('(created_at, pr_id) <', sql)
+        self.assertEqual(params['cursor_id'], 'pr-b')
+        self.assertEqual(params['row_limit'], 2)
+
+    def test_list_400_on_invalid_cursor(self) -> None:
+        response = self.client.get(self._url('?cursor=%21%21'))
+        self.assertEqual(response.status_code, 400)
 
 
 class PullRequestActivityTestCase(_PullRequestsTestBase):
@@ -188,10 +221,9 @@ class PullRequestActivityTestCase(_PullRequestsTestBase):
         return f'/organizations/{ORG}/pull-requests/activity{query}'
 
     def test_activity_maps_logins_and_sorts(self) -> None:
-        # db.execute is called twice: org->project_ids, then the
-        # identity-connection map. clickhouse.query returns the counts.
+        # db.execute only builds the identity-connection map; the org
+        # scope is applied inside ClickHouse, which returns the counts.
         self.mock_db.execute.side_effect = [
-            [{'id': PROJECT_ID}],
             [
                 {
                     'email': 'alice@example.com',
@@ -247,10 +279,16 @@ class PullRequestActivityTestCase(_PullRequestsTestBase):
         self.assertIsNone(rows[1]['email'])
 
     def test_activity_empty_when_no_projects(self) -> None:
-        self.mock_db.execute.side_effect = [[], []]
-        with mock.patch(
-            'imbi_common.graph.parse_agtype',
-            side_effect=lambda x: x,
+        self.mock_db.execute.side_effect = [[]]
+        with (
+            mock.patch(
+                'imbi_common.graph.parse_agtype',
+                side_effect=lambda x: x,
+            ),
+            mock.patch(
+                'imbi_api.endpoints.pull_requests.clickhouse.query',
+                new=mock.AsyncMock(return_value=[]),
+            ),
         ):
             response = self.client.get(self._url())
         self.assertEqual(response.status_code, 200)
@@ -8,7 +8,8 @@ from unittest import mock
 import fastapi.testclient
 from imbi_common import graph
 
-from imbi_api import models
+from imbi_api import deployment_events, models
+from imbi_api.endpoints import releases
 from tests import support
 
 PROJECT_ID = 'proj123nanoid'
@@ -35,6 +36,79 @@ def _release_row(**overrides: typing.Any) -> dict[str, typing.Any]:
     return data
 
 
+class _FakeEventStore:
+    """In-memory stand-in for :mod:`imbi_api.deployment_events`."""
+
+    def __init__(self) -> None:
+        self.rows: list[tuple[str, str, models.DeploymentEvent]] = []
+
+    def seed(self, env_slug: str, events: list[dict[str, typing.Any]]) -> None:
+        for event in events:
+            self.rows.append(
+                (
+                    RELEASE_ID,
+                    env_slug,
+                    models.DeploymentEvent.model_validate(event),
+                )
+            )
+
+    def events(self, env_slug: str) -> list[models.DeploymentEvent]:
+        return [e for _r, env, e in self.rows if env == env_slug]
+
+    async def append(
+        self,
+        db: typing.Any,
+        release_id: str,
+        env_slug: str,
+        events: list[models.DeploymentEvent],
+    ) -> None:
+        self.rows.extend((release_id, env_slug, e) for e in events)
+
+    async def update(
+        self, db: typing.Any, event_id: int, event: models.DeploymentEvent
+    ) -> None:
+        release_id, env_slug, _old = self.rows[event_id]
+        self.rows[event_id] = (release_id, env_slug, event)
+
+    async def find_run(
+        self,
+        db: typing.Any,
+        release_id: str,
+        env_slug: str,
+        external_run_id: str,
+    ) -> deployment_events.StoredEvent | None:
+        for idx in range(len(self.rows) - 1, -1, -1):
+            row_release, row_env, event = self.rows[idx]
+            if (row_release, row_env, event.external_run_id) == (
+                release_id,
+                env_slug,
+                external_run_id,
+            ):
+                return deployment_events.StoredEvent(idx, event)
+        return None
+
+    async def history(
+        self, db: typing.Any, release_id: str, env_slugs: list[str]
+    ) -> dict[str, list[models.DeploymentEvent]]:
+        result: dict[str, list[models.DeploymentEvent]] = {}
+        for row_release, env_slug, event in self.rows:
+            if row_release == release_id and env_slug in env_slugs:
+                result.setdefault(env_slug, []).append(event)
+        return result
+
+    async def replace(
+        self,
+        db: typing.Any,
+        release_id: str,
+        env_slug: str,
+        events: list[models.DeploymentEvent],
+    ) -> None:
+        self.rows = [
+            row for row in self.rows if row[:2] != (release_id, env_slug)
+        ]
+        await self.append(db, release_id, env_slug, events)
+
+
 class _ReleasesTestBase(support.SharedAppTestCase):
     """Shared setup mounting release endpoints with admin auth."""
 
@@ -85,6 +159,13 @@ class _ReleasesTestBase(support.SharedAppTestCase):
         )
         self._notes_patch.start()
         self.addCleanup(self._notes_patch.stop)
+        self.event_store = _FakeEventStore()
+        events_patch = mock.patch(
+            'imbi_api.endpoints.releases.deployment_events',
+            new=self.event_store,
+        )
+        events_patch.start()
+        self.addCleanup(events_patch.stop)
         self.client = fastapi.testclient.TestClient(self.test_app)
         self.addCleanup(self.client.close)
 
@@ -653,6 +734,7 @@ class DeploymentEdgeTestCase(_ReleasesTestBase):
             # _fetch_deployment_edge: env exists, no edge
             [{'env': self._env(), 'deployments': None}],
             [{'deployments': None}],  # create_query
+            [],  # pending_release write
         ]
         with mock.patch(
             'imbi_common.graph.parse_agtype',
@@ -708,6 +790,7 @@ class DeploymentEdgeTestCase(_ReleasesTestBase):
             [{'release': _release_row()}],
             [{'env': self._env(), 'deployments': None}],
             [{'deployments': None}],
+            [],  # pending_release write
         ]
         with (
             mock.patch(
@@ -809,6 +892,7 @@ class DeploymentEdgeTestCase(_ReleasesTestBase):
             [{'release': _release_row()}],
             [{'env': self._env(), 'deployments': None}],
             [{'deployments': None}],
+            [],  # pending_release write
         ]
         with (
             mock.patch(
@@ -863,6 +947,36 @@ class DeploymentEdgeTestCase(_ReleasesTestBase):
         self.assertEqual(len(data), 2)
         self.assertEqual(data[0]['current_status'], 'success')
 
+    def test_list_deployment_edges_reads_event_store(self) -> None:
+        self.event_store.seed(
+            'production',
+            [
+                {
+                    'timestamp': '2026-04-20T10:00:00+00:00',
+                    'status': 'in_progress',
+                },
+                {
+                    'timestamp': '2026-04-20T10:05:00+00:00',
+                    'status': 'success',
+                },
+            ],
+        )
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [{'env': self._env('production'), 'deployments': None}],
+        ]
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.get(
+                self._url(f'/{RELEASE_ID}/environments'),
+            )
+        self.assertEqual(response.status_code, 200)
+        (edge,) = response.json()
+        self.assertEqual(len(edge['deployments']), 2)
+        self.assertEqual(edge['current_status'], 'success')
+
     def test_get_single_edge_404_when_no_edge(self) -> None:
         self.mock_db.execute.side_effect = [
             [{'release': _release_row()}],
@@ -949,6 +1063,7 @@ class DeploymentEdgeTestCase(_ReleasesTestBase):
             [{'release': _release_row()}],
             [{'env': self._env(), 'deployments': None}],
             [{'deployments': None}],
+            [],  # pending_release write
         ]
         with mock.patch(
             'imbi_common.graph.parse_agtype',
@@ -961,6 +1076,29 @@ class DeploymentEdgeTestCase(_ReleasesTestBase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(self._current_release_calls(), [])
 
+    def test_record_deployment_in_progress_sets_pending_release(
+        self,
+    ) -> None:
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [{'env': self._env(), 'deployments': None}],
+            [{'deployments': None}],
+            [{'pending_release': RELEASE_ID}],
+        ]
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.post(
+                self._url(f'/{RELEASE_ID}/environments/production'),
+                json={'status': 'in_progress'},
+            )
+        self.assertEqual(response.status_code, 200)
+        query, params = self.mock_db.execute.await_args_list[-1].args[:2]
+        self.assertIn('MERGE (p)-[d:DEPLOYED_IN]->(e)', query)
+        self.assertIn('SET d.pending_release', query)
+        self.assertEqual(params['release_id'], RELEASE_ID)
+
     def test_record_deployment_current_release_empty_logs_warning(
         self,
     ) -> None:
@@ -1005,15 +1143,19 @@ class AppendDeploymentEventDedupeTestCase(_ReleasesTestBase):
 
         from imbi_api.endpoints.releases import append_deployment_event
 
+        self.event_store.seed('production', existing)
         self.mock_db.execute.side_effect = [
             [{'release': _release_row()}],
             [
                 {
                     'env': {'slug': 'production', 'name': 'Production'},
-                    'deployments': json.dumps(existing) if existing else None,
+                    'latest_event': (
+                        json.dumps(existing[-1]) if existing else None
+                    ),
+                    'deployments': None,
                 }
             ],
-            [{'deployments': None}],  # only consumed by append / set path
+            [{'latest_event': None}],  # only consumed by edge writes
             # only consumed by the current_release write on success writes
             [{'current_release': RELEASE_ID}],
         ]
@@ -1071,6 +1213,8 @@ class AppendDeploymentEventDedupeTestCase(_ReleasesTestBase):
         self.assertEqual(len(edge.deployments), 1)
         self.assertEqual(edge.deployments[0].status, 'success')
         self.assertEqual(edge.current_status, 'success')
+        stored = self.event_store.events('production')
+        self.assertEqual([e.status for e in stored], ['success'])
 
     def test_different_run_id_still_appends(self) -> None:
         existing = [
@@ -1086,8 +1230,9 @@ class AppendDeploymentEventDedupeTestCase(_ReleasesTestBase):
             existing, external_run_id='42', status='success'
         )
         self.assertEqual(outcome, 'appended')
-        self.assertEqual(len(edge.deployments), 2)
-        self.assertEqual(edge.deployments[-1].external_run_id, '42')
+        self.assertEqual(edge.deployments[0].external_run_id, '42')
+        stored = self.event_store.events('production')
+        self.assertEqual([e.external_run_id for e in stored], ['41', '42'])
 
     def test_no_external_run_id_keeps_append_only_semantics(self) -> None:
         existing = [
@@ -1101,11 +1246,11 @@ class AppendDeploymentEventDedupeTestCase(_ReleasesTestBase):
         ]
         # Both have no external_run_id, so the pre-dedupe deploy / promote
         # flow remains append-only.
-        edge, outcome = self._call(
+        _edge, outcome = self._call(
             existing, external_run_id=None, status='success'
         )
         self.assertEqual(outcome, 'appended')
-        self.assertEqual(len(edge.deployments), 2)
+        self.assertEqual(len(self.event_store.events('production')), 2)
 
     def test_performed_by_change_refreshes_in_place(self) -> None:
         """A new ``performed_by`` for the same run triggers a refresh.
@@ -1174,6 +1319,151 @@ class AppendDeploymentEventDedupeTestCase(_ReleasesTestBase):
         self.assertEqual(outcome, 'noop')
         self.assertEqual(edge.deployments[0].performed_by, 'octocat')
 
+    def test_older_event_leaves_edge_summary_alone(self) -> None:
+        import asyncio
+
+        from imbi_api.endpoints.releases import append_deployment_event
+
+        latest = {
+            'timestamp': '2026-05-13T14:00:00+00:00',
+            'status': 'failed',
+            'note': None,
+        }
+        self.event_store.seed('production', [latest])
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [
+                {
+                    'env': {'slug': 'production', 'name': 'Production'},
+                    'latest_event': json.dumps(latest),
+                    'deployments': None,
+                }
+            ],
+        ]
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            _edge, outcome = asyncio.run(
+                append_deployment_event(
+                    self.mock_db,
+                    org_slug=ORG,
+                    project_id=PROJECT_ID,
+                    release_id=RELEASE_ID,
+                    env_slug='production',
+                    status='failed',
+                    timestamp=datetime.datetime(
+                        2026, 5, 1, tzinfo=datetime.UTC
+                    ),
+                )
+            )
+        self.assertEqual(outcome, 'appended')
+        # Backfilled history lands in the store; the edge is untouched.
+        self.assertEqual(self.mock_db.execute.await_count, 2)
+        self.assertEqual(len(self.event_store.events('production')), 2)
+
+    def test_legacy_history_moves_to_store(self) -> None:
+        import asyncio
+
+        from imbi_api.endpoints.releases import append_deployment_event
+
+        legacy = [
+            {
+                'timestamp': '2026-05-13T14:00:00+00:00',
+                'status': 'success',
+                'note': None,
+                'external_run_id': '41',
+            },
+            {
+                'timestamp': '2026-05-13T15:00:00+00:00',
+                'status': 'in_progress',
+                'note': None,
+                'external_run_id': '42',
+            },
+        ]
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [
+                {
+                    'env': {'slug': 'production', 'name': 'Production'},
+                    'latest_event': None,
+                    'deployments': json.dumps(legacy),
+                }
+            ],
+            [{'latest_event': None}],  # migration drops d.deployments
+            [{'latest_event': None}],  # summary refresh for run 42
+            [],  # pending_release write
+        ]
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            _edge, outcome = asyncio.run(
+                append_deployment_event(
+                    self.mock_db,
+                    org_slug=ORG,
+                    project_id=PROJECT_ID,
+                    release_id=RELEASE_ID,
+                    env_slug='production',
+                    status='failed',
+                    external_run_id='42',
+                )
+            )
+        self.assertEqual(outcome, 'updated')
+        stored = self.event_store.events('production')
+        self.assertEqual(
+            [(e.external_run_id, e.status) for e in stored],
+            [('41', 'success'), ('42', 'failed')],
+        )
+        migrate = self.mock_db.execute.await_args_list[2].args[0]
+        self.assertIn('REMOVE d.deployments', migrate)
+
+    def test_retried_legacy_move_does_not_duplicate(self) -> None:
+        import asyncio
+
+        from imbi_api.endpoints.releases import append_deployment_event
+
+        legacy = [
+            {
+                'timestamp': '2026-05-13T14:00:00+00:00',
+                'status': 'success',
+                'note': None,
+            },
+        ]
+        # An earlier attempt copied the events but failed to write the
+        # edge, so the legacy property is still there.
+        self.event_store.seed('production', legacy)
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [
+                {
+                    'env': {'slug': 'production', 'name': 'Production'},
+                    'latest_event': None,
+                    'deployments': json.dumps(legacy),
+                }
+            ],
+            [{'latest_event': None}],
+            [],  # pending_release write
+        ]
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            asyncio.run(
+                append_deployment_event(
+                    self.mock_db,
+                    org_slug=ORG,
+                    project_id=PROJECT_ID,
+                    release_id=RELEASE_ID,
+                    env_slug='production',
+                    status='failed',
+                )
+            )
+        self.assertEqual(
+            [e.status for e in self.event_store.events('production')],
+            ['success', 'failed'],
+        )
+
 
 class CurrentReleasesTestCase(_ReleasesTestBase):
     """GET /releases/current — latest deployment event per env."""
@@ -1589,6 +1879,66 @@ class CurrentReleasesHydrationTestCase(_ReleasesTestBase):
         run_mock.assert_awaited_once()
         ci_mock.assert_awaited_once()
 
+    def test_deploy_in_progress_advances_to_success(self) -> None:
+        # v1.0.0 is the current release; an in-product deploy of v1.1.0
+        # wrote an in_progress event and set pending_release, so the
+        # current-releases read returns both rows.  The in-flight row
+        # must win, be polled, and its success must move the
+        # current_release pointer to v1.1.0.
+        self.assertIn('di.pending_release', releases.CURRENT_RELEASES_QUERY)
+        run_mock = mock.AsyncMock(
+            return_value=mock.MagicMock(
+                status='success',
+                run_id='42',
+                run_url='https://gh/runs/42',
+            )
+        )
+        self._patch_plugin_resolution(get_deployment_status=run_mock)
+        self.mock_db.execute.side_effect = [
+            [{'id': PROJECT_ID}],
+            [
+                {
+                    'env': self._env('production', sort_order=30),
+                    'release': _release_row(tag='1.0.0', id='r1'),
+                    'deployments': self._events_with_run(
+                        '2026-04-20T10:00:00+00:00', 'success'
+                    ),
+                },
+                {
+                    'env': self._env('production', sort_order=30),
+                    'release': _release_row(tag='1.1.0', id='r2'),
+                    'deployments': self._events_with_run(
+                        '2026-04-22T10:00:00+00:00',
+                        'in_progress',
+                        run_id='42',
+                        run_url='https://gh/runs/42',
+                    ),
+                },
+            ],
+            [{'release': _release_row(tag='1.1.0', id='r2')}],
+            [{'env': self._env('production'), 'deployments': None}],
+            [{'deployments': '[]'}],
+            [{'current_release': 'r2'}],  # current_release write
+        ]
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.get(self._url('/current'))
+        self.assertEqual(response.status_code, 200)
+        body = response.json()[0]
+        self.assertEqual(body['release']['tag'], '1.1.0')
+        self.assertEqual(body['current_status'], 'success')
+        run_mock.assert_awaited_once()
+        pointer_writes = [
+            c.args[1]
+            for c in self.mock_db.execute.await_args_list
+            if 'current_release' in c.args[0]
+            and 'SET d.current_release' in c.args[0]
+        ]
+        self.assertEqual(len(pointer_writes), 1)
+        self.assertEqual(pointer_writes[0]['release_id'], 'r2')
+
     def test_unknown_ci_status_returns_null(self) -> None:
         self._patch_plugin_resolution(
             get_check_status=mock.AsyncMock(return_value='unknown'),
@@ -1668,17 +2018,87 @@ def _tiny_sbom() -> dict[str, typing.Any]:
     }
 
 
+def _listed_express(version: str = '4.18.2') -> dict[str, typing.Any]:
+    """A dependency-listing row matching :func:`_tiny_sbom`."""
+    return {
+        'component_id': 'comp-1',
+        'purl_name': 'pkg:npm/express',
+        'name': 'express',
+        'ecosystem': 'npm',
+        'description': None,
+        'component_release_id': 'cr-1',
+        'version': version,
+        'license': 'MIT',
+        'supplier': None,
+        'hashes': '{}',
+        'scope': None,
+        'groups': '[]',
+        'identifiers': [{'kind': 'purl', 'value': 'pkg:npm/express'}],
+    }
+
+
+def _sbom_of(*purls: str) -> dict[str, typing.Any]:
+    """Return a CycloneDX 1.7 document listing ``name@version`` purls."""
+    components = []
+    for purl in purls:
+        name, version = purl.removeprefix('pkg:npm/').split('@')
+        components.append(
+            {
+                'type': 'library',
+                'bom-ref': purl,
+                'name': name,
+                'version': version,
+                'purl': purl,
+            }
+        )
+    return {
+        'bomFormat': 'CycloneDX',
+        'specVersion': '1.7',
+        'version': 1,
+        'components': components,
+    }
+
+
+def _batch_statements(
+    db: typing.Any,
+) -> list[tuple[str, dict[str, typing.Any]]]:
+    """``(cypher, params)`` of the statements written in one batch."""
+    db._execute_batch.assert_awaited_once()
+    return [
+        (statement.cypher, statement.params)
+        for statement in db._execute_batch.await_args.args[0]
+    ]
+
+
+def _upserted_rows(
+    statements: list[tuple[str, dict[str, typing.Any]]],
+) -> list[list[tuple[str, str]]]:
+    """``(purl_name, version)`` rows of each component upsert batch."""
+    batches = []
+    for cypher, params in statements:
+        if 'MERGE (c:Component' not in cypher:
+            continue
+        batches.append(
+            [
+                (params[f'row_{i}_purl_name'], params[f'row_{i}_version'])
+                for i in range(len(params))
+                if f'row_{i}_purl_name' in params
+            ]
+        )
+    return batches
+
+
 class PutReleaseSbomTestCase(_ReleasesTestBase):
     """PUT /releases/{release_id}/sbom"""
 
     def test_put_success_returns_204(self) -> None:
-        # _fetch_release row, then CLEAR_RELEASE_COMPONENTS (no rows),
-        # then UPSERT_COMPONENT_AND_LINK (one row), then identifier
-        # upsert (no rows expected back).
+        # _fetch_release row, then the existing-dependency read (none),
+        # then the search-scope lookup of the release's components.
+        # The component upsert and identifier batches go out together
+        # in one transactional batch.
         self.mock_db.execute.side_effect = [
             [{'release': _release_row()}],
             [],
-            [{'component_id': 'comp-1'}],
             [],
         ]
         with mock.patch(
@@ -1690,23 +2110,23 @@ class PutReleaseSbomTestCase(_ReleasesTestBase):
                 json=_tiny_sbom(),
             )
         self.assertEqual(response.status_code, 204)
-        # First execute was _fetch_release; the second was the clear
-        # query — that's the load-bearing idempotence assertion.
-        clear_call = self.mock_db.execute.call_args_list[1]
-        self.assertIn(
-            'DELETE edge',
-            clear_call.args[0],
-        )
-        # The third call (UPSERT_COMPONENT_AND_LINK) carries the
-        # edge-attribution params for ReleaseComponentEdge — the
-        # tiny SBoM emits no scope and no group properties, so
-        # both come through as None / "[]" rather than absent.
-        upsert_call = self.mock_db.execute.call_args_list[2]
-        upsert_params = upsert_call.args[1]
-        self.assertIn('scope', upsert_params)
-        self.assertIn('groups', upsert_params)
-        self.assertIsNone(upsert_params['scope'])
-        self.assertEqual(upsert_params['groups'], '[]')
+        calls = self.mock_db.execute.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertIn('collect(DISTINCT', calls[1].args[0])
+        self.assertIn('RETURN DISTINCT comp.id', calls[2].args[0])
+        statements = _batch_statements(self.mock_db)
+        self.assertEqual(len(statements), 2)
+        # The upsert batch carries the edge-attribution params for
+        # ReleaseComponentEdge — the tiny SBoM emits no scope and no
+        # group properties, so both come through as None / "[]"
+        # rather than absent.
+        upsert_cypher, upsert_params = statements[0]
+        self.assertIn('UNWIND', upsert_cypher)
+        self.assertIn('MERGE (c:Component', upsert_cypher)
+        self.assertEqual(upsert_params['row_0_purl_name'], 'pkg:npm/express')
+        self.assertIsNone(upsert_params['row_0_scope'])
+        self.assertEqual(upsert_params['row_0_groups'], '[]')
+        self.assertIn('MERGE (ci:ComponentIdentifier', statements[1][0])
 
     def test_put_unknown_release_returns_404(self) -> None:
         self.mock_db.execute.side_effect = [[]]
@@ -1740,212 +2160,114 @@ class PutReleaseSbomTestCase(_ReleasesTestBase):
         )
         self.assertEqual(response.status_code, 400)
 
-    def test_put_idempotent_clear_runs_twice_for_two_puts(self) -> None:
-        # Two PUTs in succession: each must run a CLEAR_RELEASE_COMPONENTS
-        # before re-linking — that is the durable contract.
-        for _ in range(2):
-            self.mock_db.execute.side_effect = [
-                [{'release': _release_row()}],
-                [],
-                [{'component_id': 'comp-1'}],
-                [],
-            ]
-            with mock.patch(
-                'imbi_common.graph.parse_agtype',
-                side_effect=lambda x: x,
-            ):
-                response = self.client.put(
-                    self._url(f'/{RELEASE_ID}/sbom'),
-                    json=_tiny_sbom(),
-                )
-            self.assertEqual(response.status_code, 204)
-            clear_call = self.mock_db.execute.call_args_list[1]
-            self.assertIn('DELETE edge', clear_call.args[0])
-            self.mock_db.execute.reset_mock()
-
-    def test_put_continues_past_per_component_failure(self) -> None:
-        # Two-component SBoM where one component's upsert raises.
-        # The action must log a warning for the failing component
-        # and still return 204 — partial graph state is more useful
-        # than an aborted ingest. The mock keys responses off the
-        # Cypher template + purl_name so the parallel-gather order
-        # is irrelevant.
-        two_component_sbom = {
-            'bomFormat': 'CycloneDX',
-            'specVersion': '1.7',
-            'version': 1,
-            'components': [
-                {
-                    'type': 'library',
-                    'bom-ref': 'pkg:npm/good@1.0.0',
-                    'name': 'good',
-                    'version': '1.0.0',
-                    'purl': 'pkg:npm/good@1.0.0',
-                },
-                {
-                    'type': 'library',
-                    'bom-ref': 'pkg:npm/broken@1.0.0',
-                    'name': 'broken',
-                    'version': '1.0.0',
-                    'purl': 'pkg:npm/broken@1.0.0',
-                },
-            ],
-        }
+    def test_put_unchanged_sbom_only_reads(self) -> None:
+        # Re-PUTting the SBoM a release already carries is a single
+        # read — no edge is deleted and nothing is MERGE-ed.
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [_listed_express()],
+        ]
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.put(
+                self._url(f'/{RELEASE_ID}/sbom'),
+                json=_tiny_sbom(),
+            )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.mock_db.execute.call_count, 2)
+        self.mock_db._execute_batch.assert_not_awaited()
 
-        async def fake_execute(
-            query: str,
-            params: dict[str, typing.Any] | None = None,
-            columns: list[str] | None = None,
-        ) -> list[dict[str, typing.Any]]:
-            del columns
-            params = params or {}
-            if 'MATCH (p:Project' in query and 'RETURN r' in query:
-                return [{'release': _release_row()}]
-            if 'DELETE edge' in query:
-                return []
-            if 'MERGE (c:Component' in query:
-                if params['purl_name'] == 'pkg:npm/broken':
-                    raise RuntimeError('simulated AGE error')
-                return [{'component_id': f'comp-{params["purl_name"]}'}]
-            if 'MERGE (ci:ComponentIdentifier' in query:
-                return []
-            raise AssertionError(f'unexpected query in mock: {query[:60]!r}')
-
-        self.mock_db.execute.side_effect = fake_execute
+    def test_put_unlinks_only_removed_components(self) -> None:
+        # express moved from 4.17.1 to 4.18.2: the old edge is the
+        # only one deleted, the new version is the only one upserted,
+        # and its already-attached purl identifier is not re-MERGE-ed.
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [_listed_express('4.17.1')],
+            [],
+        ]
+        with mock.patch(
+            'imbi_common.graph.parse_agtype',
+            side_effect=lambda x: x,
+        ):
+            response = self.client.put(
+                self._url(f'/{RELEASE_ID}/sbom'),
+                json=_tiny_sbom(),
+            )
+        self.assertEqual(response.status_code, 204)
+        statements = _batch_statements(self.mock_db)
+        unlink_cypher, unlink_params = statements[0]
+        self.assertIn('DELETE e', unlink_cypher)
+        self.assertEqual(unlink_params['row_0_version'], '4.17.1')
+        self.assertNotIn('row_1_version', unlink_params)
+        self.assertEqual(
+            _upserted_rows(statements), [[('pkg:npm/express', '4.18.2')]]
+        )
+        self.assertFalse(
+            any('ComponentIdentifier' in cypher for cypher, _ in statements)
+        )
 
+    def test_put_failure_leaves_previous_components(self) -> None:
+        # The unlink and upsert batches share one transaction, so a
+        # failure part way raises instead of leaving a half-applied
+        # diff, and the search scope is not refreshed.
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [_listed_express('4.17.1')],
+        ]
+        self.mock_db._execute_batch.side_effect = RuntimeError(
+            'simulated AGE error'
+        )
         with (
             mock.patch(
                 'imbi_common.graph.parse_agtype',
                 side_effect=lambda x: x,
             ),
-            self.assertLogs('imbi_api.sbom', level='WARNING') as cm,
+            self.assertRaisesRegex(RuntimeError, 'simulated AGE error'),
         ):
-            response = self.client.put(
+            self.client.put(
                 self._url(f'/{RELEASE_ID}/sbom'),
-                json=two_component_sbom,
+                json=_tiny_sbom(),
             )
+        self.assertEqual(self.mock_db.execute.call_count, 2)
+        statements = _batch_statements(self.mock_db)
+        self.assertIn('DELETE e', statements[0][0])
+        self.assertIn('MERGE (c:Component', statements[1][0])
 
-        self.assertEqual(response.status_code, 204)
-        # The failing component must show up in the logs with its
-        # purl + version + release id so on-call can find it.
-        failure_lines = [
-            line for line in cm.output if 'pkg:npm/broken' in line
-        ]
-        self.assertEqual(
-            len(failure_lines), 1, msg=f'logs were: {cm.output!r}'
-        )
-        self.assertIn('1.0.0', failure_lines[0])
-        self.assertIn(RELEASE_ID, failure_lines[0])
-        self.assertIn('simulated AGE error', failure_lines[0])
-        # The healthy component must still have made its upsert
-        # call — that's the "some data > no data" contract.
-        upsert_purls = {
-            call.args[1]['purl_name']
-            for call in self.mock_db.execute.call_args_list
-            if 'MERGE (c:Component' in call.args[0]
-        }
-        self.assertEqual(upsert_purls, {'pkg:npm/good', 'pkg:npm/broken'})
-
-    def test_put_same_purl_versions_run_sequentially_in_same_bucket(
+    def test_put_same_purl_versions_land_in_separate_batches(
         self,
     ) -> None:
         # Regression for the AGE "Entity failed to be updated: 3"
-        # conflict — two versions of the same package (sharing one
-        # purl_name and therefore one Component vertex) MUST be
-        # serialized in the same bucket. Across-bucket parallelism
-        # is fine; within-bucket parallelism deadlocks AGE.
-        multi_version_sbom = {
-            'bomFormat': 'CycloneDX',
-            'specVersion': '1.7',
-            'version': 1,
-            'components': [
-                {
-                    'type': 'library',
-                    'bom-ref': 'pkg:npm/react-is@17.0.2',
-                    'name': 'react-is',
-                    'version': '17.0.2',
-                    'purl': 'pkg:npm/react-is@17.0.2',
-                },
-                {
-                    'type': 'library',
-                    'bom-ref': 'pkg:npm/react-is@18.3.1',
-                    'name': 'react-is',
-                    'version': '18.3.1',
-                    'purl': 'pkg:npm/react-is@18.3.1',
-                },
-                # An unrelated package in a different bucket — it
-                # may interleave with the react-is bucket but
-                # MUST NOT serialize *between* the two react-is
-                # versions.
-                {
-                    'type': 'library',
-                    'bom-ref': 'pkg:npm/chalk@5.0.0',
-                    'name': 'chalk',
-                    'version': '5.0.0',
-                    'purl': 'pkg:npm/chalk@5.0.0',
-                },
-            ],
-        }
-
-        # Track which purl_names are mid-upsert so we can assert
-        # no two tasks ever hold the same Component vertex
-        # simultaneously. ``asyncio.sleep(0)`` inside the mock
-        # forces a scheduler yield so any latent within-bucket
-        # parallelism gets a chance to expose itself.
-        in_flight: set[str] = set()
-        overlapping_calls: list[str] = []
-
-        async def fake_execute(
-            query: str,
-            params: dict[str, typing.Any] | None = None,
-            columns: list[str] | None = None,
-        ) -> list[dict[str, typing.Any]]:
-            import asyncio as _asyncio
-
-            del columns
-            params = params or {}
-            if 'MATCH (p:Project' in query and 'RETURN r' in query:
-                return [{'release': _release_row()}]
-            if 'DELETE edge' in query:
-                return []
-            if 'MERGE (c:Component' in query:
-                purl = params['purl_name']
-                if purl in in_flight:
-                    overlapping_calls.append(purl)
-                in_flight.add(purl)
-                await _asyncio.sleep(0)
-                in_flight.discard(purl)
-                return [{'component_id': f'comp-{purl}'}]
-            if 'MERGE (ci:ComponentIdentifier' in query:
-                return []
-            raise AssertionError(f'unexpected query in mock: {query[:60]!r}')
-
-        self.mock_db.execute.side_effect = fake_execute
-
+        # conflict — two versions of the same package share one
+        # purl_name and therefore one Component vertex, so they MUST
+        # NOT be MERGE-d by the same UNWIND statement.
+        self.mock_db.execute.side_effect = [
+            [{'release': _release_row()}],
+            [],
+            [],
+        ]
         with mock.patch(
             'imbi_common.graph.parse_agtype',
             side_effect=lambda x: x,
         ):
             response = self.client.put(
                 self._url(f'/{RELEASE_ID}/sbom'),
-                json=multi_version_sbom,
+                json=_sbom_of(
+                    'pkg:npm/react-is@17.0.2',
+                    'pkg:npm/react-is@18.3.1',
+                    'pkg:npm/chalk@5.0.0',
+                ),
             )
-
         self.assertEqual(response.status_code, 204)
-        # The load-bearing assertion: no two upserts on the same
-        # Component vertex ever overlapped. Anything in
-        # ``overlapping_calls`` is a regression that would
-        # reproduce the AGE "Entity failed to be updated: 3"
-        # error in production.
-        self.assertEqual(overlapping_calls, [])
-        # And both react-is versions still ended up upserted.
-        upsert_purls_with_versions = sorted(
-            (call.args[1]['purl_name'], call.args[1]['version'])
-            for call in self.mock_db.execute.call_args_list
-            if 'MERGE (c:Component' in call.args[0]
-        )
+        batches = _upserted_rows(_batch_statements(self.mock_db))
+        for batch in batches:
+            purls = [purl for purl, _version in batch]
+            self.assertEqual(len(purls), len(set(purls)), msg=batch)
+        # And every version still ended up upserted.
         self.assertEqual(
-            upsert_purls_with_versions,
+            sorted(row for batch in batches for row in batch),
             [
                 ('pkg:npm/chalk', '5.0.0'),
                 ('pkg:npm/react-is', '17.0.2'),
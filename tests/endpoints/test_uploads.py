@@ -6,12 +6,24 @@ from unittest import mock
 from fastapi import testclient
 from imbi_common import graph
 
-from imbi_api import models
-from imbi_api.storage.client import StorageClient
+from imbi_api import models, settings
+from imbi_api.storage.client import ObjectStream, StorageClient
 from imbi_api.storage.dependencies import _get_storage_client
 from tests import support
 
 
+def _object(data: bytes, content_range: str | None = None) -> ObjectStream:
+    async def chunks():
+        for i in range(0, len(data), 4):
+            yield data[i : i + 4]
+
+    return ObjectStream(
+        chunks=chunks(),
+        content_length=len(data),
+        content_range=content_range,
+    )
+
+
 class UploadEndpointsTestCase(support.SharedAppTestCase):
     """Test cases for upload CRUD endpoints."""
 
@@ -49,8 +61,8 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
         ] = mock_get_current_user
 
         self.mock_db = mock.AsyncMock(spec=graph.Graph)
-        self.test_app.dependency_overrides[graph._inject_graph] = (
-            lambda: self.mock_db
+        self.test_app.dependency_overrides[graph._inject_graph] = lambda: (
+            self.mock_db
         )
 
         # Create a mock storage client for DI override
@@ -82,7 +94,7 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
         return_value=False,
     )
     @mock.patch(
-        'imbi_api.endpoints.uploads.validation.validate_upload',
+        'imbi_api.endpoints.uploads.validation.validate_upload_head',
     )
     def test_create_upload_success(
         self,
@@ -110,10 +122,14 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
         self.assertEqual(data['size'], 11)
         self.assertFalse(data['has_thumbnail'])
         mock_validate.assert_called_once()
-        self.mock_storage.upload.assert_called_once()
+        head, size = mock_validate.call_args.args[:2]
+        self.assertEqual(head, b'hello world')
+        self.assertEqual(size, 11)
+        self.mock_storage.upload_fileobj.assert_called_once()
+        self.mock_storage.upload.assert_not_called()
 
     @mock.patch(
-        'imbi_api.endpoints.uploads.validation.validate_upload',
+        'imbi_api.endpoints.uploads.validation.validate_upload_head',
     )
     def test_create_upload_validation_error(
         self,
@@ -150,7 +166,7 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
         return_value=b'thumb-data',
     )
     @mock.patch(
-        'imbi_api.endpoints.uploads.validation.validate_upload',
+        'imbi_api.endpoints.uploads.validation.validate_upload_head',
     )
     def test_create_upload_with_thumbnail(
         self,
@@ -175,8 +191,9 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
         self.assertEqual(response.status_code, 201)
         data = response.json()
         self.assertTrue(data['has_thumbnail'])
-        # Two uploads: original + thumbnail
-        self.assertEqual(self.mock_storage.upload.call_count, 2)
+        # Original streamed, thumbnail uploaded as bytes
+        self.mock_storage.upload_fileobj.assert_called_once()
+        self.mock_storage.upload.assert_called_once()
 
     def test_list_uploads_empty(self) -> None:
         """Test listing uploads when none exist."""
@@ -215,7 +232,7 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
 
     def test_get_upload_serves_content(self) -> None:
         """Test getting upload serves file content."""
-        self.mock_storage.download.return_value = b'file-data'
+        self.mock_storage.stream.return_value = _object(b'file-data')
         self.mock_db.match.return_value = [self.test_upload]
 
         response = self.client.get('/uploads/test-uuid-1234')
@@ -230,6 +247,99 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
             'max-age=3600',
             response.headers['cache-control'],
         )
+        self.assertEqual(response.headers['etag'], '"test-uuid-1234"')
+        self.assertEqual(response.headers['content-length'], '9')
+        self.assertEqual(response.headers['accept-ranges'], 'bytes')
+        self.mock_storage.stream.assert_awaited_once_with(
+            self.test_upload.s3_key, byte_range=None
+        )
+
+    def test_get_upload_range(self) -> None:
+        """A single byte range is passed to S3 and answered with 206."""
+        self.mock_storage.stream.return_value = _object(
+            b'file', content_range='bytes 0-3/1024'
+        )
+        self.mock_db.match.return_value = [self.test_upload]
+
+        response = self.client.get(
+            '/uploads/test-uuid-1234', headers={'Range': 'bytes=0-3'}
+        )
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, b'file')
+        self.assertEqual(response.headers['content-range'], 'bytes 0-3/1024')
+        self.mock_storage.stream.assert_awaited_once_with(
+            self.test_upload.s3_key, byte_range='bytes=0-3'
+        )
+
+    def test_get_upload_ignores_multi_range(self) -> None:
+        """Multiple ranges fall back to the full body."""
+        self.mock_storage.stream.return_value = _object(b'file-data')
+        self.mock_db.match.return_value = [self.test_upload]
+
+        response = self.client.get(
+            '/uploads/test-uuid-1234',
+            headers={'Range': 'bytes=0-1,4-5'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.mock_storage.stream.assert_awaited_once_with(
+            self.test_upload.s3_key, byte_range=None
+        )
+
+    def test_get_upload_unsatisfiable_range(self) -> None:
+        """An S3 InvalidRange error becomes a 416."""
+        from botocore import (  # pyright: ignore[reportMissingTypeStubs]
+            exceptions as botocore_exceptions,
+        )
+
+        self.mock_storage.stream.side_effect = botocore_exceptions.ClientError(
+            {'Error': {'Code': 'InvalidRange', 'Message': 'bad'}},
+            'GetObject',
+        )
+        self.mock_db.match.return_value = [self.test_upload]
+
+        response = self.client.get(
+            '/uploads/test-uuid-1234', headers={'Range': 'bytes=5000-'}
+        )
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response.headers['content-range'], 'bytes */1024')
+
+    def test_get_upload_not_modified(self) -> None:
+        """A matching If-None-Match is answered without S3."""
+        self.mock_db.match.return_value = [self.test_upload]
+
+        response = self.client.get(
+            '/uploads/test-uuid-1234',
+            headers={'If-None-Match': 'W/"other", "test-uuid-1234"'},
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['etag'], '"test-uuid-1234"')
+        self.mock_storage.stream.assert_not_called()
+
+    def test_get_upload_presigned_redirect(self) -> None:
+        """Presigned downloads redirect instead of proxying."""
+        self.mock_storage.presigned_url.return_value = (
+            'https://s3.example.com/signed'
+        )
+        self.mock_db.match.return_value = [self.test_upload]
+
+        with mock.patch.object(
+            settings,
+            'get_storage_settings',
+            return_value=settings.Storage(presigned_downloads=True),
+        ):
+            response = self.client.get(
+                '/uploads/test-uuid-1234', follow_redirects=False
+            )
+
+        self.assertEqual(response.status_code, 307)
+        self.assertEqual(
+            response.headers['location'], 'https://s3.example.com/signed'
+        )
+        self.mock_storage.stream.assert_not_called()
 
     def test_get_upload_s3_missing(self) -> None:
         """Test getting upload when S3 object is missing."""
@@ -237,16 +347,14 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
             exceptions as botocore_exceptions,
         )
 
-        self.mock_storage.download.side_effect = (
-            botocore_exceptions.ClientError(
-                {
-                    'Error': {
-                        'Code': 'NoSuchKey',
-                        'Message': 'Not found',
-                    },
+        self.mock_storage.stream.side_effect = botocore_exceptions.ClientError(
+            {
+                'Error': {
+                    'Code': 'NoSuchKey',
+                    'Message': 'Not found',
                 },
-                'GetObject',
-            )
+            },
+            'GetObject',
         )
         self.mock_db.match.return_value = [self.test_upload]
 
@@ -282,7 +390,7 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
 
     def test_get_thumbnail_serves_content(self) -> None:
         """Test getting thumbnail serves image content."""
-        self.mock_storage.download.return_value = b'thumb-data'
+        self.mock_storage.stream.return_value = _object(b'thumb-data')
         self.mock_db.match.return_value = [self.test_upload]
 
         response = self.client.get(
@@ -296,9 +404,12 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
             'image/webp',
         )
         self.assertIn(
-            'max-age=3600',
+            'immutable',
             response.headers['cache-control'],
         )
+        self.assertEqual(
+            response.headers['etag'], '"test-uuid-1234-thumbnail"'
+        )
 
     def test_get_thumbnail_s3_missing(self) -> None:
         """Test getting thumbnail when S3 object is missing."""
@@ -306,16 +417,14 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
             exceptions as botocore_exceptions,
         )
 
-        self.mock_storage.download.side_effect = (
-            botocore_exceptions.ClientError(
-                {
-                    'Error': {
-                        'Code': 'NoSuchKey',
-                        'Message': 'Not found',
-                    },
+        self.mock_storage.stream.side_effect = botocore_exceptions.ClientError(
+            {
+                'Error': {
+                    'Code': 'NoSuchKey',
+                    'Message': 'Not found',
                 },
-                'GetObject',
-            )
+            },
+            'GetObject',
         )
         self.mock_db.match.return_value = [self.test_upload]
 
@@ -458,6 +567,6 @@ class UploadEndpointsTestCase(support.SharedAppTestCase):
         self.test_app.dependency_overrides[permissions.get_current_user] = (
             mock_get_current_user
         )
-        self.test_app.dependency_overrides[graph._inject_graph] = (
-            lambda: self.mock_db
+        self.test_app.dependency_overrides[graph._inject_graph] = lambda: (
+            self.mock_db
         )
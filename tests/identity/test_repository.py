@@ -67,20 +67,42 @@ class DecryptHelperTestCase(unittest.TestCase):
             self.assertEqual(repository._decrypt({'wrapped': True}), 'cipher')
 
 
-class MarkStatusTestCase(unittest.IsolatedAsyncioTestCase):
+class _InvalidationTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(
+            repository.invalidation,
+            'publish_user_changed',
+            new_callable=mock.AsyncMock,
+        )
+        self.publish = patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class MarkStatusTestCase(_InvalidationTestCase):
     """Verify mark_status emits the expected query + params."""
 
     async def test_executes_with_status_param(self) -> None:
         db = mock.AsyncMock()
+        db.execute.return_value = []
         await repository.mark_status(db, 'conn-1', 'expired')
         db.execute.assert_awaited_once()
         _query, params, _columns = db.execute.await_args.args
         self.assertEqual(params['id'], 'conn-1')
         self.assertEqual(params['status'], 'expired')
         self.assertIn('now', params)
+        self.publish.assert_not_awaited()
+
+    async def test_invalidates_the_connection_owner(self) -> None:
+        db = mock.AsyncMock()
+        db.execute.return_value = [{'user_id': '"user-1"'}]
+        with mock.patch.object(
+            repository.graph, 'parse_agtype', return_value='user-1'
+        ):
+            await repository.mark_status(db, 'conn-1', 'revoked')
+        self.publish.assert_awaited_once_with('user-1')
 
 
-class RevokeTestCase(unittest.IsolatedAsyncioTestCase):
+class RevokeTestCase(_InvalidationTestCase):
     """Verify revoke clears tokens and flips status."""
 
     async def test_executes_with_integration_and_user(self) -> None:
@@ -92,9 +114,18 @@ class RevokeTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(params['user_id'], 'user-1')
         self.assertIn("status = 'revoked'", query)
         self.assertIn('access_token_encrypted = null', query)
+        self.publish.assert_awaited_once_with('user-1')
+
+
+class DeleteConnectionTestCase(_InvalidationTestCase):
+    async def test_invalidates_the_user(self) -> None:
+        db = mock.AsyncMock()
+        await repository.delete_connection(db, 'integration-1', 'user-1')
+        self.assertIn('DETACH DELETE c', db.execute.await_args.args[0])
+        self.publish.assert_awaited_once_with('user-1')
 
 
-class UpsertConnectionTestCase(unittest.IsolatedAsyncioTestCase):
+class UpsertConnectionTestCase(_InvalidationTestCase):
     """Verify upsert_connection encrypts and returns the connection id."""
 
     async def test_returns_connection_id(self) -> None:
@@ -121,6 +152,7 @@ class UpsertConnectionTestCase(unittest.IsolatedAsyncioTestCase):
                 db, 'integration-1', 'user-1', profile, credentials
             )
         self.assertEqual(connection_id, 'conn-abc')
+        self.publish.assert_awaited_once_with('user-1')
 
     async def test_raises_when_query_returns_no_rows(self) -> None:
         db = mock.AsyncMock()
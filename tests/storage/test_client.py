@@ -80,6 +80,78 @@ class StorageClientOperationsTestCase(
 
         self.assertEqual(result, b'file-data')
 
+    async def test_stream(self) -> None:
+        """Test streaming an object range in chunks."""
+
+        async def iter_chunks(chunk_size: int):
+            self.assertEqual(
+                chunk_size, self.client._settings.download_chunk_size
+            )
+            yield b'file'
+            yield b'-data'
+
+        mock_body = mock.MagicMock()
+        mock_body.iter_chunks = iter_chunks
+        mock_body.__aenter__ = mock.AsyncMock(return_value=mock_body)
+        mock_body.__aexit__ = mock.AsyncMock(return_value=None)
+        mock_s3 = mock.AsyncMock()
+        mock_s3.get_object.return_value = {
+            'Body': mock_body,
+            'ContentLength': 9,
+            'ContentRange': 'bytes 0-8/100',
+        }
+        self.client._s3 = mock_s3
+
+        result = await self.client.stream('test/key', byte_range='bytes=0-8')
+
+        self.assertEqual(result.content_length, 9)
+        self.assertEqual(result.content_range, 'bytes 0-8/100')
+        self.assertEqual(
+            [chunk async for chunk in result.chunks], [b'file', b'-data']
+        )
+        mock_s3.get_object.assert_called_once_with(
+            Bucket=self.client._settings.bucket,
+            Key='test/key',
+            Range='bytes=0-8',
+        )
+        mock_body.__aexit__.assert_awaited_once()
+
+    async def test_upload_fileobj(self) -> None:
+        """Test streaming a file object to S3."""
+        mock_s3 = mock.AsyncMock()
+        self.client._s3 = mock_s3
+        fileobj = mock.Mock()
+
+        await self.client.upload_fileobj('test/key', fileobj, 'image/png')
+
+        mock_s3.upload_fileobj.assert_called_once_with(
+            fileobj,
+            self.client._settings.bucket,
+            'test/key',
+            ExtraArgs={'ContentType': 'image/png'},
+        )
+
+    async def test_presigned_url(self) -> None:
+        """Test presigning a GET with response header overrides."""
+        mock_s3 = mock.AsyncMock()
+        mock_s3.generate_presigned_url.return_value = 'https://signed'
+        self.client._s3 = mock_s3
+
+        url = await self.client.presigned_url(
+            'test/key', content_type='image/png'
+        )
+
+        self.assertEqual(url, 'https://signed')
+        mock_s3.generate_presigned_url.assert_called_once_with(
+            'get_object',
+            Params={
+                'Bucket': self.client._settings.bucket,
+                'Key': 'test/key',
+                'ResponseContentType': 'image/png',
+            },
+            ExpiresIn=self.client._settings.presigned_url_ttl,
+        )
+
     async def test_delete(self) -> None:
         """Test deleting an object from S3."""
         mock_s3 = mock.AsyncMock()
@@ -106,6 +178,8 @@ class StorageClientOperationsTestCase(
             await self.client.upload('k', b'data', 'text/plain')
         with self.assertRaises(RuntimeError):
             await self.client.download('k')
+        with self.assertRaises(RuntimeError):
+            await self.client.stream('k')
         with self.assertRaises(RuntimeError):
             await self.client.delete('k')
 
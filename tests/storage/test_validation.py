@@ -134,3 +134,30 @@ class ValidateUploadTestCase(unittest.TestCase):
             # Should not raise with default settings and small file
             data = b'\x89PNG' + b'\x00' * 50
             validation.validate_upload(data, 'image/png')
+
+    def test_head_checks_declared_size(self) -> None:
+        """Test that a streamed upload is sized from the total, not head."""
+        with self.assertRaises(
+            validation.UploadValidationError,
+        ) as ctx:
+            validation.validate_upload_head(
+                b'<svg>',
+                2048,
+                'image/svg+xml',
+                self.settings,
+            )
+        self.assertIn('exceeds maximum', str(ctx.exception))
+
+    def test_head_magic_bytes_use_leading_bytes(self) -> None:
+        """Test that only the leading bytes reach filetype."""
+        head = b'\x89PNG' + b'\x00' * (validation.HEAD_BYTES * 2)
+        with mock.patch(
+            'imbi_api.storage.validation.filetype.guess'
+        ) as mock_guess:
+            mock_guess.return_value = mock.Mock(mime='image/png')
+            validation.validate_upload_head(
+                head, 100, 'image/png', settings.Storage()
+            )
+        self.assertEqual(
+            len(mock_guess.call_args.args[0]), validation.HEAD_BYTES
+        )
@@ -14,6 +14,9 @@ runs regardless of subclass overrides:
 
 * ``dependency_overrides`` is cleared so mocked dependencies cannot leak
   into the next test that reuses the cached app.
+* The process-wide JWT ``AuthContext`` cache is cleared so a context
+  resolved against one test's mocks is never served to another.
+* The in-process search scope cache is cleared for the same reason.
 * Any :class:`starlette.testclient.TestClient` stored as an instance
   attribute is closed so its portal thread/transport is not leaked.
 """
@@ -26,6 +29,11 @@ from imbi_common.plugins.base import Plugin, PluginManifest
 from imbi_common.plugins.registry import RegistryEntry
 from starlette import testclient
 
+from imbi_api import release_state, search_scope, stream_workers
+from imbi_api.auth import permissions
+from imbi_api.endpoints import graph_query
+from imbi_api.plugins import binding_cache, compare_cache, log_cache
+
 
 @functools.cache
 def shared_app() -> fastapi.FastAPI:
@@ -67,6 +75,14 @@ def registry_entry(
 def _reset(case: unittest.TestCase, test_app: fastapi.FastAPI) -> None:
     """Clear shared-app state and close any per-test TestClient."""
     test_app.dependency_overrides.clear()
+    permissions.clear_jwt_cache()
+    search_scope.clear_local_cache()
+    binding_cache.clear_local_cache()
+    log_cache.clear()
+    compare_cache.clear()
+    stream_workers.clear()
+    release_state.clear()
+    graph_query.clear()
     for value in list(vars(case).values()):
         if isinstance(value, testclient.TestClient):
             value.close()
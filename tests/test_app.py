@@ -6,7 +6,7 @@ import unittest.mock
 import fastapi
 from imbi_common import access_log
 
-from imbi_api import app, settings, version
+from imbi_api import app, lifespans, settings, version
 
 
 class CreateAppTestCase(unittest.TestCase):
@@ -61,6 +61,38 @@ class CreateAppTestCase(unittest.TestCase):
         self.assertEqual(set(quiet_paths), {'/status', '/api/status'})
 
 
+class BackgroundWorkersTestCase(unittest.TestCase):
+    """Worker hooks in the server lifespan and the worker-only app."""
+
+    def _lifespan_hooks(self, **env: str) -> tuple[object, ...]:
+        with (
+            unittest.mock.patch.dict(os.environ, env),
+            unittest.mock.patch.object(app.lifespan, 'Lifespan') as cls,
+        ):
+            app.create_app()
+        return cls.call_args.args
+
+    def test_server_runs_workers_by_default(self) -> None:
+        hooks = self._lifespan_hooks()
+        for hook in lifespans.WORKER_HOOKS.values():
+            self.assertIn(hook, hooks)
+
+    def test_server_without_background_workers(self) -> None:
+        hooks = self._lifespan_hooks(IMBI_API_BACKGROUND_WORKERS='false')
+        for hook in lifespans.WORKER_HOOKS.values():
+            self.assertNotIn(hook, hooks)
+        self.assertIn(lifespans.clickhouse_hook, hooks)
+
+    def test_worker_app_runs_only_selected_workers(self) -> None:
+        with unittest.mock.patch.object(app.lifespan, 'Lifespan') as cls:
+            worker_app = app.create_worker_app(['commit-sync'])
+        hooks = cls.call_args.args
+        self.assertIn(lifespans.commit_sync_worker_hook, hooks)
+        self.assertNotIn(lifespans.score_worker_hook, hooks)
+        self.assertNotIn(lifespans.email_hook, hooks)
+        self.assertEqual([], [r.path for r in worker_app.routes])
+
+
 class ApiPrefixTestCase(unittest.TestCase):
     """Test cases for prefix derivation from IMBI_API_URL."""
 
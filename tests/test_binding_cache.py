@@ -0,0 +1,160 @@
+"""Tests for the cached capability bindings and plugin enablement."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from unittest import mock
+
+from imbi_api import caching
+from imbi_api.plugins import assignments, binding_cache
+
+
+def _binding(plugin: str = 'ssm') -> assignments.CapabilityBinding:
+    return assignments.CapabilityBinding(
+        integration={'id': 'i1', 'slug': f'{plugin}-prod', 'plugin': plugin},
+        source='project',
+        default=True,
+        capability_options={'region': 'us-east-1'},
+        env_payloads={},
+        identity_integration_id=None,
+    )
+
+
+class _CacheTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        binding_cache.clear_local_cache()
+        self.addCleanup(binding_cache.clear_local_cache)
+        self.db = mock.AsyncMock()
+        self.build = mock.AsyncMock(return_value=[_binding()])
+        patcher = mock.patch.object(
+            binding_cache.assignments, 'effective_bindings', new=self.build
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _patch_client(self, client: object) -> None:
+        if client is None:
+            patcher = mock.patch.object(
+                caching.valkey,
+                'get_client',
+                side_effect=RuntimeError('no valkey'),
+            )
+        else:
+            patcher = mock.patch.object(
+                caching.valkey, 'get_client', return_value=client
+            )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class LocalCacheTestCase(_CacheTestCase):
+    """Without Valkey the bindings are cached per process."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._patch_client(None)
+
+    async def test_second_lookup_is_served_locally(self) -> None:
+        first = await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        second = await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        self.assertEqual(first, second)
+        self.build.assert_awaited_once()
+
+    async def test_kinds_are_cached_separately(self) -> None:
+        await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        await binding_cache.effective_bindings(self.db, 'p1', 'deployment')
+        self.assertEqual(self.build.await_count, 2)
+
+    async def test_invalidate_forces_a_rebuild(self) -> None:
+        await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        await binding_cache.invalidate()
+        await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        self.assertEqual(self.build.await_count, 2)
+
+    async def test_missing_project_is_not_cached(self) -> None:
+        self.build.side_effect = [LookupError('p1'), [_binding()]]
+        with self.assertRaises(LookupError):
+            await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        bindings = await binding_cache.effective_bindings(
+            self.db, 'p1', 'logs'
+        )
+        self.assertEqual(len(bindings), 1)
+
+    async def test_enabled_map_is_one_snapshot(self) -> None:
+        with mock.patch.object(
+            binding_cache.lifecycle,
+            'get_enabled_map',
+            new=mock.AsyncMock(return_value={'ssm': True}),
+        ) as get_enabled_map:
+            await binding_cache.enabled_map(self.db)
+            enabled = await binding_cache.enabled_map(self.db)
+        self.assertEqual(enabled, {'ssm': True})
+        get_enabled_map.assert_awaited_once()
+
+
+class ValkeyCacheTestCase(_CacheTestCase):
+    """With Valkey the bindings are versioned by a shared generation."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.store: dict[str, object] = {'imbi:plugins:bindings:gen': b'4'}
+        self.client = mock.AsyncMock()
+        self.client.get.side_effect = self.store.get
+
+        async def _set(key: str, value: object, ex: int) -> None:
+            self.store[key] = value
+
+        self.client.set.side_effect = _set
+        self._patch_client(self.client)
+
+    async def test_bindings_are_stored_under_the_generation(self) -> None:
+        await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        stored = self.store['imbi:plugins:bindings:4:p1:logs']
+        self.assertEqual(
+            json.loads(str(stored))[0]['integration']['plugin'], 'ssm'
+        )
+
+    async def test_credentials_are_never_cached(self) -> None:
+        binding = _binding()
+        binding.integration['encrypted_credentials'] = {'token': 'enc'}
+        self.build.return_value = [binding]
+        bindings = await binding_cache.effective_bindings(
+            self.db, 'p1', 'logs'
+        )
+        self.assertNotIn('encrypted_credentials', bindings[0].integration)
+        stored = str(self.store['imbi:plugins:bindings:4:p1:logs'])
+        self.assertNotIn('encrypted_credentials', stored)
+        self.assertNotIn('enc', json.loads(stored)[0]['integration'])
+
+    async def test_another_pod_reads_the_stored_bindings(self) -> None:
+        await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        binding_cache.clear_local_cache()
+        bindings = await binding_cache.effective_bindings(
+            self.db, 'p1', 'logs'
+        )
+        self.assertEqual(bindings, (_binding(),))
+        self.build.assert_awaited_once()
+
+    async def test_generation_bump_retires_local_copies(self) -> None:
+        await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        self.store['imbi:plugins:bindings:gen'] = b'5'
+        await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+        self.assertEqual(self.build.await_count, 2)
+
+    async def test_invalidate_bumps_the_generation(self) -> None:
+        await binding_cache.invalidate()
+        self.client.incr.assert_awaited_once_with('imbi:plugins:bindings:gen')
+
+    async def test_request_scope_reads_the_generation_once(self) -> None:
+        with binding_cache.request_scope():
+            await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+            await binding_cache.effective_bindings(self.db, 'p1', 'logs')
+            await binding_cache.effective_bindings(self.db, 'p1', 'deployment')
+        gen_reads = [
+            c
+            for c in self.client.get.call_args_list
+            if c.args[0] == 'imbi:plugins:bindings:gen'
+        ]
+        self.assertEqual(len(gen_reads), 1)
+        self.assertEqual(self.build.await_count, 2)
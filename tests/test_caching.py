@@ -0,0 +1,87 @@
+"""Tests for the shared Valkey and call-coalescing cache helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+from unittest import mock
+
+from imbi_api import caching
+
+
+class ClientTestCase(unittest.TestCase):
+    def test_unconfigured_valkey_is_none(self) -> None:
+        with mock.patch.object(
+            caching.valkey, 'get_client', side_effect=RuntimeError('no')
+        ):
+            self.assertIsNone(caching.client())
+
+
+class LoadStoreTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_bytes_are_decoded(self) -> None:
+        client = mock.AsyncMock()
+        client.get.return_value = b'value'
+        self.assertEqual(await caching.load(client, 'k', 'test'), 'value')
+
+    async def test_read_failure_is_a_miss(self) -> None:
+        client = mock.AsyncMock()
+        client.get.side_effect = ConnectionError('down')
+        self.assertIsNone(await caching.load(client, 'k', 'test'))
+
+    async def test_write_failure_is_swallowed(self) -> None:
+        client = mock.AsyncMock()
+        client.set.side_effect = ConnectionError('down')
+        await caching.store(client, 'k', 'value', 60, 'test')
+        client.set.assert_awaited_once_with('k', 'value', ex=60)
+
+
+class SingleFlightTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        flights: caching.SingleFlight[int] = caching.SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 7
+
+        waiters = [
+            asyncio.create_task(flights.run('k', call)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        self.assertIn('k', flights)
+        release.set()
+        self.assertEqual(await asyncio.gather(*waiters), [7, 7, 7])
+        self.assertEqual(calls, 1)
+        self.assertNotIn('k', flights)
+
+    async def test_cancelled_caller_does_not_cancel_the_call(self) -> None:
+        flights: caching.SingleFlight[int] = caching.SingleFlight()
+        release = asyncio.Event()
+
+        async def call() -> int:
+            await release.wait()
+            return 7
+
+        first = asyncio.create_task(flights.run('k', call))
+        second = asyncio.create_task(flights.run('k', call))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        self.assertEqual(await second, 7)
+
+    async def test_failure_reaches_every_caller_and_is_forgotten(
+        self,
+    ) -> None:
+        flights: caching.SingleFlight[int] = caching.SingleFlight()
+        call = mock.AsyncMock(side_effect=ValueError('boom'))
+        results = await asyncio.gather(
+            flights.run('k', call),
+            flights.run('k', call),
+            return_exceptions=True,
+        )
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        call.assert_awaited_once()
+        self.assertNotIn('k', flights)
@@ -9,7 +9,7 @@ from unittest import mock
 from imbi_common.plugins.errors import PluginRateLimited
 
 from imbi_api.commit_sync import queue
-from imbi_api.commit_sync.service import CommitSyncUnavailable
+from imbi_api.commit_sync.service import CommitSyncUnavailable, SyncResult
 
 
 class EnqueueTests(unittest.IsolatedAsyncioTestCase):
@@ -25,6 +25,13 @@ class EnqueueTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(args[1]['project_id'], 'p1')
         self.assertEqual(args[1]['org_slug'], 'octo')
         self.assertEqual(args[1]['requested_by'], 'alice')
+        self.assertEqual(args[1]['full'], '0')
+
+    async def test_enqueue_full_flag(self) -> None:
+        client = mock.AsyncMock()
+        client.set = mock.AsyncMock(return_value=True)
+        await queue.enqueue_commit_sync(client, 'octo', 'p1', full=True)
+        self.assertEqual('1', client.xadd.await_args.args[1]['full'])
 
     async def test_enqueue_skips_when_debounced(self) -> None:
         client = mock.AsyncMock()
@@ -41,21 +48,27 @@ class EnqueueTests(unittest.IsolatedAsyncioTestCase):
 class ProcessMessageTests(unittest.IsolatedAsyncioTestCase):
     async def test_success_sets_running_then_success(self) -> None:
         db = mock.AsyncMock()
+        run_sync = mock.AsyncMock(return_value=SyncResult(3, 2, 'full'))
         with (
-            mock.patch.object(
-                queue, 'run_sync', mock.AsyncMock(return_value=(3, 2))
-            ),
+            mock.patch.object(queue, 'run_sync', run_sync),
             mock.patch.object(queue, 'set_status', mock.AsyncMock()) as ss,
         ):
             await queue._process_message(
                 db,
-                {'project_id': 'p1', 'org_slug': 'octo', 'requested_by': 'a'},
+                {
+                    'project_id': 'p1',
+                    'org_slug': 'octo',
+                    'requested_by': 'a',
+                    'full': '1',
+                },
             )
+        self.assertTrue(run_sync.await_args.kwargs['full'])
         statuses = [c.kwargs['status'] for c in ss.await_args_list]
         self.assertEqual(['running', 'success'], statuses)
         success = ss.await_args_list[-1].kwargs
         self.assertEqual(3, success['commits'])
         self.assertEqual(2, success['tags'])
+        self.assertEqual('full', success['mode'])
 
     async def test_unavailable_marks_failed_without_raising(self) -> None:
         db = mock.AsyncMock()
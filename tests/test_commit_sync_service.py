@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import datetime
 import unittest
 from unittest import mock
 
@@ -19,6 +20,13 @@ class _FakeCommitSync(CommitSyncCapability):
         return (5, 1)
 
 
+class _IncrementalCommitSync(_FakeCommitSync):
+    async def sync_history_since(  # type: ignore[no-untyped-def]
+        self, *, ctx, credentials, since_sha, since, tags_hash
+    ):
+        return (2, 0)
+
+
 class _UnavailableCommitSync(CommitSyncCapability):
     async def check_available(self, *, ctx, credentials) -> bool:  # type: ignore[no-untyped-def]
         return False
@@ -32,22 +40,59 @@ def _resolved(handler_cls: type) -> mock.Mock:
 
 
 class RunSyncTests(unittest.IsolatedAsyncioTestCase):
-    async def test_invokes_handler_sync_all_history(self) -> None:
-        db = mock.AsyncMock()
+    async def _run(
+        self,
+        handler_cls: type,
+        cursor: service.SyncCursor | None,
+        **kwargs: bool,
+    ) -> tuple[service.SyncResult, mock.AsyncMock]:
+        advance = mock.AsyncMock()
+        self.read_cursor = mock.AsyncMock(return_value=cursor)
         with (
             mock.patch.object(
                 service,
                 'resolve_capability',
-                mock.AsyncMock(return_value=_resolved(_FakeCommitSync)),
+                mock.AsyncMock(return_value=_resolved(handler_cls)),
             ),
             mock.patch.object(
                 service,
                 '_build_context',
                 mock.AsyncMock(return_value=mock.Mock()),
             ),
+            mock.patch.object(service, 'read_cursor', self.read_cursor),
+            mock.patch.object(service, '_advance_cursor', advance),
+            mock.patch.object(
+                service.release_state, 'refresh', mock.AsyncMock()
+            ) as refresh,
         ):
-            result = await service.run_sync(db, 'octo', 'p1')
-        self.assertEqual((5, 1), result)
+            result = await service.run_sync(
+                mock.AsyncMock(), 'octo', 'p1', **kwargs
+            )
+        refresh.assert_awaited_once_with(['p1'])
+        return result, advance
+
+    async def test_invokes_handler_sync_all_history(self) -> None:
+        result, advance = await self._run(_IncrementalCommitSync, None)
+        self.assertEqual(service.SyncResult(5, 1, 'full'), result)
+        advance.assert_awaited_once()
+
+    async def test_incremental_from_cursor(self) -> None:
+        cursor = service.SyncCursor(head_sha='abc', tags_hash='h')
+        result, advance = await self._run(_IncrementalCommitSync, cursor)
+        self.assertEqual(service.SyncResult(2, 0, 'incremental'), result)
+        advance.assert_awaited_once()
+
+    async def test_full_overrides_cursor(self) -> None:
+        cursor = service.SyncCursor(head_sha='abc')
+        result, _ = await self._run(_IncrementalCommitSync, cursor, full=True)
+        self.assertEqual('full', result.mode)
+
+    async def test_plugin_without_incremental_skips_cursor(self) -> None:
+        cursor = service.SyncCursor(head_sha='abc')
+        result, advance = await self._run(_FakeCommitSync, cursor)
+        self.assertEqual(service.SyncResult(5, 1, 'full'), result)
+        self.read_cursor.assert_not_awaited()
+        advance.assert_not_awaited()
 
     async def test_unresolved_raises_unavailable(self) -> None:
         db = mock.AsyncMock()
@@ -64,6 +109,70 @@ class RunSyncTests(unittest.IsolatedAsyncioTestCase):
                 await service.run_sync(db, 'octo', 'p1')
 
 
+class CursorTests(unittest.IsolatedAsyncioTestCase):
+    def test_tags_hash_ignores_order(self) -> None:
+        self.assertEqual(
+            service.tags_hash([('v1', 'a'), ('v2', 'b')]),
+            service.tags_hash([('v2', 'b'), ('v1', 'a')]),
+        )
+        self.assertNotEqual(
+            service.tags_hash([('v1', 'a')]),
+            service.tags_hash([('v1', 'b')]),
+        )
+
+    async def test_compute_cursor_from_clickhouse(self) -> None:
+        pushed = datetime.datetime(2026, 6, 4, tzinfo=datetime.UTC)
+        query = mock.AsyncMock(
+            side_effect=[
+                [{'sha': 'abc', 'pushed_at': pushed, 'authored_at': None}],
+                [{'name': 'v1', 'sha': 'abc'}],
+            ]
+        )
+        with mock.patch.object(service.clickhouse, 'query', query):
+            cursor = await service.compute_cursor('p1')
+        assert cursor is not None
+        self.assertEqual('abc', cursor.head_sha)
+        self.assertEqual(pushed, cursor.head_at)
+        self.assertEqual(service.tags_hash([('v1', 'abc')]), cursor.tags_hash)
+
+    async def test_compute_cursor_none_without_commits(self) -> None:
+        query = mock.AsyncMock(side_effect=[[], []])
+        with mock.patch.object(service.clickhouse, 'query', query):
+            self.assertIsNone(await service.compute_cursor('p1'))
+
+    async def test_read_cursor_none_before_first_sync(self) -> None:
+        db = mock.AsyncMock()
+        db.execute.return_value = [
+            {'head_sha': None, 'head_at': None, 'tags_hash': None}
+        ]
+        self.assertIsNone(await service.read_cursor(db, 'p1'))
+
+    async def test_read_cursor_parses_properties(self) -> None:
+        db = mock.AsyncMock()
+        db.execute.return_value = [
+            {
+                'head_sha': '"abc"',
+                'head_at': '"2026-06-04T12:00:00+00:00"',
+                'tags_hash': '"h"',
+            }
+        ]
+        cursor = await service.read_cursor(db, 'p1')
+        assert cursor is not None
+        self.assertEqual('abc', cursor.head_sha)
+        self.assertEqual('h', cursor.tags_hash)
+        self.assertIsNotNone(cursor.head_at)
+
+    async def test_advance_cursor_swallows_errors(self) -> None:
+        db = mock.AsyncMock()
+        with mock.patch.object(
+            service,
+            'compute_cursor',
+            mock.AsyncMock(side_effect=RuntimeError('down')),
+        ):
+            await service._advance_cursor(db, 'p1')
+        db.execute.assert_not_awaited()
+
+
 class CheckAvailableTests(unittest.IsolatedAsyncioTestCase):
     async def test_available_does_not_raise(self) -> None:
         db = mock.AsyncMock()
@@ -155,6 +264,8 @@ class StatusTests(unittest.IsolatedAsyncioTestCase):
                 'commits': 12,
                 'tags': 4,
                 'error': '""',
+                'mode': '"incremental"',
+                'head_sha': '"abc"',
             }
         ]
         status = await service.read_status(db, 'p1')
@@ -164,3 +275,5 @@ class StatusTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual('alice', status.requested_by)
         self.assertIsNotNone(status.last_synced_at)
         self.assertIsNone(status.error)
+        self.assertEqual('incremental', status.mode)
+        self.assertEqual('abc', status.head_sha)
@@ -0,0 +1,168 @@
+"""Tests for the deployment-plugin compare() result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import fastapi
+from imbi_common.plugins.base import CompareResult
+from imbi_common.plugins.errors import PluginRateLimited
+
+from imbi_api import caching
+from imbi_api.plugins import compare_cache
+
+_BASE = 'a' * 40
+_HEAD = 'b' * 40
+_KEY = f'{compare_cache.KEY_PREFIX}:i1:{_BASE}:{_HEAD}'
+
+
+def _result(ahead: int = 3) -> CompareResult:
+    return CompareResult(base_sha=_BASE, head_sha=_HEAD, ahead=ahead, behind=0)
+
+
+class _CompareCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        compare_cache.clear()
+
+    def _patch_client(self, client: object) -> None:
+        if client is None:
+            patcher = mock.patch.object(
+                caching.valkey,
+                'get_client',
+                side_effect=RuntimeError('no valkey'),
+            )
+        else:
+            patcher = mock.patch.object(
+                caching.valkey, 'get_client', return_value=client
+            )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class WithoutValkeyTestCase(_CompareCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._patch_client(None)
+
+    async def test_concurrent_lookups_share_one_call(self) -> None:
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch() -> CompareResult:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return _result()
+
+        lookups = [
+            asyncio.create_task(
+                compare_cache.compare('i1', _BASE, _HEAD, fetch)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*lookups)
+        self.assertEqual([3, 3, 3], [r.ahead for r in results])
+        self.assertEqual(1, calls)
+        self.assertEqual(2, compare_cache.stats()['coalesced'])
+
+    async def test_branch_names_bypass_the_cache(self) -> None:
+        fetch = mock.AsyncMock(return_value=_result())
+        await compare_cache.compare('i1', 'main', _HEAD, fetch)
+        await compare_cache.compare('i1', 'main', _HEAD, fetch)
+        self.assertEqual(2, fetch.await_count)
+        self.assertEqual(2, compare_cache.stats()['uncacheable'])
+
+    async def test_abbreviated_shas_are_cacheable(self) -> None:
+        self.assertTrue(compare_cache.cacheable('aaa6400', 'bbb6400'))
+        self.assertFalse(compare_cache.cacheable('v1.2.3', 'bbb6400'))
+        self.assertFalse(compare_cache.cacheable('abc', 'bbb6400'))
+
+
+class WithValkeyTestCase(_CompareCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.store: dict[str, object] = {}
+        self.ttls: dict[str, int] = {}
+        self.client = mock.AsyncMock()
+        self.client.get.side_effect = self.store.get
+
+        async def _set(key: str, value: object, ex: int) -> bool:
+            self.store[key] = value
+            self.ttls[key] = ex
+            return True
+
+        self.client.set.side_effect = _set
+        self._patch_client(self.client)
+
+    async def test_results_are_stored_and_reused(self) -> None:
+        fetch = mock.AsyncMock(return_value=_result())
+        first = await compare_cache.compare('i1', _BASE, _HEAD, fetch)
+        second = await compare_cache.compare('i1', _BASE, _HEAD, fetch)
+        self.assertEqual(first, second)
+        fetch.assert_awaited_once()
+        self.assertEqual(compare_cache.RESULT_TTL_SECONDS, self.ttls[_KEY])
+        self.assertEqual(
+            {'hits': 1, 'misses': 1},
+            {
+                k: v
+                for k, v in compare_cache.stats().items()
+                if k in ('hits', 'misses')
+            },
+        )
+
+    async def test_keys_are_scoped_by_integration(self) -> None:
+        fetch = mock.AsyncMock(return_value=_result())
+        await compare_cache.compare('i1', _BASE, _HEAD, fetch)
+        await compare_cache.compare('i2', _BASE, _HEAD, fetch)
+        self.assertEqual(2, fetch.await_count)
+
+    async def test_plugin_errors_are_negatively_cached(self) -> None:
+        fetch = mock.AsyncMock(
+            side_effect=fastapi.HTTPException(404, 'No common ancestor')
+        )
+        for _ in range(2):
+            with self.assertRaises(fastapi.HTTPException) as ctx:
+                await compare_cache.compare('i1', _BASE, _HEAD, fetch)
+            self.assertEqual(404, ctx.exception.status_code)
+            self.assertEqual('No common ancestor', ctx.exception.detail)
+        fetch.assert_awaited_once()
+        self.assertEqual(compare_cache.FAILURE_TTL_SECONDS, self.ttls[_KEY])
+        self.assertEqual(1, compare_cache.stats()['negative_hits'])
+
+    async def test_other_errors_become_compare_failed(self) -> None:
+        fetch = mock.AsyncMock(side_effect=ValueError('bad sha'))
+        for _ in range(2):
+            with self.assertRaisesRegex(
+                compare_cache.CompareFailed, 'bad sha'
+            ):
+                await compare_cache.compare('i1', _BASE, _HEAD, fetch)
+        fetch.assert_awaited_once()
+
+    async def test_transient_errors_are_not_cached(self) -> None:
+        for exc in (
+            PluginRateLimited(retry_at=0),
+            fastapi.HTTPException(503, 'timed out'),
+        ):
+            fetch = mock.AsyncMock(side_effect=exc)
+            with self.assertRaises(type(exc)):
+                await compare_cache.compare('i1', _BASE, _HEAD, fetch)
+        self.assertEqual({}, self.store)
+
+    async def test_unreadable_entry_is_refetched(self) -> None:
+        self.store[_KEY] = json.dumps({'result': {'ahead': 'x'}})
+        fetch = mock.AsyncMock(return_value=_result(ahead=5))
+        result = await compare_cache.compare('i1', _BASE, _HEAD, fetch)
+        self.assertEqual(5, result.ahead)
+        fetch.assert_awaited_once()
+
+    async def test_valkey_errors_fall_through_to_fetch(self) -> None:
+        self.client.get.side_effect = ConnectionError('down')
+        self.client.set.side_effect = ConnectionError('down')
+        fetch = mock.AsyncMock(return_value=_result())
+        result = await compare_cache.compare('i1', _BASE, _HEAD, fetch)
+        self.assertEqual(3, result.ahead)
@@ -0,0 +1,133 @@
+"""Tests for the append-only deployment event store."""
+
+import datetime
+import unittest
+from unittest import mock
+
+from imbi_api import deployment_events, models
+
+_TS = datetime.datetime(2026, 5, 13, 14, tzinfo=datetime.UTC)
+
+
+def _db_with_connection() -> tuple[mock.MagicMock, mock.MagicMock]:
+    """A graph mock whose pool hands out one mocked connection."""
+    conn = mock.MagicMock()
+    conn.execute = mock.AsyncMock()
+    cursor = mock.MagicMock()
+    cursor.executemany = mock.AsyncMock()
+    cursor.__aenter__ = mock.AsyncMock(return_value=cursor)
+    cursor.__aexit__ = mock.AsyncMock(return_value=False)
+    conn.cursor = mock.Mock(return_value=cursor)
+    transaction = mock.MagicMock()
+    transaction.__aenter__ = mock.AsyncMock(return_value=None)
+    transaction.__aexit__ = mock.AsyncMock(return_value=False)
+    conn.transaction = mock.Mock(return_value=transaction)
+    connection = mock.MagicMock()
+    connection.__aenter__ = mock.AsyncMock(return_value=conn)
+    connection.__aexit__ = mock.AsyncMock(return_value=False)
+    db = mock.MagicMock()
+    db.pool.connection = mock.Mock(return_value=connection)
+    return db, conn
+
+
+def _row(
+    event_id: int, env_slug: str, status: str, run_id: str | None = None
+) -> tuple[object, ...]:
+    return (event_id, env_slug, _TS, status, None, run_id, None, None)
+
+
+class DeploymentEventStoreTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.db, self.conn = _db_with_connection()
+
+    async def test_ensure_schema_creates_table_and_indexes(self) -> None:
+        await deployment_events.ensure_schema(self.db)
+        statements = [c.args[0] for c in self.conn.execute.await_args_list]
+        self.assertEqual(len(statements), 3)
+        self.assertIn('CREATE TABLE IF NOT EXISTS', statements[0])
+        self.assertIn('WHERE external_run_id IS NOT NULL', statements[2])
+
+    async def test_append_inserts_one_row_per_event(self) -> None:
+        events = [
+            models.DeploymentEvent(timestamp=_TS, status='pending'),
+            models.DeploymentEvent(timestamp=_TS, status='success'),
+        ]
+        await deployment_events.append(self.db, 'rel-1', 'prod', events)
+        cursor = self.conn.cursor.return_value
+        rows = cursor.executemany.await_args.args[1]
+        self.assertEqual([r['status'] for r in rows], ['pending', 'success'])
+        self.assertEqual({r['env_slug'] for r in rows}, {'prod'})
+
+    async def test_append_nothing_skips_connection(self) -> None:
+        await deployment_events.append(self.db, 'rel-1', 'prod', [])
+        self.db.pool.connection.assert_not_called()
+
+    async def test_replace_deletes_and_inserts_in_one_transaction(
+        self,
+    ) -> None:
+        events = [models.DeploymentEvent(timestamp=_TS, status='success')]
+        await deployment_events.replace(self.db, 'rel-1', 'prod', events)
+        self.conn.transaction.assert_called_once_with()
+        delete = self.conn.execute.await_args.args
+        self.assertIn('DELETE FROM public.deployment_events', delete[0])
+        self.assertEqual(
+            delete[1], {'release_id': 'rel-1', 'env_slug': 'prod'}
+        )
+        cursor = self.conn.cursor.return_value
+        rows = cursor.executemany.await_args.args[1]
+        self.assertEqual([r['status'] for r in rows], ['success'])
+
+    async def test_purge_scopes_to_environment(self) -> None:
+        await deployment_events.purge(self.db, ['rel-1', 'rel-2'], 'prod')
+        query, params = self.conn.execute.await_args.args
+        self.assertIn('release_id = ANY', query)
+        self.assertIn('env_slug = %(env_slug)s', query)
+        self.assertEqual(params['release_ids'], ['rel-1', 'rel-2'])
+
+    async def test_purge_of_whole_releases(self) -> None:
+        await deployment_events.purge(self.db, ['rel-1'])
+        query = self.conn.execute.await_args.args[0]
+        self.assertNotIn('env_slug', query)
+
+    async def test_purge_nothing_skips_connection(self) -> None:
+        await deployment_events.purge(self.db, [])
+        self.db.pool.connection.assert_not_called()
+
+    async def test_find_run_returns_row_id(self) -> None:
+        result = mock.MagicMock()
+        result.fetchone = mock.AsyncMock(
+            return_value=_row(7, 'prod', 'in_progress', '42')
+        )
+        self.conn.execute.return_value = result
+        found = await deployment_events.find_run(
+            self.db, 'rel-1', 'prod', '42'
+        )
+        assert found is not None
+        self.assertEqual(found.id, 7)
+        self.assertEqual(found.event.external_run_id, '42')
+
+    async def test_find_run_miss(self) -> None:
+        result = mock.MagicMock()
+        result.fetchone = mock.AsyncMock(return_value=None)
+        self.conn.execute.return_value = result
+        self.assertIsNone(
+            await deployment_events.find_run(self.db, 'rel-1', 'prod', '42')
+        )
+
+    async def test_history_groups_by_environment(self) -> None:
+        result = mock.MagicMock()
+        result.fetchall = mock.AsyncMock(
+            return_value=[
+                _row(1, 'prod', 'pending'),
+                _row(2, 'staging', 'success'),
+                _row(3, 'prod', 'success'),
+            ]
+        )
+        self.conn.execute.return_value = result
+        history = await deployment_events.history(
+            self.db, 'rel-1', ['prod', 'staging']
+        )
+        self.assertEqual(
+            [e.status for e in history['prod']], ['pending', 'success']
+        )
+        self.assertEqual(len(history['staging']), 1)
@@ -4,7 +4,7 @@ from unittest import mock
 
 import typer.testing
 
-from imbi_api import entrypoint, models
+from imbi_api import entrypoint, lifespans, models
 
 
 class SetupTestCase(unittest.TestCase):
@@ -265,6 +265,37 @@ class SetupTestCase(unittest.TestCase):
         self.mock_ch_close.assert_awaited_once()
 
 
+class WorkerTestCase(unittest.TestCase):
+    """Test cases for the ``worker`` command."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.runner = typer.testing.CliRunner()
+        self.run_workers = self.enterContext(
+            mock.patch.object(
+                entrypoint, '_run_workers', new_callable=mock.AsyncMock
+            )
+        )
+
+    def test_runs_all_workers_by_default(self) -> None:
+        result = self.runner.invoke(entrypoint.main, ['worker'])
+        self.assertEqual(0, result.exit_code, result.output)
+        self.run_workers.assert_awaited_once_with(list(lifespans.WORKER_HOOKS))
+
+    def test_runs_selected_workers(self) -> None:
+        result = self.runner.invoke(
+            entrypoint.main, ['worker', 'pr-sync', 'commit-sync', 'pr-sync']
+        )
+        self.assertEqual(0, result.exit_code, result.output)
+        self.run_workers.assert_awaited_once_with(['pr-sync', 'commit-sync'])
+
+    def test_unknown_worker_exits(self) -> None:
+        result = self.runner.invoke(entrypoint.main, ['worker', 'nope'])
+        self.assertEqual(2, result.exit_code)
+        self.assertIn('Unknown worker(s): nope', result.output)
+        self.run_workers.assert_not_awaited()
+
+
 class BackfillNodeIdsTestCase(unittest.TestCase):
     """Test cases for the ``backfill-node-ids`` command (#291).
 
@@ -0,0 +1,126 @@
+"""Tests for the buffered ClickHouse insert writer."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from imbi_api import event_buffer
+
+_COLUMNS = ['id', 'type']
+
+
+class BufferTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.ch = mock.MagicMock()
+        self.ch.insert = mock.AsyncMock()
+        patcher = mock.patch(
+            'imbi_api.event_buffer.clickhouse.client.Clickhouse.get_instance',
+            return_value=self.ch,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_rows_are_coalesced_per_table(self) -> None:
+        buffer = event_buffer.Buffer(max_rows=10, flush_interval=0.05)
+        buffer.start()
+        await buffer.put('events', _COLUMNS, [['a', 'x'], ['b', 'x']])
+        await buffer.put('events', _COLUMNS, [['c', 'y']])
+        await buffer.put('other', _COLUMNS, [['d', 'z']])
+        await buffer.close()
+        calls = {c.args[0]: c.args for c in self.ch.insert.await_args_list}
+        self.assertEqual(self.ch.insert.await_count, 2)
+        self.assertEqual(
+            calls['events'][1], [['a', 'x'], ['b', 'x'], ['c', 'y']]
+        )
+        self.assertEqual(calls['events'][2], _COLUMNS)
+        self.assertEqual(buffer.stats.rows_written, 4)
+        self.assertEqual(buffer.stats.flushes, 2)
+
+    async def test_max_rows_splits_batches(self) -> None:
+        buffer = event_buffer.Buffer(max_rows=2, flush_interval=60)
+        buffer.start()
+        await buffer.put('events', _COLUMNS, [[str(i), 'x'] for i in range(5)])
+        await buffer.close()
+        sizes = [len(c.args[1]) for c in self.ch.insert.await_args_list]
+        self.assertEqual(sizes, [2, 2, 1])
+
+    async def test_wait_returns_after_the_write(self) -> None:
+        buffer = event_buffer.Buffer(flush_interval=60)
+        buffer.start()
+        await asyncio.wait_for(
+            buffer.put('operations_log', _COLUMNS, [['a', 'x']], wait=True),
+            1,
+        )
+        self.ch.insert.assert_awaited_once()
+        await buffer.close()
+
+    async def test_wait_raises_the_insert_error(self) -> None:
+        self.ch.insert.side_effect = RuntimeError('CH down')
+        buffer = event_buffer.Buffer(flush_interval=60)
+        buffer.start()
+        with (
+            self.assertLogs(event_buffer.LOGGER, 'ERROR'),
+            self.assertRaises(RuntimeError),
+        ):
+            await buffer.put('events', _COLUMNS, [['a', 'x']], wait=True)
+        await buffer.close()
+        self.assertEqual(buffer.stats.rows_failed, 1)
+
+    async def test_rejected_row_fails_only_its_writer(self) -> None:
+        async def insert(
+            table: str, rows: list[list[str]], columns: list[str]
+        ) -> None:
+            if ['bad', 'x'] in rows:
+                raise ValueError('malformed row')
+
+        self.ch.insert.side_effect = insert
+        buffer = event_buffer.Buffer(flush_interval=60)
+        put_good = asyncio.create_task(
+            buffer.put('operations_log', _COLUMNS, [['good', 'x']], wait=True)
+        )
+        put_bad = asyncio.create_task(
+            buffer.put('operations_log', _COLUMNS, [['bad', 'x']], wait=True)
+        )
+        await asyncio.sleep(0)
+        with self.assertLogs(event_buffer.LOGGER, 'WARNING'):
+            buffer.start()
+            await put_good
+            with self.assertRaises(ValueError):
+                await put_bad
+        await buffer.close()
+        self.assertEqual(self.ch.insert.await_count, 3)
+        self.assertEqual(buffer.stats.rows_written, 1)
+        self.assertEqual(buffer.stats.rows_failed, 1)
+
+    async def test_put_after_close_raises(self) -> None:
+        buffer = event_buffer.Buffer(flush_interval=60)
+        buffer.start()
+        await buffer.close()
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(
+                buffer.put('events', _COLUMNS, [['a', 'x']], wait=True), 1
+            )
+
+    async def test_full_queue_applies_backpressure(self) -> None:
+        buffer = event_buffer.Buffer(max_queue=1, flush_interval=60)
+        put = asyncio.create_task(
+            buffer.put('events', _COLUMNS, [['a', 'x'], ['b', 'x']])
+        )
+        await asyncio.sleep(0)
+        self.assertFalse(put.done())
+        buffer.start()
+        await buffer.close()
+        await put
+        self.assertEqual(buffer.stats.rows_written, 2)
+
+
+class WriteTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_inserts_directly_without_a_buffer(self) -> None:
+        ch = mock.MagicMock()
+        ch.insert = mock.AsyncMock()
+        with mock.patch(
+            'imbi_api.event_buffer.clickhouse.client.Clickhouse.get_instance',
+            return_value=ch,
+        ):
+            await event_buffer.write('events', _COLUMNS, [('a', 'x')])
+        ch.insert.assert_awaited_once_with('events', [['a', 'x']], _COLUMNS)
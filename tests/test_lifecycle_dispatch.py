@@ -167,7 +167,7 @@ class DispatchLifecycleTestCase(unittest.TestCase):
                 mock.Mock(return_value={'access_token': 'tok'}),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle_dispatch.ch_client.Clickhouse.'
+                'imbi_api.event_buffer.clickhouse.client.Clickhouse.'
                 'get_instance'
             ) as ch_get,
         ):
@@ -384,7 +384,7 @@ class DispatchLifecycleTestCase(unittest.TestCase):
                 mock.Mock(return_value={'access_token': 't'}),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle_dispatch.ch_client.Clickhouse.'
+                'imbi_api.event_buffer.clickhouse.client.Clickhouse.'
                 'get_instance'
             ) as ch_get,
         ):
@@ -482,7 +482,7 @@ class WidenedEventNotImplementedTestCase(unittest.TestCase):
                 mock.Mock(return_value={'access_token': 't'}),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle_dispatch.ch_client.Clickhouse.'
+                'imbi_api.event_buffer.clickhouse.client.Clickhouse.'
                 'get_instance'
             ) as ch_get,
         ):
@@ -579,7 +579,7 @@ class BundleAndContextPropagationTestCase(unittest.TestCase):
                 mock.Mock(return_value={'access_token': 't'}),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle_dispatch.ch_client.Clickhouse.'
+                'imbi_api.event_buffer.clickhouse.client.Clickhouse.'
                 'get_instance'
             ) as ch_get,
         ):
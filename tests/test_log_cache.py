@@ -0,0 +1,97 @@
+"""Tests for the plugin log query result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import unittest
+from unittest import mock
+
+from imbi_common.plugins.base import LogFilter, LogQuery
+
+from imbi_api import settings
+from imbi_api.plugins import log_cache
+
+
+def _query(**overrides: object) -> LogQuery:
+    start = datetime.datetime(2026, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
+    values: dict[str, object] = {
+        'start_time': start,
+        'end_time': start + datetime.timedelta(minutes=30),
+        'filters': [],
+    }
+    values.update(overrides)
+    return LogQuery(**values)  # type: ignore[arg-type]
+
+
+def _key(query: LogQuery, scope: str | None = None) -> str:
+    return log_cache.cache_key(
+        'search',
+        project_id='p1',
+        integration_id='i1',
+        environment='production',
+        scope=scope,
+        query=query,
+    )
+
+
+class LogCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        settings.clear_caches()
+        log_cache.clear()
+        self.addCleanup(settings.clear_caches)
+        self.addCleanup(log_cache.clear)
+
+    def test_key_buckets_window_and_normalizes_filters(self) -> None:
+        a = LogFilter(field='a', op='eq', value='1')
+        b = LogFilter(field='b', op='eq', value='2')
+        shifted = _query(
+            start_time=_query().start_time + datetime.timedelta(seconds=3),
+            end_time=_query().end_time + datetime.timedelta(seconds=3),
+            filters=[b, a],
+        )
+        self.assertEqual(_key(_query(filters=[a, b])), _key(shifted))
+        self.assertNotEqual(_key(_query()), _key(_query(), scope='u@x'))
+
+    async def test_hits_and_coalesces_identical_queries(self) -> None:
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 'result'
+
+        key = _key(_query())
+        lookups = [
+            asyncio.create_task(log_cache.cached(key, fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        self.assertEqual(await asyncio.gather(*lookups), ['result'] * 3)
+        self.assertEqual(await log_cache.cached(key, fetch), 'result')
+        self.assertEqual(calls, 1)
+        stats = log_cache.stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['coalesced'], 2)
+        self.assertEqual(stats['hits'], 1)
+
+    async def test_failures_are_not_cached(self) -> None:
+        fetch = mock.AsyncMock(side_effect=[RuntimeError('boom'), 'ok'])
+        key = _key(_query())
+        with self.assertRaises(RuntimeError):
+            await log_cache.cached(key, fetch)
+        self.assertEqual(await log_cache.cached(key, fetch), 'ok')
+        self.assertEqual(fetch.await_count, 2)
+
+    async def test_zero_ttl_disables_cache(self) -> None:
+        fetch = mock.AsyncMock(return_value='ok')
+        env = {'IMBI_LOG_CACHE_TTL_SECONDS': '0'}
+        with mock.patch.dict('os.environ', env):
+            settings.clear_caches()
+            key = _key(_query())
+            await log_cache.cached(key, fetch)
+            await log_cache.cached(key, fetch)
+        self.assertEqual(fetch.await_count, 2)
+        self.assertEqual(log_cache.stats()['size'], 0)
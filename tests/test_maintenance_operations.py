@@ -10,7 +10,7 @@ from unittest import mock
 import fastapi
 from imbi_common.plugins.errors import PluginRateLimited
 
-from imbi_api.commit_sync.service import CommitSyncUnavailable
+from imbi_api.commit_sync.service import CommitSyncUnavailable, SyncResult
 from imbi_api.maintenance import operations
 from imbi_api.pr_sync.service import PRSyncUnavailable
 
@@ -137,7 +137,7 @@ class ExecuteCommitSyncTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_success(self) -> None:
         set_status, patches = self._patches(
-            mock.AsyncMock(return_value=(3, 2))
+            mock.AsyncMock(return_value=SyncResult(3, 2, 'incremental'))
         )
         with patches[0], patches[1], patches[2]:
             outcome = await operations.execute_commit_sync(
@@ -147,6 +147,9 @@ class ExecuteCommitSyncTests(unittest.IsolatedAsyncioTestCase):
         statuses = [c.kwargs['status'] for c in set_status.await_args_list]
         self.assertEqual(['running', 'success'], statuses)
         self.assertEqual(3, set_status.await_args_list[-1].kwargs['commits'])
+        self.assertEqual(
+            'incremental', set_status.await_args_list[-1].kwargs['mode']
+        )
 
     async def test_unavailable_is_skipped(self) -> None:
         set_status, patches = self._patches(
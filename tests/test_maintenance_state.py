@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import datetime
 import typing
 import unittest
 from unittest import mock
@@ -230,6 +231,47 @@ class ReadStatusTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual('idle', status.state)
 
 
+class ThroughputTests(unittest.TestCase):
+    def test_running_rate_and_eta(self) -> None:
+        started = datetime.datetime.now(datetime.UTC) - datetime.timedelta(
+            minutes=10
+        )
+        status = state.RunStatus(
+            state='running',
+            started_at=started,
+            succeeded=15,
+            failed=3,
+            skipped=2,
+            remaining=38,
+            in_flight=2,
+        )
+        rate, eta = state._throughput(status)
+        assert rate is not None and eta is not None
+        self.assertAlmostEqual(2.0, rate, places=1)
+        expected = datetime.datetime.now(datetime.UTC) + datetime.timedelta(
+            minutes=20
+        )
+        self.assertLess(abs((eta - expected).total_seconds()), 5)
+
+    def test_completed_has_rate_without_eta(self) -> None:
+        started = datetime.datetime(2026, 7, 13, tzinfo=datetime.UTC)
+        status = state.RunStatus(
+            state='completed',
+            started_at=started,
+            completed_at=started + datetime.timedelta(minutes=4),
+            succeeded=8,
+        )
+        self.assertEqual((2.0, None), state._throughput(status))
+
+    def test_nothing_finished_yet(self) -> None:
+        status = state.RunStatus(
+            state='running',
+            started_at=datetime.datetime.now(datetime.UTC),
+            remaining=5,
+        )
+        self.assertEqual((None, None), state._throughput(status))
+
+
 class ReadFailuresTests(unittest.IsolatedAsyncioTestCase):
     async def test_decodes_entries(self) -> None:
         client = mock.AsyncMock()
@@ -17,6 +17,7 @@ from imbi_api.maintenance.operations import MaintenanceItemFailed
 def _operation(
     execute: mock.AsyncMock,
     pause_key: str | None = None,
+    concurrency: int = 1,
 ) -> registry.OperationDefinition:
     return registry.OperationDefinition(
         slug=typing.cast('registry.MaintenanceSlug', 'op'),
@@ -25,10 +26,13 @@ def _operation(
         pause_key=pause_key,
         enumerate=mock.AsyncMock(return_value=[]),
         execute=execute,
+        concurrency=concurrency,
     )
 
 
-class TickOperationTests(unittest.IsolatedAsyncioTestCase):
+class ProjectOutcomeTests(unittest.IsolatedAsyncioTestCase):
+    """One pass of the operation loop over a single checkout."""
+
     def setUp(self) -> None:
         self.client = mock.AsyncMock()
         self.db = mock.AsyncMock()
@@ -46,18 +50,43 @@ class TickOperationTests(unittest.IsolatedAsyncioTestCase):
         self.state['has_active_run'].return_value = True
         self.state['checkout'].return_value = 'p1'
         self.state['maybe_finalize'].return_value = False
+        patcher = mock.patch.object(worker, 'POLL_IDLE_SECONDS', 0.01)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _run_once(self, operation: registry.OperationDefinition) -> None:
+        """Run the loop until its checkout after the first one.
+
+        With a single slot the loop only checks out again once the
+        first project has settled, so stopping there lets it finish.
+        """
+        stop = asyncio.Event()
+        checkout_next = worker._checkout_next
+        calls = 0
+
+        async def checkout(*args: typing.Any) -> str | None:
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                stop.set()
+                return None
+            return await checkout_next(*args)
+
+        with mock.patch.object(worker, '_checkout_next', checkout):
+            await asyncio.wait_for(
+                worker._run_operation(self.client, self.db, operation, stop),
+                timeout=2.0,
+            )
 
     async def test_no_active_run_is_noop(self) -> None:
         self.state['has_active_run'].return_value = False
         operation = _operation(mock.AsyncMock())
-        result = await worker._tick_operation(self.client, self.db, operation)
-        self.assertFalse(result)
+        await self._run_once(operation)
         self.state['checkout'].assert_not_awaited()
 
     async def test_success_records_outcome(self) -> None:
         operation = _operation(mock.AsyncMock(return_value='succeeded'))
-        result = await worker._tick_operation(self.client, self.db, operation)
-        self.assertTrue(result)
+        await self._run_once(operation)
         self.state['record_outcome'].assert_awaited_once_with(
             self.client, 'op', 'p1', 'succeeded', ''
         )
@@ -66,23 +95,20 @@ class TickOperationTests(unittest.IsolatedAsyncioTestCase):
     async def test_record_outcome_failure_requeues(self) -> None:
         self.state['record_outcome'].side_effect = RuntimeError('valkey down')
         operation = _operation(mock.AsyncMock(return_value='succeeded'))
-        result = await worker._tick_operation(self.client, self.db, operation)
-        self.assertTrue(result)
+        await self._run_once(operation)
         self.state['requeue'].assert_awaited_once_with(self.client, 'op', 'p1')
 
     async def test_drained_finalizes(self) -> None:
         self.state['checkout'].return_value = None
         operation = _operation(mock.AsyncMock())
-        result = await worker._tick_operation(self.client, self.db, operation)
-        self.assertFalse(result)
+        await self._run_once(operation)
         self.state['maybe_finalize'].assert_awaited_once()
 
     async def test_item_failed_records_message(self) -> None:
         operation = _operation(
             mock.AsyncMock(side_effect=MaintenanceItemFailed('boom'))
         )
-        result = await worker._tick_operation(self.client, self.db, operation)
-        self.assertTrue(result)
+        await self._run_once(operation)
         self.state['record_outcome'].assert_awaited_once_with(
             self.client, 'op', 'p1', 'failed', 'boom'
         )
@@ -91,8 +117,7 @@ class TickOperationTests(unittest.IsolatedAsyncioTestCase):
         operation = _operation(
             mock.AsyncMock(side_effect=RuntimeError('secret detail'))
         )
-        result = await worker._tick_operation(self.client, self.db, operation)
-        self.assertTrue(result)
+        await self._run_once(operation)
         error = self.state['record_outcome'].await_args.args[4]
         self.assertNotIn('secret detail', error)
 
@@ -105,10 +130,7 @@ class TickOperationTests(unittest.IsolatedAsyncioTestCase):
         with mock.patch.object(
             worker, 'pause_until', mock.AsyncMock()
         ) as pause:
-            result = await worker._tick_operation(
-                self.client, self.db, operation
-            )
-        self.assertFalse(result)
+            await self._run_once(operation)
         self.state['requeue'].assert_awaited_once_with(self.client, 'op', 'p1')
         self.state['record_outcome'].assert_not_awaited()
         pause.assert_awaited_once_with(
@@ -124,19 +146,15 @@ class TickOperationTests(unittest.IsolatedAsyncioTestCase):
             'paused_remaining',
             mock.AsyncMock(return_value=30.0),
         ):
-            result = await worker._tick_operation(
-                self.client, self.db, operation
-            )
-        self.assertFalse(result)
+            await self._run_once(operation)
         self.state['checkout'].assert_not_awaited()
         self.state['maybe_finalize'].assert_awaited_once()
 
-    async def test_cancelled_requeues_and_reraises(self) -> None:
+    async def test_cancelled_project_is_requeued(self) -> None:
         operation = _operation(
             mock.AsyncMock(side_effect=asyncio.CancelledError())
         )
-        with self.assertRaises(asyncio.CancelledError):
-            await worker._tick_operation(self.client, self.db, operation)
+        await self._run_once(operation)
         self.state['requeue'].assert_awaited_once_with(self.client, 'op', 'p1')
 
 
@@ -153,14 +171,19 @@ class RunWorkerTests(unittest.IsolatedAsyncioTestCase):
         stop = asyncio.Event()
         calls = 0
 
-        async def tick(*_args: object) -> bool:
+        async def execute(*_args: object) -> bool:
             nonlocal calls
             calls += 1
             if calls >= len(registry.OPERATIONS) * 2:
                 stop.set()
             return True
 
-        with mock.patch.object(worker, '_tick_operation', tick):
+        with (
+            mock.patch.object(
+                worker, '_checkout_next', mock.AsyncMock(return_value='p1')
+            ),
+            mock.patch.object(worker, '_execute_project', execute),
+        ):
             await asyncio.wait_for(
                 worker.run_worker(mock.AsyncMock(), mock.AsyncMock(), stop),
                 timeout=2.0,
@@ -168,6 +191,95 @@ class RunWorkerTests(unittest.IsolatedAsyncioTestCase):
         self.assertGreaterEqual(calls, len(registry.OPERATIONS))
 
 
+class RunOperationTests(unittest.IsolatedAsyncioTestCase):
+    async def _run(
+        self, concurrency: int, pending: list[str]
+    ) -> tuple[int, list[str]]:
+        stop = asyncio.Event()
+        active = peak = 0
+        done: list[str] = []
+
+        async def checkout(*_args: object) -> str | None:
+            return pending.pop(0) if pending else None
+
+        async def execute(
+            _client: object, _db: object, _op: object, project_id: str
+        ) -> bool:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            done.append(project_id)
+            if not pending and active == 0:
+                stop.set()
+            return True
+
+        with (
+            mock.patch.object(worker, '_checkout_next', checkout),
+            mock.patch.object(worker, '_execute_project', execute),
+        ):
+            await asyncio.wait_for(
+                worker._run_operation(
+                    mock.AsyncMock(),
+                    mock.AsyncMock(),
+                    _operation(mock.AsyncMock(), concurrency=concurrency),
+                    stop,
+                ),
+                timeout=2.0,
+            )
+        return peak, done
+
+    async def test_runs_up_to_concurrency_projects_at_once(self) -> None:
+        peak, done = await self._run(3, [f'p{i}' for i in range(7)])
+        self.assertEqual(3, peak)
+        self.assertEqual(7, len(done))
+
+    async def test_single_slot_is_serial(self) -> None:
+        peak, done = await self._run(1, ['p1', 'p2', 'p3'])
+        self.assertEqual(1, peak)
+        self.assertEqual(['p1', 'p2', 'p3'], done)
+
+    async def test_stop_cancels_in_flight_projects(self) -> None:
+        stop = asyncio.Event()
+        started = asyncio.Event()
+        cancelled = False
+
+        async def execute(*_args: object) -> bool:
+            nonlocal cancelled
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return True
+
+        async def stopper() -> None:
+            await started.wait()
+            stop.set()
+
+        with (
+            mock.patch.object(
+                worker, '_checkout_next', mock.AsyncMock(return_value='p1')
+            ),
+            mock.patch.object(worker, '_execute_project', execute),
+        ):
+            await asyncio.wait_for(
+                asyncio.gather(
+                    worker._run_operation(
+                        mock.AsyncMock(),
+                        mock.AsyncMock(),
+                        _operation(mock.AsyncMock(), concurrency=2),
+                        stop,
+                    ),
+                    stopper(),
+                ),
+                timeout=2.0,
+            )
+        self.assertTrue(cancelled)
+
+
 class PauseHelperTests(unittest.IsolatedAsyncioTestCase):
     async def test_paused_remaining_reads_future_epoch(self) -> None:
         client = mock.AsyncMock()
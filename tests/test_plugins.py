@@ -380,6 +380,16 @@ def _binding(
     )
 
 
+#: ``binding_cache.enabled_map`` stub covering every plugin slug below.
+_ALL_ENABLED = {
+    'ssm': True,
+    'github': True,
+    'aws': True,
+    'present': True,
+    'gone': True,
+}
+
+
 class ResolutionTestCase(unittest.TestCase):
     """Branch coverage for ``resolve_capability``."""
 
@@ -390,7 +400,7 @@ class ResolutionTestCase(unittest.TestCase):
 
         mock_db = mock.AsyncMock()
         with mock.patch(
-            'imbi_api.plugins.resolution.effective_bindings',
+            'imbi_api.plugins.binding_cache.effective_bindings',
             new=mock.AsyncMock(side_effect=LookupError('p1')),
         ):
             with self.assertRaises(HTTPException) as ctx:
@@ -407,7 +417,7 @@ class ResolutionTestCase(unittest.TestCase):
 
         mock_db = mock.AsyncMock()
         with mock.patch(
-            'imbi_api.plugins.resolution.effective_bindings',
+            'imbi_api.plugins.binding_cache.effective_bindings',
             new=mock.AsyncMock(return_value=[]),
         ):
             with self.assertRaises(HTTPException) as ctx:
@@ -424,7 +434,7 @@ class ResolutionTestCase(unittest.TestCase):
         entry = _make_registry_entry('ssm')
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(
                     return_value=[_binding(options={'region': 'us-east-1'})]
                 ),
@@ -433,9 +443,13 @@ class ResolutionTestCase(unittest.TestCase):
                 'imbi_api.plugins.resolution.get_plugin', return_value=entry
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(return_value=True),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value=_ALL_ENABLED),
             ),
+            mock.patch(
+                'imbi_api.plugins.credentials.read_encrypted_credentials',
+                new=mock.AsyncMock(return_value={'token': 'enc'}),
+            ) as read_credentials,
         ):
             resolved = asyncio.run(
                 resolve_capability(mock_db, 'proj1', 'configuration', None)
@@ -444,6 +458,8 @@ class ResolutionTestCase(unittest.TestCase):
         self.assertEqual(resolved.plugin_slug, 'ssm')
         self.assertEqual(resolved.kind, 'configuration')
         self.assertEqual(resolved.capability_options, {'region': 'us-east-1'})
+        self.assertEqual(resolved.encrypted_credentials, {'token': 'enc'})
+        read_credentials.assert_awaited_once_with(mock_db, 'i1')
         self.assertIs(
             resolved.capability_cls,
             entry.manifest.get_capability('configuration').handler,
@@ -457,7 +473,7 @@ class ResolutionTestCase(unittest.TestCase):
         mock_db = mock.AsyncMock()
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(return_value=[_binding()]),
             ),
             mock.patch(
@@ -465,8 +481,8 @@ class ResolutionTestCase(unittest.TestCase):
                 return_value=_make_registry_entry('ssm'),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(return_value=False),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value={'ssm': False}),
             ),
         ):
             with self.assertRaises(HTTPException) as ctx:
@@ -485,7 +501,7 @@ class ResolutionTestCase(unittest.TestCase):
         for source, want in (('b', 'i2'), ('i2', 'i2'), ('i1', 'i1')):
             with (
                 mock.patch(
-                    'imbi_api.plugins.resolution.effective_bindings',
+                    'imbi_api.plugins.binding_cache.effective_bindings',
                     new=mock.AsyncMock(return_value=bindings),
                 ),
                 mock.patch(
@@ -493,8 +509,8 @@ class ResolutionTestCase(unittest.TestCase):
                     return_value=_make_registry_entry('ssm'),
                 ),
                 mock.patch(
-                    'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                    new=mock.AsyncMock(return_value=True),
+                    'imbi_api.plugins.binding_cache.enabled_map',
+                    new=mock.AsyncMock(return_value=_ALL_ENABLED),
                 ),
             ):
                 resolved = asyncio.run(
@@ -516,7 +532,7 @@ class ResolutionTestCase(unittest.TestCase):
         ]
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(return_value=bindings),
             ),
             mock.patch(
@@ -524,8 +540,8 @@ class ResolutionTestCase(unittest.TestCase):
                 return_value=_make_registry_entry('ssm'),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(return_value=True),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value=_ALL_ENABLED),
             ),
         ):
             with self.assertRaises(HTTPException) as ctx:
@@ -545,7 +561,7 @@ class ResolutionTestCase(unittest.TestCase):
         ]
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(return_value=bindings),
             ),
             mock.patch(
@@ -553,8 +569,8 @@ class ResolutionTestCase(unittest.TestCase):
                 return_value=_make_registry_entry('ssm'),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(return_value=True),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value=_ALL_ENABLED),
             ),
         ):
             resolved = asyncio.run(
@@ -572,7 +588,7 @@ class ResolutionTestCase(unittest.TestCase):
         ]
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(return_value=bindings),
             ),
             mock.patch(
@@ -580,8 +596,8 @@ class ResolutionTestCase(unittest.TestCase):
                 return_value=_make_registry_entry('ssm'),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(return_value=True),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value=_ALL_ENABLED),
             ),
         ):
             resolved = asyncio.run(
@@ -597,7 +613,7 @@ class ResolutionTestCase(unittest.TestCase):
         mock_db = mock.AsyncMock()
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(return_value=[_binding(slug='a')]),
             ),
             mock.patch(
@@ -605,8 +621,8 @@ class ResolutionTestCase(unittest.TestCase):
                 return_value=_make_registry_entry('ssm'),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(return_value=True),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value=_ALL_ENABLED),
             ),
         ):
             with self.assertRaises(HTTPException) as ctx:
@@ -626,7 +642,7 @@ class ResolveAllCapabilitiesTestCase(unittest.TestCase):
 
         mock_db = mock.AsyncMock()
         with mock.patch(
-            'imbi_api.plugins.resolution.effective_bindings',
+            'imbi_api.plugins.binding_cache.effective_bindings',
             new=mock.AsyncMock(return_value=[]),
         ):
             result = asyncio.run(
@@ -648,7 +664,7 @@ class ResolveAllCapabilitiesTestCase(unittest.TestCase):
         }
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(return_value=bindings),
             ),
             mock.patch(
@@ -656,8 +672,8 @@ class ResolveAllCapabilitiesTestCase(unittest.TestCase):
                 side_effect=lambda slug: entries[slug],
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(return_value=True),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value=_ALL_ENABLED),
             ),
         ):
             result = asyncio.run(
@@ -675,7 +691,7 @@ class ResolveAllCapabilitiesTestCase(unittest.TestCase):
         ]
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(return_value=bindings),
             ),
             mock.patch(
@@ -685,8 +701,8 @@ class ResolveAllCapabilitiesTestCase(unittest.TestCase):
                 ),
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(side_effect=lambda db, slug: slug == 'on'),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value={'on': True, 'off': False}),
             ),
         ):
             result = asyncio.run(
@@ -713,15 +729,15 @@ class ResolveAllCapabilitiesTestCase(unittest.TestCase):
 
         with (
             mock.patch(
-                'imbi_api.plugins.resolution.effective_bindings',
+                'imbi_api.plugins.binding_cache.effective_bindings',
                 new=mock.AsyncMock(return_value=bindings),
             ),
             mock.patch(
                 'imbi_api.plugins.resolution.get_plugin', side_effect=_get
             ),
             mock.patch(
-                'imbi_api.plugins.lifecycle.is_plugin_enabled',
-                new=mock.AsyncMock(return_value=True),
+                'imbi_api.plugins.binding_cache.enabled_map',
+                new=mock.AsyncMock(return_value=_ALL_ENABLED),
             ),
         ):
             result = asyncio.run(
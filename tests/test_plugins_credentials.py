@@ -83,6 +83,24 @@ class ReadCredentialsTestCase(unittest.TestCase):
         self.assertEqual(creds, {})
 
 
+class ReadCredentialsByIdTestCase(unittest.TestCase):
+    def test_reads_blob_by_integration_id(self) -> None:
+        db = mock.AsyncMock()
+        db.execute.return_value = [{'creds': _blob({'token': 'x'})}]
+        creds = _run(credentials.read_encrypted_credentials(db, 'i1'))
+        self.assertEqual(creds, {'token': 'x'})
+        self.assertEqual(
+            db.execute.await_args.args[1], {'integration_id': 'i1'}
+        )
+
+    def test_missing_integration_returns_empty(self) -> None:
+        db = mock.AsyncMock()
+        db.execute.return_value = []
+        self.assertEqual(
+            _run(credentials.read_encrypted_credentials(db, 'i1')), {}
+        )
+
+
 class GetCredentialFieldsTestCase(unittest.TestCase):
     def test_returns_sorted_field_names(self) -> None:
         db = mock.AsyncMock()
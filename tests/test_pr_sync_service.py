@@ -45,9 +45,13 @@ class RunSyncTests(unittest.IsolatedAsyncioTestCase):
                 '_build_context',
                 mock.AsyncMock(return_value=mock.Mock()),
             ),
+            mock.patch.object(
+                service.release_state, 'refresh', mock.AsyncMock()
+            ) as refresh,
         ):
             result = await service.run_sync(db, 'octo', 'p1')
         self.assertEqual(7, result)
+        refresh.assert_awaited_once_with(['p1'])
 
     async def test_unresolved_raises_unavailable(self) -> None:
         db = mock.AsyncMock()
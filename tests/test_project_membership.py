@@ -0,0 +1,123 @@
+"""Tests for the ClickHouse project membership table."""
+
+import unittest
+from unittest import mock
+
+from imbi_common import graph
+
+from imbi_api import project_membership
+
+
+class OrgFilterTestCase(unittest.TestCase):
+    def test_filters_on_the_membership_table(self) -> None:
+        predicate = project_membership.org_filter()
+        self.assertTrue(predicate.startswith('project_id IN (SELECT'))
+        self.assertIn('FROM project_membership FINAL', predicate)
+        self.assertIn('{org_slug:String}', predicate)
+        self.assertIn('is_deleted = 0', predicate)
+
+
+class SyncTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.db = mock.AsyncMock(spec=graph.Graph)
+        self.write = self._patch('imbi_api.event_buffer.write')
+        self.query = self._patch('imbi_common.clickhouse.query')
+        patcher = mock.patch(
+            'imbi_common.graph.parse_agtype', side_effect=lambda x: x
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def _patch(self, target: str, **kwargs: object) -> mock.AsyncMock:
+        patcher = mock.patch(target, new_callable=mock.AsyncMock, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    async def test_sync_org_writes_rows_and_tombstones_leavers(self) -> None:
+        self.db.execute.return_value = [
+            {
+                'project_id': 'p1',
+                'org_slug': 'eng',
+                'team_slug': 'core',
+                'archived': False,
+            }
+        ]
+        self.query.return_value = [{'project_id': 'p1'}, {'project_id': 'p2'}]
+        await project_membership.sync_org(self.db, 'eng')
+        table, columns, rows = self.write.await_args.args
+        self.assertEqual(table, 'project_membership')
+        self.assertEqual(columns, project_membership.COLUMNS)
+        self.assertEqual(
+            [row[:5] for row in rows],
+            [['p1', 'eng', 'core', False, 0], ['p2', '', '', False, 1]],
+        )
+
+    async def test_record_project_failure_is_logged(self) -> None:
+        self.write.side_effect = RuntimeError('clickhouse down')
+        with self.assertLogs('imbi_api.project_membership', 'WARNING'):
+            await project_membership.record_project('p1', 'eng', 'core', True)
+
+    async def test_remove_project_writes_tombstone(self) -> None:
+        await project_membership.remove_project('p1')
+        _table, _columns, rows = self.write.await_args.args
+        self.assertEqual(rows[0][:5], ['p1', '', '', False, 1])
+
+    async def test_remove_org_tombstones_without_reading_the_graph(
+        self,
+    ) -> None:
+        self.query.return_value = [{'project_id': 'p2'}, {'project_id': 'p1'}]
+        await project_membership.remove_org('eng')
+        self.db.execute.assert_not_awaited()
+        _table, _columns, rows = self.write.await_args.args
+        self.assertEqual(
+            [row[:5] for row in rows],
+            [['p1', '', '', False, 1], ['p2', '', '', False, 1]],
+        )
+
+    async def test_sync_reads_clickhouse_before_the_graph(self) -> None:
+        calls: list[str] = []
+        self.query.side_effect = lambda *args: calls.append('clickhouse') or []
+        self.db.execute.side_effect = lambda *args: calls.append('graph') or []
+        await project_membership.sync_all(self.db)
+        self.assertEqual(calls, ['clickhouse', 'graph'])
+
+
+class SyncLeaseTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.db = mock.AsyncMock(spec=graph.Graph)
+        self.client = mock.AsyncMock()
+        patcher = mock.patch.object(
+            project_membership, 'sync_all', new_callable=mock.AsyncMock
+        )
+        self.addCleanup(patcher.stop)
+        self.sync_all = patcher.start()
+
+    async def test_lease_holder_runs_the_sync(self) -> None:
+        self.client.set.return_value = True
+        self.assertTrue(
+            await project_membership.sync_all_leased(self.db, self.client)
+        )
+        self.sync_all.assert_awaited_once_with(self.db)
+        self.client.set.assert_awaited_once_with(
+            project_membership.SYNC_LEASE_KEY,
+            b'1',
+            ex=project_membership.SYNC_LEASE_SECONDS,
+            nx=True,
+        )
+        self.client.delete.assert_not_awaited()
+
+    async def test_recent_sync_is_skipped(self) -> None:
+        self.client.set.return_value = None
+        self.assertFalse(
+            await project_membership.sync_all_leased(self.db, self.client)
+        )
+        self.sync_all.assert_not_awaited()
+
+    async def test_failed_sync_releases_the_lease(self) -> None:
+        self.client.set.return_value = True
+        self.sync_all.side_effect = RuntimeError('graph down')
+        with self.assertRaises(RuntimeError):
+            await project_membership.sync_all_leased(self.db, self.client)
+        self.client.delete.assert_awaited_once_with(
+            project_membership.SYNC_LEASE_KEY
+        )
@@ -0,0 +1,201 @@
+"""Tests for the materialized release state table."""
+
+import datetime
+import typing
+import unittest
+from unittest import mock
+
+from imbi_api import release_state
+
+_OLD = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+_NEW = datetime.datetime(2026, 6, 1, tzinfo=datetime.UTC)
+
+
+def _router(
+    tags: list[dict[str, typing.Any]],
+    heads: list[dict[str, typing.Any]],
+    bases: list[dict[str, typing.Any]] | None = None,
+    counts: list[dict[str, typing.Any]] | None = None,
+) -> mock.AsyncMock:
+    """Route ``clickhouse.query`` by the table / shape of the SQL."""
+
+    async def query(sql: str, params: dict[str, typing.Any]) -> typing.Any:
+        if 'FROM tags' in sql:
+            return tags
+        if 'LIMIT 1 BY project_id,' in sql:
+            return bases or []
+        if 'countIf' in sql:
+            return counts or []
+        return heads
+
+    return mock.AsyncMock(side_effect=query)
+
+
+class ComputeTests(unittest.IsolatedAsyncioTestCase):
+    async def _compute(
+        self, query: mock.AsyncMock, *pids: str
+    ) -> dict[str, release_state.ReleaseState]:
+        with mock.patch.object(release_state.clickhouse, 'query', query):
+            return await release_state.compute(list(pids))
+
+    async def test_picks_highest_semver_not_newest(self) -> None:
+        """A late-synced lower version must not out-rank the release."""
+        query = _router(
+            tags=[
+                {
+                    'project_id': 'p1',
+                    'name': 'v4.1.3',
+                    'sha': 'sha413',
+                    'tagged_at': _NEW,
+                },
+                {
+                    'project_id': 'p1',
+                    'name': 'v7.1.0',
+                    'sha': 'sha710',
+                    'tagged_at': _OLD,
+                    'tagger_name': 'Rel Bot',
+                },
+            ],
+            heads=[{'project_id': 'p1', 'sha': 'headsha1234'}],
+            bases=[{'project_id': 'p1', 'sha': 'sha710', 'authored_at': _OLD}],
+            counts=[{'project_id': 'p1', 'c': 3}],
+        )
+        state = (await self._compute(query, 'p1'))['p1']
+        self.assertEqual(state.latest_tag, 'v7.1.0')
+        self.assertEqual(state.latest_tag_sha, 'sha710')
+        self.assertEqual(state.latest_tag_author, 'Rel Bot')
+        self.assertTrue(state.latest_tag_semver)
+        self.assertEqual(state.base_authored_at, _OLD)
+        self.assertEqual(state.head_short_sha, 'headsha')
+        self.assertEqual(state.commits_since_tag, 3)
+        self.assertFalse(state.base_missing)
+
+    async def test_tag_at_falls_back_to_recorded_at(self) -> None:
+        query = _router(
+            tags=[
+                {
+                    'project_id': 'p1',
+                    'name': 'v1.0.0',
+                    'sha': 'tagsha',
+                    'tagged_at': None,
+                    'recorded_at': _NEW,
+                }
+            ],
+            heads=[],
+        )
+        state = (await self._compute(query, 'p1'))['p1']
+        self.assertEqual(state.latest_tag_at, _NEW)
+
+    async def test_unsynced_base_reports_no_drift(self) -> None:
+        query = _router(
+            tags=[{'project_id': 'p1', 'name': 'v2.0.0', 'sha': 'missing'}],
+            heads=[{'project_id': 'p1', 'sha': 'headsha'}],
+        )
+        state = (await self._compute(query, 'p1'))['p1']
+        self.assertTrue(state.base_missing)
+        self.assertEqual(state.commits_since_tag, 0)
+        # Nothing left to count, so no count query was sent.
+        self.assertFalse(
+            any('countIf' in c.args[0] for c in query.await_args_list)
+        )
+
+    async def test_batches_untagged_and_non_semver_projects(self) -> None:
+        query = _router(
+            tags=[
+                {'project_id': 'p2', 'name': 'deploy-1', 'sha': 'd1'},
+            ],
+            heads=[
+                {'project_id': 'p1', 'sha': 'h1'},
+                {'project_id': 'p2', 'sha': 'h2'},
+            ],
+            bases=[{'project_id': 'p2', 'sha': 'd1', 'authored_at': _OLD}],
+            counts=[
+                {'project_id': 'p1', 'c': 4},
+                {'project_id': 'p2', 'c': 1},
+            ],
+        )
+        states = await self._compute(query, 'p1', 'p2', 'p3')
+        self.assertEqual(states['p1'].commits_since_tag, 4)
+        self.assertIsNone(states['p1'].latest_tag)
+        self.assertEqual(states['p2'].latest_tag, 'deploy-1')
+        self.assertFalse(states['p2'].latest_tag_semver)
+        self.assertIsNone(states['p3'].head_sha)
+        self.assertEqual(4, query.await_count)
+        count_params = query.await_args_list[-1].args[1]
+        self.assertEqual(['p1', 'p2', 'p3'], count_params['pids'])
+        self.assertEqual(['p2'], count_params['cut_pids'])
+
+
+class GetTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        release_state.clear()
+
+    def _row(self, computed_at: datetime.datetime) -> dict[str, typing.Any]:
+        return release_state.ReleaseState(
+            project_id='p1', head_sha='h1', computed_at=computed_at
+        ).model_dump()
+
+    async def test_fresh_row_is_a_single_lookup(self) -> None:
+        query = mock.AsyncMock(return_value=[self._row(release_state._now())])
+        refresh = mock.AsyncMock()
+        with (
+            mock.patch.object(release_state.clickhouse, 'query', query),
+            mock.patch.object(release_state, 'refresh', refresh),
+        ):
+            states = await release_state.get(['p1'])
+        self.assertEqual(states['p1'].head_sha, 'h1')
+        query.assert_awaited_once()
+        refresh.assert_not_called()
+
+    async def test_missing_rows_are_computed_and_stored(self) -> None:
+        state = release_state.ReleaseState(
+            project_id='p2', computed_at=release_state._now()
+        )
+        write = mock.AsyncMock()
+        with (
+            mock.patch.object(
+                release_state.clickhouse,
+                'query',
+                mock.AsyncMock(return_value=[]),
+            ),
+            mock.patch.object(
+                release_state,
+                'compute',
+                mock.AsyncMock(return_value={'p2': state}),
+            ) as compute,
+            mock.patch.object(release_state.event_buffer, 'write', write),
+        ):
+            states = await release_state.get(['p2'])
+        self.assertIs(states['p2'], state)
+        compute.assert_awaited_once_with(['p2'])
+        self.assertEqual([state.row()], write.await_args.args[2])
+
+    async def test_stale_rows_refresh_in_background(self) -> None:
+        stale = release_state._now() - release_state.STALE_AFTER * 2
+        refresh = mock.AsyncMock()
+        with (
+            mock.patch.object(
+                release_state.clickhouse,
+                'query',
+                mock.AsyncMock(return_value=[self._row(stale)]),
+            ),
+            mock.patch.object(release_state, 'refresh', refresh),
+        ):
+            states = await release_state.get(['p1'])
+            self.assertEqual(states['p1'].head_sha, 'h1')
+            # A second read while the refresh is pending does not queue
+            # another one.
+            await release_state.get(['p1'])
+            await release_state._refreshing['p1']
+        refresh.assert_awaited_once_with(['p1'])
+        self.assertEqual({}, release_state._refreshing)
+
+
+class RefreshTests(unittest.IsolatedAsyncioTestCase):
+    async def test_failure_is_swallowed(self) -> None:
+        with mock.patch.object(
+            release_state,
+            'compute',
+            mock.AsyncMock(side_effect=RuntimeError('down')),
+        ):
+            self.assertEqual({}, await release_state.refresh(['p1']))
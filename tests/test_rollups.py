@@ -0,0 +1,55 @@
+"""Tests for the daily ClickHouse rollups."""
+
+import datetime
+import unittest
+from unittest import mock
+
+from imbi_api import rollups
+
+
+class SourceTestCase(unittest.TestCase):
+    def test_partial_first_day_is_read_raw(self) -> None:
+        since = datetime.datetime(2026, 5, 1, 12, tzinfo=datetime.UTC)
+        until = datetime.datetime(2026, 5, 8, tzinfo=datetime.UTC)
+        _sql, params = rollups.source(rollups.EVENTS, since=since, until=until)
+        self.assertEqual(params['rollup_start'], datetime.date(2026, 5, 2))
+        self.assertEqual(params['rollup_end'], datetime.date(2026, 5, 8))
+        self.assertEqual(params['rollup_since'], since)
+        self.assertEqual(params['rollup_until'], until)
+
+    def test_midnight_since_starts_on_that_day(self) -> None:
+        since = datetime.datetime(2026, 5, 1, tzinfo=datetime.UTC)
+        _sql, params = rollups.source(rollups.EVENTS, since=since)
+        self.assertEqual(params['rollup_start'], datetime.date(2026, 5, 1))
+        self.assertNotIn('rollup_until', params)
+
+    def test_non_utc_bounds_are_converted(self) -> None:
+        tz = datetime.timezone(datetime.timedelta(hours=-4))
+        since = datetime.datetime(2026, 4, 30, 20, tzinfo=tz)
+        _sql, params = rollups.source(rollups.EVENTS, since=since)
+        self.assertEqual(params['rollup_start'], datetime.date(2026, 5, 1))
+
+    def test_stitches_rollup_and_raw_rows(self) -> None:
+        sql, _params = rollups.source(
+            rollups.OPERATIONS_LOG, where="entry_type = 'Deployed'"
+        )
+        self.assertIn('FROM operations_log_daily', sql)
+        self.assertIn('UNION ALL', sql)
+        self.assertIn('FROM operations_log FINAL WHERE is_deleted = 0', sql)
+        self.assertIn('NOT (toDate(occurred_at) >=', sql)
+        self.assertEqual(sql.count("(entry_type = 'Deployed')"), 2)
+
+
+class EnsureSchemaTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_creates_one_view_per_rollup(self) -> None:
+        with mock.patch(
+            'imbi_common.clickhouse.query', new_callable=mock.AsyncMock
+        ) as query:
+            await rollups.ensure_schema()
+        statements = [c.args[0] for c in query.await_args_list]
+        self.assertEqual(len(statements), len(rollups.ROLLUPS))
+        for statement, rollup in zip(statements, rollups.ROLLUPS, strict=True):
+            self.assertIn(
+                f'MATERIALIZED VIEW IF NOT EXISTS {rollup.table}', statement
+            )
+            self.assertIn('REFRESH EVERY', statement)
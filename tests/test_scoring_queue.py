@@ -191,6 +191,203 @@ class ClaimStaleTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result, [])
 
 
+class BatchedHandleEntriesTests(unittest.IsolatedAsyncioTestCase):
+    async def test_duplicate_project_entries_score_once(self) -> None:
+        client = mock.AsyncMock()
+        process = mock.AsyncMock(return_value=None)
+        with mock.patch.object(score_queue, '_process_message', process):
+            stats = await score_queue._handle_entries(
+                client,
+                [
+                    (b'1-0', {b'project_id': b'p1', b'reason': b'a'}),
+                    (b'2-0', {b'project_id': b'p2'}),
+                    (b'3-0', {b'project_id': b'p1', b'reason': b'b'}),
+                ],
+                mock.AsyncMock(),
+                mock.AsyncMock(),
+            )
+        self.assertEqual(process.await_count, 2)
+        self.assertEqual(stats.messages, 3)
+        self.assertEqual(stats.projects, 2)
+        acked = sorted(call.args[2:] for call in client.xack.await_args_list)
+        self.assertEqual(acked, [(b'1-0', b'3-0'), (b'2-0',)])
+
+    async def test_policy_snapshot_loaded_once_per_batch(self) -> None:
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(return_value=[])
+        db.match = mock.AsyncMock(return_value=[])
+        process = mock.AsyncMock(return_value=None)
+        with mock.patch.object(score_queue, '_process_message', process):
+            await score_queue._handle_entries(
+                mock.AsyncMock(),
+                [
+                    (f'{i}-0'.encode(), {b'project_id': f'p{i}'.encode()})
+                    for i in range(5)
+                ],
+                db,
+                mock.AsyncMock(),
+            )
+        db.execute.assert_awaited_once()
+        db.match.assert_awaited_once()
+        snapshots = {id(call.args[2]) for call in process.await_args_list}
+        self.assertEqual(process.await_count, 5)
+        self.assertEqual(len(snapshots), 1)
+
+    async def test_snapshot_failure_leaves_entries_pending(self) -> None:
+        client = mock.AsyncMock()
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(side_effect=RuntimeError('down'))
+        process = mock.AsyncMock()
+        with (
+            mock.patch.object(score_queue, '_process_message', process),
+            self.assertLogs('imbi_api.scoring.queue', level='ERROR'),
+        ):
+            stats = await score_queue._handle_entries(
+                client,
+                [(b'1-0', {b'project_id': b'p1'})],
+                db,
+                mock.AsyncMock(),
+            )
+        self.assertEqual(stats.failed, 1)
+        process.assert_not_called()
+        client.xack.assert_not_called()
+
+    async def test_changes_recorded_in_one_write(self) -> None:
+        client = mock.AsyncMock()
+        db = mock.AsyncMock()
+        ch = mock.AsyncMock()
+
+        async def process(
+            _db: typing.Any,
+            fields: dict[str, str],
+            _snapshot: typing.Any,
+            **_kw: typing.Any,
+        ) -> score_queue.ScoreChange | None:
+            pid = fields['project_id']
+            if pid == 'same':
+                return None
+            return score_queue.ScoreChange(pid, 80.0, 0.0, [pid])
+
+        with (
+            mock.patch.object(
+                score_queue,
+                'load_policy_snapshot',
+                mock.AsyncMock(return_value=score_queue.PolicySnapshot()),
+            ),
+            mock.patch.object(
+                score_queue,
+                '_process_message',
+                mock.AsyncMock(side_effect=process),
+            ),
+        ):
+            await score_queue._handle_entries(
+                client,
+                [
+                    (b'1-0', {b'project_id': b'p1'}),
+                    (b'2-0', {b'project_id': b'same'}),
+                    (b'3-0', {b'project_id': b'p2'}),
+                ],
+                db,
+                ch,
+            )
+        ch.insert.assert_awaited_once()
+        table, rows, _columns = ch.insert.await_args.args
+        self.assertEqual(table, 'score_history')
+        self.assertEqual(sorted(rows), [['p1'], ['p2']])
+        db._execute_batch.assert_awaited_once()
+        statements = db._execute_batch.await_args.args[0]
+        self.assertEqual(
+            sorted(s.params['id'] for s in statements), ['p1', 'p2']
+        )
+        acked = sorted(call.args[2:] for call in client.xack.await_args_list)
+        self.assertIn((b'2-0',), acked)
+        self.assertEqual(
+            sorted(i for ids in acked for i in ids), [b'1-0', b'2-0', b'3-0']
+        )
+
+    async def test_failed_write_leaves_changes_pending(self) -> None:
+        client = mock.AsyncMock()
+        ch = mock.AsyncMock()
+        ch.insert = mock.AsyncMock(side_effect=RuntimeError('ch down'))
+        db = mock.AsyncMock()
+        change = score_queue.ScoreChange('p1', 80.0, 0.0, ['p1'])
+        with (
+            mock.patch.object(
+                score_queue,
+                'load_policy_snapshot',
+                mock.AsyncMock(return_value=score_queue.PolicySnapshot()),
+            ),
+            mock.patch.object(
+                score_queue,
+                '_process_message',
+                mock.AsyncMock(return_value=change),
+            ),
+            self.assertLogs('imbi_api.scoring.queue', level='ERROR'),
+        ):
+            stats = await score_queue._handle_entries(
+                client, [(b'1-0', {b'project_id': b'p1'})], db, ch
+            )
+        self.assertEqual(stats.failed, 1)
+        db._execute_batch.assert_not_called()
+        client.xack.assert_not_called()
+
+    async def test_concurrency_is_bounded(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def process(*_args: typing.Any, **_kwargs: typing.Any) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        with mock.patch.object(
+            score_queue,
+            '_process_message',
+            mock.AsyncMock(side_effect=process),
+        ):
+            await score_queue._handle_entries(
+                mock.AsyncMock(),
+                [
+                    (f'{i}-0'.encode(), {b'project_id': f'p{i}'.encode()})
+                    for i in range(10)
+                ],
+                mock.AsyncMock(),
+                mock.AsyncMock(),
+                concurrency=3,
+            )
+        self.assertEqual(peak, 3)
+
+    async def test_failed_project_counted_and_not_acked(self) -> None:
+        client = mock.AsyncMock()
+
+        async def process(
+            _db: typing.Any, fields: dict[str, str], *_args, **_kw
+        ) -> None:
+            if fields['project_id'] == 'bad':
+                raise RuntimeError('boom')
+
+        with mock.patch.object(
+            score_queue,
+            '_process_message',
+            mock.AsyncMock(side_effect=process),
+        ):
+            stats = await score_queue._handle_entries(
+                client,
+                [
+                    (b'1-0', {b'project_id': b'bad'}),
+                    (b'2-0', {b'project_id': b'good'}),
+                ],
+                mock.AsyncMock(),
+                mock.AsyncMock(),
+            )
+        self.assertEqual(stats.failed, 1)
+        client.xack.assert_awaited_once_with(
+            score_queue.STREAM, score_queue.GROUP, b'2-0'
+        )
+
+
 class HandleEntriesWithDlqTest(unittest.IsolatedAsyncioTestCase):
     async def test_dead_letter_prevents_processing(self) -> None:
         client = mock.AsyncMock()
@@ -211,72 +408,180 @@ class HandleEntriesWithDlqTest(unittest.IsolatedAsyncioTestCase):
         process.assert_not_called()
 
 
+def _policy(**kwargs: typing.Any) -> typing.Any:
+    from imbi_common.scoring import PresencePolicy
+
+    return PresencePolicy(
+        **{
+            'name': 'Has description',
+            'slug': 'has-description',
+            'category': 'presence',
+            'attribute_name': 'description',
+            'weight': 10,
+            'present_score': 100,
+            'missing_score': 0,
+        }
+        | kwargs
+    )
+
+
+class PolicySnapshotTests(unittest.IsolatedAsyncioTestCase):
+    async def test_load_parses_policies_and_targets(self) -> None:
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(
+            return_value=[
+                {
+                    'p': {
+                        'name': 'Has description',
+                        'slug': 'has-description',
+                        'category': 'presence',
+                        'attribute_name': 'description',
+                        'weight': 10,
+                        'present_score': 100,
+                        'missing_score': 0,
+                    },
+                    'targets': ['apis'],
+                },
+                {
+                    'p': {'slug': 'broken', 'category': 'presence'},
+                    'targets': [],
+                },
+            ]
+        )
+        db.match = mock.AsyncMock(return_value=[])
+        with self.assertLogs('imbi_api.scoring.queue', level='WARNING'):
+            snapshot = await score_queue.load_policy_snapshot(db)
+        self.assertEqual(len(snapshot.policies), 1)
+        self.assertEqual(snapshot.policies[0].targets, ['apis'])
+        db.execute.assert_awaited_once()
+        db.match.assert_awaited_once()
+
+    def test_applicable_filters_targets_and_attributes(self) -> None:
+        from imbi_common import models
+
+        snapshot = score_queue.PolicySnapshot(
+            policies=[
+                _policy(),
+                _policy(slug='api-only', targets=['apis']),
+                _policy(slug='no-attr', attribute_name='not_a_field'),
+            ]
+        )
+        model = snapshot.model_for(frozenset({'consumers'}))
+        self.assertIs(model, snapshot.model_for(frozenset({'consumers'})))
+        self.assertIsInstance(model, type)
+        self.assertTrue(issubclass(model, models.Project))
+        self.assertEqual(
+            [
+                p.slug
+                for p in snapshot.applicable(model, frozenset({'consumers'}))
+            ],
+            ['has-description'],
+        )
+        self.assertEqual(
+            [p.slug for p in snapshot.applicable(model, frozenset({'apis'}))],
+            ['has-description', 'api-only'],
+        )
+
+
 class ProcessMessageTests(unittest.IsolatedAsyncioTestCase):
+    def _db(self, project: typing.Any) -> mock.AsyncMock:
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(return_value=[{'slug': 'apis'}])
+        db.match = mock.AsyncMock(return_value=[project] if project else [])
+        return db
+
+    def _project(self, score: float | None) -> typing.Any:
+        from imbi_common import models
+
+        project = mock.MagicMock(spec=models.Project)
+        project.id = 'p1'
+        project.score = score
+        return project
+
     async def test_skips_missing_project_id(self) -> None:
         db = mock.AsyncMock()
-        ch = mock.AsyncMock()
-        await score_queue._process_message(db, ch, {})
+        result = await score_queue._process_message(
+            db, {}, score_queue.PolicySnapshot()
+        )
+        self.assertIsNone(result)
         db.match.assert_not_called()
 
     async def test_skips_when_project_not_found(self) -> None:
-        db = mock.AsyncMock()
-        db.match = mock.AsyncMock(return_value=[])
-        ch = mock.AsyncMock()
+        db = self._db(None)
         with self.assertLogs('imbi_api.scoring.queue', level='INFO'):
-            await score_queue._process_message(
-                db, ch, {'project_id': 'p1', 'reason': 'policy_change'}
+            result = await score_queue._process_message(
+                db,
+                {'project_id': 'p1', 'reason': 'policy_change'},
+                score_queue.PolicySnapshot(policies=[_policy()]),
             )
+        self.assertIsNone(result)
 
-    async def test_computes_and_records_score(self) -> None:
-        from imbi_common import models
+    async def test_returns_change_without_writing(self) -> None:
+        project = self._project(0.5)
+        db = self._db(project)
+        with mock.patch.object(
+            score_queue,
+            '_score',
+            mock.AsyncMock(return_value=(80.0, mock.MagicMock())),
+        ) as mock_score:
+            change = await score_queue._process_message(
+                db,
+                {'project_id': 'p1', 'reason': 'attribute_change'},
+                score_queue.PolicySnapshot(policies=[_policy()]),
+            )
+        assert change is not None
+        self.assertEqual(change.project_id, 'p1')
+        self.assertEqual((change.score, change.previous), (80.0, 0.5))
+        self.assertEqual(change.history[4], 'attribute_change')
+        mock_score.assert_awaited_once()
+        db.match.assert_awaited_once()
+        db._execute_batch.assert_not_called()
+
+    async def test_unchanged_score_is_not_returned(self) -> None:
+        db = self._db(self._project(80.0))
+        with mock.patch.object(
+            score_queue,
+            '_score',
+            mock.AsyncMock(return_value=(80.0, mock.MagicMock())),
+        ):
+            change = await score_queue._process_message(
+                db,
+                {'project_id': 'p1'},
+                score_queue.PolicySnapshot(policies=[_policy()]),
+            )
+        self.assertIsNone(change)
 
-        db = mock.AsyncMock()
-        project = mock.MagicMock(spec=models.Project)
-        project.score = 0.5
-        db.match = mock.AsyncMock(return_value=[project])
-        ch = mock.AsyncMock()
+    async def test_clears_without_computing_when_no_policies(self) -> None:
+        project = self._project(42.0)
+        db = self._db(project)
         with (
+            mock.patch.object(score_queue, '_score', mock.AsyncMock()) as s,
             mock.patch(
-                'imbi_api.scoring.queue.compute_score',
-                mock.AsyncMock(return_value=(0.8, None)),
-            ),
-            mock.patch(
-                'imbi_api.scoring.queue.record_score_change',
-                mock.AsyncMock(),
-            ) as mock_record,
+                'imbi_api.scoring.queue.clear_score', mock.AsyncMock()
+            ) as mock_clear,
         ):
-            await score_queue._process_message(
-                db, ch, {'project_id': 'p1', 'reason': 'attribute_change'}
+            change = await score_queue._process_message(
+                db, {'project_id': 'p1'}, score_queue.PolicySnapshot()
             )
-            mock_record.assert_awaited_once()
+        self.assertIsNone(change)
+        s.assert_not_called()
+        db.execute.assert_not_called()
+        mock_clear.assert_awaited_once_with(db, project)
 
     async def test_uses_zero_when_project_score_is_none(self) -> None:
-        from imbi_common import models
-
-        db = mock.AsyncMock()
-        project = mock.MagicMock(spec=models.Project)
-        project.score = None
-        db.match = mock.AsyncMock(return_value=[project])
-        ch = mock.AsyncMock()
-        with (
-            mock.patch(
-                'imbi_api.scoring.queue.compute_score',
-                mock.AsyncMock(return_value=(0.5, None)),
-            ),
-            mock.patch(
-                'imbi_api.scoring.queue.record_score_change',
-                mock.AsyncMock(),
-            ) as mock_record,
+        db = self._db(self._project(None))
+        with mock.patch.object(
+            score_queue,
+            '_score',
+            mock.AsyncMock(return_value=(0.5, mock.MagicMock())),
         ):
-            await score_queue._process_message(
-                db, ch, {'project_id': 'p1', 'reason': 'attribute_change'}
-            )
-            _args, kwargs = mock_record.call_args
-            # previous should have been 0.0 (default when score is None)
-            self.assertEqual(
-                kwargs.get('previous', _args[4] if len(_args) > 4 else None),
-                0.0,
+            change = await score_queue._process_message(
+                db,
+                {'project_id': 'p1'},
+                score_queue.PolicySnapshot(policies=[_policy()]),
             )
+        assert change is not None
+        self.assertEqual(change.previous, 0.0)
 
 
 class ConsumeRecomputeTests(unittest.IsolatedAsyncioTestCase):
@@ -602,15 +907,95 @@ class DailyTickTests(unittest.IsolatedAsyncioTestCase):
 
         client = mock.AsyncMock()
         client.set = mock.AsyncMock(return_value=True)
-        client.xadd = mock.AsyncMock()
+        client.get = mock.AsyncMock(return_value=None)
         db = mock.AsyncMock()
         db.execute = mock.AsyncMock(return_value=[{'id': 'p1'}, {'id': 'p2'}])
-        await score_queue._try_daily_tick(
-            client, db, datetime.date(2026, 5, 12)
+        with mock.patch.object(
+            score_queue,
+            'enqueue_recompute_bulk',
+            mock.AsyncMock(return_value=2),
+        ) as bulk:
+            await score_queue._try_daily_tick(
+                client, db, datetime.date(2026, 5, 12), spread_seconds=0
+            )
+        bulk.assert_awaited_once_with(
+            client, ['p1', 'p2'], 'scheduled_recompute'
+        )
+        key = f'{score_queue.DAILY_TICK_KEY_PREFIX}:2026-05-12'
+        # Lease, then the page checkpoint, then the 25h done marker.
+        self.assertEqual(
+            [call.args[:2] for call in client.set.await_args_list],
+            [(key, b'1'), (f'{key}:cursor', 'p2'), (key, b'done')],
+        )
+        self.assertTrue(client.set.await_args_list[0].kwargs['nx'])
+        client.delete.assert_not_called()
+
+    async def test_stop_releases_lease_and_keeps_cursor(self) -> None:
+        import datetime
+
+        client = mock.AsyncMock()
+        client.set = mock.AsyncMock(return_value=True)
+        client.get = mock.AsyncMock(return_value=None)
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(
+            side_effect=[
+                [{'total': 4}],
+                [{'id': f'p{i}'} for i in range(500)],
+                [{'id': 'p999'}],
+            ]
+        )
+        stop = asyncio.Event()
+        stop.set()
+        with mock.patch.object(
+            score_queue,
+            'enqueue_recompute_bulk',
+            mock.AsyncMock(return_value=500),
+        ) as bulk:
+            await score_queue._try_daily_tick(
+                client, db, datetime.date(2026, 5, 12), stop=stop
+            )
+        bulk.assert_awaited_once()
+        key = f'{score_queue.DAILY_TICK_KEY_PREFIX}:2026-05-12'
+        client.delete.assert_awaited_once_with(key)
+        self.assertEqual(
+            client.set.await_args_list[-1].args, (f'{key}:cursor', 'p499')
+        )
+
+    async def test_resumes_after_cursor(self) -> None:
+        import datetime
+
+        client = mock.AsyncMock()
+        client.set = mock.AsyncMock(return_value=True)
+        client.get = mock.AsyncMock(return_value=b'p2')
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(return_value=[{'id': 'p3'}])
+        with mock.patch.object(
+            score_queue,
+            'enqueue_recompute_bulk',
+            mock.AsyncMock(return_value=1),
+        ) as bulk:
+            await score_queue._try_daily_tick(
+                client, db, datetime.date(2026, 5, 12), spread_seconds=0
+            )
+        self.assertEqual(db.execute.await_args.args[1]['after'], 'p2')
+        bulk.assert_awaited_once_with(client, ['p3'], 'scheduled_recompute')
+        self.assertEqual(client.set.await_args_list[-1].args[1], b'done')
+
+    async def test_failure_releases_lease(self) -> None:
+        import datetime
+
+        client = mock.AsyncMock()
+        client.set = mock.AsyncMock(return_value=True)
+        client.get = mock.AsyncMock(return_value=None)
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(side_effect=RuntimeError('db down'))
+        with self.assertRaises(RuntimeError):
+            await score_queue._try_daily_tick(
+                client, db, datetime.date(2026, 5, 12), spread_seconds=0
+            )
+        client.delete.assert_awaited_once_with(
+            f'{score_queue.DAILY_TICK_KEY_PREFIX}:2026-05-12'
         )
-        # Daily-tick SET + per-project debounce SETs.
-        self.assertEqual(3, client.set.await_count)
-        self.assertEqual(2, client.xadd.await_count)
 
     async def test_skips_when_lock_held(self) -> None:
         import datetime
@@ -674,17 +1059,17 @@ class DailyTickTests(unittest.IsolatedAsyncioTestCase):
         set_calls: list[bool | None] = []
 
         async def _fake_set(
-            key: str, *_args: object, **_kwargs: object
+            key: str, *_args: object, **kwargs: object
         ) -> bool | None:
-            if key.startswith(score_queue.DAILY_TICK_KEY_PREFIX):
+            if kwargs.get('nx'):
                 acquired = not set_calls
                 set_calls.append(acquired)
                 return acquired
-            return True  # debounce SET acquires
+            return True
 
         client = mock.AsyncMock()
         client.set = mock.AsyncMock(side_effect=_fake_set)
-        client.xadd = mock.AsyncMock()
+        client.get = mock.AsyncMock(return_value=None)
         db = mock.AsyncMock()
         db.execute = mock.AsyncMock(return_value=[{'id': 'p1'}])
         stop = asyncio.Event()
@@ -694,18 +1079,106 @@ class DailyTickTests(unittest.IsolatedAsyncioTestCase):
             await asyncio.sleep(0.05)
             stop.set()
 
-        await asyncio.gather(
-            score_queue.run_daily_tick(
-                client,
-                db,
-                hour_utc=6,
-                poll_seconds=0.01,
-                stop=stop,
-                clock=lambda: late,
-            ),
-            _fire_then_stop(),
-        )
+        with mock.patch.object(
+            score_queue,
+            'enqueue_recompute_bulk',
+            mock.AsyncMock(return_value=1),
+        ) as bulk:
+            await asyncio.gather(
+                score_queue.run_daily_tick(
+                    client,
+                    db,
+                    hour_utc=6,
+                    poll_seconds=0.01,
+                    spread_seconds=0,
+                    stop=stop,
+                    clock=lambda: late,
+                ),
+                _fire_then_stop(),
+            )
         # Project enumerated exactly once.
         self.assertEqual(1, db.execute.await_count)
-        # xadd fired for the single project.
-        self.assertEqual(1, client.xadd.await_count)
+        # And enqueued for the single project.
+        bulk.assert_awaited_once()
+
+
+class EnqueueAllTests(unittest.IsolatedAsyncioTestCase):
+    async def test_pages_project_ids_by_keyset(self) -> None:
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(
+            side_effect=[
+                [{'id': 'a'}, {'id': 'b'}],
+                [{'id': 'c'}],
+            ]
+        )
+        pages = [
+            page
+            async for page in score_queue.iter_project_id_pages(
+                db, page_size=2
+            )
+        ]
+        self.assertEqual(pages, [['a', 'b'], ['c']])
+        self.assertEqual(db.execute.await_args_list[1].args[1]['after'], 'b')
+
+    async def test_spreads_pages_across_window(self) -> None:
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(
+            side_effect=[
+                [{'total': 5}],
+                [{'id': 'a'}, {'id': 'b'}],
+                [{'id': 'c'}, {'id': 'd'}],
+                [{'id': 'e'}],
+            ]
+        )
+        with (
+            mock.patch.object(
+                score_queue,
+                'enqueue_recompute_bulk',
+                mock.AsyncMock(side_effect=lambda _c, ids, _r: len(ids)),
+            ) as bulk,
+            mock.patch.object(
+                score_queue,
+                '_wait_or_stop',
+                mock.AsyncMock(return_value=False),
+            ) as wait,
+        ):
+            result = await score_queue._enqueue_all(
+                mock.AsyncMock(),
+                db,
+                'scheduled_recompute',
+                spread_seconds=30,
+                page_size=2,
+            )
+        self.assertEqual(result, (5, 5))
+        self.assertEqual(bulk.await_count, 3)
+        # Three pages over 30s: a 10s pause before each later page.
+        self.assertEqual(
+            [call.args[1] for call in wait.await_args_list], [10.0, 10.0]
+        )
+
+    async def test_stop_abandons_remaining_pages(self) -> None:
+        db = mock.AsyncMock()
+        db.execute = mock.AsyncMock(
+            side_effect=[
+                [{'total': 4}],
+                [{'id': 'a'}, {'id': 'b'}],
+                [{'id': 'c'}, {'id': 'd'}],
+            ]
+        )
+        stop = asyncio.Event()
+        stop.set()
+        with mock.patch.object(
+            score_queue,
+            'enqueue_recompute_bulk',
+            mock.AsyncMock(return_value=2),
+        ) as bulk:
+            result = await score_queue._enqueue_all(
+                mock.AsyncMock(),
+                db,
+                'scheduled_recompute',
+                spread_seconds=60,
+                page_size=2,
+                stop=stop,
+            )
+        self.assertEqual(result, (2, 2))
+        bulk.assert_awaited_once()
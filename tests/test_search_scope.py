@@ -0,0 +1,217 @@
+"""Tests for the cached per-organization search scope."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from imbi_api import caching, search_scope
+
+
+def _client_with_pipeline() -> tuple[mock.AsyncMock, mock.MagicMock]:
+    """A mock client whose pipeline queues commands synchronously."""
+    client = mock.AsyncMock()
+    pipe = mock.MagicMock()
+    for name in (
+        'delete',
+        'sadd',
+        'srem',
+        'expire',
+        'incr',
+        'rpush',
+        'ltrim',
+        'lrange',
+        'multi',
+    ):
+        setattr(pipe, name, mock.Mock())
+    pipe.watch = mock.AsyncMock()
+    pipe.get = mock.AsyncMock(return_value=None)
+    pipe.execute = mock.AsyncMock(return_value=[])
+    pipe.__aenter__ = mock.AsyncMock(return_value=pipe)
+    pipe.__aexit__ = mock.AsyncMock(return_value=False)
+    client.pipeline = mock.Mock(return_value=pipe)
+    return client, pipe
+
+
+class _ScopeTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        search_scope.clear_local_cache()
+        self.addCleanup(search_scope.clear_local_cache)
+        self.db = mock.AsyncMock()
+        patcher = mock.patch(
+            'imbi_common.graph.parse_agtype', side_effect=lambda x: x
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _graph_rows(self, *project_ids: str) -> None:
+        """Seed the seven scope traversals (org, children, ...)."""
+        self.db.execute.side_effect = [
+            [{'org_id': 'org-1'}],
+            [{'nid': 'team-1'}],
+            [{'nid': pid} for pid in project_ids],
+            [],
+            [],
+            [],
+            [],
+        ]
+
+    def _patch_client(self, client: object) -> None:
+        if client is None:
+            patcher = mock.patch.object(
+                caching.valkey,
+                'get_client',
+                side_effect=RuntimeError('no valkey'),
+            )
+        else:
+            patcher = mock.patch.object(
+                caching.valkey, 'get_client', return_value=client
+            )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class LocalScopeTestCase(_ScopeTestCase):
+    """Without Valkey the scope is cached and maintained per process."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._patch_client(None)
+
+    async def test_second_lookup_skips_graph(self) -> None:
+        self._graph_rows('proj-1')
+        first = await search_scope.get_org_node_ids(self.db, 'eng')
+        second = await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(first, {'org-1', 'team-1', 'proj-1'})
+        self.assertIs(second, first)
+        self.assertEqual(self.db.execute.await_count, 7)
+
+    async def test_unknown_org_is_not_cached(self) -> None:
+        self.db.execute.side_effect = [[], []]
+        self.assertIsNone(
+            await search_scope.get_org_node_ids(self.db, 'missing')
+        )
+        self.assertIsNone(
+            await search_scope.get_org_node_ids(self.db, 'missing')
+        )
+        self.assertEqual(self.db.execute.await_count, 2)
+
+    async def test_add_and_remove_update_cached_scope(self) -> None:
+        self._graph_rows('proj-1')
+        await search_scope.get_org_node_ids(self.db, 'eng')
+        await search_scope.add_nodes('eng', 'proj-2', None)
+        await search_scope.remove_nodes('eng', 'proj-1')
+        scope = await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(scope, {'org-1', 'team-1', 'proj-2'})
+        self.assertEqual(self.db.execute.await_count, 7)
+
+    async def test_invalidate_forces_rebuild(self) -> None:
+        self._graph_rows('proj-1')
+        await search_scope.get_org_node_ids(self.db, 'eng')
+        await search_scope.invalidate('eng')
+        self._graph_rows('proj-1')
+        await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(self.db.execute.await_count, 14)
+
+
+class ValkeyScopeTestCase(_ScopeTestCase):
+    """With Valkey the scope set is shared and generation-checked."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client, self.pipe = _client_with_pipeline()
+        self.client.get = mock.AsyncMock(return_value=None)
+        self._patch_client(self.client)
+
+    async def test_complete_set_is_served_without_graph(self) -> None:
+        self.client.smembers = mock.AsyncMock(
+            return_value={b'__complete__', b'proj-1', b'org-1'}
+        )
+        scope = await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(scope, {'proj-1', 'org-1'})
+        self.db.execute.assert_not_awaited()
+
+    async def test_missing_marker_rebuilds_and_stores(self) -> None:
+        self.client.smembers = mock.AsyncMock(return_value={b'proj-9'})
+        self._graph_rows('proj-1')
+        scope = await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(scope, {'org-1', 'team-1', 'proj-1'})
+        self.pipe.delete.assert_called_once_with('imbi:search:scope:eng:ids')
+        stored = self.pipe.sadd.call_args.args
+        self.assertEqual(stored[0], 'imbi:search:scope:eng:ids')
+        self.assertEqual(
+            set(stored[1:]), {'__complete__', 'org-1', 'team-1', 'proj-1'}
+        )
+        self.pipe.expire.assert_called_once_with(
+            'imbi:search:scope:eng:ids', search_scope.SCOPE_TTL_SECONDS
+        )
+
+    async def test_generation_change_applies_logged_changes(self) -> None:
+        self.client.smembers = mock.AsyncMock(
+            return_value={b'__complete__', b'proj-1'}
+        )
+        await search_scope.get_org_node_ids(self.db, 'eng')
+        await search_scope.get_org_node_ids(self.db, 'eng')
+        self.client.get = mock.AsyncMock(return_value=b'2')
+        self.pipe.execute.return_value = [
+            b'2',
+            [b'["sadd", ["proj-2", "doc-1"]]', b'["srem", ["proj-1"]]'],
+        ]
+        scope = await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(scope, {'proj-2', 'doc-1'})
+        self.assertEqual(self.client.smembers.await_count, 1)
+        self.pipe.lrange.assert_called_once_with(
+            'imbi:search:scope:eng:log', 0, -1
+        )
+        await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(self.client.smembers.await_count, 1)
+
+    async def test_log_gap_reloads_set(self) -> None:
+        self.client.smembers = mock.AsyncMock(
+            return_value={b'__complete__', b'proj-1'}
+        )
+        await search_scope.get_org_node_ids(self.db, 'eng')
+        self.client.get = mock.AsyncMock(return_value=b'3')
+        self.pipe.execute.return_value = [b'3', [b'["sadd", ["proj-2"]]']]
+        await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(self.client.smembers.await_count, 2)
+
+    async def test_store_skipped_when_generation_moved(self) -> None:
+        self.client.smembers = mock.AsyncMock(return_value=set())
+        self.pipe.get.return_value = b'1'
+        self._graph_rows('proj-1')
+        scope = await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(scope, {'org-1', 'team-1', 'proj-1'})
+        self.pipe.watch.assert_awaited_once_with('imbi:search:scope:eng:gen')
+        self.pipe.multi.assert_not_called()
+        self.pipe.delete.assert_not_called()
+        self.pipe.execute.assert_not_awaited()
+
+    async def test_add_nodes_bumps_generation_and_logs(self) -> None:
+        await search_scope.add_nodes('eng', 'doc-1')
+        self.pipe.sadd.assert_called_once_with(
+            'imbi:search:scope:eng:ids', 'doc-1'
+        )
+        self.pipe.incr.assert_called_once_with('imbi:search:scope:eng:gen')
+        self.pipe.rpush.assert_called_once_with(
+            'imbi:search:scope:eng:log', '["sadd", ["doc-1"]]'
+        )
+        self.pipe.ltrim.assert_called_once_with(
+            'imbi:search:scope:eng:log', -search_scope.LOG_LENGTH, -1
+        )
+
+    async def test_invalidate_deletes_set_and_log(self) -> None:
+        await search_scope.invalidate('eng')
+        self.pipe.delete.assert_called_once_with(
+            'imbi:search:scope:eng:ids', 'imbi:search:scope:eng:log'
+        )
+        self.pipe.incr.assert_called_once_with('imbi:search:scope:eng:gen')
+        self.pipe.rpush.assert_not_called()
+
+    async def test_valkey_failure_falls_back_to_graph(self) -> None:
+        self.client.get = mock.AsyncMock(side_effect=ConnectionError())
+        self.client.smembers = mock.AsyncMock(side_effect=ConnectionError())
+        self.pipe.execute.side_effect = ConnectionError()
+        self._graph_rows('proj-1')
+        scope = await search_scope.get_org_node_ids(self.db, 'eng')
+        self.assertEqual(scope, {'org-1', 'team-1', 'proj-1'})
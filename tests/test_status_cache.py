@@ -0,0 +1,173 @@
+"""Tests for the shared deployment-plugin status cache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import typing
+import unittest
+from unittest import mock
+
+from imbi_common.plugins.base import CheckStatus, DeploymentRun
+
+from imbi_api import caching
+from imbi_api.plugins import status_cache
+
+
+class _StatusCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    def _patch_client(self, client: object) -> None:
+        if client is None:
+            patcher = mock.patch.object(
+                caching.valkey,
+                'get_client',
+                side_effect=RuntimeError('no valkey'),
+            )
+        else:
+            patcher = mock.patch.object(
+                caching.valkey, 'get_client', return_value=client
+            )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class WithoutValkeyTestCase(_StatusCacheTestCase):
+    def setUp(self) -> None:
+        self._patch_client(None)
+
+    async def test_concurrent_lookups_share_one_call(self) -> None:
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 'pass'
+
+        lookups = [
+            asyncio.create_task(
+                status_cache.check_status('i1', 'p1', 'abc', fetch)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        self.assertEqual(await asyncio.gather(*lookups), ['pass'] * 3)
+        self.assertEqual(calls, 1)
+
+    async def test_failures_reach_every_waiter(self) -> None:
+        fetch = mock.AsyncMock(side_effect=RuntimeError('boom'))
+        results = await asyncio.gather(
+            status_cache.check_status('i1', 'p1', 'abc', fetch),
+            status_cache.check_status('i1', 'p1', 'abc', fetch),
+            return_exceptions=True,
+        )
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        fetch.assert_awaited_once()
+
+
+class WithValkeyTestCase(_StatusCacheTestCase):
+    def setUp(self) -> None:
+        self.store: dict[str, object] = {}
+        self.ttls: dict[str, int] = {}
+        self.client = mock.AsyncMock()
+        self.client.get.side_effect = self.store.get
+
+        async def _set(
+            key: str, value: object, ex: int, nx: bool = False
+        ) -> bool:
+            if nx and key in self.store:
+                return False
+            self.store[key] = value
+            self.ttls[key] = ex
+            return True
+
+        async def _delete(key: str) -> None:
+            self.store.pop(key, None)
+
+        self.client.set.side_effect = _set
+        self.client.delete.side_effect = _delete
+        self._patch_client(self.client)
+
+    async def test_terminal_check_is_cached_for_long(self) -> None:
+        fetch = mock.AsyncMock(return_value='pass')
+        await status_cache.check_status('i1', 'p1', 'abc', fetch)
+        self.assertEqual(
+            await status_cache.check_status('i1', 'p1', 'abc', fetch), 'pass'
+        )
+        fetch.assert_awaited_once()
+        key = 'imbi:plugins:status:check:i1:p1:abc'
+        self.assertEqual(json.loads(str(self.store[key])), 'pass')
+        self.assertEqual(self.ttls[key], status_cache.TERMINAL_TTL_SECONDS)
+        self.assertNotIn(f'{key}:lock', self.store)
+
+    async def test_same_committish_in_other_project_is_not_shared(
+        self,
+    ) -> None:
+        await status_cache.check_status(
+            'i1', 'p1', 'abc', mock.AsyncMock(return_value='pass')
+        )
+        fetch = mock.AsyncMock(return_value='fail')
+        self.assertEqual(
+            await status_cache.check_status('i1', 'p2', 'abc', fetch), 'fail'
+        )
+        fetch.assert_awaited_once()
+
+    async def test_non_terminal_checks_are_cached_briefly(self) -> None:
+        for status in ('warn', 'unknown'):
+            with self.subTest(status=status):
+                await status_cache.check_status(
+                    'i1', 'p1', status, mock.AsyncMock(return_value=status)
+                )
+                self.assertEqual(
+                    self.ttls[f'imbi:plugins:status:check:i1:p1:{status}'],
+                    status_cache.PENDING_TTL_SECONDS,
+                )
+
+    def test_pending_statuses_cover_check_status(self) -> None:
+        self.assertEqual(
+            status_cache.PENDING_CHECK_STATUSES
+            | status_cache.TERMINAL_CHECK_STATUSES,
+            set(typing.get_args(CheckStatus)),
+        )
+        self.assertIn('warn', status_cache.PENDING_CHECK_STATUSES)
+
+    async def test_run_status_round_trips(self) -> None:
+        run = DeploymentRun(run_id='42', status='in_progress')
+        fetch = mock.AsyncMock(return_value=run)
+        await status_cache.deployment_status('i1', 'p1', '42', fetch)
+        cached = await status_cache.deployment_status('i1', 'p1', '42', fetch)
+        self.assertEqual(cached, run)
+        fetch.assert_awaited_once()
+        self.assertEqual(
+            self.ttls['imbi:plugins:status:run:i1:p1:42'],
+            status_cache.PENDING_TTL_SECONDS,
+        )
+
+    async def test_failures_are_not_cached(self) -> None:
+        fetch = mock.AsyncMock(side_effect=[RuntimeError('boom'), 'fail'])
+        with self.assertRaises(RuntimeError):
+            await status_cache.check_status('i1', 'p1', 'abc', fetch)
+        self.assertEqual(
+            await status_cache.check_status('i1', 'p1', 'abc', fetch), 'fail'
+        )
+        self.assertNotIn(
+            'imbi:plugins:status:check:i1:p1:abc:lock', self.store
+        )
+
+    async def test_waits_for_the_pod_holding_the_lock(self) -> None:
+        key = 'imbi:plugins:status:check:i1:p1:abc'
+        self.store[f'{key}:lock'] = '1'
+        fetch = mock.AsyncMock(return_value='fail')
+
+        async def _other_pod() -> None:
+            await asyncio.sleep(0.05)
+            self.store[key] = json.dumps('pass')
+
+        with mock.patch.object(status_cache, 'LOCK_POLL_SECONDS', 0.01):
+            other = asyncio.create_task(_other_pod())
+            status = await status_cache.check_status('i1', 'p1', 'abc', fetch)
+            await other
+        self.assertEqual(status, 'pass')
+        fetch.assert_not_awaited()
+        self.assertIn(f'{key}:lock', self.store)
@@ -0,0 +1,131 @@
+"""Tests for the sync stream worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from imbi_common.plugins.errors import PluginRateLimited
+
+from imbi_api import stream_workers
+
+
+def _entries(*project_ids: str) -> list[stream_workers.Entry]:
+    return [
+        (f'{i}-0'.encode(), {'project_id': pid})
+        for i, pid in enumerate(project_ids)
+    ]
+
+
+class AdaptiveConcurrencyTests(unittest.TestCase):
+    def test_halves_on_rate_limit_and_recovers(self) -> None:
+        limiter = stream_workers.AdaptiveConcurrency(8, recover_after=2)
+        limiter.rate_limited()
+        self.assertEqual(4, limiter.limit)
+        limiter.rate_limited()
+        limiter.rate_limited()
+        limiter.rate_limited()
+        self.assertEqual(1, limiter.limit)
+        for _ in range(4):
+            limiter.succeeded()
+        self.assertEqual(3, limiter.limit)
+        for _ in range(20):
+            limiter.succeeded()
+        self.assertEqual(8, limiter.limit)
+
+
+class DispatchTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        stream_workers.clear()
+        self.stats = stream_workers.stream_stats('test')
+
+    async def test_runs_projects_concurrently_up_to_limit(self) -> None:
+        active = peak = 0
+
+        async def handle(msg_id: bytes, fields: dict[str, str]) -> bool:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        limited = await stream_workers.dispatch(
+            _entries('a', 'b', 'c', 'd', 'e'),
+            handle,
+            stream_workers.AdaptiveConcurrency(3),
+            self.stats,
+        )
+        self.assertIsNone(limited)
+        self.assertEqual(3, peak)
+        self.assertEqual(5, self.stats.processed)
+        self.assertEqual(0, self.stats.in_flight)
+
+    async def test_same_project_runs_in_order(self) -> None:
+        order: list[bytes] = []
+        running: set[str] = set()
+
+        async def handle(msg_id: bytes, fields: dict[str, str]) -> bool:
+            self.assertNotIn(fields['project_id'], running)
+            running.add(fields['project_id'])
+            await asyncio.sleep(0)
+            order.append(msg_id)
+            running.discard(fields['project_id'])
+            return True
+
+        await stream_workers.dispatch(
+            _entries('a', 'a', 'a'),
+            handle,
+            stream_workers.AdaptiveConcurrency(4),
+            self.stats,
+        )
+        self.assertEqual([b'0-0', b'1-0', b'2-0'], order)
+
+    async def test_rate_limit_stops_unstarted_entries(self) -> None:
+        retry_at = time.time() + 60
+        handle = mock.AsyncMock(
+            side_effect=[PluginRateLimited(retry_at=retry_at), True]
+        )
+        limiter = stream_workers.AdaptiveConcurrency(1)
+        limited = await stream_workers.dispatch(
+            _entries('a', 'b'), handle, limiter, self.stats
+        )
+        assert limited is not None
+        self.assertEqual(retry_at, limited.retry_at)
+        handle.assert_awaited_once()
+        self.assertEqual(1, self.stats.rate_limited)
+        self.assertEqual(0, self.stats.processed)
+
+    async def test_failures_are_counted(self) -> None:
+        handle = mock.AsyncMock(side_effect=[False, True])
+        await stream_workers.dispatch(
+            _entries('a', 'b'),
+            handle,
+            stream_workers.AdaptiveConcurrency(2),
+            self.stats,
+        )
+        self.assertEqual(2, self.stats.processed)
+        self.assertEqual(1, self.stats.failed)
+
+
+class StreamLagTests(unittest.IsolatedAsyncioTestCase):
+    async def test_reads_group_lag_and_pending(self) -> None:
+        client = mock.AsyncMock()
+        client.xinfo_groups.return_value = [
+            {'name': b'other', 'lag': 1, 'pending': 0},
+            {b'name': b'workers', b'lag': 7, b'pending': 2},
+        ]
+        self.assertEqual(
+            (7, 2),
+            await stream_workers.stream_lag(client, 'stream', 'workers'),
+        )
+
+    async def test_missing_stream_returns_none(self) -> None:
+        client = mock.AsyncMock()
+        client.xinfo_groups.side_effect = Exception('no such key')
+        self.assertEqual(
+            (None, None),
+            await stream_workers.stream_lag(client, 'stream', 'workers'),
+        )